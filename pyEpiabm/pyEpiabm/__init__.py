@@ -21,9 +21,14 @@ from . import utility
 
 from .core._compartment_counter import _CompartmentCounter
 from .core.cell import Cell
+from .core._event_calendar import _EventCalendar
 from .core.household import Household
+from .core._indexed_list import _IndexedList
+from .core.intervention_modifiers import InterventionModifiers
 from .core.microcell import Microcell
 from .core.parameters import Parameters
 from .core.person import Person
+from .core._person_queue import _PersonQueue
+from .core.person_store import PersonStore
 from .core.place import Place
 from .core.population import Population
@@ -8,9 +8,14 @@
 
 from .parameters import Parameters
 from .person import Person
+from .person_store import PersonStore
 from .cell import Cell
 from .household import Household
 from .microcell import Microcell
 from .place import Place
 from .population import Population
+from .intervention_modifiers import InterventionModifiers
 from ._compartment_counter import _CompartmentCounter
+from ._indexed_list import _IndexedList
+from ._event_calendar import _EventCalendar
+from ._person_queue import _PersonQueue
@@ -14,6 +14,13 @@ class _CompartmentCounter:
     """Class Component which maintains count of people in each compartment,
     according to their age group.
 
+    The counts are held in a single integer array indexed by infection
+    status (in the order of :class:`InfectionStatus`, so row
+    ``status.value - 1``) and age group, which is updated in place. The
+    counters of the cells of a :class:`Population` hold slices of a
+    population-wide array, and also update the population totals (see
+    :meth:`Population.compartment_counts`).
+
     """
 
     def __init__(self, identifier: str):
@@ -34,10 +41,10 @@ class _CompartmentCounter:
         else:
             self.nb_age_groups = 1
 
-        # Internal datastore, returns array with age group for each status
-        # infection
-        self._compartments = {status: np.zeros(self.nb_age_groups, dtype=int)
-                              for status in InfectionStatus}
+        # Internal datastore, with a row of age groups for each infection
+        # status
+        self._set_counts(np.zeros((len(InfectionStatus), self.nb_age_groups),
+                                  dtype=int))
 
     @property
     def identifier(self):
@@ -46,6 +53,33 @@ class _CompartmentCounter:
         """
         return self._identifier
 
+    @property
+    def counts(self) -> np.ndarray:
+        """Array of the number of people in each compartment, indexed by
+        infection status (row ``status.value - 1``) and age group.
+
+        """
+        return self._counts
+
+    def _set_counts(self, counts: np.ndarray, totals: np.ndarray = None):
+        """Replaces the array of counts, which is then updated in place.
+
+        Parameters
+        ----------
+        counts : np.ndarray
+            Integer array indexed by infection status and age group
+        totals : np.ndarray
+            Array of the same shape holding the totals of several counters,
+            which is updated alongside the counts, or None
+
+        """
+        self._counts = counts
+        self._totals = totals
+        self.nb_age_groups = counts.shape[1]
+        # Rows of the array for each status, as returned by retrieve
+        self._compartments = {status: counts[i] for i, status
+                              in enumerate(InfectionStatus)}
+
     def report(self, old_status: InfectionStatus,
                new_status: InfectionStatus, age_group=0) -> None:
         """Report Person has changed state.
@@ -61,14 +95,18 @@ class _CompartmentCounter:
             Person's associated age group, defaults to 0 if age not implemented
 
         """
-        if self._compartments[old_status][age_group] <= 0:
+        counts = self._counts
+        old_row = old_status.value - 1
+        if counts[old_row, age_group] <= 0:
             raise ValueError("No people of this status and of this age group \
                               in this cell.")
-        # Initialisation of the age_counter array
-        age_counter = np.zeros(self.nb_age_groups, dtype=int)
-        age_counter[age_group] = 1
-        self._compartments[old_status] -= age_counter
-        self._compartments[new_status] += age_counter
+        new_row = new_status.value - 1
+        counts[old_row, age_group] -= 1
+        counts[new_row, age_group] += 1
+        totals = self._totals
+        if totals is not None:
+            totals[old_row, age_group] -= 1
+            totals[new_row, age_group] += 1
 
     def _increment_compartment(self, n_persons: int,
                                infection_status: InfectionStatus,
@@ -88,16 +126,16 @@ class _CompartmentCounter:
             Person's associated age group
 
         """
-        # Initialisation of the age_counter array
-        age_counter = np.zeros(self.nb_age_groups, dtype=int)
-        age_counter[age_group] = n_persons
-        self._compartments[infection_status] += age_counter
+        self._counts[infection_status.value - 1, age_group] += n_persons
+        if self._totals is not None:
+            self._totals[infection_status.value - 1, age_group] += n_persons
 
     def retrieve(self) -> typing.Dict[InfectionStatus, np.array]:
         """Get Compartment Counts.
         Returns dictionary of compartment counts, in which each entry is an
         array containing the number of people by age group. If age is not used
-        then there is only one age group and the array length is 1.
+        then there is only one age group and the array length is 1. The
+        arrays are rows of :attr:`counts`, so follow later changes.
 
         Returns
         -------
@@ -107,9 +145,28 @@ class _CompartmentCounter:
         """
         return self._compartments
 
+    def total(self, statuses: typing.Iterable[InfectionStatus]) -> int:
+        """Returns the number of people in any of the given infection
+        statuses, over all age groups.
+
+        Parameters
+        ----------
+        statuses : typing.Iterable[InfectionStatus]
+            Infection statuses to count
+
+        Returns
+        -------
+        int
+            Number of people in the given statuses
+
+        """
+        return int(self._counts[[status.value - 1 for status in statuses]]
+                   .sum())
+
     def clear_counter(self):
         """ Method to clear and reset compartment counter to zero.
         """
 
-        self._compartments = {status: np.zeros(self.nb_age_groups, dtype=int)
-                              for status in InfectionStatus}
+        if self._totals is not None:
+            self._totals -= self._counts
+        self._counts[:] = 0
@@ -0,0 +1,122 @@
+#
+# Calendar of timed events, bucketed by time
+#
+
+import heapq
+import math
+
+
+class _EventCalendar:
+    """Calendar queue of items which are each due at a given time, such as
+    people waiting for their next infection status change.
+
+    Items are held in buckets covering an interval of time of length
+    ``bucket_width``, and the keys of the non-empty buckets are held in a
+    heap. Scheduling or unscheduling an item takes constant time (besides
+    the heap operation when a new bucket is opened), and popping the due
+    items only visits the buckets up to the current time, so takes time
+    proportional to the number of due items rather than to the number of
+    scheduled items.
+
+    Each item is scheduled at most once, so scheduling an item again moves
+    it to its new time. Items with no time (None), or an infinite or NaN
+    time, are never due and so are not held.
+
+    """
+    def __init__(self, bucket_width: float = 1.0):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        bucket_width : float
+            Length of the interval of time covered by each bucket
+
+        """
+        if not bucket_width > 0:
+            raise ValueError("bucket_width must be positive")
+        self.bucket_width = bucket_width
+        self._buckets = {}
+        self._keys = []
+        self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item) -> bool:
+        return item in self._entries
+
+    def schedule(self, item, time: float):
+        """Schedules an item to be due at the given time, replacing any
+        previous time of the item.
+
+        Parameters
+        ----------
+        item : typing.Hashable
+            Item to schedule
+        time : float
+            Time at which the item is due, or None if it is never due
+
+        """
+        self.unschedule(item)
+        if time is None or not math.isfinite(time):
+            return
+        key = math.floor(time / self.bucket_width)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = {}
+            heapq.heappush(self._keys, key)
+        bucket[item] = time
+        self._entries[item] = key
+
+    def unschedule(self, item):
+        """Removes an item from the calendar, if it is scheduled.
+
+        Parameters
+        ----------
+        item : typing.Hashable
+            Item to remove
+
+        """
+        key = self._entries.pop(item, None)
+        if key is not None:
+            # Empty buckets are discarded when they are reached in
+            # pop_due
+            del self._buckets[key][item]
+
+    def pop_due(self, time: float) -> list:
+        """Removes and returns the items which are due at or before the
+        given time.
+
+        Parameters
+        ----------
+        time : float
+            Current time
+
+        Returns
+        -------
+        list
+            Due items, in order of their buckets and then in the order in
+            which they were scheduled
+
+        """
+        due = []
+        last_key = math.floor(time / self.bucket_width)
+        while self._keys and self._keys[0] <= last_key:
+            key = self._keys[0]
+            bucket = self._buckets[key]
+            if key < last_key:
+                items = list(bucket)
+            else:
+                # The bucket of the current time may hold later items
+                items = [item for item, item_time in bucket.items()
+                         if item_time <= time]
+                for item in items:
+                    del bucket[item]
+            for item in items:
+                del self._entries[item]
+            due.extend(items)
+            if key == last_key and bucket:
+                break
+            heapq.heappop(self._keys)
+            del self._buckets[key]
+        return due
@@ -0,0 +1,110 @@
+#
+# List which records the position of each of its items
+#
+
+import typing
+
+
+class _IndexedList(list):
+    """List of distinct items which also records the position of each
+    item, so that membership tests and lookups take constant time rather
+    than time proportional to the length of the list.
+
+    Removing an item keeps the order of the other items, as for a list, so
+    sweeps iterating over the list draw random numbers for the same items
+    in the same order. Only the positions of the items after the removed
+    item are updated, so removing the last item takes constant time. Only
+    the methods overridden here keep the positions up to date, so the list
+    should not be changed in any other way (such as by inserting or sorting).
+
+    """
+    def __init__(self, items: typing.Iterable = ()):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        items : typing.Iterable
+            Distinct initial items of the list
+
+        """
+        super().__init__(items)
+        self._positions = {item: i for i, item in enumerate(self)}
+        if len(self._positions) != len(self):
+            raise ValueError("Items of the list must be distinct")
+
+    def __contains__(self, item) -> bool:
+        return item in self._positions
+
+    def __reduce__(self):
+        # The positions are rebuilt from the items when unpickled or copied
+        return (self.__class__, (list(self),))
+
+    def append(self, item):
+        """Adds an item to the end of the list.
+
+        Parameters
+        ----------
+        item
+            Item to add, which must not already be in the list
+
+        """
+        if item in self._positions:
+            raise ValueError(f"{item} is already in the list")
+        self._positions[item] = len(self)
+        super().append(item)
+
+    def extend(self, items: typing.Iterable):
+        """Adds each of the given items to the end of the list.
+
+        Parameters
+        ----------
+        items : typing.Iterable
+            Items to add, which must not already be in the list
+
+        """
+        for item in items:
+            self.append(item)
+
+    def index(self, item) -> int:
+        """Returns the position of an item in the list.
+
+        Parameters
+        ----------
+        item
+            Item to find
+
+        Returns
+        -------
+        int
+            Position of the item
+
+        """
+        try:
+            return self._positions[item]
+        except KeyError:
+            raise ValueError(f"{item} is not in the list") from None
+
+    def remove(self, item):
+        """Removes an item from the list, moving each later item back one
+        position.
+
+        Parameters
+        ----------
+        item
+            Item to remove
+
+        """
+        try:
+            position = self._positions.pop(item)
+        except KeyError:
+            raise ValueError(f"{item} is not in the list") from None
+        del self[position]
+        for i in range(position, len(self)):
+            self._positions[self[i]] = i
+
+    def clear(self):
+        """Removes all items from the list.
+
+        """
+        super().clear()
+        self._positions.clear()
@@ -0,0 +1,100 @@
+#
+# First-in first-out queue of distinct people
+#
+
+from collections import deque
+
+
+class _PersonQueue:
+    """First-in first-out queue of distinct items (such as the people
+    waiting to be infected or tested in a cell), which can be drained in
+    bulk.
+
+    This replaces :class:`queue.Queue`, whose methods each take a lock
+    although pyEpiabm is single-threaded, and keeps its :meth:`put`,
+    :meth:`get`, :meth:`empty` and :meth:`qsize` methods and its ``queue``
+    attribute. An item which is already waiting is not enqueued again, so
+    a person enqueued by several sweeps in one timestep is only processed
+    once.
+
+    """
+    def __init__(self):
+        """Constructor Method.
+
+        """
+        self.queue = deque()
+        self._members = set()
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def __iter__(self):
+        return iter(self.queue)
+
+    def __contains__(self, item) -> bool:
+        return item in self._members
+
+    def put(self, item):
+        """Adds an item to the end of the queue, unless it is already
+        waiting.
+
+        Parameters
+        ----------
+        item : typing.Hashable
+            Item to enqueue
+
+        """
+        if item not in self._members:
+            self._members.add(item)
+            self.queue.append(item)
+
+    def get(self):
+        """Removes and returns the item at the front of the queue.
+
+        Returns
+        -------
+        typing.Hashable
+            First item of the queue
+
+        """
+        item = self.queue.popleft()
+        self._members.discard(item)
+        return item
+
+    def empty(self) -> bool:
+        """Returns whether the queue is empty.
+
+        """
+        return not self.queue
+
+    def qsize(self) -> int:
+        """Returns the number of items in the queue.
+
+        """
+        return len(self.queue)
+
+    def drain(self, max_items: float = None) -> list:
+        """Removes and returns the items at the front of the queue.
+
+        Parameters
+        ----------
+        max_items : float
+            Maximum number of items to remove, or None to empty the queue
+
+        Returns
+        -------
+        list
+            Removed items, in the order in which they were enqueued
+
+        """
+        if max_items is None or max_items >= len(self.queue):
+            items = list(self.queue)
+            self.queue.clear()
+            self._members.clear()
+            return items
+        items = []
+        while len(items) < max_items:
+            item = self.queue.popleft()
+            self._members.discard(item)
+            items.append(item)
+        return items
@@ -3,9 +3,7 @@
 #
 
 import typing
-import numpy as np
 import re
-from queue import Queue
 from numbers import Number
 
 from pyEpiabm.property import InfectionStatus
@@ -15,6 +13,12 @@ from .microcell import Microcell
 from .parameters import Parameters
 from .person import Person
 from ._compartment_counter import _CompartmentCounter
+from ._event_calendar import _EventCalendar
+from ._person_queue import _PersonQueue
+
+# Statuses in which a person is infectious
+_INFECTIOUS_STATUSES = frozenset(
+    status for status in InfectionStatus if status.name.startswith('Infect'))
 
 
 class Cell:
@@ -35,13 +39,21 @@ class Cell:
         self.id = str(hash(self))
         self.microcells = []
         self.persons = []
+        # Incremented whenever people join or leave the cell, so that
+        # structures built from its people can tell they are out of date
+        self.persons_version = 0
         self.places = []
         self.households = []
-        self.person_queue = Queue()
-        self.PCR_queue = Queue()
-        self.LFT_queue = Queue()
+        self.person_queue = _PersonQueue()
+        self.PCR_queue = _PersonQueue()
+        self.LFT_queue = _PersonQueue()
         self.compartment_counter = _CompartmentCounter(f"Cell {id(self)}")
         self.nearby_cell_distances = dict()
+        self.person_store = None
+        self.infectious_persons = dict()
+        self._person_positions = dict()
+        self.status_calendar = _EventCalendar()
+        self.event_log = None
 
         if not (len(loc) == 2 and isinstance(loc[0], Number) and
                 isinstance(loc[1], Number)):
@@ -100,7 +112,8 @@ class Cell:
 
     def enqueue_person(self, person: Person):
         """Add person to queue for processing at end of iteration, provided
-        they are not already recovered (and so may be infected).
+        they are not already recovered (and so may be infected). A person who
+        is already in the queue is not added again.
 
         Parameters
         ----------
@@ -159,6 +172,81 @@ class Cell:
         """
         self.compartment_counter.report(old_status, new_status, age_group)
 
+    def update_infectious_person(self, person: Person):
+        """Adds a person to, or removes them from, the index of infectious
+        people in the cell, according to their current infection status.
+
+        The index is a dictionary used as an insertion-ordered set (with None
+        values), so that sweeps iterate over infectors in a reproducible
+        order.
+
+        Parameters
+        ----------
+        person : Person
+            Person whose infection status has been set
+
+        """
+        if person.infection_status in _INFECTIOUS_STATUSES:
+            self.infectious_persons[person] = None
+        else:
+            self.infectious_persons.pop(person, None)
+
+    def update_status_calendar(self, person: Person):
+        """Schedules a person in the cell's calendar of status changes at
+        their current time of status change, or removes them from it if they
+        have none.
+
+        Parameters
+        ----------
+        person : Person
+            Person whose time of status change has been set
+
+        """
+        self.status_calendar.schedule(person, person.time_of_status_change)
+
+    def infectors(self):
+        """Returns the infectious people in the cell, in the order in which
+        they appear in the cell's list of persons. Only the index of
+        infectious people is sorted, so this is much cheaper than filtering
+        the whole cell when few people are infectious.
+
+        Returns
+        -------
+        list
+            List of infectious :class:`Person` s
+
+        """
+        return self.in_person_order(self.infectious_persons)
+
+    def in_person_order(self, persons: typing.Iterable[Person]):
+        """Returns the given people of the cell, in the order in which they
+        appear in the cell's list of persons.
+
+        Parameters
+        ----------
+        persons : typing.Iterable[Person]
+            Distinct people of the cell
+
+        Returns
+        -------
+        list
+            List of the given :class:`Person` s
+
+        """
+        persons = list(persons)
+        if len(persons) < 2:
+            return persons
+        positions = self._person_positions
+        if len(positions) != len(self.persons) or \
+                not all(person in positions for person in persons):
+            # People have joined or left the cell since the positions were
+            # last recorded. Appending or removing people does not change
+            # the relative order of the others, so only then is a rebuild
+            # needed.
+            positions = {person: i for i, person in enumerate(self.persons)}
+            self._person_positions = positions
+        return sorted(persons, key=positions.__getitem__)
+
     def number_infectious(self):
         """Returns the total number of infectious people in each
          cell, all ages combined.
@@ -169,13 +257,7 @@ class Cell:
             Total infectors in cell
 
         """
-        cell_data = self.compartment_counter.retrieve()
-        total_infectors = 0
-        for status in InfectionStatus:
-            if str(status).startswith('InfectionStatus.Infect'):
-                total_infectors += np.sum(cell_data[status])
-
-        return total_infectors
+        return self.compartment_counter.total(_INFECTIOUS_STATUSES)
 
     def set_location(self, loc: typing.Tuple[float, float]):
         """Method to set or change the location of a cell.
@@ -188,7 +270,7 @@ class Cell:
         """
         self.location = loc
 
-    def find_nearby_cells(self, other_cells):
+    def find_nearby_cells(self, other_cells, spatial_index=None):
         '''
         Helper function which takes in a given cell and the list of all cells
         and generates a list of nearby cells which are
@@ -203,12 +285,21 @@ class Cell:
         Parameters
         ----------
         other_cells : typing.List[Cell]
-            List of all cells except cell
+            List of all cells except cell (the cell itself is skipped if
+            present)
+        spatial_index : SpatialIndex
+            Optional index of the locations of other_cells, used to only
+            compute distances to cells in the grid buckets near this cell
 
         '''
         cutoff = Parameters.instance().infection_radius
 
+        if spatial_index is not None:
+            other_cells = [other_cells[i] for i in
+                           spatial_index.candidates(self.location, cutoff)]
         for cell2 in other_cells:
+            if cell2 is self:
+                continue
             distance = DistanceFunctions.dist(self.location, cell2.location)
             if distance < cutoff:
                 self.nearby_cell_distances[cell2.id] = distance
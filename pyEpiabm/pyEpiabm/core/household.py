@@ -8,6 +8,8 @@ import re
 
 from pyEpiabm.property import InfectionStatus
 
+from ._indexed_list import _IndexedList
+
 
 class Household:
     """Class representing a household,
@@ -31,7 +33,7 @@ class Household:
 
         """
         self.persons = []
-        self.susceptible_persons = []
+        self.susceptible_persons = _IndexedList()
         self.location = loc
         self.susceptibility = susceptibility
         self.infectiousness = infectiousness
@@ -71,6 +73,8 @@ class Household:
         """
         self.persons.append(person)
         person.household = self
+        if person.store is not None:
+            person.store.set_household(person, self)
         if person.infection_status == InfectionStatus.Susceptible:
             self.add_susceptible_person(person)
 
@@ -0,0 +1,328 @@
+#
+# Precomputed intervention multipliers for the force of infection
+#
+
+import math
+import typing
+
+import numpy as np
+
+from pyEpiabm.property import PlaceType
+
+from .parameters import Parameters
+
+
+class InterventionModifiers:
+    """Class holding the effect of the active interventions on each person
+    as arrays of multipliers, which the force of infection calculations
+    read in place of the intervention attributes of each :class:`Person`
+    and :class:`Microcell` (such as `isolation_start_time`).
+
+    Interventions record each intervention attribute they set with
+    :meth:`record`, which stores the start times in per-person and
+    per-microcell arrays. Once per timestep, :meth:`update` turns these
+    into the multiplier arrays below, with one row per person, so that each
+    intervention factor of a force of infection is a single array lookup
+    rather than a series of attribute and parameter checks. People joining
+    the population later (such as travellers) are added when first looked
+    up. As the places people visit change during a timestep (for example in
+    :class:`UpdatePlaceSweep`), whether a person's places are closed is
+    checked again when they are looked up if their places have changed.
+
+    Attributes
+    ----------
+    persons : list
+        List of :class:`Person` s, with the person at position i in row i
+        of each array
+    microcells : list
+        List of :class:`Microcell` s, indexing the microcell arrays
+    time : float
+        Time at which the multipliers were last calculated (None if the
+        intervention attributes have changed since)
+    isolation_house : np.ndarray
+        Multiplier of household infectiousness due to case or travel
+        isolation
+    isolation : np.ndarray
+        Multiplier of place and spatial infectiousness due to case or
+        travel isolation
+    closed : np.ndarray
+        Whether a place of each person is closed by place closure
+    closure_household : np.ndarray
+        Multiplier of household infectiousness due to place closure
+    closure_spatial : np.ndarray
+        Multiplier of spatial infectiousness and susceptibility due to place
+        closure
+    quarantine_house : np.ndarray
+        Multiplier of household infectiousness due to household quarantine
+    quarantine_spatial : np.ndarray
+        Multiplier of spatial infectiousness due to household quarantine
+    quarantine_place : np.ndarray
+        Multiplier of place infectiousness due to household quarantine, of
+        shape (persons, place types)
+    distancing_house : np.ndarray
+        Multiplier of household susceptibility due to social distancing
+    distancing_spatial : np.ndarray
+        Multiplier of spatial susceptibility due to social distancing
+    distancing_place : np.ndarray
+        Multiplier of place susceptibility due to social distancing, of
+        shape (persons, place types)
+
+    """
+    _person_attributes = ('isolation_start_time',
+                          'travel_isolation_start_time',
+                          'quarantine_start_time', 'distancing_enhanced')
+    _microcell_attributes = ('closure_start_time', 'distancing_start_time')
+
+    def __init__(self, population):
+        """Constructor Method. Reads the current intervention attributes of
+        each person and microcell in the population.
+
+        Parameters
+        ----------
+        population : Population
+            Population whose interventions are recorded
+
+        """
+        self.persons = []
+        self.microcells = []
+        self.time = None
+        self._closing_place_types = {}
+        self._person_rows = {}
+        self._microcell_rows = {}
+        self._person_microcell = np.zeros(0, dtype=np.int32)
+        self._state = {name: np.zeros(0) for name in
+                       self._person_attributes + self._microcell_attributes}
+        for cell in population.cells:
+            for microcell in cell.microcells:
+                self._microcell_row(microcell)
+                for person in microcell.persons:
+                    self._person_row(person)
+
+    @staticmethod
+    def _value(name: str, value) -> float:
+        """Returns the value of an intervention attribute as stored in the
+        arrays, with start times of None stored as NaN.
+
+        """
+        if name == 'distancing_enhanced':
+            return 1.0 if value is True else 0.0
+        return math.nan if value is None else value
+
+    def _grow(self, names: typing.Iterable[str], size: int):
+        """Reallocates the given state arrays (at least) to the given size,
+        filled with NaN.
+
+        """
+        for name in names:
+            array = self._state[name]
+            if len(array) < size:
+                grown = np.full(max(size, 2 * len(array)), math.nan)
+                grown[:len(array)] = array
+                self._state[name] = grown
+
+    def _microcell_row(self, microcell) -> int:
+        """Returns the row of a microcell, adding it if required.
+
+        """
+        row = self._microcell_rows.get(microcell)
+        if row is None:
+            row = self._microcell_rows[microcell] = len(self.microcells)
+            self.microcells.append(microcell)
+            self._grow(self._microcell_attributes, row + 1)
+            for name in self._microcell_attributes:
+                self._state[name][row] = self._value(
+                    name, getattr(microcell, name, None))
+            self.time = None
+        return row
+
+    def _person_row(self, person) -> int:
+        """Returns the row of a person, adding them if required.
+
+        """
+        row = self._person_rows.get(person)
+        if row is None:
+            row = self._person_rows[person] = len(self.persons)
+            self.persons.append(person)
+            self._grow(self._person_attributes, row + 1)
+            if len(self._person_microcell) <= row:
+                self._person_microcell = np.resize(
+                    self._person_microcell, len(self._state[
+                        self._person_attributes[0]]))
+            self._person_microcell[row] = self._microcell_row(
+                person.microcell)
+            for name in self._person_attributes:
+                self._state[name][row] = self._value(
+                    name, getattr(person, name, None))
+            self.time = None
+        return row
+
+    def record(self, obj, name: str, value):
+        """Records the value of an intervention attribute of a person or
+        microcell. The multipliers are recalculated when next used.
+
+        Parameters
+        ----------
+        obj : Person or Microcell
+            Person or microcell whose attribute was set
+        name : str
+            Name of the attribute, such as `isolation_start_time`
+        value : float or bool
+            New value of the attribute
+
+        """
+        if name in self._microcell_attributes:
+            row = self._microcell_row(obj)
+        elif name in self._person_attributes:
+            row = self._person_row(obj)
+        else:
+            raise ValueError(f"Unknown intervention attribute '{name}'")
+        self._state[name][row] = self._value(name, value)
+        self.time = None
+
+    def index(self, person, time: float, parameters=None) -> int:
+        """Returns the row of a person in the multiplier arrays, first
+        recalculating the multipliers if they are not for the given time.
+
+        Parameters
+        ----------
+        person : Person
+            Person to look up
+        time : float
+            Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+
+        Returns
+        -------
+        int
+            Row of the person
+
+        """
+        row = self._person_rows.get(person)
+        if row is None:
+            row = self._person_row(person)
+        if self.time != time:
+            self.update(time, parameters)
+        place_types = self._closing_place_types.get(row)
+        if place_types is not None and place_types != person.place_types:
+            self._update_closed(row)
+        return row
+
+    def _update_closed(self, row: int):
+        """Checks again whether a place of a person in a microcell with
+        place closure is closed, after the places they visit have changed,
+        updating their closure multipliers.
+
+        """
+        place_types = list(self.persons[row].place_types)
+        self._closing_place_types[row] = place_types
+        closed = any(place_type.value in self._closure_params[
+            'closure_place_type'] for place_type in place_types)
+        if closed == self.closed[row]:
+            return
+        self.closed[row] = closed
+        for name, key in (('closure_household',
+                           'closure_household_infectiousness'),
+                          ('closure_spatial', 'closure_spatial_params')):
+            array = getattr(self, name)
+            if not array.flags.writeable:
+                array = np.ones(len(self.closed))
+                setattr(self, name, array)
+            array[row] = self._closure_params[key] if closed else 1.0
+
+    def update(self, time: float, parameters=None):
+        """Calculates the multipliers of each person due to the
+        interventions active at the given time, from the recorded
+        intervention attributes.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+
+        """
+        if parameters is None:
+            parameters = Parameters.instance()
+        params = parameters.intervention_params
+        size = len(self.persons)
+        state = {name: self._state[name][:size]
+                 for name in self._person_attributes}
+        microcell_rows = self._person_microcell[:size]
+
+        def active(name):
+            # Start times of None are stored as NaN, so are never active
+            if name in self._microcell_attributes:
+                start = self._state[name][:len(self.microcells)]
+                return (start <= time)[microcell_rows]
+            return state[name] <= time
+
+        def scale(mask, intervention, key):
+            # Parameters are only read if the intervention is in effect
+            if not mask.any():
+                return np.broadcast_to(1.0, (size,))
+            return np.where(mask, params[intervention][key], 1.0)
+
+        def place_scale(mask, intervention, key):
+            if not mask.any():
+                return np.broadcast_to(1.0, (size, len(PlaceType)))
+            values = np.ones(len(PlaceType))
+            effect = params[intervention][key][:len(PlaceType)]
+            values[:len(effect)] = effect
+            return np.where(mask[:, np.newaxis], values, 1.0)
+
+        # Dominant interventions: 1) travel_isolate; 2) case_isolate
+        isolating = active('isolation_start_time')
+        travel_isolating = active('travel_isolation_start_time')
+        for name, key in (('isolation_house', 'isolation_house_effectiveness'),
+                          ('isolation', 'isolation_effectiveness')):
+            travel_scale = scale(travel_isolating, 'travel_isolation', key)
+            isolation_scale = scale(isolating, 'case_isolation', key)
+            setattr(self, name, np.where(travel_scale != 1, travel_scale,
+                                         isolation_scale))
+
+        # Places are only closed for people with a place of a closed type.
+        # The place types found here are kept, so that people whose places
+        # change later in the timestep are checked again when looked up
+        self.closed = np.zeros(size, dtype=bool)
+        self._closing_place_types = {}
+        closing = active('closure_start_time')
+        if closing.any():
+            self._closure_params = params['place_closure']
+            closure_types = self._closure_params['closure_place_type']
+            for row in np.flatnonzero(closing).tolist():
+                place_types = list(self.persons[row].place_types)
+                self._closing_place_types[row] = place_types
+                self.closed[row] = any(
+                    place_type.value in closure_types
+                    for place_type in place_types)
+        self.closure_household = scale(self.closed, 'place_closure',
+                                       'closure_household_infectiousness')
+        self.closure_spatial = scale(self.closed, 'place_closure',
+                                     'closure_spatial_params')
+
+        quarantined = active('quarantine_start_time')
+        self.quarantine_house = scale(quarantined, 'household_quarantine',
+                                      'quarantine_house_effectiveness')
+        self.quarantine_spatial = scale(quarantined, 'household_quarantine',
+                                        'quarantine_spatial_effectiveness')
+        self.quarantine_place = place_scale(quarantined,
+                                            'household_quarantine',
+                                            'quarantine_place_effectiveness')
+
+        distancing = active('distancing_start_time')
+        enhanced = distancing & (state['distancing_enhanced'] == 1)
+        distancing &= ~enhanced
+        for name in ('house', 'spatial', 'place'):
+            scale_function = place_scale if name == 'place' else scale
+            enhanced_scale = scale_function(
+                enhanced, 'social_distancing',
+                f'distancing_{name}_enhanced_susc')
+            distancing_scale = scale_function(
+                distancing, 'social_distancing', f'distancing_{name}_susc')
+            setattr(self, f'distancing_{name}',
+                    enhanced_scale * distancing_scale)
+        self.time = time
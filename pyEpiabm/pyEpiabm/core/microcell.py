@@ -87,6 +87,11 @@ class Microcell:
         """Adds :class:`Person` with given :class:`InfectionStatus` and given
         age group to Microcell.
 
+        If the person comes from a microcell of another cell (such as a
+        traveller introduced by :class:`TravelSweep`), they are removed from
+        the index of infectious people and the status calendar of that cell,
+        and are added to those of this cell.
+
         Parameters
         ----------
         person : Person
@@ -94,13 +99,22 @@ class Microcell:
             group
 
         """
+        old_cell = getattr(person.microcell, 'cell', None)
+        if old_cell is not None and old_cell is not self.cell:
+            old_cell.infectious_persons.pop(person, None)
+            old_cell.status_calendar.unschedule(person)
         status = person.infection_status
         age_group = person.age_group
         self.compartment_counter._increment_compartment(1, status, age_group)
         self.cell.compartment_counter._increment_compartment(1, status,
                                                              age_group)
         self.cell.persons.append(person)
+        self.cell.persons_version += 1
         self.persons.append(person)
+        self.cell.update_infectious_person(person)
+        self.cell.update_status_calendar(person)
+        if self.cell.person_store is not None:
+            self.cell.person_store.add_person(person, self)
 
     def add_people(self, n, status=InfectionStatus.Susceptible,
                    age_group=None):
@@ -119,12 +133,15 @@ class Microcell:
         for _ in range(n):
             p = Person(self, age_group)
             self.cell.persons.append(p)
+            self.cell.persons_version += 1
             self.persons.append(p)
             p.infection_status = status
             self.compartment_counter._increment_compartment(
                 1, p.infection_status, p.age_group)
             self.cell.compartment_counter._increment_compartment(
                 1, p.infection_status, p.age_group)
+            if self.cell.person_store is not None:
+                self.cell.person_store.add_person(p, self)
 
     def add_place(self, n: int, loc: typing.Tuple[float, float],
                   place_type):
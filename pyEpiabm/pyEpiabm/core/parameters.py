@@ -2,14 +2,41 @@
 # Parameters
 #
 
+import contextlib
 import json
 import numpy as np
 
 
+class _ParameterGroup(dict):
+    """Dictionary of a group of nested parameters (such as
+    `intervention_params`), whose entries are also resolved into attributes
+    when it is loaded. The group is its own attribute dictionary, so reading
+    an entry as an attribute is an ordinary attribute lookup, and entries
+    set either as items or as attributes are seen both ways. Nested
+    dictionaries are also converted to parameter groups.
+
+    """
+    def __init__(self, parameters: dict):
+        super().__init__({key: _ParameterGroup(value)
+                          if isinstance(value, dict) else value
+                          for key, value in parameters.items()})
+        self.__dict__ = self
+
+    def __reduce__(self):
+        # Rebuild the group from its entries, so that it is again its own
+        # attribute dictionary when unpickled or copied
+        return _ParameterGroup, (dict(self),)
+
+
 class Parameters:
     """Class for global parameters.
 
-    Following a singleton Pattern.
+    Following a singleton Pattern. Parameters objects can also be loaded
+    without replacing the singleton instance using :meth:`from_file`, and
+    bound to a :class:`Simulation` and its sweeps, so that several
+    configurations can be used in one process. While a simulation runs its
+    parameters are activated with :meth:`activate`, so :meth:`instance`
+    returns them.
 
     """
     class __Parameters:
@@ -21,6 +48,10 @@ class Parameters:
             in github wiki:
             https://github.com/SABS-R3-Epidemiology/epiabm/wiki
 
+            Nested dictionaries of parameters are converted to parameter
+            groups, whose entries can be read either as dictionary items or
+            as attributes.
+
             """
             with open(config_file_path, "r") as parameters_file:
                 parameters_str = parameters_file.read()
@@ -28,8 +59,15 @@ class Parameters:
                 for key, value in parameters.items():
                     if isinstance(value, list):
                         value = np.array(value)
+                    elif isinstance(value, dict):
+                        value = _ParameterGroup(value)
                     setattr(self, key, value)
 
+        def __reduce__(self):
+            # The name of this class is mangled, so it cannot be found by
+            # pickle, for example when checkpointing a simulation
+            return Parameters._from_state, (vars(self),)
+
     _instance = None  # Singleton instance
 
     @staticmethod
@@ -51,3 +89,51 @@ class Parameters:
     def set_file(file_path):
         """Loads file"""
         Parameters._instance = Parameters.__Parameters(file_path)
+
+    @staticmethod
+    def from_file(file_path):
+        """Loads a file as a new parameters object, without changing the
+        singleton instance.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the parameter file
+
+        Returns
+        -------
+        __Parameters
+            A new instance of the __Parameters class
+
+        """
+        return Parameters.__Parameters(file_path)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def activate(parameters):
+        """Context manager which makes a parameters object the singleton
+        instance, restoring the previous instance on exit.
+
+        Parameters
+        ----------
+        parameters : __Parameters
+            Parameters object to activate, as returned by :meth:`instance`
+            or :meth:`from_file`
+
+        """
+        previous = Parameters._instance
+        Parameters._instance = parameters
+        try:
+            yield parameters
+        finally:
+            Parameters._instance = previous
+
+    @staticmethod
+    def _from_state(state: dict):
+        """Returns a parameters object with the given attributes, used when
+        unpickling parameters objects.
+
+        """
+        parameters = object.__new__(Parameters.__Parameters)
+        parameters.__dict__.update(state)
+        return parameters
@@ -2,6 +2,7 @@
 # Person Class
 #
 
+import math
 import random
 import re
 
@@ -9,6 +10,9 @@ from pyEpiabm.property import InfectionStatus
 
 from .parameters import Parameters
 
+# Look-up from the integer values held in a PersonStore to InfectionStatus
+_STATUS_BY_VALUE = (None,) + tuple(InfectionStatus)
+
 
 class Person:
     """Class to represent each person in a population.
@@ -26,6 +30,11 @@ class Person:
         Person's next infection status after current one
     time_of_status_change: int
         Time when person's infection status is updated
+    store : PersonStore
+        Columnar store holding this person's state, or None if the state is
+        held on the object itself
+    store_index : int
+        Row of this person in the store (None if not stored)
 
     """
 
@@ -41,6 +50,8 @@ class Person:
             be assigned
 
         """
+        self.store = None
+        self.store_index = None
         self.initial_infectiousness = 0
         self.infectiousness = 0
         self.microcell = microcell
@@ -68,6 +79,110 @@ class Person:
 
         self.set_random_age(age_group)
 
+    @property
+    def infection_status(self):
+        """Person's current :class:`InfectionStatus`.
+
+        """
+        if self.store is None:
+            return self._infection_status
+        return _STATUS_BY_VALUE[self.store.status[self.store_index]]
+
+    @infection_status.setter
+    def infection_status(self, status):
+        if self.store is None:
+            self._infection_status = status
+        else:
+            self.store.status[self.store_index] = status.value
+        # Keep the cell's index of infectious people up to date
+        self.microcell.cell.update_infectious_person(self)
+
+    @property
+    def next_infection_status(self):
+        """Person's next :class:`InfectionStatus`, or None.
+
+        """
+        if self.store is None:
+            return self._next_infection_status
+        return _STATUS_BY_VALUE[self.store.next_status[self.store_index]]
+
+    @next_infection_status.setter
+    def next_infection_status(self, status):
+        if self.store is None:
+            self._next_infection_status = status
+        else:
+            self.store.next_status[self.store_index] = \
+                0 if status is None else status.value
+
+    @property
+    def time_of_status_change(self):
+        """Time of the person's next status change, or None.
+
+        """
+        if self.store is None:
+            return self._time_of_status_change
+        time = self.store.time_of_status_change[self.store_index]
+        return None if time != time else time
+
+    @time_of_status_change.setter
+    def time_of_status_change(self, time):
+        if self.store is None:
+            self._time_of_status_change = time
+        else:
+            self.store.time_of_status_change[self.store_index] = \
+                math.nan if time is None else time
+        # Keep the cell's calendar of status changes up to date
+        self.microcell.cell.update_status_calendar(self)
+
+    @property
+    def infectiousness(self):
+        """Person's current infectiousness.
+
+        """
+        if self.store is None:
+            return self._infectiousness
+        return self.store.infectiousness[self.store_index]
+
+    @infectiousness.setter
+    def infectiousness(self, infectiousness):
+        if self.store is None:
+            self._infectiousness = infectiousness
+        else:
+            self.store.infectiousness[self.store_index] = infectiousness
+
+    @property
+    def initial_infectiousness(self):
+        """Person's infectiousness at the start of their infection.
+
+        """
+        if self.store is None:
+            return self._initial_infectiousness
+        return self.store.initial_infectiousness[self.store_index]
+
+    @initial_infectiousness.setter
+    def initial_infectiousness(self, infectiousness):
+        if self.store is None:
+            self._initial_infectiousness = infectiousness
+        else:
+            self.store.initial_infectiousness[self.store_index] = \
+                infectiousness
+
+    @property
+    def age_group(self):
+        """Index of the person's age group.
+
+        """
+        if self.store is None:
+            return self._age_group
+        return int(self.store.age_group[self.store_index])
+
+    @age_group.setter
+    def age_group(self, age_group):
+        if self.store is None:
+            self._age_group = age_group
+        else:
+            self.store.age_group[self.store_index] = age_group
+
     def set_random_age(self, age_group=None):
         """Set random age of person, and save index of their age group.
         Note that the max age in the 80+ group is 84 here, however the precise
@@ -75,9 +190,10 @@ class Person:
         school/workplaces) so this does not cause any issues.
 
         """
-        if Parameters.instance().use_ages:
+        parameters = Parameters.instance()
+        if parameters.use_ages:
             if age_group is None:
-                group_probs = Parameters.instance().age_proportions
+                group_probs = parameters.age_proportions
                 self.age_group = random.choices(range(len(group_probs)),
                                                 weights=group_probs)[0]
             else:
@@ -149,7 +265,8 @@ class Person:
 
     def update_status(self,
                       new_status: InfectionStatus) -> None:
-        """Update Person's Infection Status.
+        """Update Person's Infection Status, recording the change in the
+        event log of the population if one is attached.
 
         Parameters
         ----------
@@ -157,9 +274,13 @@ class Person:
             Person's new status
 
         """
+        old_status = self.infection_status
         self.microcell.notify_person_status_change(
-            self.infection_status, new_status, self.age_group)
+            old_status, new_status, self.age_group)
         self.infection_status = new_status
+        event_log = self.microcell.cell.event_log
+        if event_log is not None:
+            event_log.record_status_change(self, old_status, new_status)
 
         if self.infection_status == InfectionStatus.Susceptible and \
                 self.household is not None:
@@ -244,8 +365,13 @@ class Person:
             _increment_compartment(-1, self.infection_status,
                                    self.age_group)
         self.microcell.cell.persons.remove(self)
+        self.microcell.cell.persons_version += 1
+        self.microcell.cell.infectious_persons.pop(self, None)
+        self.microcell.cell.status_calendar.unschedule(self)
         self.microcell.persons.remove(self)
         self.household.persons.remove(self)
+        if self.store is not None:
+            self.store.remove_person(self)
 
     def set_id(self, id: str):
         """Updates id of current person (i.e. for input from file).
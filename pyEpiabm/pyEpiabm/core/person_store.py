@@ -0,0 +1,270 @@
+#
+# Columnar store of per-person state
+#
+
+import math
+import typing
+
+import numpy as np
+
+from pyEpiabm.property import InfectionStatus
+
+
+class PersonStore:
+    """Class storing the per-person state read and written in the hot loops
+    of a simulation as a set of NumPy columns (structure-of-arrays), with
+    one row per :class:`Person`.
+
+    Once a person is added to the store, their infection status, next
+    infection status, time of status change, (initial) infectiousness and
+    age group are held in the columns below, and the corresponding
+    :class:`Person` attributes become thin views onto that row. This allows
+    sweeps to select and update many people at once with array operations,
+    while existing code can keep using the object interface.
+
+    Missing values are encoded as ``0`` for the status columns (``None``
+    next status), ``NaN`` for the float columns and ``-1`` for the index
+    columns.
+
+    Attributes
+    ----------
+    persons : list
+        List of :class:`Person` s, with the person at position i stored in
+        row i of each column
+    status : np.ndarray
+        Value of each person's current :class:`InfectionStatus`
+    next_status : np.ndarray
+        Value of each person's next :class:`InfectionStatus` (0 if None)
+    age_group : np.ndarray
+        Age group index of each person
+    infectiousness : np.ndarray
+        Current infectiousness of each person
+    initial_infectiousness : np.ndarray
+        Infectiousness of each person at the start of their infection
+    time_of_status_change : np.ndarray
+        Time of each person's next status change (NaN if None)
+    infection_start_time : np.ndarray
+        Start time of each person's latest infection (NaN if never infected)
+    cell_index : np.ndarray
+        Index of each person's cell in :attr:`cells`
+    microcell_index : np.ndarray
+        Index of each person's microcell in :attr:`microcells`
+    household_index : np.ndarray
+        Index of each person's household in :attr:`households` (-1 if None)
+    active : np.ndarray
+        Whether each person is still part of the population (travellers
+        which have left are kept as inactive rows)
+
+    """
+    _columns = {'status': np.int8, 'next_status': np.int8,
+                'age_group': np.int16, 'infectiousness': np.float64,
+                'initial_infectiousness': np.float64,
+                'time_of_status_change': np.float64,
+                'infection_start_time': np.float64,
+                'cell_index': np.int32, 'microcell_index': np.int32,
+                'household_index': np.int32, 'active': np.bool_}
+
+    def __init__(self, capacity: int = 0):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        capacity : int
+            Number of rows to allocate initially. The store grows as
+            required, so this is only used to avoid reallocations when the
+            population size is known in advance
+
+        """
+        self.persons = []
+        self.cells = []
+        self.microcells = []
+        self.households = []
+        self._cell_indices = {}
+        self._microcell_indices = {}
+        self._household_indices = {}
+        self._size = 0
+        self._capacity = max(int(capacity), 1)
+        for name, dtype in PersonStore._columns.items():
+            setattr(self, name, np.zeros(self._capacity, dtype=dtype))
+
+    def __len__(self):
+        """Returns the number of rows in the store (including inactive
+        ones).
+
+        """
+        return self._size
+
+    def __repr__(self):
+        """Returns a string representation of the PersonStore.
+
+        Returns
+        -------
+        str
+            String representation of the PersonStore
+
+        """
+        return f"PersonStore with {self._size} people " \
+               f"({int(np.sum(self.active[:self._size]))} active)."
+
+    def _grow(self, capacity: int):
+        """Reallocates each column with (at least) the given capacity,
+        keeping the existing rows.
+
+        Parameters
+        ----------
+        capacity : int
+            Minimum number of rows required
+
+        """
+        new_capacity = max(capacity, 2 * self._capacity)
+        for name, dtype in PersonStore._columns.items():
+            column = np.zeros(new_capacity, dtype=dtype)
+            column[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, column)
+        self._capacity = new_capacity
+
+    @staticmethod
+    def _index_of(obj, objects: typing.List, indices: typing.Dict) -> int:
+        """Returns the index of an object in one of the lookup lists,
+        appending it if it has not been seen before.
+
+        """
+        if obj is None:
+            return -1
+        try:
+            return indices[obj]
+        except KeyError:
+            indices[obj] = len(objects)
+            objects.append(obj)
+            return indices[obj]
+
+    def add_person(self, person, microcell=None) -> int:
+        """Adds a :class:`Person` to the store, copying their current state
+        into a new row. Afterwards the person's attributes read from and
+        write to this row.
+
+        Parameters
+        ----------
+        person : Person
+            Person to add to the store
+        microcell : Microcell
+            Microcell the person is being added to. Defaults to the person's
+            current microcell
+
+        Returns
+        -------
+        int
+            Row of the person in the store
+
+        """
+        if person.store is not None:
+            raise ValueError(f"Person {person.id} is already in a store")
+        if self._size == self._capacity:
+            self._grow(self._size + 1)
+        microcell = person.microcell if microcell is None else microcell
+        index = self._size
+        next_status = person.next_infection_status
+        time = person.time_of_status_change
+
+        self.status[index] = person.infection_status.value
+        self.next_status[index] = 0 if next_status is None \
+            else next_status.value
+        self.age_group[index] = person.age_group
+        self.infectiousness[index] = person.infectiousness
+        self.initial_infectiousness[index] = person.initial_infectiousness
+        self.time_of_status_change[index] = math.nan if time is None \
+            else time
+        self.infection_start_time[index] = person.infection_start_times[-1] \
+            if person.infection_start_times else math.nan
+        self.cell_index[index] = self._index_of(
+            microcell.cell, self.cells, self._cell_indices)
+        self.microcell_index[index] = self._index_of(
+            microcell, self.microcells, self._microcell_indices)
+        self.household_index[index] = self._index_of(
+            person.household, self.households, self._household_indices)
+        self.active[index] = True
+
+        self.persons.append(person)
+        self._size += 1
+        person.store = self
+        person.store_index = index
+        return index
+
+    def remove_person(self, person):
+        """Marks a :class:`Person` as no longer part of the population. The
+        row is kept so that indices of other people are unchanged.
+
+        Parameters
+        ----------
+        person : Person
+            Person to remove
+
+        """
+        self.active[person.store_index] = False
+
+    def set_household(self, person, household):
+        """Records the household of a :class:`Person` in the store.
+
+        Parameters
+        ----------
+        person : Person
+            Person whose household has changed
+        household : Household
+            Person's new household
+
+        """
+        self.household_index[person.store_index] = self._index_of(
+            household, self.households, self._household_indices)
+
+    def active_indices(self) -> np.ndarray:
+        """Returns the rows of all people still in the population.
+
+        Returns
+        -------
+        np.ndarray
+            Array of row indices
+
+        """
+        return np.flatnonzero(self.active[:self._size])
+
+    def status_mask(self, statuses: typing.Iterable[InfectionStatus]) \
+            -> np.ndarray:
+        """Returns a boolean mask of active people whose current status is
+        one of the given statuses.
+
+        Parameters
+        ----------
+        statuses : typing.Iterable[InfectionStatus]
+            Statuses to select
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask over the rows of the store
+
+        """
+        values = [status.value for status in statuses]
+        return np.isin(self.status[:self._size], values) & \
+            self.active[:self._size]
+
+    @classmethod
+    def from_population(cls, population):
+        """Builds a store containing every :class:`Person` in a
+        :class:`Population`, in cell and then person order.
+
+        Parameters
+        ----------
+        population : Population
+            Population whose people should be stored
+
+        Returns
+        -------
+        PersonStore
+            Store containing the population
+
+        """
+        store = cls(capacity=population.total_people())
+        for cell in population.cells:
+            for person in cell.persons:
+                store.add_person(person)
+        return store
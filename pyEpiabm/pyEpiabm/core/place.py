@@ -7,6 +7,7 @@ from numbers import Number
 
 from pyEpiabm.property import PlaceType
 
+from ._indexed_list import _IndexedList
 from .person import Person
 
 
@@ -35,8 +36,8 @@ class Place:
 
         """
         self._location = loc
-        self.persons = []
-        self.person_groups = {0: []}
+        self.persons = _IndexedList()
+        self.person_groups = {0: _IndexedList()}
         self.num_person_groups = 1
         self.place_type = place_type
         self.susceptibility = 0
@@ -102,7 +103,7 @@ class Place:
         if person_group in self.person_groups.keys():
             self.person_groups[person_group].append(person)
         else:
-            self.person_groups[person_group] = [person]
+            self.person_groups[person_group] = _IndexedList([person])
             self.num_person_groups += 1
         person.add_place(self, person_group)
 
@@ -153,5 +154,6 @@ class Place:
         for group in groups_to_empty:
             if group not in self.person_groups.keys():
                 continue
-            for person in self.person_groups[group]:
+            # Removing from the end is quickest, as nobody moves position
+            for person in reversed(list(self.person_groups[group])):
                 self.remove_person(person)
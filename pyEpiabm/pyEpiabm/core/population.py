@@ -3,8 +3,18 @@
 #
 from queue import PriorityQueue
 
+import numpy as np
+
+from pyEpiabm.property import InfectionStatus
+
 from .cell import Cell
 from .person import Person
+from .person_store import PersonStore
+
+# Rows of the compartment counts of the statuses in which a person is
+# infectious
+_INFECTIOUS_ROWS = [status.value - 1 for status in InfectionStatus
+                    if status.name.startswith('Infect')]
 
 
 class Population:
@@ -15,12 +25,19 @@ class Population:
     def __init__(self):
         """Constructor Method.
         List of travellers is used when introducing individuals in TravelSweep
-        and when isolating them in TravelIsolation.
+        and when isolating them in TravelIsolation. The
+        :class:`InterventionModifiers` of the population are set by
+        :class:`InterventionSweep`.
 
         """
         self.cells = []
         self.vaccine_queue = PriorityQueue()
         self.travellers = []
+        self.person_store = None
+        self.intervention_modifiers = None
+        self._compartment_counts = None
+        self._compartment_totals = None
+        self.event_log = None
 
     def __repr__(self):
         """Returns a string representation of a Population.
@@ -46,6 +63,8 @@ class Population:
         for i in range(n):
             self.cells.append(Cell())
             self.cells[i + base_num].set_id(str(i + base_num), self.cells)
+            self.cells[i + base_num].person_store = self.person_store
+            self.cells[i + base_num].event_log = self.event_log
 
     def total_people(self):
         """Returns the total number of people in the population.
@@ -58,6 +77,114 @@ class Population:
             count += len(cell.persons)
         return count
 
+    def infectious_persons(self):
+        """Returns every infectious person in the population, read from
+        the index of infectious people maintained by each :class:`Cell`.
+
+        Returns
+        -------
+        list
+            List of infectious :class:`Person` s, in cell order
+
+        """
+        return [person for cell in self.cells
+                for person in cell.infectors()]
+
+    def compartment_counts(self, by_cell: bool = False) -> np.ndarray:
+        """Returns the number of people in each compartment.
+
+        The first time this is called (and again whenever cells have been
+        added), the compartment counters of the cells are moved into a
+        single population-wide array, indexed by cell, infection status and
+        age group, of which each cell's counter then holds a slice. The
+        counters also keep the totals over all cells up to date as people
+        change status, so both arrays are returned without any further
+        work. They are updated in place, so should be copied if they are
+        to be kept, and should not be modified.
+
+        Parameters
+        ----------
+        by_cell : bool
+            Whether to return the counts of each cell rather than their
+            sum
+
+        Returns
+        -------
+        np.ndarray
+            Counts indexed by infection status (row ``status.value - 1``)
+            and age group, preceded by the cell if ``by_cell`` is True
+
+        """
+        counts = self._compartment_counts
+        if counts is None or len(counts) != len(self.cells) or (
+                self.cells and self.cells[-1].compartment_counter._totals
+                is not self._compartment_totals):
+            self._bind_compartment_counts()
+        return self._compartment_counts if by_cell \
+            else self._compartment_totals
+
+    def _bind_compartment_counts(self):
+        """Moves the compartment counters of the cells into a single
+        population-wide array, as described in :meth:`compartment_counts`.
+
+        """
+        if not self.cells:
+            counts = np.zeros((0, len(InfectionStatus), 1), dtype=int)
+        else:
+            counts = np.array([cell.compartment_counter.counts
+                               for cell in self.cells], dtype=int)
+        totals = counts.sum(axis=0)
+        for cell, cell_counts in zip(self.cells, counts):
+            cell.compartment_counter._set_counts(cell_counts, totals)
+        self._compartment_counts = counts
+        self._compartment_totals = totals
+
+    def number_infectious(self):
+        """Returns the total number of infectious people in the
+        population, read from the totals of the compartment counters.
+
+        Returns
+        -------
+        int
+            Number of infectious people
+
+        """
+        return int(self.compartment_counts()[_INFECTIOUS_ROWS].sum())
+
+    def build_person_store(self):
+        """Moves the state of every :class:`Person` in the population into a
+        columnar :class:`PersonStore`. People added to the population
+        afterwards are appended to the same store. If a store already
+        exists, it is returned unchanged.
+
+        Returns
+        -------
+        PersonStore
+            Store holding the state of the population
+
+        """
+        if self.person_store is None:
+            self.person_store = PersonStore.from_population(self)
+            for cell in self.cells:
+                cell.person_store = self.person_store
+        return self.person_store
+
+    def set_event_log(self, event_log):
+        """Attaches a log of infection status changes to the population
+        and its cells, which is given a record for each change of the
+        status of a person and for each infection by the transmission
+        sweeps (see :class:`pyEpiabm.output._EventLogWriter`).
+
+        Parameters
+        ----------
+        event_log : _EventLogWriter
+            Log to attach, or None to stop recording
+
+        """
+        self.event_log = event_log
+        for cell in self.cells:
+            cell.event_log = event_log
+
     def enqueue_vaccine(self, priority, counter, person: Person):
         """Add person to queue for processing when mass vaccination
         begins.
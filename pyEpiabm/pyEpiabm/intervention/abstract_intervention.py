@@ -52,6 +52,26 @@ class AbstractIntervention:
             self.case_threshold <= num_cases
         )
 
+    def set_attribute(self, obj, name: str, value):
+        """Sets an intervention attribute of a person or microcell (such
+        as `isolation_start_time`), and records it in the
+        :class:`InterventionModifiers` of the population, if it has them.
+
+        Parameters
+        ----------
+        obj : Person or Microcell
+            Person or microcell to set the attribute of
+        name : str
+            Name of the attribute
+        value : float or bool
+            Value of the attribute
+
+        """
+        setattr(obj, name, value)
+        modifiers = getattr(self._population, 'intervention_modifiers', None)
+        if modifiers is not None:
+            modifiers.record(obj, name, value)
+
     def __call__(self, time: float):
         """Run intervention.
 
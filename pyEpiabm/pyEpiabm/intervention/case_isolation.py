@@ -50,15 +50,17 @@ class CaseIsolation(AbstractIntervention):
                     if time > person.isolation_start_time + self.\
                               isolation_duration:
                         # Stop isolating people after their isolation period
-                        person.isolation_start_time = None
+                        self.set_attribute(person, 'isolation_start_time',
+                                           None)
                 else:
                     if self.person_selection_method(person):
                         r = random.random()
                         # Require symptomatic individuals to self-isolate
                         # with given probability
                         if r < self.isolation_probability:
-                            person.isolation_start_time = time + self.\
-                                                          isolation_delay
+                            self.set_attribute(
+                                person, 'isolation_start_time',
+                                time + self.isolation_delay)
                             if person.date_positive is not None:
                                 self._population.test_isolate_count = [0, 0]
                                 if person.is_symptomatic():
@@ -97,4 +99,4 @@ class CaseIsolation(AbstractIntervention):
             for person in cell.persons:
                 if (hasattr(person, 'isolation_start_time')) and (
                         person.isolation_start_time is not None):
-                    person.isolation_start_time = None
+                    self.set_attribute(person, 'isolation_start_time', None)
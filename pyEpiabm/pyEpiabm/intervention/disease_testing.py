@@ -41,17 +41,9 @@ class DiseaseTesting(AbstractIntervention):
 
         """
         for cell in self._population.cells:
-            num_pcr = 0
-            num_lft = 0
-            while (num_pcr < self.testing_capacity[0] and not
-                   cell.PCR_queue.empty()):
-                person = cell.PCR_queue.get()
-                num_pcr += 1
+            for person in cell.PCR_queue.drain(self.testing_capacity[0]):
                 self.do_testing(time, person, 0)
-            while (num_lft < self.testing_capacity[1] and not
-                   cell.LFT_queue.empty()):
-                person = cell.LFT_queue.get()
-                num_lft += 1
+            for person in cell.LFT_queue.drain(self.testing_capacity[1]):
                 self.do_testing(time, person, 1)
 
     def do_testing(self, time, person, index):
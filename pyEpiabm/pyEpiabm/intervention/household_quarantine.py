@@ -52,7 +52,8 @@ class HouseholdQuarantine(AbstractIntervention):
                     if time > person.quarantine_start_time + self.\
                               quarantine_duration:
                         # Stop quarantine after quarantine period
-                        person.quarantine_start_time = None
+                        self.set_attribute(person, 'quarantine_start_time',
+                                           None)
 
                 if (hasattr(person, 'isolation_start_time')) and (
                         person.isolation_start_time == time):
@@ -68,9 +69,10 @@ class HouseholdQuarantine(AbstractIntervention):
                                 r_indiv = random.random()
                                 if r_indiv < \
                                         self.quarantine_individual_compliant:
-                                    household_person.\
-                                        quarantine_start_time = \
-                                        time + self.quarantine_delay
+                                    self.set_attribute(
+                                        household_person,
+                                        'quarantine_start_time',
+                                        time + self.quarantine_delay)
 
     def turn_off(self):
         """Turn off intervention after intervention stops being active.
@@ -80,4 +82,4 @@ class HouseholdQuarantine(AbstractIntervention):
             for person in cell.persons:
                 if (hasattr(person, 'quarantine_start_time')) and (
                         person.quarantine_start_time is not None):
-                    person.quarantine_start_time = None
+                    self.set_attribute(person, 'quarantine_start_time', None)
@@ -45,12 +45,13 @@ class PlaceClosure(AbstractIntervention):
                     if time > microcell.closure_start_time + self.\
                               closure_duration:
                         # Reopen places after their closure period
-                        microcell.closure_start_time = None
+                        self.set_attribute(microcell, 'closure_start_time',
+                                           None)
                 else:
                     if (microcell.count_infectious() >= self.
                             case_microcell_threshold):
-                        microcell.closure_start_time = time + self.\
-                                                        closure_delay
+                        self.set_attribute(microcell, 'closure_start_time',
+                                           time + self.closure_delay)
 
     def turn_off(self):
         """Turn off intervention after intervention stops being active.
@@ -60,4 +61,4 @@ class PlaceClosure(AbstractIntervention):
             for microcell in cell.microcells:
                 if (hasattr(microcell, 'closure_start_time')) and (
                         microcell.closure_start_time is not None):
-                    microcell.closure_start_time = None
+                    self.set_attribute(microcell, 'closure_start_time', None)
@@ -53,22 +53,23 @@ class SocialDistancing(AbstractIntervention):
                     if time > microcell.distancing_start_time + self.\
                               distancing_duration:
                         # Stop social distancing after their distancing period
-                        microcell.distancing_start_time = None
+                        self.set_attribute(microcell,
+                                           'distancing_start_time', None)
                 else:
                     if microcell.count_infectious() >= self.\
                                 case_microcell_threshold:
-                        microcell.distancing_start_time = time + self.\
-                                                        distancing_delay
+                        self.set_attribute(microcell,
+                                           'distancing_start_time',
+                                           time + self.distancing_delay)
                         for person in microcell.persons:
                             if Parameters.instance().use_ages:
                                 r_age = random.random()
-                                if r_age < self.distancing_enhanced_prob[
-                                            person.age_group]:
-                                    person.distancing_enhanced = True
-                                else:
-                                    person.distancing_enhanced = False
+                                enhanced = r_age < self.\
+                                    distancing_enhanced_prob[person.age_group]
                             else:
-                                person.distancing_enhanced = False
+                                enhanced = False
+                            self.set_attribute(person, 'distancing_enhanced',
+                                               bool(enhanced))
 
     def turn_off(self):
         """Turn off intervention after intervention stops being active.
@@ -78,4 +79,5 @@ class SocialDistancing(AbstractIntervention):
             for microcell in cell.microcells:
                 if (hasattr(microcell, 'distancing_start_time')) and (
                         microcell.distancing_start_time is not None):
-                    microcell.distancing_start_time = None
+                    self.set_attribute(microcell, 'distancing_start_time',
+                                       None)
@@ -56,7 +56,8 @@ class TravelIsolation(AbstractIntervention):
                                 self.isolation_duration:
                             # Stop isolating people after their isolation
                             # period
-                            person.travel_isolation_start_time = None
+                            self.set_attribute(
+                                person, 'travel_isolation_start_time', None)
 
                             # Check if need to assign to new household
                             if self.hotel_isolate == 1:
@@ -108,8 +109,9 @@ class TravelIsolation(AbstractIntervention):
                                     person.household.isolation_location = \
                                         True
 
-                            person.travel_isolation_start_time = time + \
-                                self.isolation_delay
+                            self.set_attribute(
+                                person, 'travel_isolation_start_time',
+                                time + self.isolation_delay)
 
     def person_selection_method(self, person):
         """Method to determine whether a person is eligible for isolation.
@@ -141,4 +143,5 @@ class TravelIsolation(AbstractIntervention):
         for person in self._population.travellers:
             if (hasattr(person, 'travel_isolation_start_time')) and (
                     person.travel_isolation_start_time is not None):
-                person.travel_isolation_start_time = None
+                self.set_attribute(person, 'travel_isolation_start_time',
+                                   None)
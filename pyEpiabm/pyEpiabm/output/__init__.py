@@ -8,7 +8,12 @@ simulation.
 """
 
 from .abstract_reporter import AbstractReporter
+from ._table_writer import _TableWriter
 from ._csv_dict_writer import _CsvDictWriter
+from ._npy_table_writer import _NpyTableWriter
+from ._event_log_writer import _EventLogWriter
+from ._arrow_table_writer import _ArrowTableWriter
+from ._history_writer import _HistoryWriter
 from ._csv_writer import _CsvWriter
 from .new_cases_writer import NewCasesWriter
 from .age_stratified_new_cases_writer import AgeStratifiedNewCasesWriter
@@ -0,0 +1,107 @@
+#
+# Write data in dicts to a Parquet or Arrow IPC (Feather) file
+#
+
+import typing
+
+from pyEpiabm.output._table_writer import _TableWriter
+
+
+class _ArrowTableWriter(_TableWriter):
+    """Writer of rows of data in dicts to a columnar Parquet file, or an
+    Arrow IPC file (the Feather version 2 format), with one column per
+    category. Each block of rows is written as one row group or record
+    batch, as described in :class:`_TableWriter`, and the file can be read
+    with :func:`pandas.read_parquet` or :func:`pandas.read_feather`.
+
+    This requires the optional `pyarrow` package. The types of the columns
+    are those of the first block, and the file is only complete once the
+    writer is closed, so writing cannot be continued from a checkpoint.
+
+    """
+    extensions = {'parquet': '.parquet', 'feather': '.feather'}
+
+    def __init__(self, folder: str, filename: str, fieldnames: typing.List,
+                 clear_folder: bool = False, flush_interval: int = 1,
+                 output_format: str = 'parquet'):
+        """Initialises a file to store output in, and which categories
+        to record.
+
+        Parameters
+        ----------
+        folder : str
+            Output folder path
+        filename : str
+            Output file name
+        fieldnames : typing.List
+            List of categories to be saved
+        clear_folder : bool
+            Whether to empty the folder before saving results
+        flush_interval : int
+            Number of timesteps between writes of the buffered rows to file
+        output_format : str
+            Either 'parquet' or 'feather'
+
+        """
+        if output_format not in self.extensions:
+            raise ValueError(f"Unknown output format {output_format}, "
+                             + f"expected one of {list(self.extensions)}")
+        try:
+            import pyarrow
+            import pyarrow.ipc
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(f"Writing {output_format} files requires the"
+                              + " pyarrow package") from e
+        super().__init__(folder, filename, fieldnames, clear_folder,
+                         flush_interval)
+        self._pa = pyarrow
+        self.output_format = output_format
+        self.f = open(self.filepath, 'wb')
+        self.writer = None
+        self._schema = None
+
+    def __getstate__(self):
+        """Raises an error, as the file cannot be continued after the
+        writer is unpickled.
+
+        """
+        raise TypeError(f"{self.output_format} output cannot be saved in a"
+                        + " checkpoint")
+
+    def reopen(self, folder: str = None):
+        """Raises an error, as writing cannot be continued from a
+        checkpoint.
+
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Writes the buffered rows to file and closes it, completing the
+        file.
+
+        """
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        self.f.close()
+
+    def _write_block(self, rows: typing.List[typing.Dict]):
+        """Writes a block of rows to file as one row group or record batch.
+
+        Parameters
+        ----------
+        rows : typing.List[dict]
+            Rows to write
+
+        """
+        table = self._pa.Table.from_pydict(self._columns(rows))
+        if self.writer is None:
+            self._schema = table.schema
+            if self.output_format == 'parquet':
+                self.writer = self._pa.parquet.ParquetWriter(self.f,
+                                                             self._schema)
+            else:
+                self.writer = self._pa.ipc.new_file(self.f, self._schema)
+        self.writer.write_table(table.cast(self._schema))
@@ -8,12 +8,19 @@ import os
 import pandas as pd
 import logging
 
-from pyEpiabm.output.abstract_reporter import AbstractReporter
+from pyEpiabm.output._table_writer import _TableWriter
 
 
-class _CsvDictWriter(AbstractReporter):
+class _CsvDictWriter(_TableWriter):
+    """Writer of rows of data in dicts to a csv file, with one column per
+    category. The rows are buffered and written in blocks as described in
+    :class:`_TableWriter`.
+
+    """
+    extensions = {'csv': '.csv'}
+
     def __init__(self, folder: str, filename: str, fieldnames: typing.List,
-                 clear_folder: bool = False):
+                 clear_folder: bool = False, flush_interval: int = 1):
         """Initialises a file to store output in, and which categories
         to record.
 
@@ -27,45 +34,53 @@ class _CsvDictWriter(AbstractReporter):
             List of categories to be saved
         clear_folder : bool
             Whether to empty the folder before saving results
+        flush_interval : int
+            Number of timesteps between writes of the buffered rows to file
 
         """
-        super().__init__(folder, clear_folder)
-        self.filename = filename
-        self.filepath = os.path.join(folder, filename)
-        self.filepath_without_extension = os.path.join(
-            folder, os.path.splitext(filename)[0])
-        self.fieldnames = fieldnames
-
-        self.f = open(os.path.join(folder, filename), 'w', newline='')
+        super().__init__(folder, filename, fieldnames, clear_folder,
+                         flush_interval)
+        self.f = open(self.filepath, 'w', newline='')
         self.writer = csv.DictWriter(
             self.f, fieldnames=fieldnames, delimiter=',')
         self.writer.writeheader()
 
-    def __del__(self):
-        """Closes the file when the simulation is finished.
-        Required for file data to be further used.
+    def reopen(self, folder: str = None):
+        """Reopens the output file of an unpickled writer, so that writing
+        continues from where it was when the writer was pickled.
+
+        Parameters
+        ----------
+        folder : str
+            Absolute path to a folder to write to instead of the original
+            one
 
         """
-        if self.f:
-            self.f.close()
+        self.f, self.filepath = self._reopen_file(self.filepath, folder,
+                                                  newline='')
+        self.folder = os.path.dirname(self.filepath)
+        self.filepath_without_extension = os.path.splitext(
+            self.filepath)[0]
+        self.writer = csv.DictWriter(
+            self.f, fieldnames=self.fieldnames, delimiter=',')
 
-    def write(self, row: typing.Dict):
-        """Writes data to file.
+    def _write_block(self, rows: typing.List[typing.Dict]):
+        """Writes a block of rows to file.
 
         Parameters
         ----------
-        row : dict
-            Dictionary of data to be saved
+        rows : typing.List[dict]
+            Rows to write
 
         """
-        self.writer.writerow(row)
-        self.f.flush()
+        self.writer.writerows(rows)
 
     def compress(self):
         """Compresses the csv file and deletes the unzipped csv.
         """
         output_filepath = f"{self.filepath_without_extension}.zip"
         logging.info(f"Zip file created for {self.filename}")
+        self.flush()
         df = pd.read_csv(self.filepath)
         df.to_csv(output_filepath, index=False, compression={'method': 'zip'})
         self.f.close()
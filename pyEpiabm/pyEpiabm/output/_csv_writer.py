@@ -29,7 +29,8 @@ class _CsvWriter(AbstractReporter):
         """
         super().__init__(folder, clear_folder)
 
-        self.f = open(os.path.join(folder, filename), 'w')
+        self.filepath = os.path.join(folder, filename)
+        self.f = open(self.filepath, 'w')
         self.writer = csv.writer(
             self.f, delimiter=',')
         self.writer.writerow(fieldnames)
@@ -42,6 +43,21 @@ class _CsvWriter(AbstractReporter):
         if self.f:
             self.f.close()
 
+    def reopen(self, folder: str = None):
+        """Reopens the output file of an unpickled writer, so that writing
+        continues from where it was when the writer was pickled.
+
+        Parameters
+        ----------
+        folder : str
+            Absolute path to a folder to write to instead of the original
+            one
+
+        """
+        self.f, self.filepath = self._reopen_file(self.filepath, folder)
+        self.folder = os.path.dirname(self.filepath)
+        self.writer = csv.writer(self.f, delimiter=',')
+
     def write(self, row: typing.List):
         """Writes data to file.
 
@@ -0,0 +1,293 @@
+#
+# Write a log of the infection status changes of people
+#
+
+import csv
+import os
+import typing
+
+import numpy as np
+import pandas as pd
+
+from pyEpiabm.property import InfectionStatus, PlaceType
+
+from pyEpiabm.output._npy_table_writer import _NpyTableWriter
+
+
+class _EventLogWriter(_NpyTableWriter):
+    """Writer of a sparse log of the infection history of a population,
+    with one record for each change of the infection status of a person,
+    as an alternative to the dense histories with one value per person at
+    every timestep.
+
+    Each record holds the time of the change, the index of the person, their
+    old and new status (as the values of :class:`InfectionStatus`), and, for
+    an infection, the index of the infector and the setting in which the
+    infection happened ('household', 'spatial' or the name of the
+    :class:`PlaceType` of a place), or -1 and an empty string otherwise.
+    People are indexed in the order of the cells and of the people within
+    each cell when the writer is created, followed by any people added later
+    in the order of their first record. Their ids are written to a csv file
+    next to the log, which can be read with :meth:`read_ids`.
+
+    Records are emitted by :meth:`Person.update_status` and by the
+    transmission sweeps (see :meth:`AbstractSweep.store_infection_periods`)
+    once the writer is attached to the population with
+    :meth:`Population.set_event_log`, and are buffered and written in
+    blocks as described in :class:`_NpyTableWriter`, with the statuses and
+    the setting (as its index in ``settings``) stored in single bytes. The
+    log can be read with :meth:`read`, and the dense history of the
+    statuses rebuilt from it with :meth:`dense_history`.
+
+    """
+    fields = ['time', 'person', 'old_status', 'new_status', 'infector',
+              'setting']
+    settings = ('', 'household', 'spatial') + tuple(
+        place_type.name for place_type in PlaceType)
+    _dtypes = [np.float64, np.int64, np.int8, np.int8, np.int64, np.int8]
+
+    def __init__(self, folder: str, filename: str, population,
+                 clear_folder: bool = False, flush_interval: int = 1):
+        """Initialises a file to store the log in, and indexes the people
+        of the population. A record is written for each person who is not
+        susceptible, with the same old and new status, so that their
+        status is known before any change.
+
+        Parameters
+        ----------
+        folder : str
+            Output folder path
+        filename : str
+            Output file name
+        population : Population
+            Population whose status changes are recorded
+        clear_folder : bool
+            Whether to empty the folder before saving results
+        flush_interval : int
+            Number of timesteps between writes of the buffered records to
+            file
+
+        """
+        super().__init__(folder, filename, self.fields, clear_folder,
+                         flush_interval)
+        self.ids_filepath = f"{self.filepath_without_extension}_ids.csv"
+        self.time = 0.0
+        self.person_ids = []
+        self._index = {}
+        self._infectors = {}
+        self._ids_written = 0
+        for cell in population.cells:
+            for person in cell.persons:
+                status = person.infection_status
+                if status != InfectionStatus.Susceptible:
+                    self.record_status_change(person, status, status)
+                else:
+                    self._person_index(person)
+        with open(self.ids_filepath, 'w', newline='') as f:
+            csv.writer(f).writerow(['person', 'id'])
+        self._write_ids()
+
+    def flush(self):
+        """Writes the buffered records to file, and the ids of any people
+        indexed since the last write.
+
+        """
+        super().flush()
+        self._write_ids()
+
+    def _write_ids(self):
+        """Appends the ids of the people indexed since the last write to
+        the csv file of ids.
+
+        """
+        if len(self.person_ids) > self._ids_written:
+            with open(self.ids_filepath, 'a', newline='') as f:
+                csv.writer(f).writerows(
+                    (i, self.person_ids[i]) for i in
+                    range(self._ids_written, len(self.person_ids)))
+            self._ids_written = len(self.person_ids)
+
+    def reopen(self, folder: str = None):
+        """Reopens the output file of an unpickled writer, so that writing
+        continues from where it was when the writer was pickled.
+
+        Parameters
+        ----------
+        folder : str
+            Absolute path to a folder to write to instead of the original
+            one
+
+        """
+        super().reopen(folder)
+        self.ids_filepath = f"{self.filepath_without_extension}_ids.csv"
+        with open(self.ids_filepath, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['person', 'id'])
+            writer.writerows(enumerate(self.person_ids))
+
+    def _person_index(self, person) -> int:
+        """Returns the index of a person, indexing them if they are new.
+
+        """
+        index = self._index.get(person)
+        if index is None:
+            index = self._index[person] = len(self.person_ids)
+            self.person_ids.append(person.id)
+        return index
+
+    def record_infector(self, infectee, infector, setting: str = None):
+        """Records the infector of a person who is to be infected, and the
+        setting of the infection, to be written with the next change of
+        status of the infectee. If several infectors are recorded for the
+        same person, the last one is kept.
+
+        Parameters
+        ----------
+        infectee : Person
+            Person who is to be infected
+        infector : Person
+            Infector of the person
+        setting : str
+            Setting in which the infection happened
+
+        """
+        self._infectors[infectee] = (self._person_index(infector),
+                                     setting or '')
+
+    def record_status_change(self, person, old_status: InfectionStatus,
+                             new_status: InfectionStatus):
+        """Records a change of the infection status of a person, at the
+        current ``time`` of the writer.
+
+        Parameters
+        ----------
+        person : Person
+            Person whose status changed
+        old_status : InfectionStatus
+            Person's old infection status
+        new_status : InfectionStatus
+            Person's new infection status
+
+        """
+        infector, setting = self._infectors.pop(person, (-1, ''))
+        self.write({'time': self.time, 'person': self._person_index(person),
+                    'old_status': old_status.value,
+                    'new_status': new_status.value,
+                    'infector': infector,
+                    'setting': self.settings.index(setting)})
+
+    def _write_block(self, rows: typing.List[typing.Dict]):
+        """Writes a block of records to file as a record array.
+
+        Parameters
+        ----------
+        rows : typing.List[dict]
+            Records to write
+
+        """
+        block = np.rec.fromarrays(
+            [np.asarray(values, dtype=dtype) for values, dtype
+             in zip(self._columns(rows).values(), self._dtypes)],
+            names=self.fields)
+        np.save(self.f, block, allow_pickle=False)
+
+    @staticmethod
+    def read(filepath: str) -> pd.DataFrame:
+        """Reads all the records of a log.
+
+        Parameters
+        ----------
+        filepath : str
+            Path of the log
+
+        Returns
+        -------
+        pd.DataFrame
+            Records of the log, with the name of the setting of each
+            infection, and with no rows if the log is empty
+
+        """
+        events = _NpyTableWriter.read(filepath)
+        if events.empty:
+            return pd.DataFrame(columns=_EventLogWriter.fields)
+        events['setting'] = np.array(_EventLogWriter.settings,
+                                     dtype=object)[events['setting']]
+        return events
+
+    @staticmethod
+    def dense_history(events: pd.DataFrame, times: typing.Sequence,
+                      num_persons: int = None) -> np.ndarray:
+        """Rebuilds the infection status of each person at each of the
+        given times from a log of status changes, as read with
+        :meth:`read`.
+
+        The status of a person at a time is their new status in their last
+        record up to that time, or the old status of their first record
+        before it. People without any record are susceptible.
+
+        Parameters
+        ----------
+        events : pd.DataFrame
+            Log of status changes
+        times : typing.Sequence
+            Increasing times at which to give the statuses
+        num_persons : int
+            Number of people, which defaults to one more than the largest
+            index in the log
+
+        Returns
+        -------
+        np.ndarray
+            Values of the :class:`InfectionStatus` of each person (in
+            columns) at each time (in rows)
+
+        """
+        times = np.asarray(times, dtype=float)
+        event_times = events['time'].to_numpy(dtype=float)
+        persons = events['person'].to_numpy(dtype=np.int64)
+        old_status = events['old_status'].to_numpy(dtype=np.int64)
+        new_status = events['new_status'].to_numpy(dtype=np.int64)
+        if num_persons is None:
+            num_persons = int(persons.max()) + 1 if len(persons) else 0
+
+        order = np.argsort(event_times, kind='stable')
+        persons = persons[order]
+        old_status = old_status[order]
+        new_status = new_status[order]
+        ends = np.searchsorted(event_times[order], times, side='right')
+
+        # Status of each person before their first record
+        status = np.full(num_persons, InfectionStatus.Susceptible.value)
+        _, first = np.unique(persons, return_index=True)
+        status[persons[first]] = old_status[first]
+
+        history = np.empty((len(times), num_persons), dtype=status.dtype)
+        start = 0
+        for k, end in enumerate(ends.tolist()):
+            if end > start:
+                # Only the last record of each person in the interval counts
+                recent = np.arange(end - 1, start - 1, -1)
+                _, last = np.unique(persons[recent], return_index=True)
+                status[persons[recent[last]]] = new_status[recent[last]]
+                start = end
+            history[k] = status
+        return history
+
+    @staticmethod
+    def read_ids(filepath: str) -> typing.List[str]:
+        """Reads the ids of the people of a log, from the csv file written
+        next to it.
+
+        Parameters
+        ----------
+        filepath : str
+            Path of the log
+
+        Returns
+        -------
+        typing.List[str]
+            Id of each person, in the order of their index
+
+        """
+        ids_filepath = f"{os.path.splitext(filepath)[0]}_ids.csv"
+        return pd.read_csv(ids_filepath, dtype={'id': str})['id'].tolist()
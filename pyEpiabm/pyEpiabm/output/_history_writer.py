@@ -0,0 +1,245 @@
+#
+# Stream per-person histories to a chunked, compressed binary file
+#
+
+import io
+import os
+import struct
+import typing
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from pyEpiabm.output.abstract_reporter import AbstractReporter
+
+
+class _HistoryWriter(AbstractReporter):
+    """Writer of the history of a value for each person (such as their
+    infection status or infectiousness) to a chunked, compressed binary
+    file, as an alternative to a csv file with one column per person.
+
+    The values at each timestep are given as one vector, in a fixed order
+    of the people. The vectors of `chunk_size` timesteps are held in memory
+    and then written as one chunk, so memory use does not grow with the
+    length of the simulation, and the file is compressed as it is written
+    rather than afterwards.
+
+    The file is a sequence of frames, each being the length of its data as
+    an 8-byte little-endian integer followed by an array in the ``.npy``
+    format, compressed with zlib. The first frame holds the ids of the
+    people, and each later frame holds a chunk as a record array with a
+    `time` field and a `values` field holding the vector of each
+    timestep. Chunks may be read one by one with :meth:`read_chunks`, or
+    all together with :meth:`read`.
+
+    """
+    def __init__(self, folder: str, filename: str,
+                 person_ids: typing.List[str], dtype=float,
+                 chunk_size: int = 64, compression_level: int = 6,
+                 clear_folder: bool = False):
+        """Initialises a file to store output in, writing the ids of the
+        people to it.
+
+        Parameters
+        ----------
+        folder : str
+            Output folder path
+        filename : str
+            Output file name
+        person_ids : typing.List[str]
+            Ids of the people, in the order of the values of each timestep
+        dtype : numpy.dtype
+            Type of the values
+        chunk_size : int
+            Number of timesteps in each chunk
+        compression_level : int
+            Level of zlib compression, from 0 (none) to 9 (smallest)
+        clear_folder : bool
+            Whether to empty the folder before saving results
+
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least one timestep")
+        super().__init__(folder, clear_folder)
+        self.filename = filename
+        self.filepath = os.path.join(folder, filename)
+        self.person_ids = person_ids
+        self.chunk_size = chunk_size
+        self.compression_level = compression_level
+        self._dtype = np.dtype([('time', np.float64),
+                                ('values', dtype, (len(person_ids),))])
+        self._chunk = np.zeros(chunk_size, dtype=self._dtype)
+        self._rows = 0
+
+        self.f = open(self.filepath, 'wb')
+        self._write_frame(np.array(person_ids, dtype=str))
+
+    def __del__(self):
+        """Writes any buffered timesteps and closes the file when the
+        simulation is finished. Required for file data to be further used.
+
+        """
+        if getattr(self, 'f', None):
+            self.close()
+
+    def __getstate__(self):
+        """Writes any buffered timesteps, and returns the state of the
+        writer for pickling, as in :meth:`AbstractReporter.__getstate__`.
+
+        Returns
+        -------
+        dict
+            State of the writer
+
+        """
+        self.flush()
+        state = super().__getstate__()
+        # The buffer is empty, so it need not be saved
+        state.pop('_chunk')
+        return state
+
+    def __setstate__(self, state):
+        """Restores the state of an unpickled writer, without reopening
+        its output file.
+
+        Parameters
+        ----------
+        state : dict
+            State of the writer
+
+        """
+        super().__setstate__(state)
+        self._chunk = np.zeros(self.chunk_size, dtype=self._dtype)
+
+    def reopen(self, folder: str = None):
+        """Reopens the output file of an unpickled writer, so that writing
+        continues from where it was when the writer was pickled.
+
+        Parameters
+        ----------
+        folder : str
+            Absolute path to a folder to write to instead of the original
+            one
+
+        """
+        self.f, self.filepath = self._reopen_file(self.filepath, folder,
+                                                  mode='r+b')
+        self.folder = os.path.dirname(self.filepath)
+
+    def write(self, time: float, values: typing.Sequence):
+        """Adds the values of a timestep to the current chunk, writing the
+        chunk to file once it is full.
+
+        Parameters
+        ----------
+        time : float
+            Time of the values
+        values : typing.Sequence
+            Value for each person, in the order of the ids of the people
+
+        """
+        self._chunk['time'][self._rows] = time
+        self._chunk['values'][self._rows] = values
+        self._rows += 1
+        if self._rows == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered timesteps to file as a chunk.
+
+        """
+        if self._rows and self.f is not None:
+            self._write_frame(self._chunk[:self._rows])
+            self._rows = 0
+            self.f.flush()
+
+    def close(self):
+        """Writes the buffered timesteps to file and closes it.
+
+        """
+        self.flush()
+        self.f.close()
+
+    def compress(self):
+        """Does nothing, as the file is compressed while it is written.
+
+        """
+
+    def _write_frame(self, array: np.ndarray):
+        """Appends a compressed array to the file.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            Array to write
+
+        """
+        buffer = io.BytesIO()
+        np.save(buffer, array, allow_pickle=False)
+        data = zlib.compress(buffer.getvalue(), self.compression_level)
+        self.f.write(struct.pack('<Q', len(data)))
+        self.f.write(data)
+
+    @staticmethod
+    def read_chunks(filepath: str):
+        """Reads the chunks of a file written by the writer, one by one.
+
+        Parameters
+        ----------
+        filepath : str
+            Path of the file
+
+        Returns
+        -------
+        np.ndarray
+            Ids of the people
+        typing.Iterator[typing.Tuple[np.ndarray, np.ndarray]]
+            Iterator over the chunks of the file, each given by its times
+            and the array of the values of each person (in columns) at each
+            time (in rows)
+
+        """
+        def frames():
+            with open(filepath, 'rb') as f:
+                while True:
+                    header = f.read(8)
+                    if len(header) < 8:
+                        return
+                    data = f.read(struct.unpack('<Q', header)[0])
+                    yield np.load(io.BytesIO(zlib.decompress(data)),
+                                  allow_pickle=False)
+
+        iterator = frames()
+        person_ids = next(iterator)
+        return person_ids, ((chunk['time'], chunk['values'])
+                            for chunk in iterator)
+
+    @staticmethod
+    def read(filepath: str) -> pd.DataFrame:
+        """Reads a file written by the writer, in the layout of the csv
+        file it replaces.
+
+        Parameters
+        ----------
+        filepath : str
+            Path of the file
+
+        Returns
+        -------
+        pd.DataFrame
+            History of the values, with a `time` column and one column per
+            person
+
+        """
+        person_ids, chunks = _HistoryWriter.read_chunks(filepath)
+        chunks = list(chunks)
+        if chunks:
+            times = np.concatenate([times for times, _ in chunks])
+            values = np.concatenate([values for _, values in chunks])
+        else:
+            times = np.zeros(0)
+            values = np.zeros((0, len(person_ids)))
+        df = pd.DataFrame(values, columns=person_ids.tolist())
+        df.insert(0, 'time', times)
+        return df
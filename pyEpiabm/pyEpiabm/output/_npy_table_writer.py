@@ -0,0 +1,103 @@
+#
+# Write data in dicts to a file of numpy record arrays
+#
+
+import os
+import typing
+
+import numpy as np
+import pandas as pd
+
+from pyEpiabm.output._table_writer import _TableWriter
+
+
+class _NpyTableWriter(_TableWriter):
+    """Writer of rows of data in dicts to a binary file, in which each
+    block of rows is saved as one numpy record array in the ``.npy``
+    format, with one field per category. The rows are buffered and written
+    in blocks as described in :class:`_TableWriter`.
+
+    The values of each category must be numbers or strings. The blocks may
+    be loaded one by one with successive calls of :func:`numpy.load` on the
+    open file, or all together with :meth:`read`.
+
+    """
+    extensions = {'npy': '.npy'}
+
+    def __init__(self, folder: str, filename: str, fieldnames: typing.List,
+                 clear_folder: bool = False, flush_interval: int = 1):
+        """Initialises a file to store output in, and which categories
+        to record.
+
+        Parameters
+        ----------
+        folder : str
+            Output folder path
+        filename : str
+            Output file name
+        fieldnames : typing.List
+            List of categories to be saved
+        clear_folder : bool
+            Whether to empty the folder before saving results
+        flush_interval : int
+            Number of timesteps between writes of the buffered rows to file
+
+        """
+        super().__init__(folder, filename, fieldnames, clear_folder,
+                         flush_interval)
+        self.f = open(self.filepath, 'wb')
+
+    def reopen(self, folder: str = None):
+        """Reopens the output file of an unpickled writer, so that writing
+        continues from where it was when the writer was pickled.
+
+        Parameters
+        ----------
+        folder : str
+            Absolute path to a folder to write to instead of the original
+            one
+
+        """
+        self.f, self.filepath = self._reopen_file(self.filepath, folder,
+                                                  mode='r+b')
+        self.folder = os.path.dirname(self.filepath)
+        self.filepath_without_extension = os.path.splitext(
+            self.filepath)[0]
+
+    def _write_block(self, rows: typing.List[typing.Dict]):
+        """Writes a block of rows to file as a record array.
+
+        Parameters
+        ----------
+        rows : typing.List[dict]
+            Rows to write
+
+        """
+        columns = self._columns(rows)
+        block = np.rec.fromarrays(
+            [np.asarray(values) for values in columns.values()],
+            names=list(columns))
+        np.save(self.f, block, allow_pickle=False)
+
+    @staticmethod
+    def read(filepath: str) -> pd.DataFrame:
+        """Reads all the blocks of a file written by the writer.
+
+        Parameters
+        ----------
+        filepath : str
+            Path of the file
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows of the file, with one column per category
+
+        """
+        blocks = []
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            while f.tell() < size:
+                blocks.append(pd.DataFrame(np.load(f, allow_pickle=False)))
+        return pd.concat(blocks, ignore_index=True) if blocks \
+            else pd.DataFrame()
@@ -0,0 +1,186 @@
+#
+# Write rows of a table to file in buffered blocks
+#
+
+import os
+import typing
+
+from pyEpiabm.output.abstract_reporter import AbstractReporter
+
+
+class _TableWriter(AbstractReporter):
+    """Abstract class for writers which record rows of a table with given
+    columns, keeping the rows in memory and writing them to file in blocks.
+
+    The rows written in a timestep are held until :meth:`end_timestep` has
+    been called `flush_interval` times, and are then written to file in one
+    block, so the cost of writing a row is independent of the file format.
+    Any rows held are also written when :meth:`flush` is called, before the
+    writer is pickled (for example in a simulation checkpoint), and when
+    the writer is closed.
+
+    Subclasses implement :meth:`_write_block` for a file format, and map
+    the names of their formats to file extensions in ``extensions`` so
+    they can be created with :meth:`create`.
+
+    """
+    extensions = {}
+
+    def __init__(self, folder: str, filename: str, fieldnames: typing.List,
+                 clear_folder: bool = False, flush_interval: int = 1):
+        """Initialises the writer, without opening a file.
+
+        Parameters
+        ----------
+        folder : str
+            Output folder path
+        filename : str
+            Output file name
+        fieldnames : typing.List
+            List of categories to be saved
+        clear_folder : bool
+            Whether to empty the folder before saving results
+        flush_interval : int
+            Number of timesteps between writes of the buffered rows to file
+
+        """
+        if flush_interval < 1:
+            raise ValueError("Flush interval must be at least one timestep")
+        super().__init__(folder, clear_folder)
+        self.filename = filename
+        self.filepath = os.path.join(folder, filename)
+        self.filepath_without_extension = os.path.join(
+            folder, os.path.splitext(filename)[0])
+        self.fieldnames = fieldnames
+        self.flush_interval = flush_interval
+        self.f = None
+        self._rows = []
+        self._timesteps = 0
+
+    @staticmethod
+    def create(output_format: str, folder: str, filename: str,
+               fieldnames: typing.List, **kwargs):
+        """Returns a writer for the given file format. Except for csv
+        files, the extension of the filename is replaced by that of the
+        format.
+
+        Parameters
+        ----------
+        output_format : str
+            Name of the file format, such as 'csv', 'npy', 'parquet' or
+            'feather'
+        folder : str
+            Output folder path
+        filename : str
+            Output file name
+        fieldnames : typing.List
+            List of categories to be saved
+        **kwargs
+            Keyword arguments passed to the constructor of the writer
+
+        Returns
+        -------
+        _TableWriter
+            Writer for the format
+
+        """
+        for cls in _TableWriter.__subclasses__():
+            if output_format in cls.extensions:
+                if output_format != 'csv':
+                    filename = (os.path.splitext(filename)[0]
+                                + cls.extensions[output_format])
+                if len(cls.extensions) > 1:
+                    kwargs['output_format'] = output_format
+                return cls(folder, filename, fieldnames, **kwargs)
+        formats = [name for cls in _TableWriter.__subclasses__()
+                   for name in cls.extensions]
+        raise ValueError(f"Unknown output format {output_format}, expected"
+                         + f" one of {formats}")
+
+    def __del__(self):
+        """Writes any buffered rows and closes the file when the simulation
+        is finished. Required for file data to be further used.
+
+        """
+        if getattr(self, 'f', None):
+            self.close()
+
+    def __getstate__(self):
+        """Writes any buffered rows, and returns the state of the writer
+        for pickling, as in :meth:`AbstractReporter.__getstate__`.
+
+        Returns
+        -------
+        dict
+            State of the writer
+
+        """
+        self.flush()
+        return super().__getstate__()
+
+    def write(self, row: typing.Dict):
+        """Adds a row to the buffer, to be written to file at the end of
+        the current block of timesteps.
+
+        Parameters
+        ----------
+        row : dict
+            Dictionary of data to be saved
+
+        """
+        self._rows.append(row)
+
+    def end_timestep(self):
+        """Marks the end of a timestep, writing the buffered rows to file
+        every `flush_interval` timesteps.
+
+        """
+        self._timesteps += 1
+        if self._timesteps >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered rows to file.
+
+        """
+        self._timesteps = 0
+        if self._rows and self.f is not None:
+            self._write_block(self._rows)
+            self._rows = []
+            self.f.flush()
+
+    def close(self):
+        """Writes the buffered rows to file and closes it.
+
+        """
+        self.flush()
+        self.f.close()
+
+    def _write_block(self, rows: typing.List[typing.Dict]):
+        """Writes a block of rows to file.
+
+        Parameters
+        ----------
+        rows : typing.List[dict]
+            Rows to write
+
+        """
+        raise NotImplementedError
+
+    def _columns(self, rows: typing.List[typing.Dict]) -> typing.Dict:
+        """Returns the values of a block of rows in each column, keyed by
+        the name of the column.
+
+        Parameters
+        ----------
+        rows : typing.List[dict]
+            Rows of the block
+
+        Returns
+        -------
+        dict
+            List of the values of each column
+
+        """
+        return {str(name): [row.get(name) for row in rows]
+                for name in self.fieldnames}
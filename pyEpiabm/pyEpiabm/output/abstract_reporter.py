@@ -43,3 +43,108 @@ class AbstractReporter:
 
         """
         raise NotImplementedError
+
+    def end_timestep(self):
+        """Marks the end of a timestep of the simulation. Does nothing
+        unless the reporter buffers its output.
+
+        """
+
+    def flush(self):
+        """Writes any buffered output to file. Does nothing unless the
+        reporter buffers its output.
+
+        """
+
+    def __getstate__(self):
+        """Returns the state of the reporter for pickling, for example in a
+        simulation checkpoint. Open files cannot be pickled, so the length
+        of the output file written so far is recorded instead, and the file
+        must be reopened with :meth:`reopen` after unpickling.
+
+        Returns
+        -------
+        dict
+            State of the reporter
+
+        """
+        state = self.__dict__.copy()
+        f = state.pop('f', None)
+        state.pop('writer', None)
+        if f is not None and not f.closed:
+            f.flush()
+            state['_offset'] = f.tell()
+        return state
+
+    def __setstate__(self, state):
+        """Restores the state of an unpickled reporter, without reopening
+        its output file.
+
+        Parameters
+        ----------
+        state : dict
+            State of the reporter
+
+        """
+        self.__dict__.update(state)
+        self.f = None
+
+    def reopen(self, folder: str = None):
+        """Reopens the output file of an unpickled reporter, so that writing
+        continues from where it was when the reporter was pickled.
+
+        Parameters
+        ----------
+        folder : str
+            Absolute path to a folder to write to instead of the original
+            one
+
+        """
+        raise NotImplementedError
+
+    def _reopen_file(self, filepath: str, folder: str = None,
+                     mode: str = 'r+', **kwargs):
+        """Opens an output file for writing, discarding anything written
+        after the offset recorded when the reporter was pickled. If a folder
+        is given, the content of the file up to that offset is copied into
+        a file of the same name in that folder, which is opened instead,
+        and the original file is left unchanged.
+
+        Parameters
+        ----------
+        filepath : str
+            Path of the original output file
+        folder : str
+            Absolute path to a folder to write to instead of the original
+            one
+        mode : str
+            Mode in which to open the file, which must allow reading and
+            writing without truncation
+        **kwargs
+            Keyword arguments passed to :func:`open`
+
+        Returns
+        -------
+        tuple
+            Opened file, and its path
+
+        """
+        offset = self.__dict__.get('_offset', 0)
+        if folder is not None:
+            AbstractReporter.__init__(self, folder)
+            new_path = os.path.join(folder, os.path.basename(filepath))
+            if os.path.abspath(new_path) != os.path.abspath(filepath):
+                with open(filepath, 'rb') as source, \
+                        open(new_path, 'wb') as target:
+                    remaining = offset
+                    while remaining > 0:
+                        chunk = source.read(min(remaining, 1 << 20))
+                        if not chunk:
+                            break
+                        target.write(chunk)
+                        remaining -= len(chunk)
+            filepath = new_path
+        f = open(filepath, mode, **kwargs)
+        f.truncate(offset)
+        f.seek(offset)
+        return f, filepath
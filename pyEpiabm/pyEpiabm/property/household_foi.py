@@ -1,7 +1,6 @@
 #
 # Calculate household force of infection based on Covidsim code
 #
-import pyEpiabm.core
 from pyEpiabm.core import Parameters
 
 from .personal_foi import PersonalInfection
@@ -13,7 +12,8 @@ class HouseholdInfection:
 
     """
     @staticmethod
-    def household_inf(infector, time: float):
+    def household_inf(infector, time: float, parameters=None,
+                      modifiers=None):
         """Calculate the infectiousness of a person in a given
         household. Does not include interventions such as isolation,
         or whether individual is a carehome resident.
@@ -24,6 +24,12 @@ class HouseholdInfection:
             Infector
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
 
         Returns
         -------
@@ -31,20 +37,27 @@ class HouseholdInfection:
             Infectiousness parameter of household
 
         """
-        closure_inf = Parameters.instance().\
-            intervention_params['place_closure'][
-                'closure_household_infectiousness'] \
-            if (hasattr(infector.microcell, 'closure_start_time')) and (
-                infector.is_place_closed(
-                    Parameters.instance().intervention_params[
-                        'place_closure']['closure_place_type'])) and (
-                            infector.microcell.closure_start_time <= time
-                        ) else 1
+        if parameters is None:
+            parameters = Parameters.instance()
+        if modifiers is not None:
+            row = modifiers.index(infector, time, parameters)
+            closure_inf = modifiers.closure_household.item(row)
+        else:
+            closure_inf = parameters.\
+                intervention_params['place_closure'][
+                    'closure_household_infectiousness'] \
+                if (hasattr(infector.microcell, 'closure_start_time')) and (
+                    infector.is_place_closed(
+                        parameters.intervention_params[
+                            'place_closure']['closure_place_type'])) and (
+                                infector.microcell.closure_start_time <= time
+                            ) else 1
         household_infectiousness = infector.infectiousness * closure_inf
         return household_infectiousness
 
     @staticmethod
-    def household_susc(infector, infectee, time: float):
+    def household_susc(infector, infectee, time: float, parameters=None,
+                       modifiers=None):
         """Calculate the susceptibility of one person to another in a given
         household. Intervention parameters are based on the microcell
         properties of the infectee. Does not include interventions such as
@@ -58,6 +71,12 @@ class HouseholdInfection:
             Infectee
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
 
         Returns
         -------
@@ -65,92 +84,180 @@ class HouseholdInfection:
             Susceptibility parameter of household
 
         """
-        household_susceptibility = PersonalInfection.person_susc(infectee,
-                                                                 time)
-        if (hasattr(infectee.microcell, 'distancing_start_time')) and (
+        if parameters is None:
+            parameters = Parameters.instance()
+        household_susceptibility = PersonalInfection.person_susc(
+            infectee, time, parameters)
+        if modifiers is not None:
+            row = modifiers.index(infectee, time, parameters)
+            household_susceptibility *= modifiers.distancing_house.item(row)
+        elif (hasattr(infectee.microcell, 'distancing_start_time')) and (
                 infectee.microcell.distancing_start_time is not None) and (
                     infectee.microcell.distancing_start_time <= time):
             if (hasattr(infectee, 'distancing_enhanced')) and (
                         infectee.distancing_enhanced is True):
-                household_susceptibility *= Parameters.instance().\
+                household_susceptibility *= parameters.\
                     intervention_params['social_distancing'][
                         'distancing_house_enhanced_susc']
             else:
-                household_susceptibility *= Parameters.instance().\
+                household_susceptibility *= parameters.\
                     intervention_params['social_distancing'][
                         'distancing_house_susc']
         return household_susceptibility
 
     @staticmethod
-    def household_foi(infector, infectee, time: float):
-        """Calculate the force of infection parameter of a household,
-        for a particular infector and infectee.
+    def household_infector_scale(infector, time: float, parameters=None,
+                                 modifiers=None):
+        """Calculate the part of the force of infection of a household which
+        depends only on the infector, being their household infectiousness
+        scaled by interventions such as isolation, vaccination and whether
+        they are a carehome resident.
 
         Parameters
         ----------
         infector : Person
             Infector
-        infectee : Person
-            Infectee
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
 
         Returns
         -------
         float
-            Force of infection parameter of household
+            Infectiousness of the infector within their household
 
         """
+        if parameters is None:
+            parameters = Parameters.instance()
         carehome_scale_inf = 1
         if infector.care_home_resident:
-            carehome_scale_inf = Parameters.instance()\
-                .carehome_params["carehome_resident_household_scaling"]
-        carehome_scale_susc = 1
-        if infectee.care_home_resident:
-            carehome_scale_susc = Parameters.instance()\
+            carehome_scale_inf = parameters\
                 .carehome_params["carehome_resident_household_scaling"]
         seasonality = 1.0  # Not yet implemented
-        travel_isolation_scale = Parameters.instance().\
-            intervention_params['travel_isolation']['isolation_house'
-                                                    '_effectiveness'] \
-            if (hasattr(infector, 'travel_isolation_start_time')) and (
-                infector.travel_isolation_start_time is not None) and (
-                    infector.travel_isolation_start_time <= time) else 1
-        isolation_scale = Parameters.instance().\
-            intervention_params['case_isolation']['isolation_house'
-                                                  '_effectiveness'] \
-            if (hasattr(infector, 'isolation_start_time')) and (
-                infector.isolation_start_time is not None) and (
-                    infector.isolation_start_time <= time) else 1
-        quarantine_scale = Parameters.instance().\
-            intervention_params['household_quarantine']['quarantine_house'
-                                                        '_effectiveness'] \
-            if (hasattr(infectee, 'quarantine_start_time')) and (
-                infectee.quarantine_start_time is not None) and (
-                    infectee.quarantine_start_time <= time) else 1
         vacc_inf_drop = 1
         if infector.is_vaccinated:
-            vacc_params = Parameters.instance()\
+            vacc_params = parameters\
                 .intervention_params['vaccine_params']
             if time > (infector.date_vaccinated +
                        vacc_params['time_to_efficacy']):
                 vacc_inf_drop *= (1 - vacc_params['vacc_inf_drop'])
 
-        # Dominant interventions: 1) travel_isolate; 2) case_isolate
-        isolation_scale_inf = 1
-        if travel_isolation_scale != 1:
-            isolation_scale_inf = travel_isolation_scale
-        elif isolation_scale != 1:
-            isolation_scale_inf = isolation_scale
-
-        infectiousness = (HouseholdInfection.household_inf(infector, time)
-                          * seasonality
-                          * vacc_inf_drop
-                          * pyEpiabm.core.Parameters.instance().
-                          household_transmission
-                          * carehome_scale_inf
-                          * isolation_scale_inf * quarantine_scale)
-        susceptibility = (HouseholdInfection.household_susc(infector,
-                                                            infectee, time)
-                          * carehome_scale_susc)
+        if modifiers is not None:
+            row = modifiers.index(infector, time, parameters)
+            isolation_scale_inf = modifiers.isolation_house.item(row)
+        else:
+            travel_isolation_scale = parameters.\
+                intervention_params['travel_isolation']['isolation_house'
+                                                        '_effectiveness'] \
+                if (hasattr(infector, 'travel_isolation_start_time')) and (
+                    infector.travel_isolation_start_time is not None) and (
+                        infector.travel_isolation_start_time <= time) else 1
+            isolation_scale = parameters.\
+                intervention_params['case_isolation']['isolation_house'
+                                                      '_effectiveness'] \
+                if (hasattr(infector, 'isolation_start_time')) and (
+                    infector.isolation_start_time is not None) and (
+                        infector.isolation_start_time <= time) else 1
+
+            # Dominant interventions: 1) travel_isolate; 2) case_isolate
+            isolation_scale_inf = 1
+            if travel_isolation_scale != 1:
+                isolation_scale_inf = travel_isolation_scale
+            elif isolation_scale != 1:
+                isolation_scale_inf = isolation_scale
+
+        return (HouseholdInfection.household_inf(infector, time, parameters,
+                                                 modifiers)
+                * seasonality
+                * vacc_inf_drop
+                * parameters.household_transmission
+                * carehome_scale_inf
+                * isolation_scale_inf)
+
+    @staticmethod
+    def household_infectee_scales(infectee, time: float, parameters=None,
+                                  modifiers=None):
+        """Calculate the parts of the force of infection of a household
+        which depend only on the infectee, being the scaling of infectiousness
+        due to household quarantine, and their household susceptibility.
+
+        Parameters
+        ----------
+        infectee : Person
+            Infectee
+        time : float
+            Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
+
+        Returns
+        -------
+        typing.Tuple[float, float]
+            Quarantine scaling and susceptibility of the infectee
+
+        """
+        if parameters is None:
+            parameters = Parameters.instance()
+        carehome_scale_susc = 1
+        if infectee.care_home_resident:
+            carehome_scale_susc = parameters\
+                .carehome_params["carehome_resident_household_scaling"]
+        if modifiers is not None:
+            row = modifiers.index(infectee, time, parameters)
+            quarantine_scale = modifiers.quarantine_house.item(row)
+        else:
+            quarantine_scale = parameters.\
+                intervention_params['household_quarantine'][
+                    'quarantine_house_effectiveness'] \
+                if (hasattr(infectee, 'quarantine_start_time')) and (
+                    infectee.quarantine_start_time is not None) and (
+                        infectee.quarantine_start_time <= time) else 1
+        susceptibility = (HouseholdInfection.household_susc(
+            None, infectee, time, parameters, modifiers)
+            * carehome_scale_susc)
+        return quarantine_scale, susceptibility
+
+    @staticmethod
+    def household_foi(infector, infectee, time: float, parameters=None,
+                      modifiers=None):
+        """Calculate the force of infection parameter of a household,
+        for a particular infector and infectee.
+
+        Parameters
+        ----------
+        infector : Person
+            Infector
+        infectee : Person
+            Infectee
+        time : float
+            Current simulation time
+        parameters : Parameters
+            Parameters object to use, such as the parameters bound to the
+            calling sweep. Defaults to :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
+
+        Returns
+        -------
+        float
+            Force of infection parameter of household
+
+        """
+        if parameters is None:
+            parameters = Parameters.instance()
+        quarantine_scale, susceptibility = \
+            HouseholdInfection.household_infectee_scales(infectee, time,
+                                                         parameters, modifiers)
+        infectiousness = (HouseholdInfection.household_infector_scale(
+            infector, time, parameters, modifiers) * quarantine_scale)
         return (infectiousness * susceptibility)
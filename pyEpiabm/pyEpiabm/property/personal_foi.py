@@ -13,7 +13,7 @@ class PersonalInfection:
 
     """
     @staticmethod
-    def person_inf(infector, time: float):
+    def person_inf(infector, time: float, parameters=None):
         """Calculate the infectiousness of a person.
 
         Parameters
@@ -22,6 +22,9 @@ class PersonalInfection:
             Infector
         time: float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
 
         Returns
         -------
@@ -31,7 +34,9 @@ class PersonalInfection:
         """
         infector_inf = infector.infectiousness
         if infector.is_vaccinated:
-            params = Parameters.instance().\
+            if parameters is None:
+                parameters = Parameters.instance()
+            params = parameters.\
                 intervention_params['vaccine_params']
             if time > (infector.date_vaccinated + params['time_to_efficacy']):
                 infector_inf *= (1 - params['vacc_inf_drop'])
@@ -39,7 +44,7 @@ class PersonalInfection:
         return infector_inf
 
     @staticmethod
-    def person_susc(infectee, time: float):
+    def person_susc(infectee, time: float, parameters=None):
         """Calculate the susceptibility of one person to another.
 
         Does not yet import WAIFW matrix from Polymod data to determine
@@ -51,6 +56,9 @@ class PersonalInfection:
             Infectee
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
 
         Returns
         -------
@@ -60,10 +68,11 @@ class PersonalInfection:
         """
         # If we are using waning immunity then we use a multiplier from
         # igg_foi_multiplier. Otherwise, we set the susceptibility to 1.0.
-        if Parameters.instance().use_waning_immunity and\
+        if parameters is None:
+            parameters = Parameters.instance()
+        if parameters.use_waning_immunity and\
                 (infectee.num_times_infected >= 1):
-            params = defaultdict(int,
-                                 Parameters.instance().antibody_level_params)
+            params = defaultdict(int, parameters.antibody_level_params)
             if not hasattr(PersonalInfection, 'm'):
                 PersonalInfection.m =\
                     AntibodyMultiplier(params['igg_peak_at_age_41'],
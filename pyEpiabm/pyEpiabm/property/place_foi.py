@@ -13,7 +13,8 @@ class PlaceInfection:
     """
 
     @staticmethod
-    def place_inf(place, infector, time: float):
+    def place_inf(place, infector, time: float, parameters=None,
+                  modifiers=None):
         """Calculate the infectiousness of a place. Does not include
         interventions such as isolation, or whether individual is a
         carehome resident.
@@ -29,6 +30,12 @@ class PlaceInfection:
             Infectious person
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
 
         Returns
         -------
@@ -36,26 +43,33 @@ class PlaceInfection:
             Infectiousness parameter of place
 
         """
-        params = Parameters.instance().place_params
+        if parameters is None:
+            parameters = Parameters.instance()
+        params = parameters.place_params
         transmission = params["place_transmission"]
         place_idx = place.place_type.value - 1
         try:
             num_groups = params["mean_group_size"][place_idx]
         except IndexError:  # For place types not in parameters
             num_groups = 1
+        if modifiers is not None:
+            row = modifiers.index(infector, time, parameters)
+            closed = modifiers.closed.item(row)
+        else:
+            closed = (hasattr(infector.microcell, 'closure_start_time')) and (
+                infector.is_place_closed(
+                    parameters.intervention_params[
+                        'place_closure']['closure_place_type'])) and (
+                            infector.microcell.closure_start_time <= time)
         # Use group-wise capacity not max_capacity once implemented
-        place_inf = 0 if ((hasattr(infector.microcell, 'closure_start_time'))
-                          ) and (infector.is_place_closed(
-                            Parameters.instance().intervention_params[
-                                'place_closure']['closure_place_type'])) and (
-                                infector.microcell.closure_start_time <= time
-                                ) else \
+        place_inf = 0 if closed else \
             (transmission / num_groups
-                * PersonalInfection.person_inf(infector, time))
+                * PersonalInfection.person_inf(infector, time, parameters))
         return place_inf
 
     @staticmethod
-    def place_susc(place, infectee, time: float):
+    def place_susc(place, infectee, time: float, parameters=None,
+                   modifiers=None):
         """Calculate the susceptibility of a place. Intervention parameters
         are based on the microcell properties of the infectee. Does not include
         interventions such as isolation, or whether individual is a carehome
@@ -69,6 +83,12 @@ class PlaceInfection:
             Place
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
 
         Returns
         -------
@@ -76,71 +96,68 @@ class PlaceInfection:
             Susceptibility parameter of place
 
         """
-        place_susc = PersonalInfection.person_susc(infectee, time)
+        if parameters is None:
+            parameters = Parameters.instance()
+        place_susc = PersonalInfection.person_susc(infectee, time,
+                                                   parameters)
         place_idx = place.place_type.value - 1
-        if (hasattr(infectee.microcell, 'distancing_start_time')) and (
+        if modifiers is not None:
+            row = modifiers.index(infectee, time, parameters)
+            place_susc *= modifiers.distancing_place.item(row, place_idx)
+        elif (hasattr(infectee.microcell, 'distancing_start_time')) and (
                 infectee.microcell.distancing_start_time is not None) and (
                     infectee.microcell.distancing_start_time <= time):
             if (hasattr(infectee, 'distancing_enhanced')) and (
                         infectee.distancing_enhanced is True):
-                place_susc *= Parameters.instance().\
-                             intervention_params[
-                             'social_distancing'][
-                             'distancing_place_enhanced_susc'][place_idx]
+                place_susc *= parameters.intervention_params[
+                    'social_distancing']['distancing_place_enhanced_susc'][
+                    place_idx]
             else:
-                place_susc *= Parameters.instance().\
-                             intervention_params[
-                             'social_distancing'][
-                             'distancing_place_susc'][place_idx]
+                place_susc *= parameters.intervention_params[
+                    'social_distancing']['distancing_place_susc'][place_idx]
         return place_susc
 
     @staticmethod
-    def place_foi(place, infector, infectee,
-                  time: float):
-        """Calculate the force of infection of a place, for a particular
-        infector and infectee.
+    def place_isolation_scale(infector, time: float, parameters=None,
+                              modifiers=None):
+        """Calculate the scaling of the place infectiousness of an infector
+        due to case or travel isolation.
 
         Parameters
         ----------
         infector : Person
             Infector
-        infectee : Person
-            Infectee
-        place : Place
-            Place
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
 
         Returns
         -------
         float
-            Force of infection parameter of place
+            Isolation scaling of infectiousness
 
         """
-
-        carehome_scale_susc = 1
-        if place.place_type.value == 5 and (infectee.key_worker
-                                            or infector.key_worker):
-            carehome_scale_susc = Parameters.instance()\
-                .carehome_params["carehome_worker_group_scaling"]
-        travel_isolation_scale = Parameters.instance().\
+        if parameters is None:
+            parameters = Parameters.instance()
+        if modifiers is not None:
+            row = modifiers.index(infector, time, parameters)
+            return modifiers.isolation.item(row)
+        travel_isolation_scale = parameters.\
             intervention_params['travel_isolation']['isolation'
                                                     '_effectiveness'] \
             if (hasattr(infector, 'travel_isolation_start_time')) and (
                 infector.travel_isolation_start_time is not None) and (
                     infector.travel_isolation_start_time <= time) else 1
-        isolation_scale = Parameters.instance().\
+        isolation_scale = parameters.\
             intervention_params['case_isolation']['isolation_effectiveness']\
             if (hasattr(infector, 'isolation_start_time')) and (
                 infector.isolation_start_time is not None) and (
                     infector.isolation_start_time <= time) else 1
-        place_idx = place.place_type.value - 1
-        quarantine_scale = Parameters.instance().\
-            intervention_params['household_quarantine'][
-                'quarantine_place_effectiveness'][place_idx]\
-            if (hasattr(infectee, 'quarantine_start_time')) and (
-                infectee.quarantine_start_time is not None) and (
-                    infectee.quarantine_start_time <= time) else 1
 
         # Dominant interventions: 1) travel_isolate; 2) case_isolate;
         isolation_scale_inf = 1
@@ -148,9 +165,99 @@ class PlaceInfection:
             isolation_scale_inf = travel_isolation_scale
         elif isolation_scale != 1:
             isolation_scale_inf = isolation_scale
+        return isolation_scale_inf
+
+    @staticmethod
+    def place_quarantine_scale(place, infectee, time: float,
+                               parameters=None, modifiers=None):
+        """Calculate the scaling of the force of infection of a place due to
+        household quarantine of the infectee, which applies to both the
+        infectiousness and the susceptibility.
+
+        Parameters
+        ----------
+        place : Place
+            Place
+        infectee : Person
+            Infectee
+        time : float
+            Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
+
+        Returns
+        -------
+        float
+            Quarantine scaling
+
+        """
+        if parameters is None:
+            parameters = Parameters.instance()
+        place_idx = place.place_type.value - 1
+        if modifiers is not None:
+            row = modifiers.index(infectee, time, parameters)
+            return modifiers.quarantine_place.item(row, place_idx)
+        return parameters.\
+            intervention_params['household_quarantine'][
+                'quarantine_place_effectiveness'][place_idx]\
+            if (hasattr(infectee, 'quarantine_start_time')) and (
+                infectee.quarantine_start_time is not None) and (
+                    infectee.quarantine_start_time <= time) else 1
+
+    @staticmethod
+    def place_foi(place, infector, infectee, time: float,
+                  parameters=None, modifiers=None, infector_inf=None):
+        """Calculate the force of infection of a place, for a particular
+        infector and infectee.
+
+        Parameters
+        ----------
+        infector : Person
+            Infector
+        infectee : Person
+            Infectee
+        place : Place
+            Place
+        time : float
+            Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
+        infector_inf : float
+            Place infectiousness of the infector, as given by
+            :meth:`place_inf`, if already calculated
+
+        Returns
+        -------
+        float
+            Force of infection parameter of place
+
+        """
+        if parameters is None:
+            parameters = Parameters.instance()
+        carehome_scale_susc = 1
+        if place.place_type.value == 5 and (infectee.key_worker
+                                            or infector.key_worker):
+            carehome_scale_susc = parameters\
+                .carehome_params["carehome_worker_group_scaling"]
+        isolation_scale_inf = PlaceInfection.place_isolation_scale(
+            infector, time, parameters, modifiers)
+        quarantine_scale = PlaceInfection.place_quarantine_scale(
+            place, infectee, time, parameters, modifiers)
 
-        infectiousness = (PlaceInfection.place_inf(place, infector, time)
-                          * isolation_scale_inf * quarantine_scale)
+        if infector_inf is None:
+            infector_inf = PlaceInfection.place_inf(place, infector, time,
+                                                    parameters, modifiers)
+        infectiousness = (infector_inf * isolation_scale_inf
+                          * quarantine_scale)
         susceptibility = (PlaceInfection.place_susc(place, infectee,
-                          time) * carehome_scale_susc * quarantine_scale)
+                          time, parameters, modifiers) * carehome_scale_susc
+                          * quarantine_scale)
         return (infectiousness * susceptibility)
@@ -4,7 +4,6 @@
 
 import numpy as np
 
-import pyEpiabm.core
 from pyEpiabm.core import Parameters
 
 from .personal_foi import PersonalInfection
@@ -16,7 +15,7 @@ class SpatialInfection:
 
     """
     @staticmethod
-    def cell_inf(inf_cell, time: float):
+    def cell_inf(inf_cell, time: float, parameters=None):
         """Calculate the infectiousness of one cell
         towards its nearby cells. Does not include interventions such
         as isolation, or whether individual is a carehome resident.
@@ -28,6 +27,9 @@ class SpatialInfection:
             Cell causing the infection
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
 
         Returns
         -------
@@ -35,10 +37,11 @@ class SpatialInfection:
             Average number of infection events from the cell per timestep
 
         """
-        R_0 = pyEpiabm.core.Parameters.instance().basic_reproduction_num
+        if parameters is None:
+            parameters = Parameters.instance()
+        R_0 = parameters.basic_reproduction_num
 
-        infect_profile = pyEpiabm.core.Parameters.instance()\
-            .infectiousness_prof
+        infect_profile = parameters.infectiousness_prof
         total_infectiousness = np.sum(infect_profile)
 
         summed_infectiousness = sum([person.infectiousness
@@ -56,7 +59,7 @@ class SpatialInfection:
 
     @staticmethod
     def spatial_inf(inf_cell, infector,
-                    time: float):
+                    time: float, parameters=None, modifiers=None):
         """Calculate the infectiousness between cells, dependent on the
         infectious people in it.
 
@@ -68,6 +71,12 @@ class SpatialInfection:
             Infector
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
 
         Returns
         -------
@@ -75,20 +84,28 @@ class SpatialInfection:
             Infectiousness parameter of cell
 
         """
-        age = pyEpiabm.core.Parameters.instance().\
-            age_contact[infector.age_group] \
-            if pyEpiabm.core.Parameters.instance().use_ages is True else 1
-        closure_spatial = Parameters.instance().\
-            intervention_params['place_closure']['closure_spatial_params'] \
-            if ((hasattr(infector.microcell, 'closure_start_time'))) and (
-                infector.is_place_closed(
-                    Parameters.instance().intervention_params[
-                        'place_closure']['closure_place_type'])) and (
-                        infector.microcell.closure_start_time <= time) else 1
+        if parameters is None:
+            parameters = Parameters.instance()
+        age = parameters.age_contact[infector.age_group] \
+            if parameters.use_ages is True else 1
+        if modifiers is not None:
+            row = modifiers.index(infector, time, parameters)
+            closure_spatial = modifiers.closure_spatial.item(row)
+        else:
+            closure_spatial = parameters.\
+                intervention_params['place_closure'][
+                    'closure_spatial_params'] \
+                if ((hasattr(infector.microcell, 'closure_start_time'))) and (
+                    infector.is_place_closed(
+                        parameters.intervention_params[
+                            'place_closure']['closure_place_type'])) and (
+                            infector.microcell.closure_start_time <= time) \
+                else 1
         return infector.infectiousness * age * closure_spatial
 
     @staticmethod
-    def spatial_susc(susc_cell, infectee, time: float):
+    def spatial_susc(susc_cell, infectee, time: float, parameters=None,
+                     modifiers=None):
         """Calculate the susceptibility of one cell towards its neighbouring
         cells. Intervention parameters are based on the microcell properties
         of the infectee.
@@ -101,6 +118,12 @@ class SpatialInfection:
             Infectee
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
 
         Returns
         -------
@@ -108,16 +131,24 @@ class SpatialInfection:
             Susceptibility parameter of cell
 
         """
-        spatial_susc = PersonalInfection.person_susc(infectee, time)
-        if pyEpiabm.core.Parameters.instance().use_ages:
-            spatial_susc *= pyEpiabm.core.Parameters.instance().\
-                age_contact[infectee.age_group]
-
-        spatial_susc *= Parameters.instance().\
+        if parameters is None:
+            parameters = Parameters.instance()
+        spatial_susc = PersonalInfection.person_susc(infectee, time,
+                                                     parameters)
+        if parameters.use_ages:
+            spatial_susc *= parameters.age_contact[infectee.age_group]
+
+        if modifiers is not None:
+            row = modifiers.index(infectee, time, parameters)
+            spatial_susc *= modifiers.closure_spatial.item(row)
+            spatial_susc *= modifiers.distancing_spatial.item(row)
+            return spatial_susc
+
+        spatial_susc *= parameters.\
             intervention_params['place_closure']['closure_spatial_params'] \
             if ((hasattr(infectee.microcell, 'closure_start_time'))) and (
                 infectee.is_place_closed(
-                    Parameters.instance().intervention_params[
+                    parameters.intervention_params[
                         'place_closure']['closure_place_type'])) and (
                         infectee.microcell.closure_start_time <= time) else 1
 
@@ -126,18 +157,18 @@ class SpatialInfection:
                     infectee.microcell.distancing_start_time <= time):
             if (hasattr(infectee, 'distancing_enhanced')) and (
                         infectee.distancing_enhanced is True):
-                spatial_susc *= Parameters.instance().\
+                spatial_susc *= parameters.\
                     intervention_params['social_distancing'][
                         'distancing_spatial_enhanced_susc']
             else:
-                spatial_susc *= Parameters.instance().\
+                spatial_susc *= parameters.\
                     intervention_params['social_distancing'][
                         'distancing_spatial_susc']
         return spatial_susc
 
     @staticmethod
     def spatial_foi(inf_cell, susc_cell, infector,
-                    infectee, time: float):
+                    infectee, time: float, parameters=None, modifiers=None):
         """Calculate the force of infection between cells, for a particular
         infector and infectee.
 
@@ -153,6 +184,12 @@ class SpatialInfection:
             Infectee
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
+        modifiers : InterventionModifiers
+            Precomputed intervention multipliers of the population. If not
+            given, the intervention attributes of each person are read
 
         Returns
         -------
@@ -160,43 +197,54 @@ class SpatialInfection:
             Force of infection parameter of cell
 
         """
+        if parameters is None:
+            parameters = Parameters.instance()
         carehome_scale_inf = 1
         if infector.care_home_resident:
-            carehome_scale_inf = pyEpiabm.core.Parameters.instance()\
+            carehome_scale_inf = parameters\
                 .carehome_params["carehome_resident_spatial_scaling"]
         carehome_scale_susc = 1
         if infectee.care_home_resident or infector.care_home_resident:
-            carehome_scale_susc = pyEpiabm.core.Parameters.instance()\
+            carehome_scale_susc = parameters\
                 .carehome_params["carehome_resident_spatial_scaling"]
-        travel_isolation_scale = Parameters.instance().\
-            intervention_params['travel_isolation']['isolation'
-                                                    '_effectiveness'] \
-            if (hasattr(infector, 'travel_isolation_start_time')) and (
-                infector.travel_isolation_start_time is not None) and (
-                    infector.travel_isolation_start_time <= time) else 1
-        isolation_scale = Parameters.instance().\
-            intervention_params['case_isolation']['isolation_effectiveness']\
-            if (hasattr(infector, 'isolation_start_time')) and (
-                infector.isolation_start_time is not None) and (
-                    infector.isolation_start_time <= time) else 1
-        quarantine_scale = Parameters.instance().\
-            intervention_params['household_quarantine'][
-                'quarantine_spatial_effectiveness']\
-            if (hasattr(infectee, 'quarantine_start_time')) and (
-                infectee.quarantine_start_time is not None) and (
-                    infectee.quarantine_start_time <= time) else 1
-
-        # Dominant interventions: 1) travel_isolate; 2) case_isolate
-        isolation_scale_inf = 1
-        if travel_isolation_scale != 1:
-            isolation_scale_inf = travel_isolation_scale
-        elif isolation_scale != 1:
-            isolation_scale_inf = isolation_scale
+        if modifiers is not None:
+            infector_row = modifiers.index(infector, time, parameters)
+            infectee_row = modifiers.index(infectee, time, parameters)
+            isolation_scale_inf = modifiers.isolation.item(infector_row)
+            quarantine_scale = modifiers.quarantine_spatial.item(
+                infectee_row)
+        else:
+            travel_isolation_scale = parameters.\
+                intervention_params['travel_isolation']['isolation'
+                                                        '_effectiveness'] \
+                if (hasattr(infector, 'travel_isolation_start_time')) and (
+                    infector.travel_isolation_start_time is not None) and (
+                        infector.travel_isolation_start_time <= time) else 1
+            isolation_scale = parameters.\
+                intervention_params['case_isolation'][
+                    'isolation_effectiveness'] \
+                if (hasattr(infector, 'isolation_start_time')) and (
+                    infector.isolation_start_time is not None) and (
+                        infector.isolation_start_time <= time) else 1
+            quarantine_scale = parameters.\
+                intervention_params['household_quarantine'][
+                    'quarantine_spatial_effectiveness']\
+                if (hasattr(infectee, 'quarantine_start_time')) and (
+                    infectee.quarantine_start_time is not None) and (
+                        infectee.quarantine_start_time <= time) else 1
+
+            # Dominant interventions: 1) travel_isolate; 2) case_isolate
+            isolation_scale_inf = 1
+            if travel_isolation_scale != 1:
+                isolation_scale_inf = travel_isolation_scale
+            elif isolation_scale != 1:
+                isolation_scale_inf = isolation_scale
 
         infectiousness = (SpatialInfection.spatial_inf(
-            inf_cell, infector, time) * carehome_scale_inf
+            inf_cell, infector, time, parameters, modifiers)
+            * carehome_scale_inf
             * isolation_scale_inf * quarantine_scale)
         susceptibility = (SpatialInfection.spatial_susc(
-            susc_cell, infectee, time)
+            susc_cell, infectee, time, parameters, modifiers)
             * carehome_scale_susc * quarantine_scale)
         return (infectiousness * susceptibility)
@@ -8,6 +8,8 @@ create a population.
 """
 
 from .abstract_population_config import AbstractPopulationFactory
+from .ensemble_runner import EnsembleRunner
 from .file_population_config import FilePopulationFactory
+from .population_snapshot import PopulationSnapshot
 from .simulation import Simulation
 from .toy_population_config import ToyPopulationFactory
@@ -0,0 +1,217 @@
+#
+# Runs an ensemble of simulations over a pool of processes
+#
+
+import os
+import json
+import logging
+import tempfile
+import typing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from pyEpiabm.core import Parameters, Population
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.sweep import AbstractSweep
+
+from .population_snapshot import PopulationSnapshot
+from .simulation import Simulation
+
+
+class _CompartmentRecorder(AbstractSweep):
+    """Sweep which records the number of people in each infection status,
+    summed over all cells and age groups, every time it is called. Placed
+    at the end of both the initial sweeps and the sweeps of a simulation,
+    so that it records the initial state and the state after each
+    timestep.
+
+    """
+    def __init__(self):
+        """Constructor Method.
+
+        """
+        self.counts = []
+
+    def __call__(self, time):
+        """Records the current number of people in each infection status.
+
+        Parameters
+        ----------
+        time : float or dict
+            Current simulation time, or the simulation parameters when
+            called as an initial sweep
+
+        """
+        self.counts.append(
+            self._population.compartment_counts().sum(axis=1))
+
+
+def _run_member(task: typing.Dict) -> np.ndarray:
+    """Runs one member of an ensemble. Called in a worker process of
+    :class:`EnsembleRunner`, so must be a module level function.
+
+    Parameters
+    ----------
+    task : dict
+        Dictionary describing the member, as built by
+        :meth:`EnsembleRunner.run`
+
+    Returns
+    -------
+    np.ndarray
+        Array of the number of people in each infection status at each
+        time, of shape (times, statuses)
+
+    """
+    # Parameters are loaded for each member, so that overrides do not carry
+    # over between members
+    parameters = Parameters.from_file(task["parameter_file"])
+    for key, value in task["overrides"].items():
+        if isinstance(value, list):
+            value = np.array(value)
+        setattr(parameters, key, value)
+
+    with Parameters.activate(parameters):
+        population = PopulationSnapshot.load(task["snapshot"])
+        initial_sweeps = [factory() for factory in task["initial_sweeps"]]
+        sweeps = [factory() for factory in task["sweeps"]]
+    recorder = _CompartmentRecorder()
+    sim_params = dict(task["sim_params"], simulation_seed=task["seed"])
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_params = dict(task["file_params"] or {})
+        file_params.setdefault("output_file", "output.csv")
+        file_params["output_dir"] = os.path.join(
+            file_params.get("output_dir", temp_dir),
+            f"member_{task['index']}")
+
+        sim = Simulation()
+        sim.configure(population, initial_sweeps + [recorder],
+                      sweeps + [recorder], sim_params, file_params,
+                      parameters=parameters)
+        sim.run_sweeps()
+        sim.writer.close()
+    logging.info(f"Ensemble member {task['index']} completed")
+    return np.array(recorder.counts)
+
+
+class EnsembleRunner:
+    """Class to run an ensemble of simulations of the same population, with
+    different random seeds or parameters, over a pool of processes.
+
+    The population is saved once as a :class:`PopulationSnapshot`, which
+    each member loads, rather than being pickled and sent to each worker.
+    Each member loads its own parameters from the parameter file with
+    :meth:`Parameters.from_file`, so members do not share parameters.
+
+    """
+    def __init__(self,
+                 population: typing.Union[Population, str],
+                 parameter_file: str,
+                 initial_sweeps: typing.List[typing.Callable[[],
+                                                             AbstractSweep]],
+                 sweeps: typing.List[typing.Callable[[], AbstractSweep]],
+                 sim_params: typing.Dict,
+                 file_params: typing.Dict = None,
+                 max_workers: int = None):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        population : Population or str
+            Population to simulate, or the path to a snapshot of it saved
+            with :meth:`PopulationSnapshot.save`
+        parameter_file : str
+            Path to the parameter file used by each member
+        initial_sweeps : typing.List[typing.Callable]
+            Factories for the initial sweeps of each member, called with no
+            arguments. These may be sweep classes, or
+            :func:`functools.partial` objects for sweeps taking arguments,
+            and must be picklable
+        sweeps : typing.List[typing.Callable]
+            Factories for the sweeps of each member, as for
+            `initial_sweeps`
+        sim_params : dict
+            Dictionary of simulation parameters, as used by
+            :meth:`Simulation.configure`. The `simulation_seed` is replaced
+            by the seed of each member
+        file_params : dict
+            Dictionary of output file parameters, as used by
+            :meth:`Simulation.configure`. The output of each member is
+            written to a `member_<i>` subfolder of `output_dir`. If no
+            `output_dir` is given, the output files are deleted once each
+            member has finished
+        max_workers : int
+            Number of worker processes. Defaults to the number of processors
+            on the machine
+
+        """
+        self.population = population
+        self.parameter_file = os.path.abspath(parameter_file)
+        self.initial_sweeps = initial_sweeps
+        self.sweeps = sweeps
+        self.sim_params = sim_params
+        self.file_params = file_params
+        self.max_workers = max_workers
+
+    def times(self) -> np.ndarray:
+        """Returns the times at which the number of people in each infection
+        status is recorded by :meth:`run`, being the start time of the
+        simulation and the end of each timestep.
+
+        Returns
+        -------
+        np.ndarray
+            Array of times
+
+        """
+        with open(self.parameter_file, "r") as parameters_file:
+            ts = 1 / json.load(parameters_file)["time_steps_per_day"]
+        return np.arange(self.sim_params["simulation_start_time"],
+                         self.sim_params["simulation_end_time"] + ts, ts)
+
+    def run(self, members: typing.List[typing.Tuple[int, typing.Dict]]) \
+            -> np.ndarray:
+        """Runs each member of the ensemble in a pool of worker processes,
+        and gathers the number of people in each infection status over time.
+
+        Parameters
+        ----------
+        members : typing.List[typing.Tuple[int, dict]]
+            List of (seed, overrides) pairs, one for each member. The
+            overrides dictionary maps parameter names to the values which
+            replace those in the parameter file for that member
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (members, times, statuses) of the number of
+            people in each infection status, summed over all cells and age
+            groups. Times are given by :meth:`times`, and statuses are in
+            the order of :class:`InfectionStatus`
+
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            snapshot = self.population
+            if isinstance(snapshot, Population):
+                snapshot = os.path.join(temp_dir, "population.npz")
+                PopulationSnapshot.save(self.population, snapshot)
+            tasks = [{"index": i,
+                      "seed": seed,
+                      "overrides": dict(overrides or {}),
+                      "snapshot": os.path.abspath(snapshot),
+                      "parameter_file": self.parameter_file,
+                      "initial_sweeps": self.initial_sweeps,
+                      "sweeps": self.sweeps,
+                      "sim_params": self.sim_params,
+                      "file_params": self.file_params}
+                     for i, (seed, overrides) in enumerate(members)]
+            if not tasks:
+                return np.zeros((0, len(self.times()), len(InfectionStatus)),
+                                dtype=int)
+
+            with ProcessPoolExecutor(max_workers=self.max_workers) \
+                    as executor:
+                results = list(executor.map(_run_member, tasks))
+        logging.info(f"Ensemble of {len(results)} members completed")
+        return np.stack(results)
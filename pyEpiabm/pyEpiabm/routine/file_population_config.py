@@ -9,7 +9,8 @@ import copy
 import logging
 from packaging import version
 
-from pyEpiabm.core import Cell, Microcell, Person, Population, Parameters
+from pyEpiabm.core import Cell, Household, Microcell, Person, Population, \
+    Parameters
 from pyEpiabm.property import InfectionStatus, PlaceType
 from pyEpiabm.sweep import HostProgressionSweep, InitialHouseholdSweep
 from pyEpiabm.utility import log_exceptions
@@ -20,13 +21,23 @@ class FilePopulationFactory:
     """
     @staticmethod
     @log_exceptions()
-    def make_pop(input_file: str, random_seed: int = None, time: float = 0):
+    def make_pop(input_file: str, random_seed: int = None, time: float = 0,
+                 bulk: bool = False):
         """Initialize a population object from an input csv file, with one
         row per microcell. A uniform multinomial distribution is
         used to distribute the number of people into the different households
         within each microcell. A random seed may be specified for reproducible
         populations.
 
+        If `bulk` is True, the people of each microcell are created in one
+        batch: the age groups of the whole population are drawn with a
+        single multinomial draw, compartment counters are incremented once
+        per (status, age group) block and households are formed without
+        checking each person's id for duplicates. This is much faster for
+        large inputs, but consumes random numbers differently, so the
+        population differs from the one created with `bulk` False for the
+        same seed.
+
         Input file contains columns:
 
             * `cell`: ID code for cell
@@ -48,6 +59,8 @@ class FilePopulationFactory:
             Seed for reproducible household and place distribution
         time : float
             Start time of simulation where this population is used (default 0)
+        bulk : bool
+            Whether to create people in batches per microcell (default False)
 
         Returns
         -------
@@ -81,10 +94,24 @@ class FilePopulationFactory:
         # Initialise sweep to assign new people their next infection status
         host_sweep = HostProgressionSweep()
 
+        status_columns = [col for col in input.columns.values
+                          if hasattr(InfectionStatus, col)]
+        if bulk:
+            duplicates = input.duplicated(subset=["cell", "microcell"])
+            if duplicates.any():
+                line = input[duplicates].iloc[0]
+                raise ValueError(f"Duplicate microcells: {line.cell}."
+                                 + f"{line.microcell} already exists in"
+                                 + f" cell {line.cell}")
+            status_counts = input[status_columns].to_numpy(dtype=int)
+            age_groups = FilePopulationFactory._draw_age_groups(
+                int(status_counts.sum()))
+            age_start = 0
+
         # Store current cell
         current_cell = None
         # Iterate through lines (one per microcell)
-        for line in input.itertuples():
+        for row, line in enumerate(input.itertuples()):
             # Converting from float to string
             cell_id_csv = str(line.cell)
             microcell_id_csv = cell_id_csv + "." + str(line.microcell)
@@ -99,40 +126,46 @@ class FilePopulationFactory:
                 location = (line.location_x, line.location_y)
                 cell.set_location(location)
 
-            # Raise error if microcell exists, then create new one
-            microcell_ids = [microcell.id for microcell in cell.microcells]
-            if microcell_id_csv in microcell_ids:
-                raise ValueError(f"Duplicate microcells: {microcell_id_csv}"
-                                 + f" already exists in cell {cell.id}")
-
-            new_microcell = Microcell(cell)
-            new_microcell.set_id(microcell_id_csv)
-            cell.microcells.append(new_microcell)
-
-            for column in input.columns.values:
-                if hasattr(InfectionStatus, column):
+            if bulk:
+                # Duplicates have been checked for the whole input
+                new_microcell = Microcell(cell)
+                new_microcell.id = microcell_id_csv
+                cell.microcells.append(new_microcell)
+                age_end = age_start + int(status_counts[row].sum())
+                FilePopulationFactory._add_people_bulk(
+                    new_microcell, status_columns, status_counts[row],
+                    age_groups[age_start:age_end], host_sweep, time)
+                age_start = age_end
+            else:
+                # Raise error if microcell exists, then create new one
+                microcell_ids = [microcell.id
+                                 for microcell in cell.microcells]
+                if microcell_id_csv in microcell_ids:
+                    raise ValueError("Duplicate microcells: "
+                                     + f"{microcell_id_csv} already exists"
+                                     + f" in cell {cell.id}")
+
+                new_microcell = Microcell(cell)
+                new_microcell.set_id(microcell_id_csv)
+                cell.microcells.append(new_microcell)
+
+                for column in status_columns:
                     value = getattr(InfectionStatus, column)
                     for _ in range(int(getattr(line, column))):
                         person = Person(new_microcell)
                         person.set_random_age()
                         new_microcell.add_person(person)
                         person.update_status(InfectionStatus(value))
-                        if (person.infection_status
-                                == InfectionStatus.Susceptible):
-                            continue  # Next status set upon infection
-                        host_sweep.update_next_infection_status(person)
-                        host_sweep.update_time_status_change(person, time)
-                        if str(person.infection_status).startswith('Infect'):
-                            HostProgressionSweep.set_infectiousness(person,
-                                                                    time)
+                        FilePopulationFactory._set_initial_progression(
+                            person, host_sweep, time)
 
             # Add households and places to microcell
             if len(Parameters.instance().household_size_distribution) == 0:
                 if (hasattr(line, 'household_number') and
                         line.household_number > 0):
                     households = int(line.household_number)
-                    FilePopulationFactory.add_households(new_microcell,
-                                                         households)
+                    FilePopulationFactory.add_households(
+                        new_microcell, households, update_person_id=not bulk)
 
             if hasattr(line, 'place_number') and line.place_number > 0:
                 for _ in range(int(line.place_number)):
@@ -183,7 +216,115 @@ class FilePopulationFactory:
         return new_cell
 
     @staticmethod
-    def add_households(microcell: Microcell, household_number: int):
+    def _set_initial_progression(person: Person,
+                                 host_sweep: HostProgressionSweep,
+                                 time: float):
+        """Assigns the next infection status, the time of status change
+        and the infectiousness of a person created with an initial infection
+        status. Used by both the batched and the person by person paths of
+        :meth:`make_pop`, so that they treat people of each status the same.
+
+        Parameters
+        ----------
+        person : Person
+            Newly created person
+        host_sweep : HostProgressionSweep
+            Sweep used to assign infected people their next status
+        time : float
+            Start time of the simulation
+
+        """
+        if person.infection_status == InfectionStatus.Susceptible:
+            return  # Next status set upon infection
+        host_sweep.update_next_infection_status(person)
+        host_sweep.update_time_status_change(person, time)
+        if str(person.infection_status).startswith('Infect'):
+            HostProgressionSweep.set_infectiousness(person, time)
+
+    @staticmethod
+    def _draw_age_groups(n: int) -> np.ndarray:
+        """Draws the age groups of n people at once, using a single
+        multinomial draw for the number of people in each age group.
+
+        Parameters
+        ----------
+        n : int
+            Number of people
+
+        Returns
+        -------
+        np.ndarray
+            Age group of each person, or None values if ages are not used
+
+        """
+        if not Parameters.instance().use_ages:
+            return np.full(n, None)
+        proportions = np.asarray(Parameters.instance().age_proportions,
+                                 dtype=float)
+        group_counts = np.random.multinomial(
+            n, proportions / proportions.sum())
+        return np.random.permutation(
+            np.repeat(np.arange(len(proportions)), group_counts))
+
+    @staticmethod
+    def _add_people_bulk(microcell: Microcell, status_columns: list,
+                         counts: np.ndarray, age_groups: np.ndarray,
+                         host_sweep: HostProgressionSweep, time: float):
+        """Creates the people of a microcell in one batch, incrementing the
+        compartment counters of the microcell and its cell once per
+        (status, age group) block.
+
+        Parameters
+        ----------
+        microcell : Microcell
+            Microcell to fill
+        status_columns : list
+            Names of the infection statuses in the input file
+        counts : np.ndarray
+            Number of people with each status
+        age_groups : np.ndarray
+            Age group of each person to be created
+        host_sweep : HostProgressionSweep
+            Sweep used to assign infected people their next status
+        time : float
+            Start time of the simulation
+
+        """
+        cell = microcell.cell
+        start = 0
+        for column, count in zip(status_columns, counts):
+            if count == 0:
+                continue
+            status = InfectionStatus(getattr(InfectionStatus, column))
+            groups = age_groups[start:start + count]
+            start += count
+            new_people = []
+            for age_group in groups.tolist():
+                person = Person(microcell, age_group)
+                person.infection_status = status
+                microcell.persons.append(person)
+                new_people.append(person)
+            cell.persons.extend(new_people)
+            cell.persons_version += 1
+
+            if groups[0] is None:
+                blocks = {0: len(groups)}
+            else:
+                blocks = {group: n for group, n in enumerate(
+                    np.bincount(groups.astype(int))) if n > 0}
+            for age_group, n in blocks.items():
+                microcell.compartment_counter._increment_compartment(
+                    n, status, age_group)
+                cell.compartment_counter._increment_compartment(
+                    n, status, age_group)
+
+            for person in new_people:
+                FilePopulationFactory._set_initial_progression(
+                    person, host_sweep, time)
+
+    @staticmethod
+    def add_households(microcell: Microcell, household_number: int,
+                       update_person_id: bool = True):
         """Groups people in a microcell into households together.
 
         Parameters
@@ -193,6 +334,10 @@ class FilePopulationFactory:
             for grouping
         household_number : int
             Number of households to form
+        update_person_id : bool
+            Whether to set each person's id through :meth:`Person.set_id`,
+            which checks for duplicate ids in the microcell. If False, ids
+            are assigned directly, as they are unique by construction
         """
         # Initialises another multinomial distribution
         q = [1 / household_number] * household_number
@@ -200,14 +345,18 @@ class FilePopulationFactory:
         people_number = len(people_list)
         household_split = np.random.multinomial(people_number, q,
                                                 size=1)[0]
+        start = 0
         for j in range(household_number):
-            people_in_household = household_split[j]
-            household_people = []
-            for i in range(people_in_household):
-                person_choice = people_list[0]
-                people_list.remove(person_choice)
-                household_people.append(person_choice)
-            microcell.add_household(household_people)
+            # People are taken in order from the microcell
+            household_people = people_list[start:start + household_split[j]]
+            start += household_split[j]
+            if update_person_id:
+                microcell.add_household(household_people)
+            elif len(household_people) != 0:
+                household = Household(microcell, loc=microcell.location)
+                for i, person in enumerate(household_people):
+                    household.add_person(person)
+                    person.id = household.id + "." + str(i)
 
     @staticmethod
     @log_exceptions()
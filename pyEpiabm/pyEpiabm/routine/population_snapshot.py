@@ -0,0 +1,784 @@
+#
+# Binary snapshot of a population
+#
+
+import itertools
+import json
+import random
+import typing
+from enum import Enum
+
+import numpy as np
+
+from pyEpiabm.core import Cell, Household, InterventionModifiers, \
+    Microcell, Person, PersonStore, Place, Population, _IndexedList
+from pyEpiabm.property import InfectionStatus, PlaceType
+
+# Version of the snapshot layout, checked on load
+_FORMAT_VERSION = 1
+
+# Attributes stored in their own columns. Any other attribute (such as
+# the start times set by interventions) is stored as an extra
+_PERSON_ATTRIBUTES = frozenset([
+    'store', 'store_index', '_initial_infectiousness', '_infectiousness',
+    'microcell', '_infection_status', 'household', 'places', 'place_types',
+    '_next_infection_status', '_time_of_status_change',
+    'infection_start_times', 'secondary_infections_counts',
+    'time_of_recovery', 'num_times_infected', 'latent_period',
+    'exposure_period', 'infector_latent_period', 'serial_interval_dict',
+    'generation_time_dict', 'care_home_resident', 'key_worker',
+    'date_positive', 'is_vaccinated', 'id', '_age_group', 'age'])
+_HOUSEHOLD_ATTRIBUTES = frozenset([
+    'persons', 'susceptible_persons', 'location', 'susceptibility',
+    'infectiousness', 'cell', 'microcell', 'isolation_location', 'id'])
+_PLACE_ATTRIBUTES = frozenset([
+    '_location', 'persons', 'person_groups', 'num_person_groups',
+    'place_type', 'susceptibility', 'infectiousness', 'initialised', 'cell',
+    'microcell'])
+_MICROCELL_ATTRIBUTES = frozenset([
+    'persons', 'places', 'households', 'cell', 'location', 'id',
+    'compartment_counter'])
+_CELL_ATTRIBUTES = frozenset([
+    'location', 'id', 'microcells', 'persons', 'places', 'households',
+    'person_queue', 'PCR_queue', 'LFT_queue', 'compartment_counter',
+    'nearby_cell_distances', 'person_store', 'infectious_persons',
+    '_person_positions', 'status_calendar', 'event_log'])
+_POPULATION_ATTRIBUTES = frozenset([
+    'cells', 'vaccine_queue', 'travellers', 'person_store',
+    'intervention_modifiers', '_compartment_counts',
+    '_compartment_totals', 'event_log'])
+
+# Numeric attributes of people, which may be None
+_PERSON_NUMBERS = ['infectiousness', 'initial_infectiousness',
+                   'time_of_status_change', 'time_of_recovery',
+                   'latent_period', 'exposure_period',
+                   'infector_latent_period', 'date_positive']
+
+# Enums which may appear in extra attributes
+_ENUMS = {'InfectionStatus': InfectionStatus, 'PlaceType': PlaceType}
+_STATUSES = (None,) + tuple(InfectionStatus)
+_INFECTIOUS_STATUSES = frozenset(
+    status for status in InfectionStatus if status.name.startswith('Infect'))
+
+
+def _to_csr(lists: typing.List[list], dtype) -> typing.Tuple[np.ndarray,
+                                                             np.ndarray]:
+    """Flattens a list of lists into an array of values and an array of
+    offsets, so that list i is ``values[offsets[i]:offsets[i + 1]]``.
+
+    """
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter((len(values) for values in lists), dtype=np.int64,
+                          count=len(lists)), out=offsets[1:])
+    values = np.fromiter(itertools.chain.from_iterable(lists), dtype=dtype,
+                         count=int(offsets[-1]))
+    return offsets, values
+
+
+def _from_csr(offsets: np.ndarray, values: typing.Union[np.ndarray, list],
+              objects: typing.List = None) -> typing.List[list]:
+    """Splits an array (or list) of values into lists, inverting
+    :func:`_to_csr`. If a list of objects is given, the values are indices
+    into it.
+
+    """
+    if isinstance(values, np.ndarray):
+        values = values.tolist()
+    if objects is not None:
+        values = [objects[i] for i in values]
+    offsets = offsets.tolist()
+    return [values[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+def _dicts_to_csr(dicts: typing.List[dict], key_dtype, value_dtype):
+    """Flattens a list of dictionaries of lists into arrays of keys, key
+    offsets, values and value offsets.
+
+    """
+    key_offsets, keys = _to_csr([list(d) for d in dicts], key_dtype)
+    value_offsets, values = _to_csr(
+        [value for d in dicts for value in d.values()], value_dtype)
+    return key_offsets, keys, value_offsets, values
+
+
+def _dicts_from_csr(key_offsets, keys, value_offsets, values,
+                    objects: typing.List = None) -> typing.List[dict]:
+    """Rebuilds a list of dictionaries of lists, inverting
+    :func:`_dicts_to_csr`.
+
+    """
+    value_lists = iter(_from_csr(value_offsets, values, objects))
+    return [{key: next(value_lists) for key in row}
+            for row in _from_csr(key_offsets, keys)]
+
+
+def _to_json(value):
+    """Converts an attribute value into a JSON serialisable value.
+
+    """
+    if isinstance(value, Enum):
+        return {'__enum__': type(value).__name__, 'name': value.name}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Values of type {type(value).__name__} cannot be"
+                    + " stored in a population snapshot")
+
+
+def _from_json(value):
+    """Converts a value decoded from JSON back into an attribute value,
+    inverting :func:`_to_json`.
+
+    """
+    if isinstance(value, dict):
+        return _ENUMS[value['__enum__']][value['name']]
+    if isinstance(value, list):
+        return [_from_json(item) for item in value]
+    return value
+
+
+def _extras(objects: typing.List, known: typing.FrozenSet[str]) -> dict:
+    """Returns the attributes of each object without a column of their own,
+    as a dictionary from attribute name to a list of [index, value] pairs.
+
+    """
+    extras = {}
+    for i, obj in enumerate(objects):
+        for name, value in vars(obj).items():
+            if name in known:
+                continue
+            try:
+                extras.setdefault(name, []).append([i, _to_json(value)])
+            except TypeError as e:
+                raise TypeError(f"Attribute '{name}' of"
+                                + f" {type(obj).__name__}: {e}") from e
+    return extras
+
+
+def _set_extras(objects: typing.List, extras: dict):
+    """Sets the attributes saved by :func:`_extras`.
+
+    """
+    for name, values in extras.items():
+        for i, value in values:
+            setattr(objects[i], name, _from_json(value))
+
+
+def _numbers_to_array(values: typing.List, dtype=np.float64):
+    """Returns an array of numbers, with None stored as NaN, and a mask of
+    the numbers which were integers (so that their type is kept on load).
+
+    """
+    array = np.array([np.nan if value is None else value
+                      for value in values], dtype=dtype)
+    integer = np.array([isinstance(value, (int, np.integer))
+                        and not isinstance(value, bool) for value in values],
+                       dtype=bool).reshape(array.shape)
+    return array, integer
+
+
+def _numbers_from_array(array: np.ndarray, integer: np.ndarray) -> list:
+    """Returns the list of numbers saved by :func:`_numbers_to_array`, with
+    NaN read as None.
+
+    """
+    values = [None if value != value else value for value in array.tolist()]
+    for i in np.flatnonzero(integer).tolist():
+        values[i] = int(values[i])
+    return values
+
+
+def _locations_to_array(locations: typing.List[tuple]):
+    """Returns an array of (x,y) locations, and a mask of the coordinates
+    which were integers.
+
+    """
+    return _numbers_to_array([x for loc in locations for x in loc])
+
+
+def _locations_from_array(array: np.ndarray, integer: np.ndarray):
+    """Returns the list of location tuples saved by
+    :func:`_locations_to_array`.
+
+    """
+    coordinates = _numbers_from_array(array, integer)
+    return list(zip(coordinates[::2], coordinates[1::2]))
+
+
+def _counters_to_array(objects: typing.List) -> np.ndarray:
+    """Returns the compartment counts of each object as an array indexed by
+    object, infection status and age group.
+
+    """
+    return np.array([obj.compartment_counter.counts for obj in objects],
+                    dtype=np.int64).reshape(len(objects), len(InfectionStatus),
+                                            -1)
+
+
+def _set_counters(objects: typing.List, counts: np.ndarray):
+    """Sets the compartment counts saved by :func:`_counters_to_array`.
+
+    """
+    for obj, row in zip(objects, counts):
+        obj.compartment_counter._set_counts(row.astype(int))
+
+
+class PopulationSnapshot:
+    """Class to save a :class:`Population` to a binary snapshot file, and
+    to load it back.
+
+    The snapshot captures the full population graph: every cell,
+    microcell, household, place and person, the membership of households,
+    places and place groups, each person's infection status, timers and
+    infection history, the compartment counters, the testing and
+    vaccination queues and the travellers. The state is stored column-wise
+    in a NumPy ``.npz`` archive, with references between objects stored as
+    integer indices and lists stored as flattened arrays with offsets.
+    Attributes added dynamically (for example by interventions) are stored
+    alongside, as long as their values are numbers, strings, booleans,
+    None, enums or lists of these.
+
+    Loading a snapshot creates the objects directly from the columns,
+    without running the population factory or any initial sweeps, so a
+    population built once can be loaded cheaply by each member of an
+    ensemble.
+
+    """
+
+    @staticmethod
+    def save(population: Population, path: str, compressed: bool = False):
+        """Saves a population to a snapshot file. The state of Python's and
+        NumPy's random number generators is saved alongside, and may be
+        restored when loading.
+
+        Parameters
+        ----------
+        population : Population
+            Population to save
+        path : str
+            Path of the snapshot file (``.npz`` is appended if missing), or
+            a file-like object to write to
+        compressed : bool
+            Whether to compress the file, which makes it smaller but slower
+            to save and load
+
+        """
+        arrays = PopulationSnapshot._to_arrays(population)[0]
+        if compressed:
+            np.savez_compressed(path, **arrays)
+        else:
+            np.savez(path, **arrays)
+
+    @staticmethod
+    def load(path: str, restore_random_state: bool = False) -> Population:
+        """Loads a population from a snapshot file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the snapshot file, or a file-like object to read from
+        restore_random_state : bool
+            Whether to set the state of Python's and NumPy's random number
+            generators to their state when the snapshot was saved
+
+        Returns
+        -------
+        Population
+            Population in the state it was saved
+
+        """
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+        return PopulationSnapshot._from_arrays(arrays,
+                                               restore_random_state)[0]
+
+    @staticmethod
+    def _to_arrays(population: Population):
+        """Returns the arrays saved in a snapshot of a population, and the
+        lists of objects whose indices are used in them.
+
+        Parameters
+        ----------
+        population : Population
+            Population to save
+
+        Returns
+        -------
+        tuple
+            Dictionary of arrays, and dictionary from object kind
+            ('population', 'cell', 'microcell', 'household', 'place',
+            'person' or 'person_store') to the list of objects of that kind
+
+        """
+        cells = population.cells
+        microcells = [mc for cell in cells for mc in cell.microcells]
+        households = [h for cell in cells for h in cell.households]
+        places = [p for cell in cells for p in cell.places]
+        persons = [p for cell in cells for p in cell.persons]
+        n = len(persons)
+
+        cell_index = {cell: i for i, cell in enumerate(cells)}
+        cell_id_index = {cell.id: i for i, cell in enumerate(cells)}
+        microcell_index = {mc: i for i, mc in enumerate(microcells)}
+        household_index = {h: i for i, h in enumerate(households)}
+        place_index = {p: i for i, p in enumerate(places)}
+        person_index = {p: i for i, p in enumerate(persons)}
+
+        def indices(objects, index):
+            try:
+                return [index[obj] for obj in objects]
+            except KeyError as e:
+                raise ValueError(f"{e.args[0]} is referenced by the"
+                                 + " population but not part of it") from e
+
+        arrays = {}
+        # Cells
+        arrays['cell_id'] = np.array([cell.id for cell in cells], dtype=str)
+        arrays['cell_location'], arrays['cell_location_int'] = \
+            _locations_to_array([cell.location for cell in cells])
+        for name in ['microcells', 'persons', 'places', 'households']:
+            index = {'microcells': microcell_index, 'persons': person_index,
+                     'places': place_index,
+                     'households': household_index}[name]
+            arrays[f'cell_{name}_offsets'], arrays[f'cell_{name}'] = \
+                _to_csr([indices(getattr(cell, name), index)
+                         for cell in cells], np.int64)
+        for name in ['person_queue', 'PCR_queue', 'LFT_queue']:
+            arrays[f'cell_{name}_offsets'], arrays[f'cell_{name}'] = \
+                _to_csr([indices(getattr(cell, name).queue, person_index)
+                         for cell in cells], np.int64)
+        (arrays['cell_nearby_offsets'], arrays['cell_nearby'],
+         arrays['cell_distance_offsets'], arrays['cell_distances']) = \
+            _dicts_to_csr([{cell_id_index[cell_id]: [distance]
+                            for cell_id, distance
+                            in cell.nearby_cell_distances.items()}
+                           for cell in cells], np.int64, np.float64)
+        arrays['cell_counts'] = _counters_to_array(cells)
+
+        # Microcells
+        arrays['microcell_cell'] = np.array(
+            indices([mc.cell for mc in microcells], cell_index),
+            dtype=np.int64)
+        arrays['microcell_id'] = np.array([mc.id for mc in microcells],
+                                          dtype=str)
+        arrays['microcell_location'], arrays['microcell_location_int'] = \
+            _locations_to_array([mc.location for mc in microcells])
+        for name, index in [('persons', person_index),
+                            ('places', place_index),
+                            ('households', household_index)]:
+            arrays[f'microcell_{name}_offsets'], arrays[f'microcell_{name}'] \
+                = _to_csr([indices(getattr(mc, name), index)
+                           for mc in microcells], np.int64)
+        arrays['microcell_counts'] = _counters_to_array(microcells)
+
+        # Households
+        arrays['household_microcell'] = np.array(
+            indices([h.microcell for h in households], microcell_index),
+            dtype=np.int64)
+        arrays['household_id'] = np.array([h.id for h in households],
+                                          dtype=str)
+        arrays['household_location'], arrays['household_location_int'] = \
+            _locations_to_array([h.location for h in households])
+        for name in ['susceptibility', 'infectiousness']:
+            arrays[f'household_{name}'], arrays[f'household_{name}_int'] = \
+                _numbers_to_array([getattr(h, name) for h in households])
+        arrays['household_isolation_location'] = np.array(
+            [h.isolation_location for h in households], dtype=bool)
+        for name in ['persons', 'susceptible_persons']:
+            arrays[f'household_{name}_offsets'], arrays[f'household_{name}'] \
+                = _to_csr([indices(getattr(h, name), person_index)
+                           for h in households], np.int64)
+
+        # Places
+        arrays['place_cell'] = np.array(
+            indices([p.cell for p in places], cell_index), dtype=np.int64)
+        arrays['place_microcell'] = np.array(
+            indices([p.microcell for p in places], microcell_index),
+            dtype=np.int64)
+        arrays['place_location'], arrays['place_location_int'] = \
+            _locations_to_array([p._location for p in places])
+        arrays['place_type'] = np.array(
+            [p.place_type.value for p in places], dtype=np.int64)
+        for name in ['susceptibility', 'infectiousness']:
+            arrays[f'place_{name}'], arrays[f'place_{name}_int'] = \
+                _numbers_to_array([getattr(p, name) for p in places])
+        arrays['place_initialised'] = np.array(
+            [p.initialised for p in places], dtype=bool)
+        arrays['place_num_person_groups'] = np.array(
+            [p.num_person_groups for p in places], dtype=np.int64)
+        arrays['place_persons_offsets'], arrays['place_persons'] = _to_csr(
+            [indices(p.persons, person_index) for p in places], np.int64)
+        (arrays['place_group_offsets'], arrays['place_groups'],
+         arrays['place_group_persons_offsets'],
+         arrays['place_group_persons']) = _dicts_to_csr(
+            [{group: indices(members, person_index)
+              for group, members in p.person_groups.items()}
+             for p in places], np.int64, np.int64)
+
+        # Persons
+        arrays['person_id'] = np.array([p.id for p in persons], dtype=str)
+        arrays['person_microcell'] = np.array(
+            indices([p.microcell for p in persons], microcell_index),
+            dtype=np.int64)
+        arrays['person_household'] = np.fromiter(
+            (-1 if p.household is None else household_index[p.household]
+             for p in persons), dtype=np.int64, count=n)
+        arrays['person_age'] = np.fromiter(
+            (-1 if p.age is None else p.age for p in persons),
+            dtype=np.int64, count=n)
+        arrays['person_age_group'] = np.fromiter(
+            (p.age_group for p in persons), dtype=np.int64, count=n)
+        arrays['person_status'] = np.fromiter(
+            (p.infection_status.value for p in persons), dtype=np.int8,
+            count=n)
+        arrays['person_next_status'] = np.fromiter(
+            (0 if p.next_infection_status is None
+             else p.next_infection_status.value for p in persons),
+            dtype=np.int8, count=n)
+        for name in _PERSON_NUMBERS:
+            arrays[f'person_{name}'], arrays[f'person_{name}_int'] = \
+                _numbers_to_array([getattr(p, name) for p in persons])
+        arrays['person_num_times_infected'] = np.fromiter(
+            (p.num_times_infected for p in persons), dtype=np.int64,
+            count=n)
+        for name in ['care_home_resident', 'key_worker', 'is_vaccinated']:
+            arrays[f'person_{name}'] = np.fromiter(
+                (getattr(p, name) for p in persons), dtype=bool, count=n)
+        arrays['person_infection_start_times_offsets'] = _to_csr(
+            [p.infection_start_times for p in persons], np.float64)[0]
+        arrays['person_infection_start_times'], \
+            arrays['person_infection_start_times_int'] = _numbers_to_array(
+                [t for p in persons for t in p.infection_start_times])
+        arrays['person_secondary_infections_offsets'], \
+            arrays['person_secondary_infections'] = _to_csr(
+                [p.secondary_infections_counts for p in persons], np.int64)
+        arrays['person_places_offsets'], arrays['person_places'] = _to_csr(
+            [indices([place for place, _ in p.places], place_index)
+             for p in persons], np.int64)
+        arrays['person_place_groups'] = np.fromiter(
+            (group for p in persons for _, group in p.places),
+            dtype=np.int64, count=len(arrays['person_places']))
+        for name in ['serial_interval', 'generation_time']:
+            (arrays[f'person_{name}_key_offsets'],
+             arrays[f'person_{name}_keys'],
+             arrays[f'person_{name}_offsets'],
+             arrays[f'person_{name}']) = _dicts_to_csr(
+                [getattr(p, f'{name}_dict') for p in persons],
+                np.float64, np.float64)
+
+        # Population
+        store = population.person_store
+        if store is not None:
+            # Order of the people in the store, which sets the order of
+            # batched operations on it
+            arrays['person_store_rows'] = np.array(
+                [person_index[p] for row, p in enumerate(store.persons)
+                 if store.active[row] and p in person_index],
+                dtype=np.int64)
+        arrays['travellers'] = np.array(
+            indices(population.travellers, person_index), dtype=np.int64)
+        vaccine_queue = list(population.vaccine_queue.queue)
+        arrays['vaccine_queue'] = np.array(
+            [[priority, counter, person_index[person]]
+             for priority, counter, person in vaccine_queue],
+            dtype=np.int64).reshape(-1, 3)
+
+        np_state = np.random.get_state()
+        arrays['numpy_random_keys'] = np_state[1]
+        metadata = {
+            'version': _FORMAT_VERSION,
+            'person_store': population.person_store is not None,
+            'intervention_modifiers':
+                population.intervention_modifiers is not None,
+            'random_state': _to_json(random.getstate()),
+            'numpy_random_state': [np_state[0], int(np_state[2]),
+                                   int(np_state[3]), float(np_state[4])],
+            'extras': {
+                'cell': _extras(cells, _CELL_ATTRIBUTES),
+                'microcell': _extras(microcells, _MICROCELL_ATTRIBUTES),
+                'household': _extras(households, _HOUSEHOLD_ATTRIBUTES),
+                'place': _extras(places, _PLACE_ATTRIBUTES),
+                'person': _extras(persons, _PERSON_ATTRIBUTES),
+                'population': _extras([population],
+                                      _POPULATION_ATTRIBUTES)}}
+        arrays['metadata'] = np.array(json.dumps(metadata))
+        objects = {'population': [population], 'cell': cells,
+                   'microcell': microcells, 'household': households,
+                   'place': places, 'person': persons,
+                   'person_store': [] if store is None else [store]}
+        return arrays, objects
+
+    @staticmethod
+    def _from_arrays(arrays: typing.Dict[str, np.ndarray],
+                     restore_random_state: bool = False):
+        """Creates a population from the arrays of a snapshot, inverting
+        :meth:`_to_arrays`.
+
+        Parameters
+        ----------
+        arrays : dict
+            Dictionary of arrays read from a snapshot
+        restore_random_state : bool
+            Whether to restore the state of the random number generators
+
+        Returns
+        -------
+        tuple
+            Population, and dictionary from object kind to the list of
+            objects of that kind, as returned by :meth:`_to_arrays`
+
+        """
+        metadata = json.loads(arrays['metadata'].item())
+        if metadata['version'] != _FORMAT_VERSION:
+            raise ValueError(f"Snapshot format version {metadata['version']}"
+                             + " is not supported (expected"
+                             + f" {_FORMAT_VERSION})")
+        extras = metadata['extras']
+
+        def numbers(name):
+            return _numbers_from_array(arrays[name], arrays[f'{name}_int'])
+
+        population = Population()
+        cells = population.cells
+        for cell_id, location in zip(
+                arrays['cell_id'].tolist(), _locations_from_array(
+                    arrays['cell_location'], arrays['cell_location_int'])):
+            cell = Cell(location)
+            cell.id = cell_id
+            cells.append(cell)
+
+        microcells = []
+        for cell_index, mc_id, location in zip(
+                arrays['microcell_cell'].tolist(),
+                arrays['microcell_id'].tolist(), _locations_from_array(
+                    arrays['microcell_location'],
+                    arrays['microcell_location_int'])):
+            microcell = Microcell(cells[cell_index])
+            microcell.id = mc_id
+            microcell.location = location
+            microcells.append(microcell)
+
+        households = []
+        for mc_index, h_id, location, susceptibility, infectiousness, \
+                isolation in zip(
+                    arrays['household_microcell'].tolist(),
+                    arrays['household_id'].tolist(), _locations_from_array(
+                        arrays['household_location'],
+                        arrays['household_location_int']),
+                    numbers('household_susceptibility'),
+                    numbers('household_infectiousness'),
+                    arrays['household_isolation_location'].tolist()):
+            microcell = microcells[mc_index]
+            household = Household.__new__(Household)
+            household.__dict__.update(
+                location=location, susceptibility=susceptibility,
+                infectiousness=infectiousness, cell=microcell.cell,
+                microcell=microcell, isolation_location=isolation, id=h_id)
+            households.append(household)
+
+        places = []
+        for cell_index, mc_index, location, place_type, susceptibility, \
+                infectiousness, initialised, num_groups in zip(
+                    arrays['place_cell'].tolist(),
+                    arrays['place_microcell'].tolist(),
+                    _locations_from_array(arrays['place_location'],
+                                          arrays['place_location_int']),
+                    arrays['place_type'].tolist(),
+                    numbers('place_susceptibility'),
+                    numbers('place_infectiousness'),
+                    arrays['place_initialised'].tolist(),
+                    arrays['place_num_person_groups'].tolist()):
+            place = Place.__new__(Place)
+            place.__dict__.update(
+                _location=location, place_type=PlaceType(place_type),
+                susceptibility=susceptibility, infectiousness=infectiousness,
+                initialised=initialised, num_person_groups=num_groups,
+                cell=cells[cell_index], microcell=microcells[mc_index])
+            places.append(place)
+
+        # People are created without running the constructor, which would
+        # draw random ages and register them with their microcell
+        persons = []
+        person_places = _from_csr(arrays['person_places_offsets'], list(zip(
+            [places[i] for i in arrays['person_places'].tolist()],
+            arrays['person_place_groups'].tolist())))
+        infection_start_times = _from_csr(
+            arrays['person_infection_start_times_offsets'],
+            numbers('person_infection_start_times'))
+        secondary_infections = _from_csr(
+            arrays['person_secondary_infections_offsets'],
+            arrays['person_secondary_infections'])
+        serial_intervals, generation_times = (_dicts_from_csr(
+            arrays[f'person_{name}_key_offsets'],
+            arrays[f'person_{name}_keys'], arrays[f'person_{name}_offsets'],
+            arrays[f'person_{name}'])
+            for name in ['serial_interval', 'generation_time'])
+        columns = zip(
+            arrays['person_id'].tolist(),
+            arrays['person_microcell'].tolist(),
+            arrays['person_household'].tolist(),
+            arrays['person_age'].tolist(),
+            arrays['person_age_group'].tolist(),
+            arrays['person_status'].tolist(),
+            arrays['person_next_status'].tolist(),
+            *(numbers(f'person_{name}') for name in _PERSON_NUMBERS),
+            arrays['person_num_times_infected'].tolist(),
+            arrays['person_care_home_resident'].tolist(),
+            arrays['person_key_worker'].tolist(),
+            arrays['person_is_vaccinated'].tolist(),
+            person_places, infection_start_times, secondary_infections,
+            serial_intervals, generation_times)
+        for (person_id, mc_index, h_index, age, age_group, status,
+             next_status, infectiousness, initial_infectiousness,
+             time_of_status_change, time_of_recovery, latent_period,
+             exposure_period, infector_latent_period, date_positive,
+             num_times_infected, care_home_resident, key_worker,
+             is_vaccinated, visited, start_times, secondary_counts,
+             serial_interval_dict, generation_time_dict) in columns:
+            person = Person.__new__(Person)
+            person.__dict__.update(
+                store=None, store_index=None,
+                _initial_infectiousness=initial_infectiousness,
+                _infectiousness=infectiousness,
+                microcell=microcells[mc_index],
+                _infection_status=_STATUSES[status],
+                household=None if h_index < 0 else households[h_index],
+                places=visited,
+                place_types=[place.place_type for place, _ in visited],
+                _next_infection_status=_STATUSES[next_status],
+                _time_of_status_change=time_of_status_change,
+                infection_start_times=start_times,
+                secondary_infections_counts=secondary_counts,
+                time_of_recovery=time_of_recovery,
+                num_times_infected=num_times_infected,
+                latent_period=latent_period, exposure_period=exposure_period,
+                infector_latent_period=infector_latent_period,
+                serial_interval_dict=serial_interval_dict,
+                generation_time_dict=generation_time_dict,
+                care_home_resident=care_home_resident, key_worker=key_worker,
+                date_positive=date_positive, is_vaccinated=is_vaccinated,
+                id=person_id, _age_group=age_group,
+                age=None if age < 0 else age)
+            persons.append(person)
+
+        # Membership lists
+        for cell, members, cell_microcells, cell_places, cell_households, \
+                queued, PCR_queued, LFT_queued, nearby in zip(
+                    cells,
+                    _from_csr(arrays['cell_persons_offsets'],
+                              arrays['cell_persons'], persons),
+                    _from_csr(arrays['cell_microcells_offsets'],
+                              arrays['cell_microcells'], microcells),
+                    _from_csr(arrays['cell_places_offsets'],
+                              arrays['cell_places'], places),
+                    _from_csr(arrays['cell_households_offsets'],
+                              arrays['cell_households'], households),
+                    _from_csr(arrays['cell_person_queue_offsets'],
+                              arrays['cell_person_queue'], persons),
+                    _from_csr(arrays['cell_PCR_queue_offsets'],
+                              arrays['cell_PCR_queue'], persons),
+                    _from_csr(arrays['cell_LFT_queue_offsets'],
+                              arrays['cell_LFT_queue'], persons),
+                    _dicts_from_csr(arrays['cell_nearby_offsets'],
+                                    arrays['cell_nearby'],
+                                    arrays['cell_distance_offsets'],
+                                    arrays['cell_distances'])):
+            cell.persons = members
+            cell.microcells = cell_microcells
+            cell.places = cell_places
+            cell.households = cell_households
+            for queue, queued_persons in [(cell.person_queue, queued),
+                                          (cell.PCR_queue, PCR_queued),
+                                          (cell.LFT_queue, LFT_queued)]:
+                for person in queued_persons:
+                    queue.put(person)
+            cell.nearby_cell_distances = {
+                cells[i].id: distances[0] for i, distances in nearby.items()}
+            cell.infectious_persons = {
+                person: None for person in members
+                if person._infection_status in _INFECTIOUS_STATUSES}
+            for person in members:
+                cell.status_calendar.schedule(
+                    person, person._time_of_status_change)
+
+        for microcell, members, mc_places, mc_households in zip(
+                microcells,
+                _from_csr(arrays['microcell_persons_offsets'],
+                          arrays['microcell_persons'], persons),
+                _from_csr(arrays['microcell_places_offsets'],
+                          arrays['microcell_places'], places),
+                _from_csr(arrays['microcell_households_offsets'],
+                          arrays['microcell_households'], households)):
+            microcell.persons = members
+            microcell.places = mc_places
+            microcell.households = mc_households
+
+        for household, members, susceptible in zip(
+                households,
+                _from_csr(arrays['household_persons_offsets'],
+                          arrays['household_persons'], persons),
+                _from_csr(arrays['household_susceptible_persons_offsets'],
+                          arrays['household_susceptible_persons'], persons)):
+            household.persons = members
+            household.susceptible_persons = _IndexedList(susceptible)
+
+        for place, members, groups in zip(
+                places,
+                _from_csr(arrays['place_persons_offsets'],
+                          arrays['place_persons'], persons),
+                _dicts_from_csr(arrays['place_group_offsets'],
+                                arrays['place_groups'],
+                                arrays['place_group_persons_offsets'],
+                                arrays['place_group_persons'], persons)):
+            place.persons = _IndexedList(members)
+            place.person_groups = {group: _IndexedList(group_members)
+                                   for group, group_members in groups.items()}
+
+        _set_counters(cells, arrays['cell_counts'])
+        _set_counters(microcells, arrays['microcell_counts'])
+
+        population.travellers = [persons[i]
+                                 for i in arrays['travellers'].tolist()]
+        for priority, counter, i in arrays['vaccine_queue'].tolist():
+            population.vaccine_queue.put((priority, counter, persons[i]))
+
+        _set_extras(cells, extras['cell'])
+        _set_extras(microcells, extras['microcell'])
+        _set_extras(households, extras['household'])
+        _set_extras(places, extras['place'])
+        _set_extras(persons, extras['person'])
+        _set_extras([population], extras['population'])
+
+        store = None
+        if metadata['person_store']:
+            store = PersonStore(capacity=len(persons))
+            for i in arrays['person_store_rows'].tolist():
+                store.add_person(persons[i])
+            for person in persons:
+                if person.store is None:
+                    store.add_person(person)
+            population.person_store = store
+            for cell in cells:
+                cell.person_store = store
+
+        if metadata.get('intervention_modifiers'):
+            # The multipliers are rebuilt from the intervention attributes
+            # of the people and microcells, which are stored as extras
+            population.intervention_modifiers = \
+                InterventionModifiers(population)
+
+        if restore_random_state:
+            version, internal, gauss_next = metadata['random_state']
+            random.setstate((version, tuple(internal), gauss_next))
+            name, pos, has_gauss, cached_gaussian = \
+                metadata['numpy_random_state']
+            np.random.set_state((name, arrays['numpy_random_keys'], pos,
+                                 has_gauss, cached_gaussian))
+        objects = {'population': [population], 'cell': cells,
+                   'microcell': microcells, 'household': households,
+                   'place': places, 'person': persons,
+                   'person_store': [] if store is None else [store]}
+        return population, objects
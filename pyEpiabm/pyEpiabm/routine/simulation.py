@@ -2,6 +2,8 @@
 # Simulates a complete pandemic
 #
 
+import io
+import pickle
 import random
 import os
 import logging
@@ -11,12 +13,46 @@ import pandas as pd
 from tqdm import tqdm
 
 from pyEpiabm.core import Parameters, Population
-from pyEpiabm.output import _CsvDictWriter
+from pyEpiabm.output import _CsvDictWriter, _EventLogWriter
+from pyEpiabm.output import _HistoryWriter, _TableWriter
 from pyEpiabm.output import AbstractReporter
 from pyEpiabm.property import InfectionStatus
 from pyEpiabm.sweep import AbstractSweep
 from pyEpiabm.utility import log_exceptions
 
+from .population_snapshot import PopulationSnapshot
+
+
+class _CheckpointPickler(pickle.Pickler):
+    """Pickler which stores references to the objects of a population
+    snapshot (cells, people etc.) as their indices in the snapshot, rather
+    than pickling them.
+
+    """
+    def __init__(self, file, objects: typing.Dict[str, typing.List]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._references = {id(obj): (kind, i)
+                            for kind, objs in objects.items()
+                            for i, obj in enumerate(objs)}
+
+    def persistent_id(self, obj):
+        return self._references.get(id(obj))
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+    """Unpickler which resolves the references stored by
+    :class:`_CheckpointPickler` to the objects of a loaded population
+    snapshot.
+
+    """
+    def __init__(self, file, objects: typing.Dict[str, typing.List]):
+        super().__init__(file)
+        self._objects = objects
+
+    def persistent_load(self, reference):
+        kind, i = reference
+        return self._objects[kind][i]
+
 
 class Simulation:
     """Class to run a full simulation.
@@ -35,7 +71,9 @@ class Simulation:
                   sweeps: typing.List[AbstractSweep],
                   sim_params: typing.Dict,
                   file_params: typing.Dict,
-                  inf_history_params: typing.Dict = None):
+                  inf_history_params: typing.Dict = None,
+                  checkpoint_params: typing.Dict = None,
+                  parameters=None):
         """Initialise a population structure for use in the simulation.
 
         sim_params Contains:
@@ -55,6 +93,12 @@ class Simulation:
                should be used
             * `age_stratified`: Boolean to determine whether the output will \
                 be age stratified
+            * `output_format`: Format of the output file, one of 'csv' \
+                (default), 'npy', 'parquet' or 'feather' (see \
+                :class:`pyEpiabm.output._TableWriter`). Parquet and \
+                Feather files require the pyarrow package
+            * `flush_interval`: Number of timesteps between writes of the \
+                buffered output rows to file (default 1)
 
         inf_history_params Contains:
             * `output_dir`: String for the location for the output files, \
@@ -71,6 +115,20 @@ class Simulation:
                need a csv file containing generation time data
             * `compress`: Boolean to determine whether we compress \
                the infection history csv files
+            * `output_format`: Format of the infection status and \
+               infectiousness histories, either 'csv' (default) or \
+               'chunked' for chunked, compressed binary files written by \
+               :class:`pyEpiabm.output._HistoryWriter`
+            * `chunk_size`: Number of timesteps in each chunk of the \
+               chunked histories (default 64)
+            * `event_log`: Boolean to determine whether we need a log of \
+               the infection status changes of people, with their \
+               infectors (see :class:`pyEpiabm.output._EventLogWriter`)
+
+        checkpoint_params Contains:
+            * `output_dir`: String for the location of the checkpoint files, \
+               as a relative path
+            * `interval`: Number of timesteps between checkpoints
 
         Parameters
         ----------
@@ -101,9 +159,28 @@ class Simulation:
             data from these files to mimic real life epidemic sampling
             techniques. These files can be compressed when 'compress' is True,
             reducing the size of these files.
+        checkpoint_params : dict
+            Dictionary of parameters for checkpoints of the simulation. If
+            given, the state of the simulation is saved every `interval`
+            timesteps, and the simulation can be continued from any of these
+            checkpoints with :meth:`resume`. No checkpoints are made if the
+            dictionary is None
+        parameters : Parameters
+            Parameters object used by the simulation and bound to its
+            sweeps, as returned by :meth:`Parameters.from_file`. It is made
+            the current :meth:`Parameters.instance` while the simulation is
+            configured and run, so several simulations with different
+            parameters can be used in one process. Sweeps which read
+            parameters when they are constructed should be constructed
+            within :meth:`Parameters.activate`. Defaults to the current
+            :meth:`Parameters.instance`
         """
         self.sim_params = sim_params
         self.population = population
+        self.parameters = parameters if parameters is not None \
+            else Parameters.instance()
+        # Number of timesteps completed, used to continue from checkpoints
+        self._steps_completed = 0
         self.initial_sweeps = initial_sweeps
         self.sweeps = sweeps
 
@@ -113,12 +190,12 @@ class Simulation:
         self.age_stratified = file_params["age_stratified"] \
             if "age_stratified" in file_params else False
 
-        Parameters.instance().use_ages = self.age_stratified
+        self.parameters.use_ages = self.age_stratified
 
         self.include_waning = sim_params["include_waning"] \
             if "include_waning" in sim_params else False
 
-        Parameters.instance().use_waning_immunity = self.include_waning
+        self.parameters.use_waning_immunity = self.include_waning
 
         # If random seed is specified in parameters, set this in numpy
         if "simulation_seed" in self.sim_params:
@@ -127,10 +204,11 @@ class Simulation:
         # Initial sweeps configure the population by changing the type,
         # infection status, infectiousness or susceptibility of people
         # or places. Only runs on the first timestep.
-        for s in initial_sweeps + sweeps:
-            s.bind_population(self.population)
-            logging.info(f"Bound sweep {s.__class__.__name__} to"
-                         + " population")
+        with Parameters.activate(self.parameters):
+            for s in initial_sweeps + sweeps:
+                s.bind_population(self.population, self.parameters)
+                logging.info(f"Bound sweep {s.__class__.__name__} to"
+                             + " population")
 
         # General sweeps run through the population on every timestep, and
         # include host progression and spatial infections.
@@ -151,9 +229,13 @@ class Simulation:
         if self.age_stratified:
             output_titles.insert(1, "age_group")
 
-        self.writer = _CsvDictWriter(
-            folder, filename,
-            output_titles)
+        output_format = file_params["output_format"] \
+            if "output_format" in file_params else "csv"
+        flush_interval = file_params["flush_interval"] \
+            if "flush_interval" in file_params else 1
+        self.writer = _TableWriter.create(
+            output_format, folder, filename,
+            output_titles, flush_interval=flush_interval)
 
         self.status_output = False
         self.infectiousness_output = False
@@ -165,8 +247,21 @@ class Simulation:
         self.secondary_infections_writer = None
         self.serial_interval_writer = None
         self.generation_time_writer = None
+        self.event_log_writer = None
         self.compress = False
 
+        self.checkpoint_dir = None
+        self.checkpoint_interval = None
+        if checkpoint_params:
+            self.checkpoint_dir = os.path.join(
+                os.getcwd(), checkpoint_params["output_dir"])
+            self.checkpoint_interval = int(checkpoint_params["interval"])
+            if self.checkpoint_interval < 1:
+                raise ValueError("Checkpoint interval must be at least one"
+                                 + " timestep")
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            logging.info(f"Set checkpoint location to {self.checkpoint_dir}")
+
         if inf_history_params:
             # Setting up writer for infection history for each person. If the
             # inf_history_params dict is empty then we do not need to record
@@ -181,12 +276,18 @@ class Simulation:
             self.generation_time_output = inf_history_params \
                 .get("generation_time_output")
             self.compress = inf_history_params.get("compress", False)
+            history_format = inf_history_params.get("output_format", "csv")
+            if history_format not in ("csv", "chunked"):
+                raise ValueError("Unknown infection history format "
+                                 + f"{history_format}, expected 'csv' or "
+                                 + "'chunked'")
+            chunk_size = inf_history_params.get("chunk_size", 64)
             person_ids = []
             person_ids += [person.id for cell in population.cells for person
                            in cell.persons]
             self.ih_output_titles = ["time"] + person_ids
             self.Rt_output_titles = ["time"] + person_ids + ["R_t"]
-            ts = 1 / Parameters.instance().time_steps_per_day
+            ts = 1 / self.parameters.time_steps_per_day
             times = np.arange(self.sim_params["simulation_start_time"],
                               self.sim_params["simulation_end_time"] + ts,
                               ts).tolist()
@@ -197,7 +298,8 @@ class Simulation:
             if not (self.status_output or self.infectiousness_output
                     or self.secondary_infections_output
                     or self.serial_interval_output
-                    or self.generation_time_output):
+                    or self.generation_time_output
+                    or inf_history_params.get("event_log")):
                 logging.warning("status_output, infectiousness_output, "
                                 + "secondary_infections_output, "
                                 + "serial_interval_output and "
@@ -206,28 +308,38 @@ class Simulation:
 
             if self.status_output:
 
-                ih_file_name = "inf_status_history.csv"
+                if history_format == "chunked":
+                    ih_file_name = "inf_status_history.bin"
+                    self.ih_status_writer = _HistoryWriter(
+                        ih_folder, ih_file_name, person_ids,
+                        dtype=np.int8, chunk_size=chunk_size)
+                else:
+                    ih_file_name = "inf_status_history.csv"
+                    self.ih_status_writer = _CsvDictWriter(
+                        ih_folder, ih_file_name,
+                        self.ih_output_titles
+                    )
                 logging.info(
                     f"Set infection history infection status location to "
                     f"{os.path.join(ih_folder, ih_file_name)}")
 
-                self.ih_status_writer = _CsvDictWriter(
-                    ih_folder, ih_file_name,
-                    self.ih_output_titles
-                )
-
             if self.infectiousness_output:
 
-                ih_file_name = "infectiousness_history.csv"
+                if history_format == "chunked":
+                    ih_file_name = "infectiousness_history.bin"
+                    self.ih_infectiousness_writer = _HistoryWriter(
+                        ih_folder, ih_file_name, person_ids,
+                        dtype=np.float64, chunk_size=chunk_size)
+                else:
+                    ih_file_name = "infectiousness_history.csv"
+                    self.ih_infectiousness_writer = _CsvDictWriter(
+                        ih_folder, ih_file_name,
+                        self.ih_output_titles
+                    )
                 logging.info(
                     f"Set infection history infectiousness location to "
                     f"{os.path.join(ih_folder, ih_file_name)}")
 
-                self.ih_infectiousness_writer = _CsvDictWriter(
-                    ih_folder, ih_file_name,
-                    self.ih_output_titles
-                )
-
             if self.secondary_infections_output:
 
                 ih_file_name = "secondary_infections.csv"
@@ -264,6 +376,17 @@ class Simulation:
                     self.si_output_titles
                 )
 
+            if inf_history_params.get("event_log"):
+
+                file_name = "infection_events.npy"
+                logging.info(
+                    f"Set infection event log location to "
+                    f"{os.path.join(ih_folder, file_name)}")
+
+                self.event_log_writer = _EventLogWriter(
+                    ih_folder, file_name, population)
+                population.set_event_log(self.event_log_writer)
+
     @log_exceptions()
     def run_sweeps(self):
         """Iteration step of the simulation. First the initialisation sweeps
@@ -274,45 +397,74 @@ class Simulation:
         argument for their call method but the elements of sweeps take time
         as an argument for their call method.
 
+        The parameters of the simulation are the current
+        :meth:`Parameters.instance` while it runs.
+
+        If the simulation has been loaded from a checkpoint, it continues
+        from the timestep after the checkpoint, and the initialisation
+        sweeps are not run again. If checkpoints are configured, the state
+        of the simulation is saved every `interval` timesteps.
+
         """
-        # Define time step between sweeps
-        ts = 1 / Parameters.instance().time_steps_per_day
-        # Initialise on the time step before starting.
-        for sweep in self.initial_sweeps:
-            sweep(self.sim_params)
-        logging.info("Initial Sweeps Completed at time "
-                     + f"{self.sim_params['simulation_start_time']} days")
-        # First entry of the data file is the initial state
-        self.write_to_file(self.sim_params["simulation_start_time"])
-        if self.ih_status_writer:
-            self.write_to_ih_file(self.sim_params["simulation_start_time"],
-                                  output_option="status")
-        if self.ih_infectiousness_writer:
-            self.write_to_ih_file(self.sim_params["simulation_start_time"],
-                                  output_option="infectiousness")
-
-        times = np.arange(self.sim_params["simulation_start_time"] + ts,
-                          self.sim_params["simulation_end_time"] + ts,
-                          ts)
-        for t in tqdm(times):
-            for sweep in self.sweeps:
-                sweep(t)
-            self.write_to_file(t)
-            if self.ih_status_writer:
-                self.write_to_ih_file(t, output_option="status")
-            if self.ih_infectiousness_writer:
-                self.write_to_ih_file(t, output_option="infectiousness")
-            for writer in self.writers:
-                writer.write(t, self.population)
-            logging.debug(f'Iteration at time {t} days completed')
-
-        logging.info(f"Final time {t} days reached")
-        if self.secondary_infections_writer:
-            self.write_to_Rt_file(times)
-        if self.serial_interval_writer:
-            self.write_to_serial_interval_file(times)
-        if self.generation_time_writer:
-            self.write_to_generation_time_file(times)
+        with Parameters.activate(self.parameters):
+            # Define time step between sweeps
+            ts = 1 / self.parameters.time_steps_per_day
+            if self._steps_completed == 0:
+                if self.event_log_writer:
+                    self.event_log_writer.time = \
+                        self.sim_params["simulation_start_time"]
+                # Initialise on the time step before starting.
+                for sweep in self.initial_sweeps:
+                    sweep(self.sim_params)
+                logging.info(
+                    "Initial Sweeps Completed at time "
+                    + f"{self.sim_params['simulation_start_time']} days")
+                # First entry of the data file is the initial state
+                self.write_to_file(self.sim_params["simulation_start_time"])
+                if self.ih_status_writer:
+                    self.write_to_ih_file(
+                        self.sim_params["simulation_start_time"],
+                        output_option="status")
+                if self.ih_infectiousness_writer:
+                    self.write_to_ih_file(
+                        self.sim_params["simulation_start_time"],
+                        output_option="infectiousness")
+                self._end_timestep()
+
+            times = np.arange(self.sim_params["simulation_start_time"] + ts,
+                              self.sim_params["simulation_end_time"] + ts,
+                              ts)
+            for t in tqdm(times[self._steps_completed:]):
+                if self.event_log_writer:
+                    self.event_log_writer.time = t
+                for sweep in self.sweeps:
+                    sweep(t)
+                self.write_to_file(t)
+                if self.ih_status_writer:
+                    self.write_to_ih_file(t, output_option="status")
+                if self.ih_infectiousness_writer:
+                    self.write_to_ih_file(t, output_option="infectiousness")
+                for writer in self.writers:
+                    writer.write(t, self.population)
+                self._end_timestep()
+                self._steps_completed += 1
+                logging.debug(f'Iteration at time {t} days completed')
+
+                if self.checkpoint_interval and \
+                        self._steps_completed % self.checkpoint_interval == 0 \
+                        and self._steps_completed < len(times):
+                    self.save_checkpoint(os.path.join(
+                        self.checkpoint_dir, f"checkpoint_{t:g}.npz"))
+
+            logging.info(f"Final time {times[-1]} days reached")
+            if self.secondary_infections_writer:
+                self.write_to_Rt_file(times)
+            if self.serial_interval_writer:
+                self.write_to_serial_interval_file(times)
+            if self.generation_time_writer:
+                self.write_to_generation_time_file(times)
+            for reporter in self._reporters():
+                reporter.flush()
 
     def write_to_file(self, time):
         """Records the count number of a given list of infection statuses
@@ -324,19 +476,16 @@ class Simulation:
             Time of output data
 
         """
-        if Parameters.instance().use_ages:
-            nb_age_groups = len(Parameters.instance().age_proportions)
-        else:
-            nb_age_groups = 1
-        if Parameters.instance().use_ages:
+        statuses = list(InfectionStatus)
+        # Counts indexed by cell, infection status and age group
+        counts = self.population.compartment_counts(by_cell=True)
+        if self.parameters.use_ages:
+            nb_age_groups = len(self.parameters.age_proportions)
             if self.spatial_output:  # Separate output line for each cell
-                for cell in self.population.cells:
+                for cell, cell_counts in zip(self.population.cells, counts):
                     for age_i in range(0, nb_age_groups):
-                        data = {s: 0 for s in list(InfectionStatus)}
-                        for inf_status in list(InfectionStatus):
-                            data_per_inf_status = \
-                                cell.compartment_counter.retrieve()[inf_status]
-                            data[inf_status] += data_per_inf_status[age_i]
+                        data = dict(zip(statuses,
+                                        cell_counts[:, age_i].tolist()))
                         # Age groups are numbered from 1 to the total number
                         # of age groups (thus the +1):
                         data["age_group"] = age_i + 1
@@ -346,33 +495,28 @@ class Simulation:
                         data["location_y"] = cell.location[1]
                         self.writer.write(data)
             else:  # Summed output across all cells in population
-                data = {s: 0 for s in list(InfectionStatus)}
-                for cell in self.population.cells:
-                    for age_i in range(0, nb_age_groups):
-                        for inf_status in list(InfectionStatus):
-                            data_per_inf_status = \
-                                cell.compartment_counter.retrieve()[inf_status]
-                            data[inf_status] += data_per_inf_status[age_i]
-                        data["age_group"] = age_i + 1
-                        data["time"] = time
-                        self.writer.write(data)
+                # Each line holds the running total over the cells and age
+                # groups written so far
+                running_totals = np.cumsum(
+                    counts[:, :, :nb_age_groups].transpose(0, 2, 1)
+                    .reshape(-1, len(statuses)), axis=0)
+                for k, totals in enumerate(running_totals.tolist()):
+                    data = dict(zip(statuses, totals))
+                    data["age_group"] = k % nb_age_groups + 1
+                    data["time"] = time
+                    self.writer.write(data)
         else:  # If age not considered, age_group not written in csv
             if self.spatial_output:  # Separate output line for each cell
-                for cell in self.population.cells:
-                    data = {s: 0 for s in list(InfectionStatus)}
-                    for k in data:
-                        data[k] += sum(cell.compartment_counter.retrieve()[k])
+                for cell, totals in zip(self.population.cells,
+                                        counts.sum(axis=2).tolist()):
+                    data = dict(zip(statuses, totals))
                     data["time"] = time
                     data["cell"] = cell.id
                     data["location_x"] = cell.location[0]
                     data["location_y"] = cell.location[1]
                     self.writer.write(data)
             else:  # Summed output across all cells in population
-                data = {s: 0 for s in list(InfectionStatus)}
-                for cell in self.population.cells:
-                    for k in data:
-                        # Sum across age compartments
-                        data[k] += sum(cell.compartment_counter.retrieve()[k])
+                data = dict(zip(statuses, counts.sum(axis=(0, 2)).tolist()))
                 data["time"] = time
                 self.writer.write(data)
 
@@ -390,7 +534,13 @@ class Simulation:
             output_option="infectiousness"
 
         """
-        if self.status_output and output_option == "status":
+        if isinstance(self.ih_status_writer, _HistoryWriter) \
+                and output_option == "status":
+            self.ih_status_writer.write(
+                time, [person.infection_status.value
+                       for cell in self.population.cells
+                       for person in cell.persons])
+        elif self.status_output and output_option == "status":
             ih_data = {column: 0 for column in
                        self.ih_status_writer.fieldnames}
             for cell in self.population.cells:
@@ -400,7 +550,14 @@ class Simulation:
             ih_data["time"] = time
             self.ih_status_writer.write(ih_data)
 
-        if self.infectiousness_output and output_option == "infectiousness":
+        if isinstance(self.ih_infectiousness_writer, _HistoryWriter) \
+                and output_option == "infectiousness":
+            self.ih_infectiousness_writer.write(
+                time, [person.infectiousness
+                       for cell in self.population.cells
+                       for person in cell.persons])
+        elif self.infectiousness_output \
+                and output_option == "infectiousness":
             infect_data = {column: 0 for column in
                            self.ih_infectiousness_writer.fieldnames}
             for cell in self.population.cells:
@@ -532,6 +689,124 @@ class Simulation:
     def add_writer(self, writer: AbstractReporter):
         self.writers.append(writer)
 
+    def _reporters(self) -> typing.List[AbstractReporter]:
+        """Returns every reporter used by the simulation.
+
+        """
+        reporters = list(self.writers)
+        for value in vars(self).values():
+            if isinstance(value, AbstractReporter):
+                reporters.append(value)
+        return reporters
+
+    def _end_timestep(self):
+        """Marks the end of a timestep for every reporter, so that those
+        which buffer their output write it to file at their flush interval.
+
+        """
+        for reporter in self._reporters():
+            reporter.end_timestep()
+
+    def save_checkpoint(self, path: str):
+        """Saves the state of the simulation to a checkpoint file, from
+        which it can be continued with :meth:`resume`.
+
+        The checkpoint contains a :class:`PopulationSnapshot` of the
+        population, the sweeps (with their internal state, such as the
+        active status of each intervention), the length of each output file
+        written so far, the parameters of the simulation and the state of
+        Python's and NumPy's random number generators.
+
+        Parameters
+        ----------
+        path : str
+            Path of the checkpoint file
+
+        """
+        arrays, objects = PopulationSnapshot._to_arrays(self.population)
+        buffer = io.BytesIO()
+        _CheckpointPickler(buffer, objects).dump({'simulation': self})
+        arrays['simulation'] = np.frombuffer(buffer.getvalue(),
+                                             dtype=np.uint8)
+        np.savez(path, **arrays)
+        logging.info(f"Saved checkpoint to {path}")
+
+    @staticmethod
+    def load_checkpoint(checkpoint: str, output_dir: str = None):
+        """Loads a simulation from a checkpoint file made by
+        :meth:`save_checkpoint`, ready to be continued with
+        :meth:`run_sweeps`. The parameters of the simulation and the state
+        of the random number generators are restored to their values when
+        the checkpoint was made.
+
+        Output files are truncated to their length at the checkpoint, and
+        written to from there. If an output folder is given, the output up
+        to the checkpoint is instead copied into that folder (leaving the
+        original files unchanged), and all output and later checkpoints are
+        written there. This allows several scenarios to be forked from the
+        same checkpoint, for example after changing the parameters or the
+        sweeps of the loaded simulation.
+
+        Parameters
+        ----------
+        checkpoint : str
+            Path of the checkpoint file
+        output_dir : str
+            Location of the output files of the continued simulation, as a
+            relative path. Defaults to the original locations
+
+        Returns
+        -------
+        Simulation
+            Simulation in the state it was saved
+
+        """
+        with np.load(checkpoint, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+        objects = PopulationSnapshot._from_arrays(
+            arrays, restore_random_state=True)[1]
+        state = _CheckpointUnpickler(
+            io.BytesIO(arrays['simulation'].tobytes()), objects).load()
+
+        sim = state['simulation']
+        folder = None
+        if output_dir is not None:
+            folder = os.path.join(os.getcwd(), output_dir)
+            if sim.checkpoint_dir is not None:
+                sim.checkpoint_dir = folder
+        for reporter in sim._reporters():
+            reporter.reopen(folder)
+        if sim.event_log_writer:
+            sim.population.set_event_log(sim.event_log_writer)
+        logging.info(f"Loaded checkpoint from {checkpoint} after"
+                     + f" {sim._steps_completed} timesteps")
+        return sim
+
+    @staticmethod
+    def resume(checkpoint: str, output_dir: str = None):
+        """Loads a simulation from a checkpoint file with
+        :meth:`load_checkpoint` and runs it to the end. For a given
+        checkpoint the output is identical to that of the original
+        simulation.
+
+        Parameters
+        ----------
+        checkpoint : str
+            Path of the checkpoint file
+        output_dir : str
+            Location of the output files of the continued simulation, as a
+            relative path. Defaults to the original locations
+
+        Returns
+        -------
+        Simulation
+            Simulation which has been run to the end
+
+        """
+        sim = Simulation.load_checkpoint(checkpoint, output_dir)
+        sim.run_sweeps()
+        return sim
+
     def compress_csv(self):
         """Compresses the infection history csvs when they are written.
 
@@ -10,7 +10,8 @@ import math
 
 from pyEpiabm.core import Population, Parameters
 from pyEpiabm.property import PlaceType
-from pyEpiabm.utility import DistanceFunctions, log_exceptions
+from pyEpiabm.utility import DistanceFunctions, SpatialIndex, \
+    log_exceptions
 
 from .abstract_population_config import AbstractPopulationFactory
 
@@ -184,20 +185,23 @@ class ToyPopulationFactory(AbstractPopulationFactory):
         """
         try:
             if method == "random":
-                for cell in population.cells:
+                # Index of cell locations, updated as cells are placed, to
+                # find the cells near each candidate microcell location
+                spatial_index = SpatialIndex(
+                    [cell.location for cell in population.cells],
+                    bucket_size=1 / math.sqrt(max(len(population.cells), 1)))
+                for i, cell in enumerate(population.cells):
                     cell.set_location(tuple(np.random.rand(2)))
+                    spatial_index.move(i, cell.location)
                     for microcell in cell.microcells:
                         while True:
                             # Will keep random location only if microcell
                             # is closer to its cell's location than any other.
-                            # Not very efficient.
                             microcell.set_location(tuple(np.random.rand(2)))
                             cell_dist = (DistanceFunctions.dist(microcell.
                                          location, cell.location))
-                            inter_dist = [DistanceFunctions.dist(microcell.
-                                          location, cell2.location) for cell2
-                                          in population.cells]
-                            if min(inter_dist) == cell_dist:
+                            if not spatial_index.any_within(
+                                    microcell.location, cell_dist):
                                 break
 
             elif method == "uniform_x":
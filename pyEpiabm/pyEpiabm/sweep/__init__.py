@@ -9,14 +9,21 @@
 from .abstract_sweep import AbstractSweep
 from .initial_demographics_sweep import InitialDemographicsSweep
 from .host_progression_sweep import HostProgressionSweep
+from .batched_host_progression_sweep import BatchedHostProgressionSweep
+from .calendar_host_progression_sweep import CalendarHostProgressionSweep
 from .household_sweep import HouseholdSweep
+from .batched_household_sweep import BatchedHouseholdSweep
 from .initial_household_sweep import InitialHouseholdSweep
 from .initial_infected_sweep import InitialInfectedSweep
 from .place_sweep import PlaceSweep
+from .batched_place_sweep import BatchedPlaceSweep
 from .initial_place_sweep import InitialisePlaceSweep
 from .queue_sweep import QueueSweep
 from .spatial_sweep import SpatialSweep
+from .cached_spatial_sweep import CachedSpatialSweep
 from .update_place_sweep import UpdatePlaceSweep
+from .pooled_update_place_sweep import PooledUpdatePlaceSweep
+from .lazy_update_place_sweep import LazyUpdatePlaceSweep
 from .intervention_sweep import InterventionSweep
 from .travel_sweep import TravelSweep
 from .transition_matrices import StateTransitionMatrix, TransitionTimeMatrix
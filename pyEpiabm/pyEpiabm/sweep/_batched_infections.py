@@ -0,0 +1,87 @@
+#
+# Array helpers for the batched transmission sweeps
+#
+
+import typing
+
+import numpy as np
+
+
+def pair_indices(infector_counts: np.ndarray,
+                 infectee_counts: np.ndarray) \
+        -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the indices of every (infector, infectee) pair within each
+    group, where the infectors (and the infectees) of each group are stored
+    consecutively, in group order.
+
+    Parameters
+    ----------
+    infector_counts : np.ndarray
+        Number of infectors in each group
+    infectee_counts : np.ndarray
+        Number of infectees in each group
+
+    Returns
+    -------
+    typing.Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Group, infector and infectee index of each pair. The pairs of each
+        group are ordered by infector, then by infectee
+
+    """
+    infector_starts = np.cumsum(infector_counts) - infector_counts
+    infectee_starts = np.cumsum(infectee_counts) - infectee_counts
+    pair_counts = infector_counts * infectee_counts
+    pair_group = np.repeat(np.arange(len(pair_counts)), pair_counts)
+    local = np.arange(pair_counts.sum()) \
+        - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+    pair_infector = infector_starts[pair_group] \
+        + local // infectee_counts[pair_group]
+    pair_infectee = infectee_starts[pair_group] \
+        + local % infectee_counts[pair_group]
+    return pair_group, pair_infector, pair_infectee
+
+
+def draw_infections(pair_infectee: np.ndarray, probability: np.ndarray,
+                    num_infectees: int) -> np.ndarray:
+    """Draws which infectees are infected, each with probability
+    1 - prod(1 - p) over the probabilities p of their pairs, and the pair
+    responsible for each infection, chosen with probability proportional to
+    p among the pairs of the infectee.
+
+    Parameters
+    ----------
+    pair_infectee : np.ndarray
+        Infectee index of each pair
+    probability : np.ndarray
+        Probability of infection of each pair, between 0 and 1
+    num_infectees : int
+        Number of infectees
+
+    Returns
+    -------
+    np.ndarray
+        Index of the pair responsible for each infection, in infectee order
+
+    """
+    with np.errstate(divide='ignore'):
+        log_escape = np.bincount(pair_infectee,
+                                 weights=np.log1p(-probability),
+                                 minlength=num_infectees)
+    infected = np.random.random(num_infectees) < -np.expm1(log_escape)
+    if not infected.any():
+        return np.zeros(0, dtype=int)
+
+    # Choose the pair of each infectee using the cumulative probability over
+    # the pairs of each infectee, in pair order
+    order = np.argsort(pair_infectee, kind='stable')
+    order = order[infected[pair_infectee[order]]]
+    cumulative = np.cumsum(probability[order])
+    pair_counts = np.bincount(pair_infectee[order],
+                              minlength=num_infectees)[infected]
+    ends = np.cumsum(pair_counts)
+    starts = ends - pair_counts
+    offsets = np.concatenate(([0.0], cumulative))[starts]
+    chosen = np.searchsorted(
+        cumulative, offsets + np.random.random(len(starts))
+        * (cumulative[ends - 1] - offsets), side='right')
+    return order[np.clip(chosen, starts, ends - 1)]
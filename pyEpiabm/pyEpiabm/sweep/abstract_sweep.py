@@ -2,24 +2,40 @@
 # AbstractSweep Class
 #
 
-from pyEpiabm.core import Population
+from pyEpiabm.core import Parameters, Population
 
 
 class AbstractSweep:
     """Abstract class for Population Sweeps.
 
     """
-    def bind_population(self, population: Population):
-        """Set the population which the sweep will act on.
+    def bind_population(self, population: Population, parameters=None):
+        """Set the population which the sweep will act on, and the
+        parameters it uses.
 
         Parameters
         ----------
         population : Population
             Population: :class:`Population` to bind
+        parameters : Parameters
+            Parameters object to bind, as returned by
+            :meth:`Parameters.from_file`. If not given, the sweep uses
+            the current :meth:`Parameters.instance` each time
 
         """
         # Possibly add check to see if self._population has already been set
         self._population = population
+        self._parameters = parameters
+
+    @property
+    def parameters(self):
+        """Parameters used by the sweep, being those bound with the
+        population, or else the current :meth:`Parameters.instance`.
+
+        """
+        parameters = getattr(self, '_parameters', None)
+        return parameters if parameters is not None \
+            else Parameters.instance()
 
     def __call__(self, time: float):
         """Run sweep over population.
@@ -33,12 +49,14 @@ class AbstractSweep:
         raise NotImplementedError
 
     @staticmethod
-    def store_infection_periods(infector, infectee, time):
+    def store_infection_periods(infector, infectee, time,
+                                setting: str = None):
         """Sets the exposure_period of the infectee (defined as the time
         between the infector having status I and the infectee having status
         E. Also sets stores the infector's latent period within the infectee
         (to be used in calculating the generation time). This is called during
-        the daily sweeps.
+        the daily sweeps. The infector and setting of the infection are also
+        recorded in the event log of the population, if one is attached.
 
         Parameters
         ----------
@@ -48,8 +66,14 @@ class AbstractSweep:
             Current secondary case
         time : float
             Current simulation time
+        setting : str
+            Setting of the infection, such as 'household', 'spatial' or the
+            name of the type of a place
         """
         inf_to_exposed = (time -
                           infector.infection_start_times[-1])
         infectee.set_exposure_period(inf_to_exposed)
         infectee.set_infector_latent_period(infector.latent_period)
+        event_log = infectee.microcell.cell.event_log
+        if event_log is not None:
+            event_log.record_infector(infectee, infector, setting)
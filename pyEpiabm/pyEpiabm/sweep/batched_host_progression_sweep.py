@@ -0,0 +1,306 @@
+#
+# Batched progression of infection within individuals
+#
+
+import numpy as np
+
+from pyEpiabm.property import InfectionStatus
+
+from .host_progression_sweep import HostProgressionSweep
+
+# Values of the statuses in which a person is infectious
+_INFECTIOUS = [status.value for status in InfectionStatus
+               if status.name.startswith('Infect')]
+
+
+class BatchedHostProgressionSweep(HostProgressionSweep):
+    """Class for sweeping through the population and updating host infection
+    status and time to next infection status change, as in
+    :class:`HostProgressionSweep`, but working on whole columns of the
+    population's :class:`PersonStore` at once.
+
+    At each timestep the people whose status change is due are selected with
+    a boolean mask. Their next statuses are drawn with a categorical sampler
+    per (status, age group) pair, their transition times with batched inverse
+    CDF draws, and the infectiousness of every infectious person is then
+    updated in a single array operation. People who need individual
+    treatment (care home residents, and recovered people when waning
+    immunity is used) fall back to the per-person methods of
+    :class:`HostProgressionSweep`.
+
+    Random numbers are drawn from NumPy in batches, so for a given seed the
+    trajectories differ from those of :class:`HostProgressionSweep`, although
+    the transition probabilities and time distributions are the same.
+
+    """
+
+    def bind_population(self, population, parameters=None):
+        """Binds the population to the sweep, moving its state into a
+        :class:`PersonStore` if it is not already held in one.
+
+        Parameters
+        ----------
+        population : Population
+            Population to bind
+        parameters : Parameters
+            Parameters object to bind, see
+            :meth:`AbstractSweep.bind_population`
+
+        """
+        super().bind_population(population, parameters)
+        self._store = population.build_person_store()
+
+    def _testing_active(self):
+        """Returns whether the disease testing intervention is configured
+        in the parameters bound to the sweep.
+
+        """
+        return 'disease_testing' in getattr(self.parameters,
+                                            'intervention_params', {})
+
+    def _set_infectiousness_batch(self, rows: np.ndarray,
+                                  status: np.ndarray, time: float):
+        """Assigns the initial infectiousness and infection start time of
+        people who have just become infectious, as in
+        :meth:`HostProgressionSweep.set_infectiousness`.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Rows of the newly infectious people in the person store
+        status : np.ndarray
+            Values of their current infection statuses
+        time : float
+            Current simulation time
+
+        """
+        if time < 0:
+            raise ValueError('The infection start time cannot be negative')
+        params = self.parameters
+        scale = np.where(status == InfectionStatus.InfectASympt.value,
+                         params.asympt_infectiousness,
+                         params.sympt_infectiousness)
+        self._store.initial_infectiousness[rows] = \
+            np.random.gamma(1, 1, len(rows)) * scale
+        self._store.infection_start_time[rows] = time
+        for row in rows:
+            person = self._store.persons[row]
+            person.infection_start_times.append(time)
+            person.increment_num_times_infected()
+            person.secondary_infections_counts.append(0)
+
+    def _draw_next_status_batch(self, rows: np.ndarray, status: np.ndarray):
+        """Draws the next infection status of several people at once from
+        the cumulative transition weights of their (status, age group).
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Rows of the people in the person store
+        status : np.ndarray
+            Values of their current infection statuses
+
+        """
+        if self._cumulative_weights.shape[1] == 1:
+            # Transition probabilities do not depend on age
+            cumulative = self._cumulative_weights[status, 0]
+        else:
+            cumulative = self._cumulative_weights[
+                status, self._store.age_group[rows]]
+        total = cumulative[:, -1]
+        if np.any(total <= 0):
+            raise ValueError('Total of weights must be greater than zero')
+        thresholds = np.random.random(len(rows)) * total
+        self._store.next_status[rows] = \
+            1 + np.sum(cumulative <= thresholds[:, None], axis=1)
+
+    def _draw_transition_time_batch(self, status: np.ndarray,
+                                    next_status: np.ndarray) -> np.ndarray:
+        """Draws transition times for several people at once, using one
+        batched inverse CDF draw per (status, next status) pair.
+
+        Parameters
+        ----------
+        status : np.ndarray
+            Values of the people's current infection statuses
+        next_status : np.ndarray
+            Values of their next infection statuses
+
+        Returns
+        -------
+        np.ndarray
+            Array of transition times
+
+        """
+        transition_time = np.empty(len(status))
+        keys = status.astype(int) * (self.number_of_states + 1) + next_status
+        for key in np.unique(keys):
+            selected = keys == key
+            pair = divmod(int(key), self.number_of_states + 1)
+            sampler = self._time_samplers[pair]
+            if sampler is not None:
+                transition_time[selected] = sampler.icdf_choose_noexp_array(
+                    np.count_nonzero(selected))
+            else:
+                transition_time[selected] = self._fixed_times[pair]
+        return transition_time
+
+    def _transition_batch(self, rows: np.ndarray, time: float,
+                          testing_rows: list) -> np.ndarray:
+        """Moves each given person to their next infection status and
+        assigns their following status and time of status change.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Rows of the people whose status change is due
+        time : float
+            Current simulation time
+        testing_rows : list
+            List of rows of asymptomatic or uninfected people, which is
+            extended with the people who have just become asymptomatic. None
+            if disease testing is not used
+
+        Returns
+        -------
+        np.ndarray
+            Rows of the people whose next status change is also due
+
+        """
+        store = self._store
+        waning = self.parameters.use_waning_immunity
+        persons = [store.persons[row] for row in rows]
+        for person in persons:
+            person.update_status(person.next_infection_status)
+        status = store.status[rows]
+
+        infected = np.isin(status, [InfectionStatus.InfectASympt.value,
+                                    InfectionStatus.InfectMild.value,
+                                    InfectionStatus.InfectGP.value])
+        if np.any(infected):
+            self._set_infectiousness_batch(rows[infected], status[infected],
+                                           time)
+            if testing_rows is not None:
+                testing_rows.extend(rows[infected & (
+                    status == InfectionStatus.InfectASympt.value)])
+
+        # Final statuses have no next status, and people needing individual
+        # treatment are passed to the per-person method
+        recovered = status == InfectionStatus.Recovered.value
+        final = np.isin(status, [InfectionStatus.Dead.value,
+                                 InfectionStatus.Vaccinated.value])
+        if not waning:
+            final |= recovered
+        individual = np.fromiter(
+            (person.care_home_resident or
+             bool(waning and person.time_of_recovery)
+             for person in persons), dtype=bool, count=len(persons)) & ~final
+        regular = ~(final | individual)
+        store.next_status[rows[final]] = 0
+        for k in np.flatnonzero(individual):
+            self.update_next_infection_status(persons[k], time)
+        if np.any(regular):
+            self._draw_next_status_batch(rows[regular], status[regular])
+
+        # People who have become susceptible again wait to be infected
+        timed = status != InfectionStatus.Susceptible.value
+        store.time_of_status_change[rows[~timed]] = np.nan
+        for k in np.flatnonzero(recovered):
+            persons[k].set_time_of_recovery(time)
+
+        transition_time = np.full(len(rows), np.inf)
+        drawn = timed & ~final
+        if waning:
+            transition_time[recovered] = 1
+            drawn &= ~recovered
+        if np.any(drawn):
+            transition_time[drawn] = self._draw_transition_time_batch(
+                status[drawn], store.next_status[rows[drawn]])
+        transition_time[np.isin(status, [InfectionStatus.InfectMild.value,
+                                         InfectionStatus.InfectGP.value])] \
+            += self.delay
+        if np.any(transition_time[timed] < 0):
+            raise ValueError('New transition time must be larger than' +
+                             ' or equal to 0')
+        store.time_of_status_change[rows[timed]] = \
+            time + transition_time[timed]
+        # The columns were written directly, so the status calendars of the
+        # cells are brought up to date as the setters of Person would do
+        for person in persons:
+            person.microcell.cell.update_status_calendar(person)
+
+        for k in np.flatnonzero(status == InfectionStatus.Exposed.value):
+            persons[k].set_latent_period(float(transition_time[k]))
+            persons[k].store_generation_time()
+            persons[k].store_serial_interval()
+        if testing_rows is not None:
+            for k in np.flatnonzero(timed):
+                self.sympt_testing_queue(persons[k].microcell.cell,
+                                         persons[k])
+
+        rows = rows[timed]
+        return rows[store.time_of_status_change[rows] <= time]
+
+    def _update_infectiousness_batch(self, time: float):
+        """Updates the infectiousness of every infectious person from their
+        initial infectiousness and time since infection, and sets it to 0
+        for people who have recovered, died or been vaccinated, as in
+        :meth:`HostProgressionSweep._updates_infectiousness`.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        """
+        store = self._store
+        size = len(store)
+        status = store.status[:size]
+        rows = np.flatnonzero(store.active[:size] &
+                              np.isin(status, _INFECTIOUS))
+        time_since_infection = ((time - store.infection_start_time[rows])
+                                / self.model_time_step).astype(int)
+        store.infectiousness[rows] = store.initial_infectiousness[rows] * \
+            self.infectiousness_progression[time_since_infection]
+        cleared = np.isin(status, [InfectionStatus.Recovered.value,
+                                   InfectionStatus.Dead.value,
+                                   InfectionStatus.Vaccinated.value])
+        store.infectiousness[:size][cleared] = 0
+
+    def __call__(self, time: float):
+        """Selects the people whose infection status change is due, updates
+        their infection status and assigns them their next infection status
+        and the time of their next status change, repeating while further
+        changes are due in this timestep. Then updates the infectiousness
+        of the whole population.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        """
+        store = self._store
+        size = len(store)
+        active = store.active[:size]
+        time_of_change = store.time_of_status_change[:size]
+
+        # Rows of uninfected or asymptomatic people, for disease testing
+        testing_rows = None
+        if self._testing_active():
+            testing_rows = list(np.flatnonzero(active & (
+                np.isnan(time_of_change) |
+                np.isin(store.status[:size],
+                        [InfectionStatus.Recovered.value,
+                         InfectionStatus.Vaccinated.value]))))
+
+        rows = np.flatnonzero(active & (time_of_change <= time))
+        self._check_matrices()
+        while rows.size > 0:
+            rows = self._transition_batch(rows, time, testing_rows)
+        self._update_infectiousness_batch(time)
+
+        if testing_rows is not None:
+            self.asympt_uninf_testing_queue(
+                [(store.persons[row].microcell.cell, store.persons[row])
+                 for row in testing_rows], time)
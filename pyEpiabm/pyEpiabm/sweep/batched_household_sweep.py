@@ -0,0 +1,126 @@
+#
+# Batched infection due to contact within households
+#
+
+import numpy as np
+
+from pyEpiabm.property import HouseholdInfection
+
+from ._batched_infections import draw_infections, pair_indices
+from .household_sweep import HouseholdSweep
+
+
+class BatchedHouseholdSweep(HouseholdSweep):
+    """Class to run the intra-household infections, as in
+    :class:`HouseholdSweep`, but drawing one infection event per
+    susceptible household member rather than one per (infector, infectee)
+    pair.
+
+    The household force of infection factorises into a part depending only
+    on the infector and parts depending only on the infectee (see
+    :meth:`HouseholdInfection.household_infector_scale` and
+    :meth:`HouseholdInfection.household_infectee_scales`), so each of these
+    is calculated once per person. The force of infection of every pair in
+    every household with an infector is then found in a single array
+    operation, and each susceptible member is infected with probability
+    1 - prod(1 - foi) over the infectors in their household. The infector
+    of each new infection is chosen with probability proportional to their
+    force of infection on the infectee, for the secondary infection
+    bookkeeping.
+
+    Random numbers are drawn from NumPy in batches, so for a given seed the
+    infections differ from those of :class:`HouseholdSweep`, although the
+    probability that each person is infected is the same. Each infectee is
+    enqueued at most once per timestep.
+
+    """
+    def __call__(self, time: float):
+        """Given a population structure, finds the infectors in each
+        household and considers whether they infected the susceptible
+        household members, based on individual infectiousness and
+        susceptibility.
+
+        Parameters
+        ----------
+        time : float
+            Simulation time
+
+        """
+        parameters = self.parameters
+        modifiers = self._population.intervention_modifiers
+        # Index of each household with an infector, in the order they are
+        # first met. Few container objects are kept alive here, as creating
+        # many would trigger garbage collection of the whole population.
+        household_index = {}
+        cells = []
+        infectors = []
+        infector_household = []
+        for cell in self._population.cells:
+            for infector in cell.infectors():
+                household = infector.household
+                if household is None:
+                    raise AttributeError(f"{infector} is not part of a "
+                                         + "household")
+                h = household_index.get(household)
+                if h is None:
+                    h = household_index[household] = len(cells)
+                    cells.append(cell)
+                infectors.append(infector)
+                infector_household.append(h)
+        if not infectors:
+            return
+        households = list(household_index)
+        infectee_counts = np.array([len(household.susceptible_persons)
+                                    for household in households])
+        if not infectee_counts.any():
+            return
+
+        # Group the infectors by household, leaving out those with no
+        # susceptible household members
+        infector_household = np.array(infector_household)
+        order = np.argsort(infector_household, kind='stable')
+        order = order[infectee_counts[infector_household[order]] > 0]
+        infectors = [infectors[i] for i in order.tolist()]
+        infector_counts = np.bincount(infector_household[order],
+                                      minlength=len(households))
+        infectees = [infectee for household in households
+                     for infectee in household.susceptible_persons]
+
+        infector_scale = np.array(
+            [HouseholdInfection.household_infector_scale(infector, time,
+                                                         parameters, modifiers)
+             for infector in infectors], dtype=float)
+        quarantine_scale = []
+        susceptibility = []
+        for infectee in infectees:
+            scales = HouseholdInfection.household_infectee_scales(
+                infectee, time, parameters, modifiers)
+            quarantine_scale.append(scales[0])
+            susceptibility.append(scales[1])
+        quarantine_scale = np.array(quarantine_scale, dtype=float)
+        susceptibility = np.array(susceptibility, dtype=float)
+
+        # Multiplied in the same order as HouseholdInfection.household_foi
+        _, pair_infector, pair_infectee = pair_indices(infector_counts,
+                                                       infectee_counts)
+        force_of_infection = np.minimum((infector_scale[pair_infector]
+                                         * quarantine_scale[pair_infectee])
+                                        * susceptibility[pair_infectee], 1)
+        chosen = draw_infections(pair_infectee, force_of_infection,
+                                 len(infectees))
+        if len(chosen) == 0:
+            return
+
+        infectee_household = np.repeat(np.arange(len(cells)),
+                                       infectee_counts)
+        for i, j in zip(pair_infector[chosen].tolist(),
+                        pair_infectee[chosen].tolist()):
+            infector = infectors[i]
+            infectee = infectees[j]
+            cells[infectee_household[j]].enqueue_person(infectee)
+            # Increment the infector's secondary_infections_count
+            infector.increment_secondary_infections()
+            # Stores the exposure period and infector's latent
+            # period within attributes of the infectee
+            self.store_infection_periods(infector, infectee, time,
+                                         "household")
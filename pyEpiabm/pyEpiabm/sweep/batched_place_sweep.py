@@ -0,0 +1,137 @@
+#
+# Batched infection due to contact in social spaces outside of households
+#
+
+import numpy as np
+
+from pyEpiabm.property import PlaceInfection
+
+from .place_sweep import PlaceSweep
+
+
+class BatchedPlaceSweep(PlaceSweep):
+    """Class to run the place infections, as in :class:`PlaceSweep`, but
+    summing the infectiousness of the infectors in each place group and
+    drawing the infections of each group at once, rather than drawing the
+    contacts of each infector and one infection event per contact.
+
+    As in :class:`PlaceSweep`, each infector meets each member of their
+    place group with probability equal to their place infectiousness, and
+    infects each susceptible member they meet with probability equal to the
+    place force of infection (or always, if their infectiousness is above
+    one). The force of infection is the product of a factor of the infector
+    (place infectiousness and isolation) and a factor of the infectee (place
+    susceptibility and quarantine), apart from the scaling of key workers in
+    care homes. The infector factors, weighted by the probability of
+    meeting, are therefore summed over the infectors of each group, and each
+    susceptible member is infected with probability 1 - exp(-h), where h is
+    this sum times their own factor. This matches the probability
+    1 - prod(1 - foi) of :class:`PlaceSweep` when the force of infection of
+    each contact is small, and slightly underestimates it otherwise. The
+    infector of each new infection is chosen with probability proportional
+    to their share of the sum, for the secondary infection bookkeeping.
+
+    The group of each infector is read from :attr:`Person.places` rather
+    than searched for, and random numbers are drawn once per group, so for
+    a given seed the infections differ from those of :class:`PlaceSweep`.
+    Each infectee is enqueued at most once per timestep.
+
+    """
+    def __call__(self, time: float):
+        """Given a population structure with places, sums the infectiousness
+        of the infectors in each place group, and considers whether they
+        infected the susceptible members of the group, based on individual
+        and place infectiousness and susceptibility.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        """
+        modifiers = self._population.intervention_modifiers
+        groups = {}
+        for cell in self._population.cells:
+            for infector in cell.infectors():
+                for place, group in infector.places:
+                    place_inf = PlaceInfection.place_inf(
+                        place, infector, time, self.parameters, modifiers)
+                    if place_inf <= 0:
+                        continue
+                    entries = groups.setdefault((place, group), [])
+                    entries.append((cell, infector, place_inf))
+
+        infected = set()
+        for (place, group), entries in groups.items():
+            infectees = [person for person in place.person_groups[group]
+                         if person.is_susceptible()
+                         and person not in infected]
+            if not infectees:
+                continue
+            cells, infectors, infectiousness = zip(*entries)
+            infectiousness = np.array(infectiousness, dtype=float)
+            certain = infectiousness > 1
+            if certain.any():
+                # High infectiousness (> 1) means all susceptible members
+                # become infected, by one of the highly infectious infectors
+                weights = certain.astype(float)
+                infectee_weights = [weights] * len(infectees)
+                new_infectees = infectees
+            else:
+                isolation = np.array([PlaceInfection.place_isolation_scale(
+                    infector, time, self.parameters, modifiers)
+                    for infector in infectors])
+                weights = infectiousness * infectiousness * isolation
+
+                # Key workers in care homes scale the force of infection of
+                # every contact they are part of
+                if place.place_type.value == 5:
+                    scaling = self.parameters.carehome_params[
+                        "carehome_worker_group_scaling"]
+                    key_workers = np.array([infector.key_worker
+                                            for infector in infectors])
+                    key_weights = weights * scaling
+                    other_weights = np.where(key_workers, key_weights,
+                                             weights)
+                    infectee_weights = [key_weights if person.key_worker
+                                        else other_weights
+                                        for person in infectees]
+                else:
+                    infectee_weights = [weights] * len(infectees)
+
+                susceptibility = np.empty(len(infectees))
+                for j, infectee in enumerate(infectees):
+                    quarantine_scale = PlaceInfection.place_quarantine_scale(
+                        place, infectee, time, self.parameters, modifiers)
+                    susceptibility[j] = PlaceInfection.place_susc(
+                        place, infectee, time, self.parameters,
+                        modifiers) * quarantine_scale * quarantine_scale
+                hazard = susceptibility * np.array(
+                    [w.sum() for w in infectee_weights])
+                drawn = (np.random.random(len(infectees))
+                         < -np.expm1(-hazard)).tolist()
+                new_infectees = [infectee for infectee, d
+                                 in zip(infectees, drawn) if d]
+                infectee_weights = [w for w, d
+                                    in zip(infectee_weights, drawn) if d]
+            if not new_infectees:
+                continue
+
+            # Choose the infector of each infectee with probability
+            # proportional to their share of the infectee's hazard
+            draws = np.random.random(len(new_infectees))
+            for infectee, w, r in zip(new_infectees, infectee_weights,
+                                      draws.tolist()):
+                cumulative = np.cumsum(w)
+                i = min(int(np.searchsorted(cumulative, r * cumulative[-1],
+                                            side='right')),
+                        len(infectors) - 1)
+                infector = infectors[i]
+                infected.add(infectee)
+                cells[i].enqueue_person(infectee)
+                # Increment the infector's secondary_infections_count
+                infector.increment_secondary_infections()
+                # Stores the exposure period and infector's latent
+                # period within attributes of the infectee
+                self.store_infection_periods(
+                    infector, infectee, time, place.place_type.name)
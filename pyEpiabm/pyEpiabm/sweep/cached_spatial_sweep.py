@@ -0,0 +1,300 @@
+#
+# Infection between cells using cached neighbour structures
+#
+
+import bisect
+import logging
+import random
+
+import numpy as np
+
+from pyEpiabm.property import InfectionStatus, SpatialInfection
+from pyEpiabm.utility import DistanceFunctions, SpatialKernel
+
+from .spatial_sweep import SpatialSweep
+
+
+class CachedSpatialSweep(SpatialSweep):
+    """Class to run the inter-cell space infections, as in
+    :class:`SpatialSweep`, without the work per infectious cell growing
+    with the number of cells in the population.
+
+    When the population is bound, the neighbours of each cell (the cells
+    within the infection radius) are stored in a compressed sparse row (CSR)
+    structure, together with their distances. At each timestep the number
+    of susceptible people and the size of every cell are read once, so the
+    number of susceptibles outside a given cell is found by subtraction
+    rather than by summing over all other cells. Infectee cells are drawn by
+    bisection of the cumulative distance weights of the infector cell's
+    neighbours, which are only recomputed when cell sizes change.
+
+    In CovidSim mode, every other cell can be sampled, so the spatial
+    kernel between each pair of cells, and the ratio of this kernel to the
+    kernel of the minimum distance between their microcells (the
+    probability of accepting a sampled infectee), are computed once with
+    NumPy from arrays of the cell and microcell locations, and held as two
+    dense matrices of the size of the number of cells squared. The cell
+    weights are then accumulated once per infector rather than once per
+    rejection sampling step.
+
+    The cumulative weights are accumulated in the same order as in
+    :meth:`SpatialSweep.find_infectees` and
+    :meth:`SpatialSweep.find_infectees_Covidsim`, and the same random
+    numbers are drawn, so for a given seed the infection events are those
+    of :class:`SpatialSweep`. In CovidSim mode the kernels are computed by
+    NumPy rather than one at a time in Python, so they may differ in the
+    last bit, which only changes an event if a random number falls between
+    the two values.
+
+    """
+
+    def bind_population(self, population, parameters=None):
+        """Binds the population to the sweep, finding the nearby cells of
+        each cell and storing them in CSR form.
+
+        Parameters
+        ----------
+        population : Population
+            Population to bind
+        parameters : Parameters
+            Parameters object to bind, see
+            :meth:`AbstractSweep.bind_population`
+
+        """
+        super().bind_population(population, parameters)
+        cell_indices = {cell.id: i for i, cell in enumerate(population.cells)}
+        indptr = [0]
+        indices = []
+        distances = []
+        for cell in population.cells:
+            # Neighbours are kept in population order, as in find_infectees
+            row = sorted((cell_indices[cell_id], distance) for cell_id,
+                         distance in cell.nearby_cell_distances.items()
+                         if cell_id in cell_indices)
+            indices.extend(i for i, _ in row)
+            distances.extend(distance for _, distance in row)
+            indptr.append(len(indices))
+        self._indptr = np.array(indptr, dtype=np.int64)
+        self._indices = np.array(indices, dtype=np.int64)
+        self._distances = np.array(distances, dtype=np.float64)
+        self._cell_sizes = None
+        self._cumulative_rows = {}
+        self._kernels = None
+        self._acceptance = None
+
+    def _update_cell_sizes(self):
+        """Reads the number of people in each cell, discarding the cached
+        cumulative weights if any cell has changed size (for example when
+        travellers arrive or leave).
+
+        """
+        sizes = np.fromiter((len(cell.persons)
+                             for cell in self._population.cells),
+                            dtype=np.int64,
+                            count=len(self._population.cells))
+        if self._cell_sizes is None or \
+                not np.array_equal(sizes, self._cell_sizes):
+            self._cell_sizes = sizes
+            self._cumulative_rows = {}
+
+    def _cumulative_weights(self, cell_index: int):
+        """Returns the neighbours of a cell and their cumulative distance
+        weights (size of the neighbour divided by its distance).
+
+        Parameters
+        ----------
+        cell_index : int
+            Index of the cell in the population
+
+        Returns
+        -------
+        tuple
+            List of neighbour indices and list of cumulative weights
+
+        """
+        try:
+            return self._cumulative_rows[cell_index]
+        except KeyError:
+            start, end = self._indptr[cell_index:cell_index + 2]
+            neighbours = self._indices[start:end]
+            weights = self._cell_sizes[neighbours] / \
+                self._distances[start:end]
+            row = (neighbours.tolist(), np.cumsum(weights).tolist())
+            self._cumulative_rows[cell_index] = row
+            return row
+
+    def find_infectees_cached(self, cell_index: int, number_to_infect: int):
+        """Given the index of an infector cell and the number of people
+        needed to infect, chooses infectee cells among the cell's neighbours
+        (weighted by size over distance) and an infectee in each, as in
+        :meth:`SpatialSweep.find_infectees`.
+
+        Parameters
+        ----------
+        cell_index : int
+            Index of the infector cell in the population
+        number_to_infect : int
+            Maximum number of people to infect
+
+        Returns
+        -------
+        typing.List[Person]
+            List of exposed people to test an infection event
+
+        """
+        cells = self._population.cells
+        neighbours, cumulative = self._cumulative_weights(cell_index)
+        if not cumulative or cumulative[-1] == 0:
+            infector_cell = cells[cell_index]
+            cutoff = self.parameters.infection_radius
+            logging.exception("ValueError: no cells"
+                              + f" within radius {cutoff} of"
+                              + f" cell {infector_cell.id} at location"
+                              + f" {infector_cell.location} - skipping cell.")
+            return []
+
+        total = cumulative[-1] + 0.0
+        hi = len(cumulative) - 1
+        cell_list = [cells[neighbours[bisect.bisect(
+            cumulative, random.random() * total, 0, hi)]]
+            for _ in range(number_to_infect)]
+        return [random.sample(infectee_cell.persons, 1)[0]
+                for infectee_cell in cell_list]
+
+    def _compute_kernels(self):
+        """Computes the spatial kernel between each pair of cells, and the
+        probability of accepting an infectee sampled in one cell from an
+        infector in another, being the ratio of this kernel to the kernel
+        of the minimum distance between the microcells of the two cells.
+
+        """
+        cells = self._population.cells
+        locations = np.array([cell.location for cell in cells],
+                             dtype=np.float64).reshape(-1, 2)
+        microcell_locations = np.array(
+            [microcell.location for cell in cells
+             for microcell in cell.microcells],
+            dtype=np.float64).reshape(-1, 2)
+        counts = np.array([len(cell.microcells) for cell in cells],
+                          dtype=np.int64)
+        offsets = np.cumsum(counts) - counts
+        has_microcells = counts > 0
+        self._kernels = np.empty((len(cells), len(cells)))
+        self._acceptance = np.empty((len(cells), len(cells)))
+        for i in range(len(cells)):
+            self._kernels[i] = SpatialKernel.weighting(
+                DistanceFunctions.dist(locations.T, tuple(locations[i])))
+            # Minimum distance between the microcells of each cell and
+            # those of this cell
+            minimum = np.full(len(cells), np.inf)
+            if counts[i] > 0:
+                distances = np.min([DistanceFunctions.dist(
+                    microcell_locations.T, tuple(location))
+                    for location in microcell_locations[
+                        offsets[i]:offsets[i] + counts[i]]], axis=0)
+                minimum[has_microcells] = np.minimum.reduceat(
+                    distances, offsets[has_microcells])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self._acceptance[i] = self._kernels[i] / \
+                    SpatialKernel.weighting(minimum)
+
+    def find_infectees_Covidsim_cached(self, cell_index: int, infector,
+                                       number_to_infect: int,
+                                       susceptible: np.ndarray):
+        """Given the index of an infector cell, an infector and the number
+        of people needed to infect, follows CovidSim's rejection sampling to
+        create a list of infectees, as in
+        :meth:`SpatialSweep.find_infectees_Covidsim`.
+
+        Parameters
+        ----------
+        cell_index : int
+            Index of the infector cell in the population
+        infector : Person
+            Infector instance of person
+        number_to_infect : int
+            Maximum number of people to infect
+        susceptible : np.ndarray
+            Number of susceptible people in each cell of the population
+
+        Returns
+        -------
+        typing.List[Person]
+            List of people to infect
+
+        """
+        if number_to_infect == 0:
+            return []
+        cells = self._population.cells
+        if self._kernels is None:
+            self._compute_kernels()
+        acceptance = self._acceptance[cell_index]
+        # Susceptible numbers do not change during the sweep, so the
+        # cumulative weights are the same at each sampling step
+        weights = np.delete(susceptible * self._kernels[cell_index],
+                            cell_index)
+        cumulative = np.cumsum(weights).tolist()
+        total = cumulative[-1] + 0.0
+        if total <= 0.0:
+            raise ValueError('Total of weights must be greater than zero')
+        hi = len(cumulative) - 1
+        max_count = self._population.total_people()
+
+        infectee_list = []
+        count = 0
+        while number_to_infect > 0 and count < max_count:
+            count += 1
+            k = bisect.bisect(cumulative, random.random() * total, 0, hi)
+            # Index in the population, skipping the infector cell
+            j = k if k < cell_index else k + 1
+            infectee = random.sample(cells[j].persons, 1)[0]
+            if (acceptance[j] > random.random()):
+                infectee_list.append(infectee)
+                number_to_infect -= 1
+        return infectee_list
+
+    def __call__(self, time: float):
+        """Loops over the cells containing infectious people and generates
+        a random number of people for each to infect in other cells, then
+        tests an infection event for each, as in :class:`SpatialSweep`.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        """
+        cells = self._population.cells
+        if len(cells) == 1:
+            return
+        if self.parameters.infection_radius == 0:
+            return
+
+        # Susceptible people in each cell, summed over age groups, read from
+        # the counts the compartment counters keep up to date
+        susceptible = self._population.compartment_counts(by_cell=True)[
+            :, InfectionStatus.Susceptible.value - 1].sum(axis=1)
+        total_susceptible = int(susceptible.sum())
+        do_covidsim = self.parameters.do_CovidSim
+        if not do_covidsim:
+            self._update_cell_sizes()
+
+        for i, cell in enumerate(cells):
+            if not cell.infectious_persons:
+                continue
+            if total_susceptible - susceptible[i] == 0:
+                # No people outside the cell are susceptible
+                continue
+            ave_num_of_infections = SpatialInfection.cell_inf(
+                cell, time, self.parameters)
+            number_to_infect = np.random.poisson(ave_num_of_infections)
+            infector = random.choice(cell.infectors())
+
+            if do_covidsim:
+                infectee_list = self.find_infectees_Covidsim_cached(
+                    i, infector, number_to_infect, susceptible)
+            else:
+                infectee_list = self.find_infectees_cached(i,
+                                                           number_to_infect)
+            for infectee in infectee_list:
+                self.do_infection_event(infector, infectee, time)
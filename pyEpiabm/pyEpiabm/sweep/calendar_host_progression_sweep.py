@@ -0,0 +1,53 @@
+#
+# Progression of infection within individuals, driven by a calendar
+#
+
+from .host_progression_sweep import HostProgressionSweep
+
+
+class CalendarHostProgressionSweep(HostProgressionSweep):
+    """Class for updating host infection status and time to next infection
+    status change, as in :class:`HostProgressionSweep`, but only visiting
+    the people whose status change is due.
+
+    Each cell holds a calendar of the times of status change of its people
+    (see :meth:`Cell.update_status_calendar`), bucketed by day, which is
+    updated whenever a person's time of status change is set. At each
+    timestep the people whose status change is due are popped from the
+    calendar of each cell and processed in the order of the cell's list of
+    persons, and the infectiousness of the infectious people of the cell is
+    updated. The cost of a timestep therefore grows with the number of
+    status changes and infectious people rather than with the size of the
+    population, and for a given seed the trajectories are the same as with
+    :class:`HostProgressionSweep`.
+
+    Disease testing draws from every uninfected or asymptomatic person at
+    each timestep, so when it is configured the whole population is swept
+    as in :class:`HostProgressionSweep`.
+
+    """
+
+    def __call__(self, time: float):
+        """Updates the infection status of the people whose status change
+        is due, assigning them their next infection status and the time of
+        their next status change, and updates the infectiousness of the
+        infectious people.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        """
+        if 'disease_testing' in getattr(self.parameters,
+                                        'intervention_params', {}):
+            super().__call__(time)
+            return
+        self._check_matrices()
+        for cell in self._population.cells:
+            due = cell.in_person_order(
+                cell.status_calendar.pop_due(time))
+            for person in due:
+                self._progress_person(cell, person, time, [])
+            for person in cell.infectious_persons:
+                self._updates_infectiousness(person, time)
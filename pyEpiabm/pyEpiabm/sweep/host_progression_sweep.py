@@ -7,12 +7,12 @@ import typing
 import numpy as np
 from collections import defaultdict
 
-import pyEpiabm as pe
 from pyEpiabm.core import Parameters, Person
 from pyEpiabm.property import InfectionStatus
 
 from .abstract_sweep import AbstractSweep
-from .transition_matrices import StateTransitionMatrix, TransitionTimeMatrix
+from .transition_matrices import StateTransitionMatrix, \
+    TransitionTimeMatrix, _TrackedMatrix
 
 
 class HostProgressionSweep(AbstractSweep):
@@ -21,7 +21,7 @@ class HostProgressionSweep(AbstractSweep):
 
     """
 
-    def __init__(self):
+    def __init__(self, parameters=None):
         """Initialise parameters to be used in class methods. State
         transition matrix is set where each row of the matrix corresponds
         to a current infection status of a person. The columns of that
@@ -37,44 +37,80 @@ class HostProgressionSweep(AbstractSweep):
         infectiousness and which depends on time since the start of the
         infection, measured in timesteps (following what is done in Covidsim).
 
+        These are built from the given parameters, and built again from the
+        parameters bound with a population if these differ (see
+        :meth:`bind_population`).
+
+        Parameters
+        ----------
+        parameters : Parameters
+            Parameters object to build from. Defaults to
+            :meth:`Parameters.instance`
+
         """
+        self.number_of_states = len(InfectionStatus)
+        self._build(parameters if parameters is not None
+                    else Parameters.instance())
+
+    def bind_population(self, population, parameters=None):
+        """Binds the population to the sweep. If a parameters object is
+        bound with it, other than the one the sweep was built from, the
+        transition matrices and infectiousness progression are built again
+        from these parameters.
+
+        Parameters
+        ----------
+        population : Population
+            Population to bind
+        parameters : Parameters
+            Parameters object to bind, see
+            :meth:`AbstractSweep.bind_population`
+
+        """
+        super().bind_population(population, parameters)
+        if parameters is not None and parameters is not self._built_from:
+            self._build(parameters)
+
+    def _build(self, parameters):
+        """Builds the transition matrices and infectiousness progression
+        from a parameters object, as described in :meth:`__init__`.
+
+        Parameters
+        ----------
+        parameters : Parameters
+            Parameters object to build from
+
+        """
+        self._built_from = parameters
         # Instantiate state transition matrix
-        use_ages = Parameters.instance().use_ages
-        coefficients = defaultdict(int, Parameters.instance()
-                                   .host_progression_lists)
-        multipliers = defaultdict(list, Parameters.instance()
-                                  .rate_multiplier_params)
+        use_ages = parameters.use_ages
+        coefficients = defaultdict(int, parameters.host_progression_lists)
+        multipliers = defaultdict(list, parameters.rate_multiplier_params)
         matrix_object = StateTransitionMatrix(coefficients, multipliers,
-                                              use_ages)
+                                              use_ages, parameters)
         self.state_transition_matrix = matrix_object.matrix
-        if pe.Parameters.instance().use_waning_immunity:
+        if parameters.use_waning_immunity:
             self.waning_transition_matrix = matrix_object.waning_matrix
 
-        self.number_of_states = len(InfectionStatus)
-        assert self.state_transition_matrix.shape == \
-               (self.number_of_states, self.number_of_states), \
-               'Matrix dimensions must match number of infection states'
-
         # Instantiate transmission time matrix
         time_matrix_object = TransitionTimeMatrix()
         self.transition_time_matrix = \
-            time_matrix_object.create_transition_time_matrix()
+            time_matrix_object.create_transition_time_matrix(parameters)
         # Instantiate parameters to be used in update transition time
         # method
-        self.latent_to_symptom_delay = \
-            pe.Parameters.instance().latent_to_sympt_delay
+        self.latent_to_symptom_delay = parameters.latent_to_sympt_delay
         # Defining the length of the model time step (in days, can be a
         # fraction of day as well).
-        self.model_time_step = 1 / pe.Parameters.instance().time_steps_per_day
+        self.model_time_step = 1 / parameters.time_steps_per_day
         self.delay = np.floor(self.latent_to_symptom_delay /
                               self.model_time_step)
 
         # Infectiousness progression
         # Instantiate parameters to be used in update infectiousness
-        infectious_profile = pe.Parameters.instance().infectiousness_prof
+        infectious_profile = parameters.infectiousness_prof
         inf_prof_resolution = len(infectious_profile) - 1
         inf_prof_average = np.average(infectious_profile)
-        infectious_period = pe.Parameters.instance().asympt_infect_period
+        infectious_period = parameters.asympt_infect_period
         # Extreme case where model time step would be too small
         max_inf_steps = 2550
         # Define number of time steps a person is infectious:
@@ -107,8 +143,68 @@ class HostProgressionSweep(AbstractSweep):
             infectiousness_prog[i] /= scaling_param
         self.infectiousness_progression = infectiousness_prog
 
+    @property
+    def state_transition_matrix(self):
+        """State transition matrix, as a :class:`pd.DataFrame`. The matrix
+        is compiled into the table of cumulative weights (indexed by status
+        value and age group) from which next infection statuses are drawn,
+        when it is assigned and again whenever entries have been assigned in
+        place since (see :meth:`_check_matrices`). A copy of an assigned
+        matrix is kept, so later changes to the assigned data frame itself
+        are not used.
+
+        """
+        return self._state_transition_matrix
+
+    @state_transition_matrix.setter
+    def state_transition_matrix(self, matrix):
+        assert matrix.shape == \
+               (self.number_of_states, self.number_of_states), \
+               'Matrix dimensions must match number of infection states'
+        if not isinstance(matrix, _TrackedMatrix):
+            matrix = _TrackedMatrix(matrix)
+        self._state_transition_matrix = matrix
+        self._cumulative_weights = StateTransitionMatrix.compile_matrix(matrix)
+        self._cumulative_weight_rows = self._cumulative_weights.tolist()
+        self._state_version = matrix.version
+
+    @property
+    def transition_time_matrix(self):
+        """Transition time matrix, as a :class:`pd.DataFrame`. The matrix
+        is compiled into tables of samplers and fixed times (indexed by
+        current and next status values) when it is assigned and again
+        whenever entries have been assigned in place since (see
+        :meth:`_check_matrices`). A copy of an assigned matrix is kept, as
+        for :attr:`state_transition_matrix`.
+
+        """
+        return self._transition_time_matrix
+
+    @transition_time_matrix.setter
+    def transition_time_matrix(self, matrix):
+        if not isinstance(matrix, _TrackedMatrix):
+            matrix = _TrackedMatrix(matrix)
+        self._transition_time_matrix = matrix
+        self._time_samplers, self._fixed_times = \
+            TransitionTimeMatrix.compile_matrix(matrix)
+        self._time_sampler_rows = self._time_samplers.tolist()
+        self._fixed_time_rows = self._fixed_times.tolist()
+        self._time_version = matrix.version
+
+    def _check_matrices(self):
+        """Recompiles the state transition and transition time matrices if
+        entries of either have been assigned in place since it was last
+        compiled, which is found from the version numbers of the matrices
+        without comparing their entries.
+
+        """
+        if self._state_transition_matrix.version != self._state_version:
+            self.state_transition_matrix = self._state_transition_matrix
+        if self._transition_time_matrix.version != self._time_version:
+            self.transition_time_matrix = self._transition_time_matrix
+
     @staticmethod
-    def set_infectiousness(person: Person, time: float):
+    def set_infectiousness(person: Person, time: float, parameters=None):
         """Assigns the initial infectiousness of a person for when they go from
         the exposed infection state to the next state, either InfectAsympt,
         InfectMild or InfectGP. Also assigns the infection start time and
@@ -125,22 +221,29 @@ class HostProgressionSweep(AbstractSweep):
             Instance of person class with infection status attributes
         time : float
             Current simulation time
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
 
         """
+        if parameters is None:
+            parameters = Parameters.instance()
         init_infectiousness = np.random.gamma(1, 1)
         if person.infection_status == InfectionStatus.InfectASympt:
             infectiousness = (init_infectiousness *
-                              pe.Parameters.instance().asympt_infectiousness)
+                              parameters.asympt_infectiousness)
             person.initial_infectiousness = infectiousness
         elif (person.infection_status == InfectionStatus.InfectMild or
               person.infection_status == InfectionStatus.InfectGP):
             infectiousness = (init_infectiousness *
-                              pe.Parameters.instance().sympt_infectiousness)
+                              parameters.sympt_infectiousness)
             person.initial_infectiousness = infectiousness
 
         # Add new infection start time, increment number of times infected and
         # add a new entry to the secondary_infections_counts list
         person.infection_start_times.append(time)
+        if person.store is not None:
+            person.store.infection_start_time[person.store_index] = time
         person.increment_num_times_infected()
         person.secondary_infections_counts.append(0)
         if person.infection_start_times[-1] < 0:
@@ -169,7 +272,7 @@ class HostProgressionSweep(AbstractSweep):
             person.next_infection_status = None
             return
         elif (person.infection_status == InfectionStatus.Recovered and not
-              Parameters.instance().use_waning_immunity):
+              self.parameters.use_waning_immunity):
             person.next_infection_status = None
             return
         elif (person.care_home_resident and
@@ -178,36 +281,38 @@ class HostProgressionSweep(AbstractSweep):
             return
         elif (person.care_home_resident and
               person.infection_status == InfectionStatus.InfectHosp):
-            carehome_params = Parameters.instance().carehome_params
+            carehome_params = self.parameters.carehome_params
             carehome_hosp = carehome_params['carehome_rel_prob_hosp']
             if random.uniform(0, 1) > carehome_hosp:
                 person.next_infection_status = InfectionStatus.Dead
                 return
-        row_index = person.infection_status.name
+        outcomes = range(1, self.number_of_states + 1)
+        self._check_matrices()
 
         # If we are not using waning immunity or person.time_of_recovery is
-        # None (so they have never reached Recovered) then we choose weights
-        # from the state_transition_matrix. Otherwise, we use the
-        # waning_transition_matrix.
-        if (not Parameters.instance().use_waning_immunity or
+        # None (so they have never reached Recovered) then we choose from the
+        # compiled cumulative weights of the state_transition_matrix.
+        # Otherwise, we use the waning_transition_matrix.
+        if (not self.parameters.use_waning_immunity or
                 not person.time_of_recovery):
-            weights = self.state_transition_matrix.loc[row_index].to_numpy()
-            weights = [w[person.age_group] if isinstance(w, list) else w
-                       for w in weights]
+            age_rows = \
+                self._cumulative_weight_rows[person.infection_status.value]
+            cum_weights = age_rows[person.age_group] if len(age_rows) > 1 \
+                else age_rows[0]
+            next_infection_status_number = random.choices(
+                outcomes, cum_weights=cum_weights)[0]
         else:
             if time is None:
                 raise ValueError("Simulation time must be passed to "
                                  "update_next_infection_status when waning "
                                  "immunity is active")
             weights = self._get_waning_weights(person, time)
-
-        outcomes = range(1, self.number_of_states + 1)
-        if len(weights) != len(outcomes):
-            raise AssertionError('The number of infection statuses must' +
-                                 ' match the number of transition' +
-                                 ' probabilities')
-
-        next_infection_status_number = random.choices(outcomes, weights)[0]
+            if len(weights) != len(outcomes):
+                raise AssertionError('The number of infection statuses must'
+                                     + ' match the number of transition'
+                                     + ' probabilities')
+            next_infection_status_number = random.choices(outcomes,
+                                                          weights)[0]
         next_infection_status = \
             InfectionStatus(next_infection_status_number)
 
@@ -280,36 +385,23 @@ class HostProgressionSweep(AbstractSweep):
                                        InfectionStatus.Vaccinated]:
             transition_time = np.inf
         elif (person.infection_status == InfectionStatus.Recovered and not
-              Parameters.instance().use_waning_immunity):
+              self.parameters.use_waning_immunity):
             transition_time = np.inf
+        elif person.infection_status == InfectionStatus.Recovered:
+            # If someone is recovered, then their transition time will be
+            # equal to 1 when waning immunity is turned on. This means that
+            # everyone spends exactly 1 day in the Recovered compartment with
+            # waning immunity
+            transition_time = 1
         else:
-            row_index = person.infection_status.name
-            column_index = person.next_infection_status.name
-            # Checks for susceptible to exposed case
-            # where transition time is zero
-            try:
-                if person.infection_status != InfectionStatus.Recovered:
-                    transition_time_icdf_object = \
-                        self.transition_time_matrix.loc[row_index,
-                                                        column_index]
-                    transition_time = \
-                        transition_time_icdf_object.icdf_choose_noexp()
-                else:
-                    # If someone is recovered, then their transition time
-                    # will be equal to 1 when waning immunity is turned on.
-                    # This means that everyone spends exactly 1 day in the
-                    # Recovered compartment with waning immunity
-                    transition_time = 1
-            except AttributeError as e:
-                if "object has no attribute 'icdf_choose_noexp'" in str(e):
-                    transition_time = transition_time_icdf_object
-                    assert isinstance(
-                        transition_time_icdf_object,
-                        (float, int)), \
-                        ("Entries of transition time matrix" +
-                         " must either be ICDF" + " objects or numbers")
-                else:
-                    raise
+            self._check_matrices()
+            row = person.infection_status.value
+            column = person.next_infection_status.value
+            sampler = self._time_sampler_rows[row][column]
+            if sampler is not None:
+                transition_time = sampler.icdf_choose_noexp()
+            else:
+                transition_time = self._fixed_time_rows[row][column]
 
         # Adds delay to transition time for first level symptomatic infection
         # statuses (InfectMild or InfectGP), as is done in CovidSim.
@@ -365,6 +457,46 @@ class HostProgressionSweep(AbstractSweep):
                                            InfectionStatus.Vaccinated]:
                 person.infectiousness = 0
 
+    def _progress_person(self, cell, person: Person, time: float,
+                         asympt_or_uninf_people: list):
+        """Updates the infection status of a person while their status
+        change is due, assigning them their next infection status and the
+        time of their next status change after each update, and then
+        updates their infectiousness.
+
+        Parameters
+        ----------
+        cell : Cell
+            Cell of the person
+        person : Person
+            Person to update
+        time : float
+            Current simulation time
+        asympt_or_uninf_people : list
+            List of (cell, person) tuples of asymptomatic or uninfected
+            people for disease testing, which is extended with the person if
+            they become asymptomatic
+
+        """
+        while person.time_of_status_change <= time:
+            person.update_status(person.next_infection_status)
+            if person.infection_status in \
+                [InfectionStatus.InfectASympt,
+                 InfectionStatus.InfectMild,
+                 InfectionStatus.InfectGP]:
+                self.set_infectiousness(person, time, self.parameters)
+                if not person.is_symptomatic():
+                    asympt_or_uninf_people.append((cell, person))
+            self.update_next_infection_status(person, time)
+            if person.infection_status == InfectionStatus.Susceptible:
+                person.time_of_status_change = None
+                break
+            elif person.infection_status == InfectionStatus.Recovered:
+                person.set_time_of_recovery(time)
+            self.update_time_status_change(person, time)
+            self.sympt_testing_queue(cell, person)
+        self._updates_infectiousness(person, time)
+
     def __call__(self, time: float):
         """Sweeps through all people in the population, updates their
         infection status if it is time and assigns them their next infection
@@ -380,33 +512,19 @@ class HostProgressionSweep(AbstractSweep):
         # store list of uninfected or asymptomatic people for processing
         # for disease testing.
         asympt_or_uninf_people = []
+        self._check_matrices()
         for cell in self._population.cells:
             for person in cell.persons:
                 if person.time_of_status_change is None:
                     assert person.is_susceptible()
                     asympt_or_uninf_people.append((cell, person))
                     continue  # pragma: no cover
-                if person.infection_status in [InfectionStatus.Recovered,
-                                               InfectionStatus.Vaccinated]:
+                if person.infection_status in \
+                        [InfectionStatus.Recovered,
+                         InfectionStatus.Vaccinated]:
                     asympt_or_uninf_people.append((cell, person))
-                while person.time_of_status_change <= time:
-                    person.update_status(person.next_infection_status)
-                    if person.infection_status in \
-                        [InfectionStatus.InfectASympt,
-                         InfectionStatus.InfectMild,
-                         InfectionStatus.InfectGP]:
-                        self.set_infectiousness(person, time)
-                        if not person.is_symptomatic():
-                            asympt_or_uninf_people.append((cell, person))
-                    self.update_next_infection_status(person, time)
-                    if person.infection_status == InfectionStatus.Susceptible:
-                        person.time_of_status_change = None
-                        break
-                    elif person.infection_status == InfectionStatus.Recovered:
-                        person.set_time_of_recovery(time)
-                    self.update_time_status_change(person, time)
-                    self.sympt_testing_queue(cell, person)
-                self._updates_infectiousness(person, time)
+                self._progress_person(cell, person, time,
+                                      asympt_or_uninf_people)
 
         self.asympt_uninf_testing_queue(asympt_or_uninf_people, time)
 
@@ -427,10 +545,10 @@ class HostProgressionSweep(AbstractSweep):
             symptomatic inndividual to be added to a testing queue.
 
         """
-        if hasattr(Parameters.instance(), 'intervention_params'):
-            if 'disease_testing' in Parameters.instance(). \
+        if hasattr(self.parameters, 'intervention_params'):
+            if 'disease_testing' in self.parameters. \
               intervention_params.keys():
-                testing_params = Parameters.instance(). \
+                testing_params = self.parameters. \
                     intervention_params['disease_testing']
                 r = random.random()
                 type_r = random.random()
@@ -476,10 +594,10 @@ class HostProgressionSweep(AbstractSweep):
             should stop being considered as positive.
 
         """
-        if hasattr(Parameters.instance(), 'intervention_params'):
-            if 'disease_testing' in Parameters.instance(). \
+        if hasattr(self.parameters, 'intervention_params'):
+            if 'disease_testing' in self.parameters. \
               intervention_params.keys():
-                testing_params = Parameters.instance(). \
+                testing_params = self.parameters. \
                     intervention_params['disease_testing']
                 for item in person_list:
                     cell = item[0]
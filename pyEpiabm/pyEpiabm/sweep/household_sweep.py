@@ -5,7 +5,6 @@
 import random
 
 from pyEpiabm.property import HouseholdInfection
-from pyEpiabm.core import Person
 
 from .abstract_sweep import AbstractSweep
 
@@ -29,11 +28,12 @@ class HouseholdSweep(AbstractSweep):
             Simulation time
 
         """
-        # Double loop over the whole population, checking infectiousness
-        # status, and whether they are absent from their household.
+        parameters = self.parameters
+        modifiers = self._population.intervention_modifiers
+        # Double loop over the infectious people in each cell, read from
+        # the cell's index of infectious people.
         for cell in self._population.cells:
-            infectious_persons = filter(Person.is_infectious, cell.persons)
-            for infector in infectious_persons:
+            for infector in cell.infectors():
 
                 if infector.household is None:
                     raise AttributeError(f"{infector} is not part of a "
@@ -45,7 +45,7 @@ class HouseholdSweep(AbstractSweep):
                     # Calculate "force of infection" parameter which will
                     # determine the likelihood of an infection event.
                     force_of_infection = HouseholdInfection.household_foi(
-                        infector, infectee, time)
+                        infector, infectee, time, parameters, modifiers)
 
                     # Compare a uniform random number to the force of infection
                     # to see whether an infection event occurs in this timestep
@@ -58,4 +58,5 @@ class HouseholdSweep(AbstractSweep):
                         infector.increment_secondary_infections()
                         # Stores the exposure period and infector's latent
                         # period within attributes of the infectee
-                        self.store_infection_periods(infector, infectee, time)
+                        self.store_infection_periods(infector, infectee, time,
+                                                     "household")
@@ -109,3 +109,5 @@ class InitialDemographicsSweep(AbstractSweep):
                 # dictionary
                 cell_count_dict.update({age_str: cell_count_dict[age_str] + 1})
             self.counts_writer.write(cell_count_dict)
+        self.writer.flush()
+        self.counts_writer.flush()
@@ -8,7 +8,6 @@ import logging
 
 from pyEpiabm.property import InfectionStatus
 from pyEpiabm.sweep.host_progression_sweep import HostProgressionSweep
-from pyEpiabm.core import Parameters
 
 from .abstract_sweep import AbstractSweep
 
@@ -65,8 +64,8 @@ class InitialInfectedSweep(AbstractSweep):
 
         # set default to not treat carehome residents differently
         carehome_inf = 1
-        if hasattr(Parameters.instance(), 'carehome_params'):
-            care_param = Parameters.instance().carehome_params
+        if hasattr(self.parameters, 'carehome_params'):
+            care_param = self.parameters.carehome_params
             carehome_inf = care_param["carehome_allow_initial_infections"]
 
         if ("initial_infect_cell" not in sim_params
@@ -102,10 +101,11 @@ class InitialInfectedSweep(AbstractSweep):
         pers_to_infect = random.sample(all_persons,
                                        int(sim_params
                                            ["initial_infected_number"]))
+        host_sweep = HostProgressionSweep(self.parameters)
         for person in pers_to_infect:
             person.update_status(InfectionStatus.InfectMild)
             person.household.remove_susceptible_person(person)
             person.next_infection_status = InfectionStatus.Recovered
-            HostProgressionSweep.set_infectiousness(person, start_time)
-            HostProgressionSweep().update_time_status_change(person,
-                                                             start_time)
+            HostProgressionSweep.set_infectiousness(person, start_time,
+                                                    self.parameters)
+            host_sweep.update_time_status_change(person, start_time)
@@ -2,7 +2,6 @@
 # Sweep to initialise people present in a place
 #
 
-from pyEpiabm.core import Parameters
 
 from .abstract_sweep import AbstractSweep
 from .update_place_sweep import UpdatePlaceSweep
@@ -34,7 +33,7 @@ class InitialisePlaceSweep(AbstractSweep):
 
         helper = UpdatePlaceSweep()
         helper.bind_population(self._population)
-        params = Parameters.instance().place_params
+        params = self.parameters.place_params
         schools = ["PrimarySchool", "SecondarySchool", "SixthForm"]
         for cell in self._population.cells:
             for place in cell.places:
@@ -130,7 +129,7 @@ class InitialisePlaceSweep(AbstractSweep):
                 # People can't have more than one place of each type.
                 continue
 
-            if not Parameters.instance().use_ages:
+            if not self.parameters.use_ages:
                 person_list.append(person)
                 weights.append(prop[2])  # Add everyone to adult group
             else:
@@ -75,7 +75,7 @@ class InitialVaccineQueue(AbstractSweep):
         age group.
 
         """
-        if 'vaccine_params' in Parameters.instance().intervention_params:
+        if 'vaccine_params' in self.parameters.intervention_params:
             all_persons = [pers for cell in self._population.cells
                            for pers in cell.persons]
             random.shuffle(all_persons)
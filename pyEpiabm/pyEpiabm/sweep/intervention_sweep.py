@@ -4,7 +4,7 @@
 
 import logging
 
-from pyEpiabm.core import Parameters
+from pyEpiabm.core import InterventionModifiers, Parameters
 from pyEpiabm.intervention import CaseIsolation, Vaccination, PlaceClosure
 from pyEpiabm.intervention import HouseholdQuarantine, SocialDistancing
 from pyEpiabm.intervention import DiseaseTesting, TravelIsolation
@@ -15,7 +15,9 @@ from .abstract_sweep import AbstractSweep
 class InterventionSweep(AbstractSweep):
     """Class to sweep through all possible interventions.
     Check if intervention should be active based on policy time and number
-    of infected individuals.
+    of infected individuals. The effects of the interventions on the force
+    of infection are then precomputed once per timestep in the
+    :class:`InterventionModifiers` of the population.
 
     Possible interventions:
 
@@ -49,8 +51,11 @@ class InterventionSweep(AbstractSweep):
                                   'vaccine_params': Vaccination,
                                   'travel_isolation': TravelIsolation}
 
-    def bind_population(self, population):
-        self._population = population
+    def bind_population(self, population, parameters=None):
+        super().bind_population(population, parameters)
+        if parameters is not None:
+            self.intervention_params = parameters.intervention_params.copy()
+        population.intervention_modifiers = InterventionModifiers(population)
         for intervention_key, intervention_object in self.\
                 intervention_params.items():
             if isinstance(intervention_object, list):
@@ -73,7 +78,7 @@ class InterventionSweep(AbstractSweep):
                     # Other interventions will be activated and updated
                     # with corresponding parameters in the __call__ function
                     if index == 0:
-                        Parameters.instance().intervention_params[
+                        self.parameters.intervention_params[
                             intervention_key] = single_object
                         previous_end_date = current_end_date
 
@@ -106,8 +111,7 @@ class InterventionSweep(AbstractSweep):
             # - Include condition on ICU
             #   Intervention will be activated based on time and cases now.
             #   We would like to implement a threshold based on ICU numbers.
-            num_cases = sum(map(lambda cell: cell.number_infectious(),
-                            self._population.cells))
+            num_cases = self._population.number_infectious()
             if intervention.is_active(time, num_cases):
                 if self.intervention_active_status[intervention] is False:
                     # If the next same type intervention is activated,
@@ -118,7 +122,7 @@ class InterventionSweep(AbstractSweep):
                         intervention_key = intervention.name
                         # Update parameter values with current
                         # active intervention
-                        Parameters.instance().intervention_params[
+                        self.parameters.intervention_params[
                             intervention_key] = self.intervention_params[
                             intervention_key][
                             intervention.occurrence_index]
@@ -129,3 +133,8 @@ class InterventionSweep(AbstractSweep):
                 # Turn off intervention
                 self.intervention_active_status[intervention] = False
                 intervention.turn_off()
+
+        if self._population.intervention_modifiers is None:
+            self._population.intervention_modifiers = \
+                InterventionModifiers(self._population)
+        self._population.intervention_modifiers.update(time, self.parameters)
@@ -0,0 +1,173 @@
+#
+# Sweep to update only the place groups which contain infectious people
+#
+
+import numpy as np
+
+from pyEpiabm.property import PlaceType
+
+from .pooled_update_place_sweep import PooledUpdatePlaceSweep
+
+
+class LazyUpdatePlaceSweep(PooledUpdatePlaceSweep):
+    """Class to update the people present in workplaces and outdoor
+    spaces, as in :class:`PooledUpdatePlaceSweep`, but only filling the
+    variable place groups which :class:`PlaceSweep` will visit in this
+    timestep, being those with an infectious member.
+
+    In :class:`PooledUpdatePlaceSweep`, the capacities of the places of a
+    cell are drawn, and the places are filled from consecutive runs of a
+    random permutation of the pool of possible visitors. Here the
+    capacities are drawn in the same way, but only the positions of the
+    infectious people in the permutation are drawn, which determine the
+    places they visit. The rest of each of these places is then filled with
+    people drawn from the pool without the infectious people, which is the
+    distribution of the rest of the permutation given the positions of the
+    infectious people. The contacts of each infectious person therefore
+    have the same distribution as in :class:`PooledUpdatePlaceSweep`.
+
+    The filled groups are emptied at the start of the next timestep, so
+    the cost of each timestep grows with the number of infectious people
+    rather than with the number of places. As the variable groups without
+    an infectious member are left empty, people who are not infectious are
+    only recorded as visiting a place if they share it with an infectious
+    person. Interventions which depend on the places people visit (such as
+    place closure) and the drawing of key workers therefore only see these
+    people.
+
+    """
+    def __init__(self):
+        """Constructor Method.
+
+        """
+        super().__init__()
+
+    def bind_population(self, population, parameters=None):
+        """Binds the population to the sweep, discarding the pools of any
+        previously bound population.
+
+        Parameters
+        ----------
+        population : Population
+            Population to bind
+        parameters : Parameters
+            Parameters object to bind, see
+            :meth:`AbstractSweep.bind_population`
+
+        """
+        super().bind_population(population, parameters)
+        self._pool_positions = {}
+        self._filled = None
+
+    def _positions(self, cell, pools):
+        """Returns the position of each person in the pools of a cell,
+        finding them again if the pools have been rebuilt.
+
+        Parameters
+        ----------
+        cell : Cell
+            Cell of the pools
+        pools : list
+            Pools of the cell, as returned by :meth:`_cell_pools`
+
+        Returns
+        -------
+        typing.List[typing.Dict[Person, int]]
+            Position of each person in each pool
+
+        """
+        cached_pools, positions = self._pool_positions.get(cell, (None, None))
+        if cached_pools is not pools:
+            positions = [{person: i for i, person in enumerate(pool)}
+                         for _, pool in pools]
+            self._pool_positions[cell] = (pools, positions)
+        return positions
+
+    def __call__(self, time: float):
+        """Given a population structure, fills the variable groups of the
+        workplaces and outdoor spaces visited by infectious people, having
+        emptied those filled in the previous timestep.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        """
+        if self._filled is None:
+            # Empty the variable groups filled when the places were
+            # initialised
+            for cell in self._population.cells:
+                for places, _ in self._cell_pools(cell):
+                    for place in places:
+                        if place.place_type == PlaceType.Workplace:
+                            place.empty_place(
+                                [list(place.person_groups)[-1]])
+                        else:
+                            place.empty_place()
+        else:
+            for place, group in self._filled:
+                place.empty_place(groups_to_empty=[group])
+        self._filled = []
+
+        params = self.parameters.place_params
+        key_workers = getattr(self.parameters, 'use_key_workers', 0)
+        for cell in self._population.cells:
+            if not cell.infectious_persons:
+                continue
+            pools = self._cell_pools(cell)
+            for (places, pool), positions in zip(
+                    pools, self._positions(cell, pools)):
+                infector_positions = [positions[person]
+                                      for person in cell.infectious_persons
+                                      if person in positions]
+                if not places or not infector_positions:
+                    continue
+                param_ind = places[0].place_type.value - 1
+                mean_capacity = params["mean_size"][param_ind] \
+                    if (places[0].place_type == PlaceType.Workplace
+                        and param_ind < len(params["mean_size"])) else 25
+                capacities = np.random.poisson(mean_capacity, len(places))
+                ends = np.minimum(np.cumsum(capacities), len(pool))
+
+                # Place visited by each infectious person, if any
+                infector_places = np.searchsorted(
+                    ends, np.random.choice(len(pool), len(infector_positions),
+                                           replace=False), side='right')
+                visited = infector_places < len(places)
+                infectors = np.array(infector_positions)[visited]
+                infector_places = infector_places[visited]
+                if len(infectors) == 0:
+                    continue
+                filled = np.unique(infector_places)
+                sizes = (ends - np.concatenate(([0], ends[:-1])))[filled]
+                num_others = sizes - np.bincount(
+                    infector_places, minlength=len(places))[filled]
+
+                # The rest of each place is filled from the people in the
+                # pool who are not infectious
+                others = np.ones(len(pool), dtype=bool)
+                others[infector_positions] = False
+                others = np.random.permutation(np.flatnonzero(others))
+                others_ends = np.cumsum(num_others).tolist()
+                if key_workers:
+                    new_key_workers = (np.random.random(sum(sizes))
+                                       < key_workers).tolist()
+                start = 0
+                k = 0
+                for j, end in zip(filled.tolist(), others_ends):
+                    place = places[j]
+                    if place.place_type == PlaceType.Workplace:
+                        group = list(place.person_groups)[-1]
+                    else:
+                        group = 0
+                    members = [pool[i] for i in
+                               infectors[infector_places == j].tolist()
+                               + others[start:end].tolist()]
+                    for person in members:
+                        if key_workers and new_key_workers[k]:
+                            person.key_worker = True
+                        place.add_person(person, group)
+                        k += 1
+                    self._filled.append((place, group))
+                    start = end
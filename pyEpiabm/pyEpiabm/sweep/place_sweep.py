@@ -31,17 +31,16 @@ class PlaceSweep(AbstractSweep):
             Current simulation time
 
         """
-        # Double loop over the whole population, checking infectiousness
-        # status, and whether they are absent from their household.
+        modifiers = self._population.intervention_modifiers
+        # Double loop over the infectious people in each cell, read from
+        # the cell's index of infectious people.
         for cell in self._population.cells:
-            for infector in cell.persons:
-                if not infector.is_infectious():
-                    continue
+            for infector in cell.infectors():
                 place_list = [i[0] for i in infector.places]
                 for place in place_list:
                     infector_group = place.get_group_index(infector)
-                    infectiousness = PlaceInfection.place_inf(place, infector,
-                                                              time)
+                    infectiousness = PlaceInfection.place_inf(
+                        place, infector, time, self.parameters, modifiers)
                     # Covidsim only considers infectees in
                     # the group with the infector. I suggest we use this line
                     # to easily change the list of possible infectees.
@@ -60,8 +59,9 @@ class PlaceSweep(AbstractSweep):
 
                             # Stores the exposure period and infector's latent
                             # period within attributes of the infectee
-                            self.store_infection_periods(infector, infectee,
-                                                         time)
+                            self.store_infection_periods(
+                                infector, infectee, time,
+                                place.place_type.name)
 
                     # Otherwise number of infectees is binomially
                     # distributed. Not sure if covidsim considers only
@@ -89,7 +89,7 @@ class PlaceSweep(AbstractSweep):
 
                             force_of_infection = PlaceInfection.\
                                 place_foi(place, infector, infectee,
-                                          time)
+                                          time, self.parameters, modifiers)
 
                             # Compare a uniform random number to the force of
                             # infection to see whether an infection event
@@ -106,5 +106,6 @@ class PlaceSweep(AbstractSweep):
                                 # Stores the exposure period and infector's
                                 # latent period within attributes of the
                                 # infectee
-                                self.store_infection_periods(infector,
-                                                             infectee, time)
+                                self.store_infection_periods(
+                                    infector, infectee, time,
+                                    place.place_type.name)
@@ -0,0 +1,161 @@
+#
+# Sweep to update people present in places from precomputed pools
+#
+
+import numpy as np
+
+from pyEpiabm.property import PlaceType
+
+from .update_place_sweep import UpdatePlaceSweep
+
+
+class PooledUpdatePlaceSweep(UpdatePlaceSweep):
+    """Class to update the people present in workplaces and outdoor
+    spaces, as in :class:`UpdatePlaceSweep`, drawing the new occupants of
+    all places of a cell in a few array operations.
+
+    When a cell is first updated, the people who may visit its places are
+    stored in a pool for each place type: everyone in the cell for outdoor
+    spaces, and everyone not in the fixed population of a workplace (the
+    groups other than the last) for workplaces. The pools are only rebuilt
+    when people join or leave the cell. At each update the variable groups
+    of every place in the cell are emptied, the capacity of each place is
+    drawn in a single Poisson draw and the pool is shuffled once, with
+    consecutive runs of the shuffled pool filling each place in turn. As in
+    :class:`UpdatePlaceSweep`, nobody visits more than one place of each
+    type, but the capacity of a place is only limited by the number of
+    people left in the pool, so the occupancy differs slightly when places
+    are nearly as large as their cell.
+
+    Two further modes trade fidelity for speed:
+
+    - ``update_interval`` : places are updated every given number of
+      timesteps (starting with the first), keeping their occupants in
+      between rather than redrawing them every timestep.
+    - ``infectious_cells_only`` : only places in cells with an infectious
+      person are updated, as only these may host infections in
+      :class:`PlaceSweep`. Places in other cells keep the occupants of their
+      last update, which may still affect interventions that depend on the
+      places people visit, such as place closure.
+
+    """
+    def __init__(self, update_interval: int = 1,
+                 infectious_cells_only: bool = False):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        update_interval : int
+            Number of timesteps between updates of the places
+        infectious_cells_only : bool
+            Whether to only update places in cells with an infectious
+            person
+
+        """
+        if int(update_interval) != update_interval or update_interval < 1:
+            raise ValueError("update_interval must be a positive integer")
+        self.update_interval = int(update_interval)
+        self.infectious_cells_only = infectious_cells_only
+
+    def bind_population(self, population, parameters=None):
+        """Binds the population to the sweep, discarding the pools of any
+        previously bound population.
+
+        Parameters
+        ----------
+        population : Population
+            Population to bind
+        parameters : Parameters
+            Parameters object to bind, see
+            :meth:`AbstractSweep.bind_population`
+
+        """
+        super().bind_population(population, parameters)
+        self._pools = {}
+        self._num_calls = 0
+
+    def _cell_pools(self, cell):
+        """Returns the places of a cell which are updated, and the people
+        who may visit them, rebuilding these if people have joined or left
+        the cell since they were last found.
+
+        Parameters
+        ----------
+        cell : Cell
+            Cell to find the pools of
+
+        Returns
+        -------
+        typing.List[typing.Tuple[typing.List[Place], typing.List[Person]]]
+            Workplaces and outdoor spaces of the cell, each with the people
+            who may visit them
+
+        """
+        version, pools = self._pools.get(cell, (None, None))
+        if version == cell.persons_version:
+            return pools
+        workplaces = [place for place in cell.places
+                      if place.place_type == PlaceType.Workplace]
+        outdoor_spaces = [place for place in cell.places
+                          if place.place_type == PlaceType.OutdoorSpace]
+        fixed = set()
+        for place in workplaces:
+            for group in list(place.person_groups)[:-1]:
+                fixed.update(place.person_groups[group])
+        pools = [(workplaces, [person for person in cell.persons
+                               if person not in fixed]),
+                 (outdoor_spaces, list(cell.persons))]
+        self._pools[cell] = (cell.persons_version, pools)
+        return pools
+
+    def __call__(self, time: float):
+        """Given a population structure, updates the people present in
+        each workplace and outdoor space at a specific timepoint.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        """
+        self._num_calls += 1
+        if (self._num_calls - 1) % self.update_interval != 0:
+            return
+        params = self.parameters.place_params
+        key_workers = getattr(self.parameters, 'use_key_workers', 0)
+        for cell in self._population.cells:
+            if self.infectious_cells_only and not cell.infectious_persons:
+                continue
+            for places, pool in self._cell_pools(cell):
+                if not places or not pool:
+                    continue
+                groups = []
+                for place in places:
+                    # Workplaces keep their fixed population, held in all
+                    # but the last group
+                    if place.place_type == PlaceType.Workplace:
+                        group = list(place.person_groups)[-1]
+                        place.empty_place(groups_to_empty=[group])
+                    else:
+                        group = 0
+                        place.empty_place()
+                    groups.append(group)
+
+                param_ind = places[0].place_type.value - 1
+                mean_capacity = params["mean_size"][param_ind] \
+                    if (places[0].place_type == PlaceType.Workplace
+                        and param_ind < len(params["mean_size"])) else 25
+                capacities = np.random.poisson(mean_capacity, len(places))
+                ends = np.minimum(np.cumsum(capacities), len(pool)).tolist()
+                order = np.random.permutation(len(pool))[:ends[-1]].tolist()
+                if key_workers:
+                    new_key_workers = (np.random.random(len(order))
+                                       < key_workers).tolist()
+                start = 0
+                for place, group, end in zip(places, groups, ends):
+                    for i in range(start, end):
+                        person = pool[order[i]]
+                        if key_workers and new_key_workers[i]:
+                            person.key_worker = True
+                        place.add_person(person, group)
+                    start = end
@@ -2,9 +2,9 @@
 # Sweeps for enqueued persons to update infection status
 #
 import random
+
 import numpy as np
 
-from pyEpiabm.core import Parameters
 from pyEpiabm.property import InfectionStatus
 
 from .abstract_sweep import AbstractSweep
@@ -14,6 +14,10 @@ class QueueSweep(AbstractSweep):
     """Class to sweep through the enqueued persons
     in each cell and update their infection status.
 
+    The queues of all cells are drained at once, and the times for the
+    vaccine of the vaccinated people among them to become effective are
+    drawn in a single batch.
+
     """
 
     def __call__(self, time: float):
@@ -25,29 +29,29 @@ class QueueSweep(AbstractSweep):
             Simulation time
 
         """
-        for cell in self._population.cells:
-            while not cell.person_queue.empty():
-                person = cell.person_queue.get()
-                # Get takes person from the queue and removes them, so clears
-                # the queue for the next timestep.
-                # Update the infection status
-                if person.is_vaccinated:
-                    vacc_params = Parameters.instance().\
-                        intervention_params['vaccine_params']
-                    delay = np.random.poisson(vacc_params['time_to_efficacy'],
-                                              1)
-                    if time > (person.date_vaccinated +
-                               delay):
-                        r = random.random()
-                        if r < vacc_params['vacc_protectiveness']:
-                            person.next_infection_status = InfectionStatus.\
-                                Vaccinated
-                        else:
-                            person.next_infection_status = InfectionStatus.\
-                                Exposed
-                    else:
-                        person.next_infection_status = InfectionStatus.Exposed
-                else:
-                    person.next_infection_status = InfectionStatus.Exposed
-
-                person.time_of_status_change = time
+        # Draining the queues clears them for the next timestep
+        persons = [person for cell in self._population.cells
+                   for person in cell.person_queue.drain()]
+        next_statuses = [InfectionStatus.Exposed] * len(persons)
+
+        # Vaccinated people are protected with a given probability, once
+        # the vaccine has had time to become effective
+        vaccinated = [k for k, person in enumerate(persons)
+                      if person.is_vaccinated]
+        if vaccinated:
+            vacc_params = self.parameters.intervention_params['vaccine_params']
+            delays = np.random.poisson(vacc_params['time_to_efficacy'],
+                                       len(vaccinated))
+            date_vaccinated = np.array([persons[k].date_vaccinated
+                                        for k in vaccinated])
+            effective = (time > date_vaccinated + delays).tolist()
+            # Protection is only drawn once the vaccine is effective, with
+            # the same random numbers as drawing person by person
+            for k, is_effective in zip(vaccinated, effective):
+                if is_effective and \
+                        random.random() < vacc_params['vacc_protectiveness']:
+                    next_statuses[k] = InfectionStatus.Vaccinated
+
+        for person, next_status in zip(persons, next_statuses):
+            person.next_infection_status = next_status
+            person.time_of_status_change = time
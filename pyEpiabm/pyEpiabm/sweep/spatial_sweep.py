@@ -8,9 +8,9 @@ import numpy as np
 import logging
 import typing
 
-from pyEpiabm.core import Cell, Parameters, Person
+from pyEpiabm.core import Cell, Person
 from pyEpiabm.property import InfectionStatus, SpatialInfection
-from pyEpiabm.utility import DistanceFunctions, SpatialKernel
+from pyEpiabm.utility import DistanceFunctions, SpatialIndex, SpatialKernel
 
 from .abstract_sweep import AbstractSweep
 
@@ -46,7 +46,7 @@ class SpatialSweep(AbstractSweep):
             return
         # If infection radius is set to zero no infections will occur so
         # break immediately to save time.
-        if Parameters.instance().infection_radius == 0:
+        if self.parameters.infection_radius == 0:
             return
         # Double loop over the whole population, checking infectiousness
         # status, and whether they are absent from their household.
@@ -68,16 +68,16 @@ class SpatialSweep(AbstractSweep):
                 continue
             # If there are any infectors calculate number of infection events
             # given out in total by the cell
-            ave_num_of_infections = SpatialInfection.cell_inf(cell, time)
+            ave_num_of_infections = SpatialInfection.cell_inf(
+                cell, time, self.parameters)
             number_to_infect = np.random.poisson(ave_num_of_infections)
 
             # Sample at random from the cell to find an infector. Have
             # checked to ensure there is an infector present.
-            possible_infectors = [person for person in cell.persons
-                                  if person.is_infectious()]
+            possible_infectors = cell.infectors()
             infector = random.choice(possible_infectors)
 
-            if Parameters.instance().do_CovidSim:
+            if self.parameters.do_CovidSim:
                 infectee_list = self.find_infectees_Covidsim(infector,
                                                              poss_susc_cells,
                                                              number_to_infect)
@@ -116,7 +116,7 @@ class SpatialSweep(AbstractSweep):
         # Specifically inter-cell infections so can't be the same cell.
         distance_weights = []
         # Use of the cutoff distance idea from CovidSim.
-        cutoff = Parameters.instance().infection_radius
+        cutoff = self.parameters.infection_radius
         # Will catch the case if distance weights isn't configured
         # correctly and returns the wrong length.
         actual_infectee_cells = []
@@ -240,7 +240,8 @@ class SpatialSweep(AbstractSweep):
         # involved in the infection event
         force_of_infection = SpatialInfection.\
             spatial_foi(infector.microcell.cell, infectee.microcell.cell,
-                        infector, infectee, time)
+                        infector, infectee, time, self.parameters,
+                        self._population.intervention_modifiers)
 
         # Compare a uniform random number to the force of
         # infection to see whether an infection event
@@ -254,10 +255,15 @@ class SpatialSweep(AbstractSweep):
 
             # Stores the exposure period and infector's latent
             # period within attributes of the infectee
-            self.store_infection_periods(infector, infectee, time)
+            self.store_infection_periods(infector, infectee, time,
+                                         "spatial")
 
-    def bind_population(self, population):
-        super().bind_population(population)
+    def bind_population(self, population, parameters=None):
+        super().bind_population(population, parameters)
+        # Index cell locations so that only cells in nearby grid buckets
+        # are considered for each cell
+        spatial_index = SpatialIndex(
+            [cell.location for cell in population.cells],
+            bucket_size=self.parameters.infection_radius)
         for cell in population.cells:
-            other_cells = [x for x in population.cells if x != cell]
-            cell.find_nearby_cells(other_cells)
+            cell.find_nearby_cells(population.cells, spatial_index)
@@ -7,17 +7,78 @@ import numpy as np
 import typing
 
 import pyEpiabm as pe
-import pyEpiabm.core
 from pyEpiabm.property import InfectionStatus
 from pyEpiabm.utility import InverseCdf, RateMultiplier
 
 
+class _MatrixIndexer:
+    """Wraps an indexer of a :class:`_TrackedMatrix` (such as `.loc`), so
+    that assignments through it are recorded by the matrix.
+
+    """
+    def __init__(self, indexer, matrix):
+        self._indexer = indexer
+        self._matrix = matrix
+
+    def __getattr__(self, name):
+        return getattr(self._indexer, name)
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    def __setitem__(self, key, value):
+        self._indexer[key] = value
+        self._matrix.version += 1
+
+
+class _TrackedMatrix(pd.DataFrame):
+    """Data frame holding a transition matrix of a sweep, with a version
+    number which is incremented whenever entries are assigned, through
+    item assignment or the `.loc`, `.iloc`, `.at` and `.iat` indexers. The
+    sweep compares the version with that of its compiled tables, so that
+    edits made in place are used without comparing the entries of the
+    matrix. Other in place changes are not recorded, and require the
+    matrix to be assigned to the sweep again.
+
+    """
+    _metadata = ['version']
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    @property
+    def _constructor(self):
+        # Frames derived from the matrix are ordinary data frames
+        return pd.DataFrame
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    @property
+    def loc(self):
+        return _MatrixIndexer(super().loc, self)
+
+    @property
+    def iloc(self):
+        return _MatrixIndexer(super().iloc, self)
+
+    @property
+    def at(self):
+        return _MatrixIndexer(super().at, self)
+
+    @property
+    def iat(self):
+        return _MatrixIndexer(super().iat, self)
+
+
 class StateTransitionMatrix:
     """Class to generate and edit the state transition matrix
     """
     def __init__(self, coefficients: typing.Dict[str, typing.List[float]],
                  multipliers: typing.Dict[str, typing.List[float]],
-                 use_ages=False):
+                 use_ages=False, parameters=None):
         """Generate age independent transition matrix.
 
         Parameters
@@ -28,14 +89,53 @@ class StateTransitionMatrix:
             Dictionary of rate multipliers
         use_ages : bool
             Whether to include age dependant lists in matrix
+        parameters : Parameters
+            Parameters object to use. Defaults to
+            :meth:`Parameters.instance`
         """
+        self._parameters = parameters if parameters is not None \
+            else pe.core.Parameters.instance()
         self.matrix = self.create_state_transition_matrix(coefficients)
         self.age_dependent = use_ages
-        if pe.core.Parameters.instance().use_waning_immunity:
+        if self._parameters.use_waning_immunity:
             self.waning_matrix =\
                 self.create_waning_transition_matrix(multipliers)
         if not self.age_dependent:
             self.remove_age_dependence()
+        self.matrix = _TrackedMatrix(self.matrix)
+        self.cumulative_weights = self.compile_matrix(self.matrix)
+
+    @staticmethod
+    def compile_matrix(matrix: pd.DataFrame) -> np.ndarray:
+        """Compiles a state transition matrix into a dense array of
+        cumulative transition weights, so that the next infection status can
+        be drawn with integer indexing only. The array is indexed by
+        [current status value, age group, next status index], with row 0
+        unused as status values start at 1. If no entry of the matrix
+        depends on age there is a single age group.
+
+        Parameters
+        ----------
+        matrix : pd.DataFrame
+            State transition matrix, with age dependent entries given as
+            lists
+
+        Returns
+        -------
+        np.ndarray
+            Array of cumulative transition weights
+
+        """
+        nb_states = len(InfectionStatus)
+        entries = [[matrix.loc[row.name, column.name]
+                    for column in InfectionStatus] for row in InfectionStatus]
+        nb_age_groups = max([len(w) for row in entries for w in row
+                             if isinstance(w, list)], default=1)
+        weights = np.zeros((nb_states + 1, nb_age_groups, nb_states))
+        for i, row in enumerate(entries):
+            for j, w in enumerate(row):
+                weights[i + 1, :, j] = w
+        return np.cumsum(weights, axis=2)
 
     @staticmethod
     def create_empty_state_transition_matrix():
@@ -97,7 +197,7 @@ class StateTransitionMatrix:
                                                           "to_icurecov"]
         matrix.loc['InfectICU', 'Dead'] = coeff["prob_icu_to_death"]
         matrix.loc['InfectICURecov', 'Recovered'] = 1
-        if pe.core.Parameters.instance().use_waning_immunity:
+        if self._parameters.use_waning_immunity:
             matrix.loc['Recovered', 'Susceptible'] = 1
         else:
             matrix.loc['Recovered', 'Recovered'] = 1
@@ -215,13 +315,14 @@ class StateTransitionMatrix:
         row = current_infection_status_row.name
         column = next_infection_status_column.name
         self.matrix.loc[row, column] = new_probability
+        self.cumulative_weights = self.compile_matrix(self.matrix)
 
     def remove_age_dependence(self):
         """Conducts weighted average over age groups to remove age dependence
         in the state transition matrix.
 
         """
-        weights = pyEpiabm.core.Parameters.instance().age_proportions
+        weights = self._parameters.age_proportions
 
         self.matrix = self.matrix.apply(
             lambda col: col.map(lambda x: np.average(x, weights=weights)
@@ -240,12 +341,52 @@ class TransitionTimeMatrix:
         nb_states = len(InfectionStatus)
         zero_trans = np.full((nb_states, nb_states), -1.0)
         labels = [status.name for status in InfectionStatus]
-        self.matrix = pd.DataFrame(zero_trans,
-                                   columns=labels,
-                                   index=labels,
-                                   dtype='object')
+        self.matrix = _TrackedMatrix(zero_trans,
+                                     columns=labels,
+                                     index=labels,
+                                     dtype='object')
+
+    @staticmethod
+    def compile_matrix(matrix: pd.DataFrame) \
+            -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Compiles a transition time matrix into a typed table of sampler
+        handles and a table of fixed transition times, both indexed by
+        [current status value, next status value] (row and column 0 are
+        unused as status values start at 1). Entries with an
+        `icdf_choose_noexp` method (such as :class:`InverseCdf` objects)
+        are samplers, and all other entries must be numbers.
 
-    def create_transition_time_matrix(self):
+        Parameters
+        ----------
+        matrix : pd.DataFrame
+            Transition time matrix
+
+        Returns
+        -------
+        np.ndarray
+            Object array of samplers, None where the time is fixed
+        np.ndarray
+            Array of fixed transition times, NaN where a sampler is used
+
+        """
+        nb_states = len(InfectionStatus)
+        samplers = np.full((nb_states + 1, nb_states + 1), None,
+                           dtype=object)
+        fixed_times = np.full((nb_states + 1, nb_states + 1), np.nan)
+        for row in InfectionStatus:
+            for column in InfectionStatus:
+                entry = matrix.loc[row.name, column.name]
+                if hasattr(entry, 'icdf_choose_noexp'):
+                    samplers[row.value, column.value] = entry
+                elif isinstance(entry, (int, float)):
+                    fixed_times[row.value, column.value] = entry
+                else:
+                    raise ValueError("Entries of transition time matrix" +
+                                     " must either be ICDF" +
+                                     " objects or numbers")
+        return samplers, fixed_times
+
+    def create_transition_time_matrix(self, parameters=None):
         """Fills the transition time matrix with :class:`InverseCdf` objects,
         where the distributions of times of transition are defined. For
         example, the element ij in the matrix is the :class:`InverseCdf`
@@ -255,55 +396,63 @@ class TransitionTimeMatrix:
         expect to happen are assigned a value of -1.0 in the matrix, so it
         will not pass silently if these are accessed accidentally.
 
+        Parameters
+        ----------
+        parameters : Parameters
+            Parameters object to read the distributions from. Defaults to
+            :meth:`Parameters.instance`
+
         Returns
         -------
         pd.DataFrame
             Matrix in the form of a dataframe
 
         """
+        if parameters is None:
+            parameters = pe.Parameters.instance()
         matrix = TransitionTimeMatrix().matrix
         matrix.loc['Exposed', 'InfectASympt'] =\
-            InverseCdf(pe.Parameters.instance().latent_period,
-                       pe.Parameters.instance().latent_period_iCDF)
+            InverseCdf(parameters.latent_period,
+                       parameters.latent_period_iCDF)
         matrix.loc['Exposed', 'InfectMild'] =\
-            InverseCdf(pe.Parameters.instance().latent_period,
-                       pe.Parameters.instance().latent_period_iCDF)
+            InverseCdf(parameters.latent_period,
+                       parameters.latent_period_iCDF)
         matrix.loc['Exposed', 'InfectGP'] =\
-            InverseCdf(pe.Parameters.instance().latent_period,
-                       pe.Parameters.instance().latent_period_iCDF)
+            InverseCdf(parameters.latent_period,
+                       parameters.latent_period_iCDF)
         matrix.loc['InfectASympt', 'Recovered'] =\
-            InverseCdf(pe.Parameters.instance().asympt_infect_period,
-                       pe.Parameters.instance().asympt_infect_icdf)
+            InverseCdf(parameters.asympt_infect_period,
+                       parameters.asympt_infect_icdf)
         matrix.loc['InfectMild', 'Recovered'] =\
-            InverseCdf(pe.Parameters.instance().mean_mild_to_recov,
-                       pe.Parameters.instance().mild_to_recov_icdf)
+            InverseCdf(parameters.mean_mild_to_recov,
+                       parameters.mild_to_recov_icdf)
         matrix.loc['InfectGP', 'Recovered'] =\
-            InverseCdf(pe.Parameters.instance().mean_gp_to_recov,
-                       pe.Parameters.instance().gp_to_recov_icdf)
+            InverseCdf(parameters.mean_gp_to_recov,
+                       parameters.gp_to_recov_icdf)
         matrix.loc['InfectGP', 'InfectHosp'] =\
-            InverseCdf(pe.Parameters.instance().mean_gp_to_hosp,
-                       pe.Parameters.instance().gp_to_hosp_icdf)
+            InverseCdf(parameters.mean_gp_to_hosp,
+                       parameters.gp_to_hosp_icdf)
         matrix.loc['InfectGP', 'Dead'] =\
-            InverseCdf(pe.Parameters.instance().mean_gp_to_death,
-                       pe.Parameters.instance().gp_to_death_icdf)
+            InverseCdf(parameters.mean_gp_to_death,
+                       parameters.gp_to_death_icdf)
         matrix.loc['InfectHosp', 'Recovered'] =\
-            InverseCdf(pe.Parameters.instance().mean_hosp_to_recov,
-                       pe.Parameters.instance().hosp_to_recov_icdf)
+            InverseCdf(parameters.mean_hosp_to_recov,
+                       parameters.hosp_to_recov_icdf)
         matrix.loc['InfectHosp', 'InfectICU'] =\
-            InverseCdf(pe.Parameters.instance().mean_hosp_to_icu,
-                       pe.Parameters.instance().hosp_to_icu_icdf)
+            InverseCdf(parameters.mean_hosp_to_icu,
+                       parameters.hosp_to_icu_icdf)
         matrix.loc['InfectHosp', 'Dead'] =\
-            InverseCdf(pe.Parameters.instance().mean_hosp_to_death,
-                       pe.Parameters.instance().hosp_to_death_icdf)
+            InverseCdf(parameters.mean_hosp_to_death,
+                       parameters.hosp_to_death_icdf)
         matrix.loc['InfectICU', 'InfectICURecov'] =\
-            InverseCdf(pe.Parameters.instance().mean_icu_to_icurecov,
-                       pe.Parameters.instance().icu_to_icurecov_icdf)
+            InverseCdf(parameters.mean_icu_to_icurecov,
+                       parameters.icu_to_icurecov_icdf)
         matrix.loc['InfectICU', 'Dead'] =\
-            InverseCdf(pe.Parameters.instance().mean_icu_to_death,
-                       pe.Parameters.instance().icu_to_death_icdf)
+            InverseCdf(parameters.mean_icu_to_death,
+                       parameters.icu_to_death_icdf)
         matrix.loc['InfectICURecov', 'Recovered'] =\
-            InverseCdf(pe.Parameters.instance().mean_icurecov_to_recov,
-                       pe.Parameters.instance().icurecov_to_recov)
+            InverseCdf(parameters.mean_icurecov_to_recov,
+                       parameters.icurecov_to_recov)
         return matrix
 
     def update_transition_time_with_float(
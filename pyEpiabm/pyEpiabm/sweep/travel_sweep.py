@@ -35,6 +35,26 @@ class TravelSweep(AbstractSweep):
         self.initial_cell.add_microcells(1)
         self.initial_microcell = self.initial_cell.microcells[0]
 
+    def bind_population(self, population, parameters=None):
+        """Binds the population to the sweep, reading the travel parameters
+        from the parameters bound with it, if given. The host progression
+        sweep used to give introduced individuals their infection progression
+        is also built from the bound parameters.
+
+        Parameters
+        ----------
+        population : Population
+            Population to bind
+        parameters : Parameters
+            Parameters object to bind, see
+            :meth:`AbstractSweep.bind_population`
+
+        """
+        super().bind_population(population, parameters)
+        if parameters is not None:
+            self.travel_params = parameters.travel_params
+        self._host_sweep = HostProgressionSweep(self.parameters)
+
     def __call__(self, time: float):
         """Based on number of infected cases in population, infected
         individuals are introduced to the population for a certain
@@ -49,8 +69,7 @@ class TravelSweep(AbstractSweep):
 
         """
         # Introduce number of individuals
-        num_cases = sum(map(lambda cell: cell.number_infectious(),
-                        self._population.cells))
+        num_cases = self._population.number_infectious()
         num_individuals_introduced_ratio = math.floor(
             num_cases * self.travel_params['ratio_introduce_cases'])
         if len(self.travel_params['constant_introduce_cases']) > 1:
@@ -70,6 +89,7 @@ class TravelSweep(AbstractSweep):
 
             # Remove individuals introduced from introduce_population
             self.initial_cell.persons = []
+            self.initial_cell.persons_version += 1
             self.initial_microcell.persons = []
 
         # Remove individuals if the duration of their stay has passed
@@ -90,11 +110,11 @@ class TravelSweep(AbstractSweep):
             Infected individuals added to population at certain time step
 
         """
-        asymp_prop = Parameters.instance().host_progression_lists[
+        asymp_prop = self.parameters.host_progression_lists[
             "prob_exposed_to_asympt"]
-        if Parameters.instance().use_ages:
+        if self.parameters.use_ages:
             # Age used in model
-            age_prop = Parameters.instance().age_proportions
+            age_prop = self.parameters.age_proportions
             # Travellers are between 15-80 years
             age_prop_adjusted = [0.0 if i in [0, 1, 2, 16] else prop for
                                  i, prop in enumerate(age_prop)]
@@ -139,8 +159,9 @@ class TravelSweep(AbstractSweep):
             # Assigns them their next infection status and the time of
             # their next status change. Also updates their infectiousness.
             person.next_infection_status = InfectionStatus.Recovered
-            HostProgressionSweep.set_infectiousness(person, time)
-            HostProgressionSweep().update_time_status_change(person, time)
+            HostProgressionSweep.set_infectiousness(person, time,
+                                                    self.parameters)
+            self._host_sweep.update_time_status_change(person, time)
             # Store travellers
             self._population.travellers.append(person)
 
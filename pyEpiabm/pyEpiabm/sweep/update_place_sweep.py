@@ -7,7 +7,6 @@ import math
 import numpy as np
 import logging
 
-from pyEpiabm.core import Parameters
 
 from .abstract_sweep import AbstractSweep
 
@@ -32,7 +31,7 @@ class UpdatePlaceSweep(AbstractSweep):
         # of the variable population and refilling them.
 
         # Can call a this line if being called in from file etc.
-        params = Parameters.instance().place_params
+        params = self.parameters.place_params
         for cell in self._population.cells:
             for place in cell.places:
                 param_ind = place.place_type.value - 1
@@ -84,8 +83,8 @@ class UpdatePlaceSweep(AbstractSweep):
 
         """
         if place.place_type.name == "CareHome" and \
-                hasattr(Parameters.instance(), 'carehome_params'):
-            carehome_params = Parameters.instance().carehome_params
+                hasattr(self.parameters, 'carehome_params'):
+            carehome_params = self.parameters.carehome_params
         # If a specific list of people is not provided, use the whole cell
         if person_list is None:
             person_list = (place.cell.persons).copy()
@@ -137,7 +136,7 @@ class UpdatePlaceSweep(AbstractSweep):
             if ((person not in place.persons) and
                     (place.place_type not in person.place_types)):
                 if place.place_type.name == "CareHome":
-                    if hasattr(Parameters.instance(), 'carehome_params'):
+                    if hasattr(self.parameters, 'carehome_params'):
                         if person.age >= carehome_params[
                                 "carehome_minimum_age"]:
                             group_index = 1
@@ -146,10 +145,10 @@ class UpdatePlaceSweep(AbstractSweep):
                                 "carehome_minimum_age"]:
                             group_index = 0
                             person.key_worker = True
-                elif (hasattr(Parameters.instance(), 'use_key_workers') and
-                      Parameters.instance().use_key_workers != 0):
+                elif (hasattr(self.parameters, 'use_key_workers') and
+                      self.parameters.use_key_workers != 0):
                     r = random.random()
-                    if r < Parameters.instance().use_key_workers:
+                    if r < self.parameters.use_key_workers:
                         person.key_worker = True
 
                 if group_index is not None:
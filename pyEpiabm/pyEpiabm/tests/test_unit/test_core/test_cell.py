@@ -1,6 +1,4 @@
 import unittest
-from queue import Queue
-
 import pyEpiabm as pe
 from pyEpiabm.property.infection_status import InfectionStatus
 from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
@@ -20,9 +18,9 @@ class TestCell(TestPyEpiabm):
         self.assertEqual(self.cell.microcells, [])
         self.assertEqual(self.cell.persons, [])
         self.assertEqual(self.cell.places, [])
-        self.assertIsInstance(self.cell.person_queue, Queue)
-        self.assertIsInstance(self.cell.PCR_queue, Queue)
-        self.assertIsInstance(self.cell.LFT_queue, Queue)
+        self.assertIsInstance(self.cell.person_queue, pe._PersonQueue)
+        self.assertIsInstance(self.cell.PCR_queue, pe._PersonQueue)
+        self.assertIsInstance(self.cell.LFT_queue, pe._PersonQueue)
         self.assertRaises(ValueError, pe.Cell, (.2, .3, .4))
 
     def test_repr(self):
@@ -70,6 +68,61 @@ class TestCell(TestPyEpiabm):
         person.update_status(InfectionStatus.Recovered)
         self.assertEqual(self.cell.number_infectious(), 0)
 
+    def test_update_infectious_person(self):
+        self.cell.add_microcells(1)
+        self.cell.microcells[0].add_people(2)
+        person = self.cell.microcells[0].persons[0]
+        self.assertEqual(self.cell.infectious_persons, {})
+        person.update_status(InfectionStatus.InfectMild)
+        self.assertEqual(list(self.cell.infectious_persons), [person])
+        person.update_status(InfectionStatus.InfectHosp)
+        self.assertEqual(list(self.cell.infectious_persons), [person])
+        person.update_status(InfectionStatus.Recovered)
+        self.assertEqual(self.cell.infectious_persons, {})
+
+        # Infectious people are also indexed when added to the cell
+        self.cell.microcells[0].add_people(1, InfectionStatus.InfectGP)
+        self.assertEqual(list(self.cell.infectious_persons),
+                         [self.cell.persons[-1]])
+
+    def test_infectors(self):
+        self.cell.add_microcells(2)
+        self.cell.microcells[0].add_people(3)
+        self.cell.microcells[1].add_people(2)
+        persons = self.cell.persons
+        for i in [4, 1, 2]:
+            persons[i].update_status(InfectionStatus.InfectASympt)
+        # Returned in the order of the cell's persons, not of infection
+        self.assertEqual(self.cell.infectors(),
+                         [persons[1], persons[2], persons[4]])
+
+        # Order is kept when people leave the cell
+        self.cell.microcells[0].add_household(persons[:3])
+        left = persons[1]
+        left.remove_person()
+        self.assertNotIn(left, self.cell.infectious_persons)
+        self.assertEqual(self.cell.infectors(), [persons[1], persons[3]])
+        self.cell.microcells[0].add_people(1, InfectionStatus.InfectMild)
+        self.assertEqual(self.cell.infectors(),
+                         [persons[1], persons[3], persons[4]])
+
+    def test_update_status_calendar(self):
+        self.cell.add_microcells(1)
+        self.cell.microcells[0].add_people(3)
+        persons = self.cell.persons
+        persons[2].time_of_status_change = 1.5
+        persons[0].time_of_status_change = 1
+        persons[1].time_of_status_change = 4
+        self.assertEqual(len(self.cell.status_calendar), 3)
+        persons[1].time_of_status_change = None
+        self.assertEqual(self.cell.in_person_order(
+            self.cell.status_calendar.pop_due(5)), [persons[0], persons[2]])
+
+        persons[0].time_of_status_change = 6
+        self.cell.microcells[0].add_household(persons)
+        persons[0].remove_person()
+        self.assertEqual(len(self.cell.status_calendar), 0)
+
     def test_set_loc(self):
         self.assertEqual(self.cell.location, (0, 0))
         self.cell.set_location((3.0, 2.0))
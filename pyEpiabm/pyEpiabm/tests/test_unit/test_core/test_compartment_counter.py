@@ -43,6 +43,26 @@ class TestCompartmentCounter(TestPyEpiabm):
         self.assertEqual(counter.retrieve()[InfectionStatus.Susceptible].all(),
                          0)
 
+    def test_counts(self):
+        counter = pe._CompartmentCounter("test")
+        self.assertEqual(counter.counts.shape,
+                         (len(InfectionStatus), counter.nb_age_groups))
+        counter._increment_compartment(3, InfectionStatus.Susceptible, 0)
+        counter.report(InfectionStatus.Susceptible,
+                       InfectionStatus.InfectGP, 0)
+        self.assertEqual(counter.counts[InfectionStatus.InfectGP.value - 1,
+                                        0], 1)
+        self.assertEqual(counter.total([InfectionStatus.Susceptible,
+                                        InfectionStatus.InfectGP]), 3)
+
+        # The retrieved compartments are views of the counts
+        compartments = counter.retrieve()
+        counter.report(InfectionStatus.Susceptible,
+                       InfectionStatus.InfectGP, 0)
+        self.assertEqual(compartments[InfectionStatus.InfectGP][0], 2)
+        counter.clear_counter()
+        self.assertEqual(compartments[InfectionStatus.InfectGP][0], 0)
+
     @patch('pyEpiabm.core.Parameters.instance')
     def test_construct_no_age(self, mock_params):
         mock_params.return_value.use_ages = False
@@ -0,0 +1,65 @@
+import pickle
+import unittest
+
+import numpy as np
+
+import pyEpiabm as pe
+
+
+class TestEventCalendar(unittest.TestCase):
+    """Test the '_EventCalendar' class.
+    """
+    def setUp(self) -> None:
+        self.subject = pe._EventCalendar()
+        for item, time in [('a', 2.5), ('b', 0.5), ('c', 2), ('d', 7)]:
+            self.subject.schedule(item, time)
+
+    def test__init__(self):
+        self.assertEqual(self.subject.bucket_width, 1.0)
+        self.assertEqual(len(pe._EventCalendar()), 0)
+        self.assertRaises(ValueError, pe._EventCalendar, 0)
+
+    def test_schedule(self):
+        self.assertEqual(len(self.subject), 4)
+        self.assertIn('a', self.subject)
+
+        # Items are moved when scheduled again, and dropped with no time
+        self.subject.schedule('d', 1)
+        self.subject.schedule('c', None)
+        self.subject.schedule('b', np.inf)
+        self.subject.schedule('e', np.nan)
+        self.assertEqual(len(self.subject), 2)
+        self.assertNotIn('c', self.subject)
+        self.assertEqual(self.subject.pop_due(10), ['d', 'a'])
+
+    def test_unschedule(self):
+        self.subject.unschedule('a')
+        self.subject.unschedule('e')
+        self.assertNotIn('a', self.subject)
+        self.assertEqual(self.subject.pop_due(3), ['b', 'c'])
+
+    def test_pop_due(self):
+        self.assertEqual(self.subject.pop_due(0), [])
+        self.assertEqual(self.subject.pop_due(2.2), ['b', 'c'])
+        self.assertEqual(len(self.subject), 2)
+
+        # Items scheduled in the past are due straight away
+        self.subject.schedule('e', 1)
+        self.assertEqual(self.subject.pop_due(2.5), ['e', 'a'])
+        self.assertEqual(self.subject.pop_due(6.9), [])
+        self.assertEqual(self.subject.pop_due(7), ['d'])
+        self.assertEqual(len(self.subject), 0)
+
+    def test_bucket_width(self):
+        subject = pe._EventCalendar(0.25)
+        for i, time in enumerate([0.3, 0.1, 0.6, 0.5]):
+            subject.schedule(i, time)
+        self.assertEqual(subject.pop_due(0.5), [1, 0, 3])
+
+    def test_pickle(self):
+        subject = pickle.loads(pickle.dumps(self.subject))
+        self.assertEqual(subject.pop_due(10), ['b', 'a', 'c', 'd'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import copy
+import pickle
+import unittest
+
+import pyEpiabm as pe
+
+
+class TestIndexedList(unittest.TestCase):
+    """Test the '_IndexedList' class.
+    """
+    def setUp(self) -> None:
+        self.subject = pe._IndexedList(['a', 'b', 'c'])
+
+    def test__init__(self):
+        self.assertEqual(self.subject, ['a', 'b', 'c'])
+        self.assertEqual(pe._IndexedList(), [])
+        self.assertIsInstance(self.subject, list)
+        self.assertRaises(ValueError, pe._IndexedList, ['a', 'a'])
+
+    def test_append(self):
+        self.subject.append('d')
+        self.subject.extend(['e', 'f'])
+        self.assertEqual(self.subject, ['a', 'b', 'c', 'd', 'e', 'f'])
+        self.assertEqual(self.subject.index('f'), 5)
+        self.assertRaises(ValueError, self.subject.append, 'a')
+
+    def test_contains(self):
+        self.assertIn('b', self.subject)
+        self.assertNotIn('d', self.subject)
+        self.assertEqual(self.subject.index('c'), 2)
+        self.assertRaises(ValueError, self.subject.index, 'd')
+
+    def test_remove(self):
+        # The order of the other items is kept
+        self.subject.remove('a')
+        self.assertEqual(self.subject, ['b', 'c'])
+        self.assertEqual(self.subject.index('c'), 1)
+        self.assertNotIn('a', self.subject)
+        self.subject.remove('c')
+        self.assertEqual(self.subject, ['b'])
+        self.assertEqual(self.subject.index('b'), 0)
+        self.assertRaises(ValueError, self.subject.remove, 'a')
+
+        self.subject.clear()
+        self.assertEqual(self.subject, [])
+        self.assertNotIn('c', self.subject)
+
+    def test_copy(self):
+        for subject in [pickle.loads(pickle.dumps(self.subject)),
+                        copy.deepcopy(self.subject)]:
+            self.assertIsInstance(subject, pe._IndexedList)
+            self.assertEqual(subject, self.subject)
+            self.assertEqual(subject.index('b'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
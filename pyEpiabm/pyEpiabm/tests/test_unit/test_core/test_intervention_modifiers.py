@@ -0,0 +1,136 @@
+import unittest
+
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.property import PlaceType
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestInterventionModifiers(TestPyEpiabm):
+    """Test the 'InterventionModifiers' class.
+    """
+    def setUp(self) -> None:
+        self.population = pe.Population()
+        self.population.add_cells(1)
+        self.cell = self.population.cells[0]
+        self.cell.add_microcells(2)
+        for microcell in self.cell.microcells:
+            microcell.add_people(2)
+        self.microcell = self.cell.microcells[0]
+        self.microcell.add_place(1, (1, 1), PlaceType.PrimarySchool)
+        self.microcell.places[0].add_person(self.microcell.persons[0])
+        self.person = self.microcell.persons[0]
+        self.person.isolation_start_time = 1
+        self.modifiers = pe.InterventionModifiers(self.population)
+
+    def test__init__(self):
+        self.assertEqual(self.modifiers.persons, self.cell.persons)
+        self.assertEqual(self.modifiers.microcells, self.cell.microcells)
+        self.assertIsNone(self.modifiers.time)
+
+        # Attributes already set are read on construction
+        self.modifiers.update(1)
+        np.testing.assert_array_equal(self.modifiers.isolation,
+                                      [0.5, 1, 1, 1])
+        np.testing.assert_array_equal(self.modifiers.isolation_house,
+                                      [0.5, 1, 1, 1])
+        self.assertEqual(self.modifiers.time, 1)
+
+    def test_record(self):
+        person = self.cell.microcells[1].persons[1]
+        self.modifiers.record(person, 'quarantine_start_time', 2)
+        self.modifiers.record(person, 'distancing_enhanced', True)
+        self.modifiers.record(self.cell.microcells[1],
+                              'distancing_start_time', 2)
+        self.assertIsNone(self.modifiers.time)
+
+        # Start times are not yet reached
+        self.modifiers.update(1)
+        np.testing.assert_array_equal(self.modifiers.quarantine_house, 1)
+        np.testing.assert_array_equal(self.modifiers.distancing_house, 1)
+
+        self.modifiers.update(2)
+        np.testing.assert_array_equal(self.modifiers.quarantine_house,
+                                      [1, 1, 1, 1.5])
+        np.testing.assert_array_equal(self.modifiers.quarantine_spatial,
+                                      [1, 1, 1, 0.25])
+        np.testing.assert_array_equal(self.modifiers.quarantine_place[3],
+                                      0.25)
+        np.testing.assert_array_equal(self.modifiers.distancing_house,
+                                      [1, 1, 0.8, 0.5])
+        np.testing.assert_array_equal(self.modifiers.distancing_spatial,
+                                      [1, 1, 0.8, 0.5])
+        np.testing.assert_array_equal(self.modifiers.distancing_place[:, 0],
+                                      [1, 1, 0.8, 0.5])
+
+        self.modifiers.record(person, 'quarantine_start_time', None)
+        self.modifiers.update(2)
+        np.testing.assert_array_equal(self.modifiers.quarantine_house, 1)
+        with self.assertRaises(ValueError):
+            self.modifiers.record(person, 'infectiousness', 1)
+
+    def test_update_isolation(self):
+        # Travel isolation takes precedence over case isolation
+        pe.Parameters.instance().intervention_params['travel_isolation'][
+            'isolation_effectiveness'] = 0.2
+        self.modifiers.record(self.person, 'travel_isolation_start_time', 0)
+        self.modifiers.update(1)
+        self.assertEqual(self.modifiers.isolation[0], 0.2)
+        self.assertEqual(self.modifiers.isolation_house[0], 0.5)
+
+    def test_update_closure(self):
+        self.modifiers.record(self.microcell, 'closure_start_time', 1)
+        self.modifiers.record(self.cell.microcells[1], 'closure_start_time',
+                              1)
+        self.modifiers.update(1)
+        # Only people with a place of a closed type are affected
+        np.testing.assert_array_equal(self.modifiers.closed,
+                                      [True, False, False, False])
+        np.testing.assert_array_equal(self.modifiers.closure_household,
+                                      [5, 1, 1, 1])
+        np.testing.assert_array_equal(self.modifiers.closure_spatial,
+                                      [0.5, 1, 1, 1])
+
+    def test_index_closure(self):
+        self.modifiers.record(self.microcell, 'closure_start_time', 1)
+        self.modifiers.update(1)
+        other = self.microcell.persons[1]
+        self.assertEqual(self.modifiers.closure_household.item(
+            self.modifiers.index(other, 1)), 1)
+
+        # People whose places change after the update are checked again
+        place = self.microcell.places[0]
+        place.remove_person(self.person)
+        place.add_person(other)
+        row = self.modifiers.index(other, 1)
+        self.assertTrue(self.modifiers.closed[row])
+        self.assertEqual(self.modifiers.closure_household[row], 5)
+        self.assertEqual(self.modifiers.closure_spatial[row], 0.5)
+        row = self.modifiers.index(self.person, 1)
+        self.assertFalse(self.modifiers.closed[row])
+        self.assertEqual(self.modifiers.closure_household[row], 1)
+        self.assertEqual(self.modifiers.closure_spatial[row], 1)
+        self.assertEqual(self.modifiers.time, 1)
+
+    def test_index(self):
+        self.assertEqual(self.modifiers.index(self.person, 1), 0)
+        self.assertEqual(self.modifiers.time, 1)
+
+        # New people are added when first looked up
+        self.microcell.add_people(1)
+        new_person = self.microcell.persons[-1]
+        new_person.quarantine_start_time = 0
+        self.assertEqual(self.modifiers.index(new_person, 1), 4)
+        self.assertIs(self.modifiers.persons[4], new_person)
+        self.assertEqual(self.modifiers.quarantine_house[4], 1.5)
+
+        # Adding many people grows the arrays
+        self.microcell.add_people(10)
+        for person in self.microcell.persons[-10:]:
+            self.modifiers.index(person, 1)
+        self.assertEqual(len(self.modifiers.isolation), 15)
+
+
+if __name__ == '__main__':
+    unittest.main()
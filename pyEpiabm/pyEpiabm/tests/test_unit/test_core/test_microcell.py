@@ -54,6 +54,23 @@ class TestMicrocell(TestPyEpiabm):
         self.assertEqual(len(self.microcell.persons), 2)
         self.assertEqual(len(self.cell.persons), 2)
         self.assertEqual(self.cell.number_infectious(), 1)
+        self.assertEqual(self.cell.persons_version, 2)
+
+    def test_add_person_other_cell(self):
+        other_cell = pe.Cell()
+        other_microcell = pe.Microcell(other_cell)
+        other_microcell.add_people(1, InfectionStatus.InfectMild)
+        person = other_microcell.persons[0]
+        person.time_of_status_change = 5.0
+        self.assertIn(person, other_cell.status_calendar)
+
+        # Moving to another cell moves the person's calendar entry and
+        # infectious index entry with them
+        self.microcell.add_person(person)
+        self.assertNotIn(person, other_cell.status_calendar)
+        self.assertNotIn(person, other_cell.infectious_persons)
+        self.assertIn(person, self.cell.status_calendar)
+        self.assertIn(person, self.cell.infectious_persons)
 
     def test_add_people(self, n=4):
         self.assertEqual(len(self.microcell.persons), 0)
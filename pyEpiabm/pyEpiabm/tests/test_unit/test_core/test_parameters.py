@@ -1,4 +1,5 @@
 from collections import defaultdict
+import pickle
 import unittest
 from unittest.mock import patch
 import os
@@ -27,6 +28,55 @@ class TestParameters(TestPyEpiabm):
         my_dict = defaultdict(int, my_dict)
         self.assertEqual(my_dict["false_key"], 0)
 
+    def test_parameter_groups(self):
+        params = pe.Parameters.instance()
+        self.assertIsInstance(params.carehome_params, dict)
+        self.assertEqual(
+            params.carehome_params.carehome_resident_household_scaling,
+            params.carehome_params["carehome_resident_household_scaling"])
+        self.assertEqual(
+            params.intervention_params.case_isolation.start_time,
+            params.intervention_params["case_isolation"]["start_time"])
+        params.carehome_params.new_param = 2
+        self.assertEqual(params.carehome_params["new_param"], 2)
+        params.carehome_params["other_param"] = 3
+        self.assertEqual(params.carehome_params.other_param, 3)
+        self.assertIn('other_param', vars(params.carehome_params))
+        with self.assertRaises(AttributeError):
+            params.carehome_params.missing_param
+
+    def test_from_file(self):
+        param_loc = os.path.join(os.path.dirname(__file__), os.pardir,
+                                 os.pardir, 'testing_parameters.json')
+        params = pe.Parameters.from_file(param_loc)
+        self.assertIsNot(params, pe.Parameters.instance())
+        params.infection_radius = 123
+        self.assertNotEqual(pe.Parameters.instance().infection_radius, 123)
+
+        # Parameters can be pickled, for example in simulation checkpoints
+        copied = pickle.loads(pickle.dumps(params))
+        self.assertEqual(copied.infection_radius, 123)
+        self.assertEqual(copied.carehome_params, params.carehome_params)
+        self.assertEqual(
+            copied.intervention_params.case_isolation.start_time,
+            params.intervention_params.case_isolation.start_time)
+        copied.carehome_params['new_param'] = 1
+        self.assertEqual(copied.carehome_params.new_param, 1)
+
+    def test_activate(self):
+        previous = pe.Parameters.instance()
+        params = pe.Parameters.from_file(os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            'testing_parameters.json'))
+        with pe.Parameters.activate(params) as active:
+            self.assertIs(active, params)
+            self.assertIs(pe.Parameters.instance(), params)
+        self.assertIs(pe.Parameters.instance(), previous)
+        with self.assertRaises(ValueError):
+            with pe.Parameters.activate(params):
+                raise ValueError
+        self.assertIs(pe.Parameters.instance(), previous)
+
 
 class TestNoConfigParameters(unittest.TestCase):
     """Test class for tests without implicit config call
@@ -90,6 +90,20 @@ class TestPerson(TestPyEpiabm):
             pe.property.InfectionStatus.Exposed)
         self.assertEqual(len(self.person.household.susceptible_persons), 0)
 
+    def test_update_status_event_log(self):
+        self.cell.event_log = MagicMock()
+        self.person.update_status(pe.property.InfectionStatus.Exposed)
+        self.cell.event_log.record_status_change.assert_called_once_with(
+            self.person, pe.property.InfectionStatus.Susceptible,
+            pe.property.InfectionStatus.Exposed)
+
+    def test_infectious_index(self):
+        # Setting the status directly also keeps the cell's index up to date
+        self.person.infection_status = pe.property.InfectionStatus.InfectGP
+        self.assertIn(self.person, self.cell.infectious_persons)
+        self.person.infection_status = pe.property.InfectionStatus.Dead
+        self.assertNotIn(self.person, self.cell.infectious_persons)
+
     def test_configure_place(self):
         # Tests both the add and remove functions
         self.assertEqual(len(self.person.places), 0)
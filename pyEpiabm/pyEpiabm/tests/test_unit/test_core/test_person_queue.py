@@ -0,0 +1,59 @@
+import pickle
+import unittest
+
+import pyEpiabm as pe
+
+
+class TestPersonQueue(unittest.TestCase):
+    """Test the '_PersonQueue' class.
+    """
+    def setUp(self) -> None:
+        self.subject = pe._PersonQueue()
+        for item in ['a', 'b', 'c']:
+            self.subject.put(item)
+
+    def test__init__(self):
+        subject = pe._PersonQueue()
+        self.assertTrue(subject.empty())
+        self.assertEqual(subject.qsize(), 0)
+        self.assertEqual(list(subject.queue), [])
+
+    def test_put(self):
+        # Items already waiting are not enqueued again
+        self.subject.put('b')
+        self.subject.put('d')
+        self.assertEqual(list(self.subject), ['a', 'b', 'c', 'd'])
+        self.assertEqual(len(self.subject), 4)
+        self.assertIn('d', self.subject)
+
+    def test_get(self):
+        self.assertEqual(self.subject.get(), 'a')
+        self.assertNotIn('a', self.subject)
+        self.assertEqual(self.subject.qsize(), 2)
+
+        # An item can be enqueued again once it has left the queue
+        self.subject.put('a')
+        self.assertEqual(list(self.subject.queue), ['b', 'c', 'a'])
+        self.subject.drain()
+        self.assertRaises(IndexError, self.subject.get)
+
+    def test_drain(self):
+        self.assertEqual(self.subject.drain(2), ['a', 'b'])
+        self.assertEqual(list(self.subject), ['c'])
+        self.subject.put('a')
+        self.assertEqual(self.subject.drain(1.5), ['c', 'a'])
+        self.assertTrue(self.subject.empty())
+
+        self.subject.put('b')
+        self.assertEqual(self.subject.drain(), ['b'])
+        self.assertEqual(self.subject.drain(), [])
+        self.assertNotIn('b', self.subject)
+
+    def test_pickle(self):
+        subject = pickle.loads(pickle.dumps(self.subject))
+        subject.put('a')
+        self.assertEqual(subject.drain(), ['a', 'b', 'c'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import math
+
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.tests.test_unit.mocked_logging_tests import TestMockedLogs
+
+
+class TestPersonStore(TestMockedLogs):
+    """Test the 'PersonStore' class.
+    """
+    def setUp(self) -> None:
+        self.population = pe.Population()
+        self.population.add_cells(2)
+        for cell in self.population.cells:
+            cell.add_microcells(1)
+            cell.microcells[0].add_people(3)
+        self.person = self.population.cells[1].persons[0]
+        self.person.update_status(InfectionStatus.InfectMild)
+        self.person.next_infection_status = InfectionStatus.Recovered
+        self.person.time_of_status_change = 4.0
+        self.person.infectiousness = 1.5
+        self.person.infection_start_times.append(2.0)
+
+    def test__init__(self):
+        store = pe.PersonStore(capacity=10)
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.persons, [])
+        self.assertEqual(len(store.status), 10)
+        self.assertEqual(repr(store), "PersonStore with 0 people (0 active).")
+
+    def test_from_population(self):
+        store = self.population.build_person_store()
+        self.assertEqual(len(store), 6)
+        self.assertIs(self.population.person_store, store)
+        self.assertIs(self.population.build_person_store(), store)
+        for cell in self.population.cells:
+            self.assertIs(cell.person_store, store)
+
+        index = self.person.store_index
+        self.assertEqual(index, 3)
+        self.assertIs(store.persons[index], self.person)
+        self.assertEqual(store.status[index],
+                         InfectionStatus.InfectMild.value)
+        self.assertEqual(store.next_status[index],
+                         InfectionStatus.Recovered.value)
+        self.assertEqual(store.next_status[0], 0)
+        self.assertEqual(store.time_of_status_change[index], 4.0)
+        self.assertTrue(math.isnan(store.time_of_status_change[0]))
+        self.assertEqual(store.infectiousness[index], 1.5)
+        self.assertEqual(store.infection_start_time[index], 2.0)
+        self.assertEqual(store.cell_index[index], 1)
+        self.assertEqual(store.household_index[index], -1)
+        np.testing.assert_array_equal(store.active_indices(), range(6))
+
+    def test_person_view(self):
+        store = self.population.build_person_store()
+        index = self.person.store_index
+        self.assertEqual(self.person.infection_status,
+                         InfectionStatus.InfectMild)
+        self.assertEqual(self.person.time_of_status_change, 4.0)
+        self.assertIsNone(store.persons[0].time_of_status_change)
+        self.assertIsNone(store.persons[0].next_infection_status)
+
+        # Writes through the person and through the store are shared
+        self.person.update_status(InfectionStatus.Recovered)
+        self.assertEqual(store.status[index],
+                         InfectionStatus.Recovered.value)
+        store.infectiousness[index] = 0.5
+        self.assertEqual(self.person.infectiousness, 0.5)
+        self.person.next_infection_status = None
+        self.assertEqual(store.next_status[index], 0)
+        self.person.time_of_status_change = None
+        self.assertTrue(math.isnan(store.time_of_status_change[index]))
+
+    def test_add_person(self):
+        store = self.population.build_person_store()
+        microcell = self.population.cells[0].microcells[0]
+        microcell.add_people(1, InfectionStatus.InfectASympt)
+        new_person = microcell.persons[-1]
+        self.assertEqual(len(store), 7)
+        self.assertIs(new_person.store, store)
+        self.assertEqual(store.status[6], InfectionStatus.InfectASympt.value)
+        self.assertTrue(store.status_mask(
+            [InfectionStatus.InfectASympt])[6])
+
+        microcell.add_household([new_person])
+        self.assertEqual(store.household_index[6], 0)
+        self.assertIs(store.households[0], new_person.household)
+
+        with self.assertRaises(ValueError):
+            store.add_person(new_person)
+
+    def test_remove_person(self):
+        store = self.population.build_person_store()
+        microcell = self.population.cells[0].microcells[0]
+        microcell.add_household(list(microcell.persons))
+        person = microcell.persons[0]
+        person.remove_person()
+        self.assertFalse(store.active[0])
+        np.testing.assert_array_equal(store.active_indices(), range(1, 6))
+        self.assertFalse(store.status_mask([InfectionStatus.Susceptible])[0])
+
+    def test_grow(self):
+        store = pe.PersonStore(capacity=1)
+        for person in self.population.cells[0].persons:
+            store.add_person(person)
+        self.assertEqual(len(store), 3)
+        self.assertGreaterEqual(len(store.status), 3)
+        self.assertTrue(np.all(store.active[:3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -70,6 +70,15 @@ class TestPlace(TestPyEpiabm):
         self.assertEqual(len(test_place.persons), 0)
         self.assertRaises(KeyError, test_place.get_group_index, self.person)
 
+        # Every member of a group is removed
+        people = [pe.Person(self.microcell) for _ in range(5)]
+        for person in people:
+            test_place.add_person(person, person_group=2)
+        test_place.empty_place([2])
+        self.assertEqual(test_place.person_groups[2], [])
+        self.assertEqual(len(test_place.persons), 0)
+        self.assertTrue(all(person.places == [] for person in people))
+
     def test_set_susc(self):
         test_place = pe.Place((1.0, 1.0), pe.property.PlaceType.Workplace,
                               self.cell, self.microcell)
@@ -1,6 +1,7 @@
 import unittest
 
 import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus
 from pyEpiabm.tests.test_unit.mocked_logging_tests import TestMockedLogs
 
 
@@ -35,9 +36,77 @@ class TestPopulation(TestMockedLogs):
         cell_ids = [cell.id for cell in population.cells]
         self.assertEqual(len(cell_ids), len(set(cell_ids)))
 
+    def test_set_event_log(self):
+        population = pe.Population()
+        population.add_cells(2)
+        event_log = object()
+        population.set_event_log(event_log)
+        self.assertIs(population.event_log, event_log)
+        for cell in population.cells:
+            self.assertIs(cell.event_log, event_log)
+        # Cells added later share the log
+        population.add_cells(1)
+        self.assertIs(population.cells[-1].event_log, event_log)
+
     def test_total_people(self):
         self.assertEqual(self.population.total_people(), 0)
 
+    def test_infectious_persons(self):
+        population = pe.Population()
+        population.add_cells(2)
+        for cell in population.cells:
+            cell.add_microcells(1)
+            cell.microcells[0].add_people(2)
+        self.assertEqual(population.infectious_persons(), [])
+        self.assertEqual(population.number_infectious(), 0)
+
+        infectors = [population.cells[1].persons[1],
+                     population.cells[0].persons[0]]
+        for person in infectors:
+            person.update_status(pe.property.InfectionStatus.InfectMild)
+        self.assertEqual(population.infectious_persons(), infectors[::-1])
+        self.assertEqual(population.number_infectious(), 2)
+
+    def test_compartment_counts(self):
+        population = pe.Population()
+        self.assertEqual(population.compartment_counts(by_cell=True).shape,
+                         (0, len(InfectionStatus), 1))
+        population.add_cells(2)
+        for cell in population.cells:
+            cell.add_microcells(1)
+            cell.microcells[0].add_people(3)
+        population.cells[1].persons[0].update_status(
+            InfectionStatus.InfectMild)
+        counts = population.compartment_counts(by_cell=True)
+        self.assertEqual(counts.shape[:2], (2, len(InfectionStatus)))
+        self.assertEqual(counts[1, InfectionStatus.InfectMild.value - 1]
+                         .sum(), 1)
+        totals = population.compartment_counts().sum(axis=1)
+        self.assertEqual(totals[InfectionStatus.Susceptible.value - 1], 5)
+        self.assertEqual(totals[InfectionStatus.InfectMild.value - 1], 1)
+
+        # The counters of the cells are slices of the population array,
+        # and keep the totals up to date
+        self.assertIs(population.compartment_counts(by_cell=True), counts)
+        person = population.cells[0].persons[0]
+        person.update_status(InfectionStatus.InfectGP)
+        row = InfectionStatus.InfectGP.value - 1
+        self.assertEqual(counts[0, row].sum(), 1)
+        self.assertEqual(population.compartment_counts()[row].sum(), 1)
+        self.assertEqual(population.number_infectious(), 2)
+        population.cells[1].compartment_counter.clear_counter()
+        self.assertEqual(population.number_infectious(), 1)
+        self.assertEqual(population.compartment_counts().sum(), 3)
+
+        # Cells added later are also counted
+        population.add_cells(1)
+        population.cells[2].add_microcells(1)
+        population.cells[2].microcells[0].add_people(
+            1, InfectionStatus.InfectMild)
+        self.assertEqual(population.compartment_counts(by_cell=True).shape[0],
+                         3)
+        self.assertEqual(population.number_infectious(), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
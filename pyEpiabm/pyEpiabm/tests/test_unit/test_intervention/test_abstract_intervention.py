@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 import pyEpiabm as pe
 from pyEpiabm.intervention import AbstractIntervention
@@ -34,6 +35,21 @@ class TestAbstractIntervention(unittest.TestCase):
         self.assertFalse(self.intervention_object.is_active(time=0,
                                                             num_cases=50))
 
+    def test_set_attribute(self):
+        population = mock.Mock()
+        person = mock.Mock()
+        intervention = AbstractIntervention(start_time=1, policy_duration=10,
+                                            population=population)
+        intervention.set_attribute(person, 'isolation_start_time', 2)
+        self.assertEqual(person.isolation_start_time, 2)
+        # Attributes are recorded in the intervention modifiers
+        population.intervention_modifiers.record.assert_called_once_with(
+            person, 'isolation_start_time', 2)
+
+        population.intervention_modifiers = None
+        intervention.set_attribute(person, 'isolation_start_time', None)
+        self.assertIsNone(person.isolation_start_time)
+
     def test___call__(self):
         self.assertRaises(NotImplementedError,
                           self.intervention_object.__call__, 1)
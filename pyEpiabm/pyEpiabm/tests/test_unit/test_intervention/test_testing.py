@@ -80,6 +80,19 @@ class TestDiseaseTesting(TestPyEpiabm):
 
         self.assertEqual(mock_random.call_count, 2)
 
+    @mock.patch('random.random')
+    def test_capacity(self, mock_random):
+        # People beyond the testing capacity wait for the next timestep
+        mock_random.return_value = 1
+        self.testing.testing_capacity = [1, 0]
+        self.cell.enqueue_PCR_testing(self.person1)
+        self.cell.enqueue_PCR_testing(self.person2)
+        self.cell.enqueue_LFT_testing(self.person1)
+        self.testing(time=1.0)
+        self.assertEqual(list(self.cell.PCR_queue.queue), [self.person2])
+        self.assertEqual(list(self.cell.LFT_queue.queue), [self.person1])
+        self.assertEqual(mock_random.call_count, 1)
+
     def test_turn_off(self):
         self.person1.date_positive = 1.0
         self.person2.date_positive = 1.0
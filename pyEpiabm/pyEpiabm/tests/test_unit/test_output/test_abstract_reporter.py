@@ -45,6 +45,13 @@ class TestAbstractReporter(unittest.TestCase):
         self.assertRaises(NotImplementedError,
                           subject.write)
 
+    @mock.patch("os.path.exists")
+    @mock.patch("os.makedirs")
+    def test_reopen(self, mock_makedirs, mock_pathexists):
+        subject = pe.output.AbstractReporter("test_folder", False)
+        self.assertRaises(NotImplementedError,
+                          subject.reopen)
+
 
 if __name__ == '__main__':
     unittest.main()
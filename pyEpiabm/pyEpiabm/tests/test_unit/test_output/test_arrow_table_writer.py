@@ -0,0 +1,44 @@
+import unittest
+import importlib.util
+import tempfile
+
+import pandas as pd
+
+import pyEpiabm as pe
+
+
+class TestArrowTableWriter(unittest.TestCase):
+    """Test the methods of the '_ArrowTableWriter' class.
+    """
+
+    def test_format(self):
+        with tempfile.TemporaryDirectory() as folder:
+            self.assertRaises(ValueError, pe.output._ArrowTableWriter,
+                              folder, 'file', ['a'], output_format='xlsx')
+
+    @unittest.skipIf(importlib.util.find_spec('pyarrow') is not None,
+                     "pyarrow is installed")
+    def test_missing_pyarrow(self):
+        with tempfile.TemporaryDirectory() as folder:
+            self.assertRaises(ImportError, pe.output._TableWriter.create,
+                              'parquet', folder, 'file.csv', ['a'])
+
+    @unittest.skipIf(importlib.util.find_spec('pyarrow') is None,
+                     "pyarrow is not installed")
+    def test_write(self):
+        for output_format, read in [('parquet', pd.read_parquet),
+                                    ('feather', pd.read_feather)]:
+            with tempfile.TemporaryDirectory() as folder:
+                m = pe.output._TableWriter.create(
+                    output_format, folder, 'file.csv', ['time', 'count'])
+                for t in range(3):
+                    m.write({'time': t, 'count': 2 * t})
+                    m.end_timestep()
+                m.close()
+                df = read(m.filepath)
+                self.assertEqual(df['time'].tolist(), [0, 1, 2])
+                self.assertEqual(df['count'].tolist(), [0, 2, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch, mock_open, call, MagicMock
 import os
+import pickle
+import tempfile
 
 import pyEpiabm as pe
 
@@ -35,8 +37,36 @@ class TestCsvDictWriter(unittest.TestCase):
             m = pe.output._CsvDictWriter('mock_folder', 'mock_filename',
                                          mock_categories)
             m.write(new_content)
+            # Rows are buffered until the end of the timestep
+            mo().write.assert_called_once_with('Cat1,Cat2,Cat3\r\n')
+            m.end_timestep()
         mo().write.assert_has_calls([call('Cat1,Cat2,Cat3\r\n'),
                                     call('a,b,c\r\n')])
+        mo().flush.assert_called_once()
+
+    def test_flush_interval(self):
+        """Test that the rows of the _CsvDictWriter class are written
+        every flush interval.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'file.csv')
+            m = pe.output._CsvDictWriter(folder, 'file.csv', ['a', 'b'],
+                                         flush_interval=2)
+            contents = []
+            for i in range(3):
+                m.write({'a': i, 'b': 2 * i})
+                m.end_timestep()
+                with open(path) as f:
+                    contents.append(f.read())
+            self.assertEqual(contents[0], '')
+            self.assertEqual(contents[1], 'a,b\n0,0\n1,2\n')
+            self.assertEqual(contents[2], contents[1])
+            m.flush()
+            with open(path) as f:
+                self.assertEqual(f.read(), 'a,b\n0,0\n1,2\n2,4\n')
+            del m
+            self.assertRaises(ValueError, pe.output._CsvDictWriter,
+                              folder, 'file.csv', ['a'], flush_interval=0)
 
     @patch('os.makedirs')
     def test_del(self, mock_mkdir):
@@ -71,6 +101,33 @@ class TestCsvDictWriter(unittest.TestCase):
             mock_to_csv.assert_called_once()
             mock_remove.assert_called_once_with(m.filepath)
 
+    def test_reopen(self):
+        """Test the pickling and reopen methods of the _CsvDictWriter class.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._CsvDictWriter(folder, 'file.csv', ['a', 'b'])
+            m.write({'a': 1, 'b': 2})
+            state = pickle.dumps(m)
+            m.write({'a': 3, 'b': 4})
+            del m
+
+            # Writing continues from the state when pickled
+            m = pickle.loads(state)
+            self.assertIsNone(m.f)
+            fork = os.path.join(folder, 'fork')
+            m.reopen(fork)
+            m.write({'a': 5, 'b': 6})
+            del m
+            m = pickle.loads(state)
+            m.reopen()
+            m.write({'a': 7, 'b': 8})
+            del m
+
+            with open(os.path.join(folder, 'file.csv')) as f:
+                self.assertEqual(f.read(), 'a,b\n1,2\n7,8\n')
+            with open(os.path.join(fork, 'file.csv')) as f:
+                self.assertEqual(f.read(), 'a,b\n1,2\n5,6\n')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch, mock_open, call, MagicMock
 import os
+import pickle
+import tempfile
 
 import pyEpiabm as pe
 
@@ -49,6 +51,24 @@ class TestCsvWriter(unittest.TestCase):
             m.__del__()
             fake_file.close.assert_called_once()
 
+    def test_reopen(self):
+        """Test the pickling and reopen methods of the _CsvWriter class.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._CsvWriter(folder, 'file.csv', ['a', 'b'])
+            m.write([1, 2])
+            state = pickle.dumps(m)
+            m.write([3, 4])
+            del m
+
+            m = pickle.loads(state)
+            m.reopen()
+            self.assertEqual(m.folder, folder)
+            m.write([5, 6])
+            del m
+            with open(os.path.join(folder, 'file.csv')) as f:
+                self.assertEqual(f.read(), 'a,b\n1,2\n5,6\n')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestEventLogWriter(TestPyEpiabm):
+    """Test the methods of the '_EventLogWriter' class.
+    """
+    def setUp(self) -> None:
+        self.population = pe.Population()
+        self.population.add_cells(2)
+        for cell in self.population.cells:
+            cell.add_microcells(1)
+            cell.microcells[0].add_people(2)
+        self.persons = [person for cell in self.population.cells
+                        for person in cell.persons]
+        for i, person in enumerate(self.persons):
+            person.id = f"0.0.0.{i}"
+        self.persons[3].update_status(InfectionStatus.InfectMild)
+        self.persons[3].infection_start_times = [0.0]
+        self.persons[3].set_latent_period(1.0)
+
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._EventLogWriter(folder, 'log.npy', self.population)
+            self.population.set_event_log(m)
+            # The initial status of people who are not susceptible is known
+            self.assertEqual(len(m._rows), 1)
+            self.assertEqual(m.person_ids, [p.id for p in self.persons])
+
+            m.time = 2.0
+            pe.sweep.AbstractSweep.store_infection_periods(
+                self.persons[3], self.persons[0], 2.0, 'household')
+            self.persons[0].update_status(InfectionStatus.Exposed)
+            self.persons[3].update_status(InfectionStatus.Recovered)
+            m.end_timestep()
+            del m
+
+            path = os.path.join(folder, 'log.npy')
+            with open(path, 'rb') as f:
+                block = np.load(f)
+                self.assertEqual(block.dtype['setting'], np.int8)
+            df = pe.output._EventLogWriter.read(path)
+            self.assertEqual(list(df.columns),
+                             pe.output._EventLogWriter.fields)
+            self.assertEqual(df['time'].tolist(), [0.0, 2.0, 2.0])
+            self.assertEqual(df['person'].tolist(), [3, 0, 3])
+            self.assertEqual(df['old_status'].tolist(),
+                             [InfectionStatus.InfectMild.value,
+                              InfectionStatus.Susceptible.value,
+                              InfectionStatus.InfectMild.value])
+            self.assertEqual(df['new_status'].tolist(),
+                             [InfectionStatus.InfectMild.value,
+                              InfectionStatus.Exposed.value,
+                              InfectionStatus.Recovered.value])
+            self.assertEqual(df['infector'].tolist(), [-1, 3, -1])
+            self.assertEqual(df['setting'].tolist(), ['', 'household', ''])
+            self.assertEqual(pe.output._EventLogWriter.read_ids(path),
+                             [p.id for p in self.persons])
+
+    def test_new_person(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._EventLogWriter(folder, 'log.npy', self.population)
+            self.population.set_event_log(m)
+            microcell = self.population.cells[0].microcells[0]
+            microcell.add_people(1)
+            person = microcell.persons[-1]
+            person.id = "0.0.0.4"
+            person.update_status(InfectionStatus.Exposed)
+            m.flush()
+            ids = pe.output._EventLogWriter.read_ids(
+                os.path.join(folder, 'log.npy'))
+            self.assertEqual(ids, [p.id for p in self.persons] + [person.id])
+            del m
+
+    def test_reopen(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._EventLogWriter(folder, 'log.npy', self.population)
+            # People are pickled with the writer, as in a checkpoint
+            state = pickle.dumps((m, self.persons))
+            m.record_status_change(self.persons[0], InfectionStatus.Exposed,
+                                   InfectionStatus.InfectMild)
+            del m
+
+            m, persons = pickle.loads(state)
+            self.assertIsNone(m.f)
+            m.reopen()
+            m.time = 1.0
+            m.record_status_change(persons[1],
+                                   InfectionStatus.Susceptible,
+                                   InfectionStatus.Exposed)
+            del m
+            path = os.path.join(folder, 'log.npy')
+            df = pe.output._EventLogWriter.read(path)
+            self.assertEqual(df['person'].tolist(), [3, 1])
+            self.assertEqual(pe.output._EventLogWriter.read_ids(path),
+                             [p.id for p in self.persons])
+
+    def test_dense_history(self):
+        S, E, R = (InfectionStatus.Susceptible.value,
+                   InfectionStatus.Exposed.value,
+                   InfectionStatus.Recovered.value)
+        events = pd.DataFrame({'time': [0.0, 2.0, 1.0, 2.0],
+                               'person': [2, 0, 0, 2],
+                               'old_status': [E, E, S, E],
+                               'new_status': [E, R, E, R]})
+        history = pe.output._EventLogWriter.dense_history(
+            events, [0.0, 0.5, 1.0, 2.0, 3.0], num_persons=4)
+        np.testing.assert_array_equal(history, [[S, S, E, S],
+                                                [S, S, E, S],
+                                                [E, S, E, S],
+                                                [R, S, R, S],
+                                                [R, S, R, S]])
+        # Status before the first record is the old status of that record
+        history = pe.output._EventLogWriter.dense_history(events[1:], [0.0])
+        np.testing.assert_array_equal(history, [[S, S, E]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+import pyEpiabm as pe
+
+
+class TestHistoryWriter(unittest.TestCase):
+    """Test the methods of the '_HistoryWriter' class.
+    """
+
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._HistoryWriter(folder, 'file.bin', ['a', 'b'],
+                                         dtype=np.int8, chunk_size=2)
+            for t in range(5):
+                m.write(t, [t, 2 * t])
+            path = os.path.join(folder, 'file.bin')
+            # Full chunks are written as soon as they are filled
+            person_ids, chunks = pe.output._HistoryWriter.read_chunks(path)
+            self.assertEqual(person_ids.tolist(), ['a', 'b'])
+            self.assertEqual([times.tolist() for times, _ in chunks],
+                             [[0, 1], [2, 3]])
+            del m
+
+            person_ids, chunks = pe.output._HistoryWriter.read_chunks(path)
+            chunks = list(chunks)
+            self.assertEqual(len(chunks), 3)
+            self.assertEqual(chunks[2][1].dtype, np.int8)
+            np.testing.assert_array_equal(chunks[2][1], [[4, 8]])
+
+            df = pe.output._HistoryWriter.read(path)
+            self.assertEqual(list(df.columns), ['time', 'a', 'b'])
+            self.assertEqual(df['time'].tolist(), [0, 1, 2, 3, 4])
+            self.assertEqual(df['b'].tolist(), [0, 2, 4, 6, 8])
+
+        self.assertRaises(ValueError, pe.output._HistoryWriter,
+                          'folder', 'file.bin', ['a'], chunk_size=0)
+
+    def test_compression(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._HistoryWriter(folder, 'file.bin',
+                                         [str(i) for i in range(1000)],
+                                         dtype=np.int8)
+            for t in range(64):
+                m.write(t, np.ones(1000))
+            del m
+            self.assertLess(os.path.getsize(os.path.join(folder, 'file.bin')),
+                            64 * 1000 // 10)
+
+    def test_reopen(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._HistoryWriter(folder, 'file.bin', ['a'])
+            m.write(0, [0.5])
+            state = pickle.dumps(m)
+            m.write(1, [1.5])
+            del m
+
+            m = pickle.loads(state)
+            self.assertIsNone(m.f)
+            fork = os.path.join(folder, 'fork')
+            m.reopen(fork)
+            m.write(2, [2.5])
+            del m
+            df = pe.output._HistoryWriter.read(
+                os.path.join(folder, 'file.bin'))
+            self.assertEqual(df['a'].tolist(), [0.5, 1.5])
+            df = pe.output._HistoryWriter.read(os.path.join(fork, 'file.bin'))
+            self.assertEqual(df['time'].tolist(), [0, 2])
+            self.assertEqual(df['a'].tolist(), [0.5, 2.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+import pyEpiabm as pe
+
+
+class TestNpyTableWriter(unittest.TestCase):
+    """Test the methods of the '_NpyTableWriter' class.
+    """
+
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._NpyTableWriter(folder, 'file.npy',
+                                          ['time', 'cell', 'count'],
+                                          flush_interval=2)
+            for t in range(3):
+                m.write({'time': t, 'cell': '0', 'count': 2 * t})
+                m.write({'time': t, 'cell': '10', 'count': 1.5})
+                m.end_timestep()
+            del m
+
+            path = os.path.join(folder, 'file.npy')
+            # Each block is a record array
+            with open(path, 'rb') as f:
+                block = np.load(f)
+                self.assertEqual(block.dtype.names, ('time', 'cell', 'count'))
+                np.testing.assert_array_equal(block['count'], [0, 1.5, 2, 1.5])
+            df = pe.output._NpyTableWriter.read(path)
+            self.assertEqual(list(df.columns), ['time', 'cell', 'count'])
+            self.assertEqual(df['time'].tolist(), [0, 0, 1, 1, 2, 2])
+            self.assertEqual(df['cell'].tolist(), ['0', '10'] * 3)
+            self.assertEqual(df['count'].tolist(), [0, 1.5, 2, 1.5, 4, 1.5])
+
+    def test_reopen(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._NpyTableWriter(folder, 'file.npy', ['a'])
+            m.write({'a': 1})
+            state = pickle.dumps(m)
+            m.write({'a': 2})
+            del m
+
+            m = pickle.loads(state)
+            self.assertIsNone(m.f)
+            m.reopen()
+            m.write({'a': 3})
+            del m
+            df = pe.output._NpyTableWriter.read(
+                os.path.join(folder, 'file.npy'))
+            self.assertEqual(df['a'].tolist(), [1, 3])
+
+    def test_read_empty(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._NpyTableWriter(folder, 'file.npy', ['a'])
+            del m
+            df = pe.output._NpyTableWriter.read(
+                os.path.join(folder, 'file.npy'))
+            self.assertTrue(df.empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import os
+import tempfile
+
+import pyEpiabm as pe
+
+
+class TestTableWriter(unittest.TestCase):
+    """Test the methods of the '_TableWriter' class.
+    """
+
+    def test_create(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._TableWriter.create('csv', folder, 'file.txt',
+                                              ['a'], flush_interval=3)
+            self.assertIsInstance(m, pe.output._CsvDictWriter)
+            self.assertEqual(m.filename, 'file.txt')
+            self.assertEqual(m.flush_interval, 3)
+            del m
+
+            m = pe.output._TableWriter.create('npy', folder, 'file.csv',
+                                              ['a'])
+            self.assertIsInstance(m, pe.output._NpyTableWriter)
+            self.assertEqual(m.filepath, os.path.join(folder, 'file.npy'))
+            del m
+
+            self.assertRaises(ValueError, pe.output._TableWriter.create,
+                              'xlsx', folder, 'file.csv', ['a'])
+
+    def test_write_block(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._TableWriter(folder, 'file', ['a'])
+            self.assertIsNone(m.f)
+            m.write({'a': 1})
+            # Rows are held until a file is opened
+            m.flush()
+            self.assertEqual(m._rows, [{'a': 1}])
+            m.f = open(os.path.join(folder, 'file'), 'w')
+            self.assertRaises(NotImplementedError, m.end_timestep)
+            m.f.close()
+            m.f = None
+
+    def test_columns(self):
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output._TableWriter(folder, 'file',
+                                       ['a', pe.property.InfectionStatus.
+                                        Susceptible])
+            rows = [{'a': 1, pe.property.InfectionStatus.Susceptible: 2},
+                    {'a': 3}]
+            self.assertEqual(m._columns(rows),
+                             {'a': [1, 3],
+                              'InfectionStatus.Susceptible': [2, None]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import os
 import unittest
 from unittest.mock import patch
 
@@ -62,6 +63,61 @@ class TestHouseholdInfection(TestPyEpiabm):
         # * household transmission (0.1)
         self.assertIsInstance(result, float)
 
+    def test_house_inf_force_parameters(self):
+        params = pe.Parameters.from_file(os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            'testing_parameters.json'))
+        params.household_transmission = 0.5
+        result = HouseholdInfection.household_foi(self.infector,
+                                                  self.infectee,
+                                                  self.time, params)
+        self.assertEqual(result, 0.5)
+        self.assertEqual(HouseholdInfection.household_foi(
+            self.infector, self.infectee, self.time), 0.1)
+
+    def test_house_foi_scales(self):
+        self.infector.care_home_resident = True
+        self.infectee.quarantine_start_time = 0
+        infector_scale = HouseholdInfection.household_infector_scale(
+            self.infector, self.time)
+        quarantine_scale, susceptibility = \
+            HouseholdInfection.household_infectee_scales(self.infectee,
+                                                         self.time)
+        self.assertEqual(infector_scale * quarantine_scale * susceptibility,
+                         HouseholdInfection.household_foi(
+                             self.infector, self.infectee, self.time))
+        self.assertEqual(quarantine_scale, pe.Parameters.instance()
+                         .intervention_params['household_quarantine'][
+                             'quarantine_house_effectiveness'])
+
+    def test_house_modifiers(self):
+        # Precomputed multipliers match those read from the attributes
+        microcell = self.infector.microcell
+        self.infector.place_types.append(PlaceType.PrimarySchool)
+        microcell.closure_start_time = 1
+        self.infector.isolation_start_time = 1
+        self.infectee.quarantine_start_time = 1
+        microcell.distancing_start_time = 1
+        self.infectee.distancing_enhanced = False
+        result = HouseholdInfection.household_foi(self.infector,
+                                                  self.infectee, self.time)
+        modifiers = pe.InterventionModifiers(self._population)
+        self.assertEqual(HouseholdInfection.household_foi(
+            self.infector, self.infectee, self.time, modifiers=modifiers),
+            result)
+        self.assertEqual(HouseholdInfection.household_infectee_scales(
+            self.infectee, self.time, modifiers=modifiers),
+            HouseholdInfection.household_infectee_scales(self.infectee,
+                                                         self.time))
+        self.assertEqual(modifiers.time, self.time)
+
+        # Changes made by interventions are recorded
+        modifiers.record(self.infector, 'isolation_start_time', None)
+        self.assertIsNone(modifiers.time)
+        self.assertEqual(HouseholdInfection.household_foi(
+            self.infector, self.infectee, self.time, modifiers=modifiers),
+            result / 0.5)
+
     def test_vaccine_inf_drop(self):
         self.infectee.is_vaccinated = True
         self.infector.is_vaccinated = True
@@ -1,3 +1,4 @@
+import os
 import unittest
 from unittest.mock import patch
 
@@ -58,12 +59,30 @@ class TestPlaceInfection(TestPyEpiabm):
         self.assertTrue(result > 0)
         self.assertIsInstance(result, float)
 
+    def test_place_inf_parameters(self):
+        params = pe.Parameters.from_file(os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            'testing_parameters.json'))
+        params.place_params['place_transmission'] *= 2
+        self.assertAlmostEqual(
+            PlaceInfection.place_inf(self.place, self.infector, self.time,
+                                     params),
+            2 * PlaceInfection.place_inf(self.place, self.infector,
+                                         self.time))
+
     def test_place_foi(self):
         result = PlaceInfection.place_foi(self.place, self.infector,
                                           self.infectee, self.time)
         self.assertTrue(result > 0)
         self.assertIsInstance(result, float)
 
+        # Precalculated place infectiousness
+        place_inf = PlaceInfection.place_inf(self.place, self.infector,
+                                             self.time)
+        self.assertAlmostEqual(PlaceInfection.place_foi(
+            self.place, self.infector, self.infectee, self.time,
+            infector_inf=2 * place_inf), 2 * result)
+
     def test_place_case_isolation(self):
         # Not isolating (isolation_start_time = None)
         result = PlaceInfection.place_foi(self.place, self.infector,
@@ -150,6 +169,57 @@ class TestPlaceInfection(TestPyEpiabm):
         self.assertEqual(result*isolation_effectiveness,
                          result_isolating)
 
+    def test_place_scales(self):
+        for person in (self.infector, self.infectee):
+            person.isolation_start_time = None
+            person.travel_isolation_start_time = None
+            person.quarantine_start_time = None
+        self.assertEqual(PlaceInfection.place_isolation_scale(
+            self.infector, self.time), 1)
+        self.assertEqual(PlaceInfection.place_quarantine_scale(
+            self.place, self.infectee, self.time), 1)
+
+        self.infector.isolation_start_time = 1
+        self.infectee.quarantine_start_time = 1
+        params = pe.Parameters.instance().intervention_params
+        place_idx = self.place.place_type.value - 1
+        self.assertEqual(PlaceInfection.place_isolation_scale(
+            self.infector, self.time),
+            params['case_isolation']['isolation_effectiveness'])
+        self.assertEqual(PlaceInfection.place_quarantine_scale(
+            self.place, self.infectee, self.time),
+            params['household_quarantine'][
+                'quarantine_place_effectiveness'][place_idx])
+        self.infector.isolation_start_time = None
+        self.infectee.quarantine_start_time = None
+
+    def test_place_modifiers(self):
+        # Precomputed multipliers match those read from the attributes
+        self.infector.place_types.append(PlaceType.PrimarySchool)
+        self.infector.travel_isolation_start_time = 1
+        self.infectee.quarantine_start_time = 1
+        self.microcell.distancing_start_time = 1
+        self.infectee.distancing_enhanced = True
+        modifiers = pe.InterventionModifiers(pe.Population())
+        for function, args in [
+                (PlaceInfection.place_foi, (self.infector, self.infectee)),
+                (PlaceInfection.place_susc, (self.infectee,))]:
+            self.assertEqual(function(self.place, *args, self.time),
+                             function(self.place, *args, self.time,
+                                      modifiers=modifiers))
+        self.microcell.closure_start_time = 1
+        modifiers = pe.InterventionModifiers(pe.Population())
+        self.assertEqual(PlaceInfection.place_inf(
+            self.place, self.infector, self.time, modifiers=modifiers), 0)
+        self.assertEqual(modifiers.persons, [self.infector])
+
+        for person in (self.infector, self.infectee):
+            person.travel_isolation_start_time = None
+            person.quarantine_start_time = None
+        self.infector.place_types.remove(PlaceType.PrimarySchool)
+        self.microcell.distancing_start_time = None
+        self.microcell.closure_start_time = None
+
     @patch('pyEpiabm.property.PlaceInfection.place_susc')
     @patch('pyEpiabm.property.PlaceInfection.place_inf')
     @patch('pyEpiabm.core.Parameters.instance')
@@ -1,3 +1,4 @@
+import os
 import unittest
 from unittest.mock import patch
 
@@ -86,6 +87,17 @@ class TestSpatialInfection(TestPyEpiabm):
         self.assertIsInstance(result, float)
         self.assertTrue(result >= 0)
 
+    def test_cell_inf_parameters(self):
+        self.infector.update_status(InfectionStatus.InfectMild)
+        self.infector.infectiousness = 1.0
+        params = pe.Parameters.from_file(os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            'testing_parameters.json'))
+        params.basic_reproduction_num *= 2
+        self.assertAlmostEqual(
+            SpatialInfection.cell_inf(self.cell, self.time, params),
+            2 * SpatialInfection.cell_inf(self.cell, self.time))
+
     def test_spatial_case_isolation(self):
         # Not isolating (isolation_start_time = None)
         result = SpatialInfection.spatial_foi(
@@ -150,6 +162,29 @@ class TestSpatialInfection(TestPyEpiabm):
         self.assertEqual(result_susc*result_inf*closure_spatial_params,
                          result_closure_foi)
 
+    def test_spatial_modifiers(self):
+        # Precomputed multipliers match those read from the attributes
+        self.infector.place_types.append(PlaceType.PrimarySchool)
+        self.infectee.place_types.append(PlaceType.PrimarySchool)
+        self.microcell.closure_start_time = 1
+        self.infector.isolation_start_time = 1
+        self.infectee.quarantine_start_time = 1
+        self.microcell.distancing_start_time = 1
+        self.infectee.distancing_enhanced = True
+        modifiers = pe.InterventionModifiers(self._population)
+        result = SpatialInfection.spatial_foi(self.cell, self.cell,
+                                              self.infector, self.infectee,
+                                              self.time)
+        self.assertEqual(SpatialInfection.spatial_foi(
+            self.cell, self.cell, self.infector, self.infectee, self.time,
+            modifiers=modifiers), result)
+        self.assertEqual(SpatialInfection.spatial_susc(
+            self.cell, self.infectee, self.time, modifiers=modifiers),
+            SpatialInfection.spatial_susc(self.cell, self.infectee,
+                                          self.time))
+        self.assertEqual(modifiers.closure_spatial.tolist(), [0.5, 0.5])
+        self.assertEqual(modifiers.quarantine_spatial.tolist(), [1, 0.25])
+
     def test_spatial_household_quarantine(self):
         # Not in quarantine (quarantine_start_time = None)
         result = SpatialInfection.spatial_foi(
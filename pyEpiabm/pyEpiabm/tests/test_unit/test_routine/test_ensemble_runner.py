@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.routine import EnsembleRunner, PopulationSnapshot
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestEnsembleRunner(TestPyEpiabm):
+    """Test the 'EnsembleRunner' class.
+    """
+    def setUp(self) -> None:
+        self.parameter_file = os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            'testing_parameters.json')
+        pe.Parameters.instance().use_ages = False
+        self.pop = pe.routine.ToyPopulationFactory().make_pop(
+            {"population_size": 200, "cell_number": 2,
+             "microcell_number": 2, "household_number": 20,
+             "place_number": 2})
+        self.sim_params = {"simulation_start_time": 0,
+                           "simulation_end_time": 5,
+                           "initial_infected_number": 10}
+        self.runner = EnsembleRunner(
+            self.pop, self.parameter_file,
+            [pe.sweep.InitialInfectedSweep],
+            [pe.sweep.HouseholdSweep, pe.sweep.QueueSweep,
+             pe.sweep.HostProgressionSweep],
+            self.sim_params, max_workers=2)
+
+    def test__init__(self):
+        self.assertIs(self.runner.population, self.pop)
+        self.assertTrue(os.path.isabs(self.runner.parameter_file))
+        self.assertEqual(self.runner.max_workers, 2)
+        np.testing.assert_array_equal(self.runner.times(), range(6))
+
+    def test_run(self):
+        counts = self.runner.run([(1, {}), (1, None),
+                                  (2, {"household_transmission": 0})])
+        self.assertEqual(counts.shape, (3, 6, len(InfectionStatus)))
+        np.testing.assert_array_equal(counts.sum(axis=2), 200)
+
+        # Same seed gives the same run, and initial infections are recorded
+        np.testing.assert_array_equal(counts[0], counts[1])
+        initial = counts[0, 0]
+        self.assertEqual(initial[InfectionStatus.Susceptible.value - 1], 190)
+        self.assertEqual(initial[InfectionStatus.InfectMild.value - 1]
+                         + initial[InfectionStatus.InfectASympt.value - 1]
+                         + initial[InfectionStatus.InfectGP.value - 1], 10)
+
+        # No household transmission leaves no new exposed people
+        susceptible = counts[2, :, InfectionStatus.Susceptible.value - 1]
+        np.testing.assert_array_equal(susceptible, 190)
+        self.assertEqual(self.runner.run([]).shape,
+                         (0, 6, len(InfectionStatus)))
+
+    def test_run_snapshot_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "population.npz")
+            PopulationSnapshot.save(self.pop, path)
+            self.runner.population = path
+            self.runner.file_params = {"output_dir": temp_dir,
+                                       "output_file": "output.csv"}
+            counts = self.runner.run([(1, {})])
+            self.assertTrue(os.path.exists(os.path.join(
+                temp_dir, "member_0", "output.csv")))
+            self.runner.file_params = None
+            np.testing.assert_array_equal(
+                counts, self.runner.run([(1, {})]))
+
+
+if __name__ == '__main__':
+    unittest.main()
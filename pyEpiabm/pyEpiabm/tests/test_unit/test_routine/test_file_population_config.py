@@ -182,6 +182,80 @@ class TestPopConfig(TestPyEpiabm):
         self.assertTrue(len(households) <= 5)
         self.assertTrue(num_empty_households < 5)
 
+    @patch("pandas.read_csv")
+    def test_make_pop_bulk(self, mock_read):
+        """Tests for when the population is created in batches.
+        """
+        self.df['household_number'] = pd.Series([2, 3])
+        mock_read.return_value = self.df
+
+        test_pop = FilePopulationFactory.make_pop('test_input.csv',
+                                                  random_seed=1, bulk=True)
+        self.assertEqual(test_pop.total_people(), 22)
+        for i, cell in enumerate(test_pop.cells):
+            self.assertEqual(cell.id, str(self.input.get('cell')[i]))
+            self.assertEqual(cell.microcells[0].id,
+                             f"{cell.id}.{self.input.get('microcell')[i]}")
+            self.assertEqual(cell.number_infectious(),
+                             self.input.get('InfectMild')[i])
+            self.assertEqual(len(cell.infectious_persons),
+                             self.input.get('InfectMild')[i])
+
+            # Compartment counters match the people in the cell
+            counts = cell.compartment_counter.retrieve()
+            for status in [pe.property.InfectionStatus.Susceptible,
+                           pe.property.InfectionStatus.InfectMild]:
+                for age_group in range(len(counts[status])):
+                    self.assertEqual(counts[status][age_group], sum(
+                        person.infection_status == status and
+                        person.age_group == age_group
+                        for person in cell.persons))
+
+            for person in cell.persons:
+                self.assertIsInstance(person.age_group, int)
+                self.assertEqual(person.household.persons[
+                    int(person.id.split(".")[-1])], person)
+                if person.is_infectious():
+                    self.assertEqual(person.num_times_infected, 1)
+                    self.assertIsNotNone(person.time_of_status_change)
+
+        ids = [person.id for cell in test_pop.cells
+               for person in cell.persons]
+        self.assertEqual(len(set(ids)), 22)
+
+    @patch("pandas.read_csv")
+    def test_make_pop_bulk_matches(self, mock_read):
+        """Tests that both paths give people of each status the same
+        progression, when no random numbers are used for ages.
+        """
+        pe.Parameters.instance().use_ages = False
+        self.df['InfectASympt'] = pd.Series([1, 2])
+        self.df['Recovered'] = pd.Series([2, 1])
+
+        populations = []
+        for bulk in [False, True]:
+            mock_read.return_value = self.df.copy()
+            populations.append(FilePopulationFactory.make_pop(
+                'test_input.csv', random_seed=3, bulk=bulk))
+        people = [[(person.infection_status, person.next_infection_status,
+                    person.time_of_status_change, person.infection_start_times,
+                    person.initial_infectiousness, person.num_times_infected)
+                   for cell in pop.cells for person in cell.persons]
+                  for pop in populations]
+        self.assertEqual(people[0], people[1])
+        self.assertEqual([cell.number_infectious()
+                          for cell in populations[1].cells], [3, 5])
+
+    @patch('logging.exception')
+    @patch("pandas.read_csv")
+    def test_duplicate_microcell_bulk(self, mock_read, mock_log):
+        self.df.iat[1, 0] = 1
+        mock_read.return_value = self.df
+
+        FilePopulationFactory.make_pop('test_input.csv', bulk=True)
+        mock_log.assert_called_once_with("ValueError in FilePopulation"
+                                         + "Factory.make_pop()")
+
     @patch("numpy.random.seed")
     @patch("random.seed")
     @patch("pandas.read_csv")
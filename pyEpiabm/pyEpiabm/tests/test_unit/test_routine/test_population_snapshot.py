@@ -0,0 +1,181 @@
+import io
+import json
+import random
+import unittest
+
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus, PlaceType
+from pyEpiabm.routine import PopulationSnapshot
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestPopulationSnapshot(TestPyEpiabm):
+    """Test the 'PopulationSnapshot' class.
+    """
+    def setUp(self) -> None:
+        pe.Parameters.instance().use_ages = False
+        self.pop = pe.Population()
+        self.pop.add_cells(2)
+        self.pop.cells[1].set_location((1.5, 2))
+        for cell in self.pop.cells:
+            cell.add_microcells(2)
+            for microcell in cell.microcells:
+                microcell.add_people(3)
+                microcell.add_household(microcell.persons)
+        self.pop.cells[0].nearby_cell_distances = {self.pop.cells[1].id: 2.5}
+
+        microcell = self.pop.cells[0].microcells[0]
+        microcell.add_place(1, (0.5, 0.5), PlaceType.Workplace)
+        self.place = microcell.places[0]
+        self.place.set_infectiousness(0.3)
+        self.place.add_person(microcell.persons[0], 1)
+        self.place.add_person(microcell.persons[1])
+
+        self.person = self.pop.cells[1].persons[2]
+        self.person.update_status(InfectionStatus.InfectMild)
+        self.person.next_infection_status = InfectionStatus.Recovered
+        self.person.time_of_status_change = 7.5
+        self.person.infectiousness = 1.2
+        self.person.infection_start_times = [2, 4.5]
+        self.person.secondary_infections_counts = [1, 0]
+        self.person.serial_interval_dict = {4.5: [1.0, 2.0]}
+        self.person.isolation_start_time = 6
+        self.pop.cells[1].microcells[1].closure_start_time = None
+        self.pop.cells[0].enqueue_person(self.pop.cells[0].persons[2])
+        self.pop.cells[1].enqueue_PCR_testing(self.person)
+        self.pop.enqueue_vaccine(2, 1, self.person)
+        self.pop.travellers.append(self.pop.cells[0].persons[3])
+
+    def round_trip(self, population, **kwargs):
+        file = io.BytesIO()
+        PopulationSnapshot.save(population, file)
+        file.seek(0)
+        return PopulationSnapshot.load(file, **kwargs)
+
+    def test_round_trip(self):
+        pop = self.round_trip(self.pop)
+        self.assertEqual([cell.id for cell in pop.cells], ['0', '1'])
+        self.assertEqual(pop.cells[1].location, (1.5, 2))
+        self.assertIsInstance(pop.cells[1].location[1], int)
+        self.assertEqual(pop.cells[0].nearby_cell_distances, {'1': 2.5})
+        for old_cell, cell in zip(self.pop.cells, pop.cells):
+            self.assertEqual([p.id for p in cell.persons],
+                             [p.id for p in old_cell.persons])
+            self.assertEqual([mc.id for mc in cell.microcells],
+                             [mc.id for mc in old_cell.microcells])
+            for mc in cell.microcells:
+                self.assertIs(mc.cell, cell)
+                for person in mc.persons:
+                    self.assertIs(person.microcell, mc)
+                    self.assertIs(person.household, mc.households[0])
+                self.assertEqual(mc.households[0].persons, mc.persons)
+            for status, counts in cell.compartment_counter.retrieve().items():
+                np.testing.assert_array_equal(
+                    counts, old_cell.compartment_counter.retrieve()[status])
+
+        person = pop.cells[1].persons[2]
+        self.assertEqual(person.infection_status, InfectionStatus.InfectMild)
+        self.assertEqual(person.next_infection_status,
+                         InfectionStatus.Recovered)
+        self.assertEqual(person.time_of_status_change, 7.5)
+        self.assertEqual(person.infectiousness, 1.2)
+        self.assertEqual(person.infection_start_times, [2, 4.5])
+        self.assertIsInstance(person.infection_start_times[0], int)
+        self.assertEqual(person.secondary_infections_counts, [1, 0])
+        self.assertEqual(person.serial_interval_dict, {4.5: [1.0, 2.0]})
+        self.assertEqual(person.isolation_start_time, 6)
+        self.assertIsNone(person.latent_period)
+        self.assertIsNone(pop.cells[1].microcells[1].closure_start_time)
+        self.assertEqual(pop.cells[1].infectors(), [person])
+        self.assertEqual(pop.cells[1].status_calendar.pop_due(8), [person])
+        self.assertEqual(pop.number_infectious(), 1)
+
+        self.assertEqual(list(pop.cells[1].PCR_queue.queue), [person])
+        self.assertEqual(list(pop.cells[0].person_queue.queue),
+                         [pop.cells[0].persons[2]])
+        self.assertEqual(pop.vaccine_queue.get(), (2, 1, person))
+        self.assertEqual(pop.travellers, [pop.cells[0].persons[3]])
+
+    def test_round_trip_places(self):
+        pop = self.round_trip(self.pop)
+        microcell = pop.cells[0].microcells[0]
+        place = microcell.places[0]
+        self.assertEqual(pop.cells[0].places, [place])
+        self.assertIs(place.microcell, microcell)
+        self.assertEqual(place.place_type, PlaceType.Workplace)
+        self.assertEqual(place.infectiousness, 0.3)
+        self.assertEqual(place.num_person_groups, 2)
+        self.assertEqual(place.persons, microcell.persons[:2])
+        self.assertEqual(place.person_groups, {0: [microcell.persons[1]],
+                                               1: [microcell.persons[0]]})
+        self.assertEqual(microcell.persons[0].places, [(place, 1)])
+        self.assertEqual(microcell.persons[0].place_types,
+                         [PlaceType.Workplace])
+        self.assertEqual(microcell.persons[2].places, [])
+
+    def test_person_store(self):
+        self.pop.build_person_store()
+        self.person.infectiousness = 0.7
+        pop = self.round_trip(self.pop)
+        self.assertIsNotNone(pop.person_store)
+        self.assertEqual(len(pop.person_store), 12)
+        self.assertEqual(pop.cells[1].persons[2].infectiousness, 0.7)
+
+    def test_intervention_modifiers(self):
+        pop = self.round_trip(self.pop)
+        self.assertIsNone(pop.intervention_modifiers)
+
+        # Modifiers are rebuilt from the intervention attributes
+        self.pop.intervention_modifiers = pe.InterventionModifiers(self.pop)
+        pop = self.round_trip(self.pop)
+        modifiers = pop.intervention_modifiers
+        self.assertIsInstance(modifiers, pe.InterventionModifiers)
+        self.assertEqual(len(modifiers.persons), 12)
+        row = modifiers.index(pop.cells[1].persons[2], 6)
+        self.assertEqual(modifiers.isolation[row],
+                         pe.Parameters.instance().intervention_params[
+                             'case_isolation']['isolation_effectiveness'])
+
+    def test_random_state(self):
+        random.seed(1)
+        np.random.seed(1)
+        file = io.BytesIO()
+        PopulationSnapshot.save(self.pop, file)
+        expected = (random.random(), np.random.random())
+
+        file.seek(0)
+        PopulationSnapshot.load(file)
+        self.assertNotEqual((random.random(), np.random.random()), expected)
+        file.seek(0)
+        PopulationSnapshot.load(file, restore_random_state=True)
+        self.assertEqual((random.random(), np.random.random()), expected)
+
+    def test_errors(self):
+        self.person.unsupported = {'a': 1}
+        with self.assertRaises(TypeError):
+            PopulationSnapshot.save(self.pop, io.BytesIO())
+        del self.person.unsupported
+
+        file = io.BytesIO()
+        PopulationSnapshot.save(self.pop, file)
+        file.seek(0)
+        with np.load(file) as data:
+            arrays = {name: data[name] for name in data.files}
+        metadata = json.loads(arrays['metadata'].item())
+        metadata['version'] = 0
+        arrays['metadata'] = np.array(json.dumps(metadata))
+        file = io.BytesIO()
+        np.savez(file, **arrays)
+        file.seek(0)
+        with self.assertRaises(ValueError):
+            PopulationSnapshot.load(file)
+
+        self.place.persons.append(pe.Person(self.pop.cells[0].microcells[0]))
+        with self.assertRaises(ValueError):
+            PopulationSnapshot.save(self.pop, io.BytesIO())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 import os
 import sys
 import random
+import tempfile
 import numpy as np
+import pandas as pd
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 
@@ -704,6 +706,93 @@ class TestSimulation(TestMockedLogs):
         mock_mkdir.assert_called_with(
             os.path.join(os.getcwd(), self.inf_history_params["output_dir"]))
 
+    @patch('pyEpiabm.routine.simulation.tqdm', notqdm)
+    def test_write_to_ih_file_chunked(self):
+        with tempfile.TemporaryDirectory() as folder:
+            inf_history_params = dict(self.inf_history_params,
+                                      output_dir=folder, status_output=True,
+                                      infectiousness_output=True,
+                                      secondary_infections_output=False,
+                                      serial_interval_output=False,
+                                      generation_time_output=False,
+                                      compress=True,
+                                      output_format="chunked", chunk_size=2)
+            test_sim = pe.routine.Simulation()
+            test_sim.configure(self.rt_test_population, self.initial_sweeps,
+                               self.sweeps, self.sim_params,
+                               dict(self.file_params, output_dir=folder),
+                               inf_history_params)
+            self.assertIsInstance(test_sim.ih_status_writer,
+                                  pe.output._HistoryWriter)
+            persons = self.rt_test_population.cells[0].persons
+            with patch.object(test_sim.ih_status_writer, 'write') as mock:
+                test_sim.write_to_ih_file(1, "status")
+                mock.assert_called_once_with(
+                    1, [person.infection_status.value for person in persons])
+            with patch.object(test_sim.ih_infectiousness_writer, 'write') \
+                    as mock:
+                test_sim.write_to_ih_file(1, "infectiousness")
+                mock.assert_called_once_with(
+                    1, [person.infectiousness for person in persons])
+
+            test_sim.run_sweeps()
+            test_sim.compress_csv()
+            del test_sim
+            self.assertEqual(sorted(os.listdir(folder)),
+                             ["inf_status_history.bin",
+                              "infectiousness_history.bin", "test_file.csv"])
+            df = pe.output._HistoryWriter.read(
+                os.path.join(folder, "inf_status_history.bin"))
+            self.assertEqual(list(df.columns),
+                             ["time"] + [person.id for person in persons])
+            self.assertEqual(df["time"].tolist(), [0, 1])
+            self.assertEqual(df.iloc[-1, 1:].tolist(),
+                             [person.infection_status.value
+                              for person in persons])
+
+            with patch('logging.exception') as mock_log:
+                pe.routine.Simulation().configure(
+                    self.rt_test_population, self.initial_sweeps,
+                    self.sweeps, self.sim_params,
+                    dict(self.file_params, output_dir=folder),
+                    dict(inf_history_params, output_format="hdf5"))
+                mock_log.assert_called_once_with("ValueError in"
+                                                 + " Simulation.configure()")
+
+    def test_event_log(self):
+        population = self.pop_factory.make_pop(self.rt_pop_params)
+        with tempfile.TemporaryDirectory() as folder:
+            inf_history_params = dict(self.inf_history_params,
+                                      output_dir=folder, status_output=True,
+                                      compress=False, event_log=True)
+            test_sim = pe.routine.Simulation()
+            test_sim.configure(population, self.initial_sweeps,
+                               [pe.sweep.HostProgressionSweep()],
+                               dict(self.sim_params, simulation_end_time=30,
+                                    initial_infected_number=1),
+                               dict(self.file_params, output_dir=folder),
+                               inf_history_params)
+            self.assertIsInstance(test_sim.event_log_writer,
+                                  pe.output._EventLogWriter)
+            self.assertIs(population.cells[0].event_log,
+                          test_sim.event_log_writer)
+            test_sim.run_sweeps()
+            del test_sim
+
+            # The log gives the same statuses as the dense history
+            path = os.path.join(folder, "infection_events.npy")
+            persons = population.cells[0].persons
+            self.assertEqual(pe.output._EventLogWriter.read_ids(path),
+                             [person.id for person in persons])
+            events = pe.output._EventLogWriter.read(path)
+            self.assertGreater(len(events), 1)
+            status = pd.read_csv(os.path.join(folder,
+                                              "inf_status_history.csv"))
+            history = pe.output._EventLogWriter.dense_history(
+                events, status["time"], len(persons))
+            np.testing.assert_array_equal(history,
+                                          status.iloc[:, 1:].to_numpy())
+
     @patch('os.makedirs')
     def test_write_to_Rt_file(self, mock_mkdir, time=1):
 
@@ -1016,6 +1105,204 @@ class TestSimulation(TestMockedLogs):
                                                    self.file_params[
                                                        "output_dir"]))
 
+    @patch('pyEpiabm.routine.simulation.tqdm', notqdm)
+    def test_checkpoint_resume(self):
+        pe.Parameters.instance().time_steps_per_day = 1
+        sim_params = {"simulation_start_time": 0,
+                      "simulation_end_time": 8,
+                      "initial_infected_number": 3,
+                      "simulation_seed": 1}
+
+        def make_sim(folder, checkpoint_params):
+            pe.routine.Simulation.set_random_seed(1)
+            population = self.pop_factory.make_pop(
+                {"population_size": 60, "cell_number": 2,
+                 "microcell_number": 2, "household_number": 10})
+            sim = pe.routine.Simulation()
+            sim.configure(population, [pe.sweep.InitialInfectedSweep()],
+                          [pe.sweep.HouseholdSweep(),
+                           pe.sweep.QueueSweep(),
+                           pe.sweep.HostProgressionSweep()],
+                          sim_params,
+                          {"output_file": "output.csv",
+                           "output_dir": folder},
+                          checkpoint_params=checkpoint_params)
+            return sim
+
+        with tempfile.TemporaryDirectory() as folder:
+            checkpoint_dir = os.path.join(folder, "checkpoints")
+            sim = make_sim(folder, {"output_dir": checkpoint_dir,
+                                    "interval": 3})
+            sim.run_sweeps()
+            del sim
+            self.assertEqual(sorted(os.listdir(checkpoint_dir)),
+                             ["checkpoint_3.npz", "checkpoint_6.npz"])
+            with open(os.path.join(folder, "output.csv")) as f:
+                expected = f.read()
+            self.assertEqual(len(expected.splitlines()), 10)
+
+            # Forked run continues identically, leaving the original
+            # output unchanged
+            fork = os.path.join(folder, "fork")
+            sim = pe.routine.Simulation.resume(
+                os.path.join(checkpoint_dir, "checkpoint_3.npz"), fork)
+            self.assertEqual(sim._steps_completed, 8)
+            self.assertEqual(sim.checkpoint_dir, fork)
+            del sim
+            with open(os.path.join(fork, "output.csv")) as f:
+                self.assertEqual(f.read(), expected)
+            self.assertEqual(sorted(os.listdir(fork)),
+                             ["checkpoint_6.npz", "output.csv"])
+
+            # Resuming in place truncates the output at the checkpoint
+            sim = pe.routine.Simulation.load_checkpoint(
+                os.path.join(checkpoint_dir, "checkpoint_6.npz"))
+            self.assertEqual(sim._steps_completed, 6)
+            del sim
+            with open(os.path.join(folder, "output.csv")) as f:
+                self.assertEqual(f.read(), "\n".join(
+                    expected.splitlines()[:8]) + "\n")
+
+    @patch('pyEpiabm.routine.simulation.tqdm', notqdm)
+    def test_checkpoint_resume_interventions(self):
+        pe.Parameters.instance().time_steps_per_day = 1
+        # Sweeps with waning immunity cannot be saved in checkpoints
+        pe.Parameters.instance().use_waning_immunity = False
+        sim_params = {"simulation_start_time": 0,
+                      "simulation_end_time": 12,
+                      "initial_infected_number": 3,
+                      "simulation_seed": 1}
+
+        with tempfile.TemporaryDirectory() as folder:
+            pe.routine.Simulation.set_random_seed(1)
+            population = self.pop_factory.make_pop(
+                {"population_size": 60, "cell_number": 2,
+                 "microcell_number": 2, "household_number": 10,
+                 "place_number": 2})
+            sim = pe.routine.Simulation()
+            sim.configure(population, [pe.sweep.InitialInfectedSweep()],
+                          [pe.sweep.InterventionSweep(),
+                           pe.sweep.HouseholdSweep(),
+                           pe.sweep.PlaceSweep(),
+                           pe.sweep.QueueSweep(),
+                           pe.sweep.HostProgressionSweep()],
+                          sim_params,
+                          {"output_file": "output.csv",
+                           "output_dir": folder},
+                          checkpoint_params={"output_dir": folder,
+                                             "interval": 4})
+            sim.run_sweeps()
+            del sim
+            with open(os.path.join(folder, "output.csv")) as f:
+                expected = f.read()
+
+            # Interventions are active from time 6, so their multipliers
+            # are rebuilt when the checkpoint is loaded
+            fork = os.path.join(folder, "fork")
+            sim = pe.routine.Simulation.resume(
+                os.path.join(folder, "checkpoint_8.npz"), fork)
+            self.assertIsInstance(sim.population.intervention_modifiers,
+                                  pe.InterventionModifiers)
+            del sim
+            with open(os.path.join(fork, "output.csv")) as f:
+                self.assertEqual(f.read(), expected)
+
+    @patch('pyEpiabm.routine.simulation.tqdm', notqdm)
+    def test_output_format(self):
+        pe.Parameters.instance().time_steps_per_day = 1
+        # Sweeps with waning immunity cannot be saved in checkpoints
+        pe.Parameters.instance().use_waning_immunity = False
+        sim_params = {"simulation_start_time": 0,
+                      "simulation_end_time": 8,
+                      "initial_infected_number": 3,
+                      "simulation_seed": 1}
+
+        def run_sim(folder, file_params):
+            pe.routine.Simulation.set_random_seed(1)
+            population = self.pop_factory.make_pop(
+                {"population_size": 60, "cell_number": 2,
+                 "microcell_number": 2, "household_number": 10})
+            sim = pe.routine.Simulation()
+            sim.configure(population, [pe.sweep.InitialInfectedSweep()],
+                          [pe.sweep.HouseholdSweep(),
+                           pe.sweep.QueueSweep(),
+                           pe.sweep.HostProgressionSweep()],
+                          sim_params,
+                          dict(file_params, output_file="output.csv",
+                               output_dir=folder, spatial_output=True),
+                          checkpoint_params={"output_dir": folder,
+                                             "interval": 3})
+            sim.run_sweeps()
+            return sim
+
+        with tempfile.TemporaryDirectory() as folder:
+            sim = run_sim(folder, {"output_format": "npy",
+                                   "flush_interval": 4})
+            self.assertIsInstance(sim.writer, pe.output._NpyTableWriter)
+            del sim
+            self.assertEqual(sorted(os.listdir(folder)),
+                             ["checkpoint_3.npz", "checkpoint_6.npz",
+                              "output.npy"])
+            expected = pe.output._NpyTableWriter.read(
+                os.path.join(folder, "output.npy"))
+            self.assertEqual(list(expected.columns)[:4],
+                             ["time", "cell", "location_x", "location_y"])
+            self.assertEqual(expected["time"].tolist(),
+                             [t for t in range(9) for _ in range(2)])
+            self.assertEqual(expected["cell"].tolist(), ["0", "1"] * 9)
+            self.assertTrue((expected.iloc[:, 4:].sum(axis=1)
+                             .groupby(expected["time"]).sum() == 60).all())
+
+            # Rows buffered when the checkpoint was made were written to
+            # file, so resuming gives the same output
+            sim = pe.routine.Simulation.resume(
+                os.path.join(folder, "checkpoint_6.npz"))
+            del sim
+            output = pe.output._NpyTableWriter.read(
+                os.path.join(folder, "output.npy"))
+            pd.testing.assert_frame_equal(output, expected)
+
+    def test_parameters(self):
+        params = pe.Parameters.from_file(os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            'testing_parameters.json'))
+        params.time_steps_per_day = 2
+        previous = pe.Parameters.instance()
+        previous.use_waning_immunity = False
+        sweep = MagicMock(spec=pe.sweep.HouseholdSweep)
+        sweep.side_effect = lambda t: self.assertIs(
+            pe.Parameters.instance(), params)
+
+        with tempfile.TemporaryDirectory() as folder:
+            test_sim = pe.routine.Simulation()
+            test_sim.configure(self.test_population, [], [sweep],
+                               self.sim_params,
+                               {"output_file": "output.csv",
+                                "output_dir": folder},
+                               parameters=params)
+            self.assertIs(test_sim.parameters, params)
+            sweep.bind_population.assert_called_once_with(
+                self.test_population, params)
+            self.assertTrue(params.use_waning_immunity)
+            self.assertFalse(previous.use_waning_immunity)
+
+            test_sim.run_sweeps()
+            self.assertEqual(sweep.call_count, 2)
+            self.assertIs(pe.Parameters.instance(), previous)
+            test_sim.writer.f.close()
+
+    @patch('logging.exception')
+    @patch('os.makedirs')
+    def test_configure_checkpoint_exception(self, mock_mkdir, mock_log):
+        with patch('pyEpiabm.output._csv_dict_writer.open'):
+            test_sim = pe.routine.Simulation()
+            test_sim.configure(self.test_population, self.initial_sweeps,
+                               self.sweeps, self.sim_params, self.file_params,
+                               checkpoint_params={"output_dir": "mock",
+                                                  "interval": 0})
+        mock_log.assert_called_once_with("ValueError in"
+                                         + " Simulation.configure()")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import MagicMock
 
 import pyEpiabm as pe
 from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
@@ -15,6 +16,11 @@ class TestAbstractSweep(TestPyEpiabm):
         subject = pe.sweep.AbstractSweep()
         population = pe.Population()
         subject.bind_population(population)
+        self.assertIs(subject.parameters, pe.Parameters.instance())
+
+        parameters = object()
+        subject.bind_population(population, parameters)
+        self.assertIs(subject.parameters, parameters)
 
     def test___call__(self):
         subject = pe.sweep.AbstractSweep()
@@ -35,6 +41,13 @@ class TestAbstractSweep(TestPyEpiabm):
         self.assertEqual(infectee.exposure_period, 5.0)
         self.assertEqual(infectee.infector_latent_period, 3.0)
 
+        # The infector is recorded in the event log of the population
+        pop.set_event_log(MagicMock())
+        pe.sweep.AbstractSweep.store_infection_periods(infector, infectee,
+                                                       time, "household")
+        pop.event_log.record_infector.assert_called_once_with(
+            infectee, infector, "household")
+
 
 if __name__ == '__main__':
     unittest.main()
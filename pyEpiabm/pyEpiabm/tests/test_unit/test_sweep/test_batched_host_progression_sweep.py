@@ -0,0 +1,195 @@
+import os
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestBatchedHostProgressionSweep(TestPyEpiabm):
+    """Tests the 'BatchedHostProgressionSweep' class.
+    """
+
+    def setUp(self) -> None:
+        """Sets up a population of 100 susceptible people, 20 of which
+        are exposed and due to become infectious at time 1. All
+        transitions take 5 days.
+        """
+        self.population = pe.Population()
+        self.population.add_cells(1)
+        self.cell = self.population.cells[0]
+        self.cell.add_microcells(1)
+        self.microcell = self.cell.microcells[0]
+        self.microcell.add_people(100)
+        self.persons = self.microcell.persons
+        for person in self.persons[:20]:
+            person.update_status(InfectionStatus.Exposed)
+            person.next_infection_status = InfectionStatus.InfectMild
+            person.time_of_status_change = 1.0
+        self.test_sweep = pe.sweep.BatchedHostProgressionSweep()
+        time_matrix = self.test_sweep.transition_time_matrix.copy()
+        time_matrix.loc[:, :] = 5.0
+        self.test_sweep.transition_time_matrix = time_matrix
+
+    def test_bind_population(self):
+        self.test_sweep.bind_population(self.population)
+        self.assertIs(self.population.person_store, self.test_sweep._store)
+        self.assertEqual(len(self.test_sweep._store), 100)
+        n = len(InfectionStatus)
+        self.assertEqual(self.test_sweep._cumulative_weights.shape[0], n + 1)
+        self.assertEqual(self.test_sweep._cumulative_weights.shape[2], n)
+        self.assertEqual(self.test_sweep._fixed_times.shape, (n + 1, n + 1))
+
+        # Each row of the table matches the state transition matrix
+        weights = self.test_sweep.state_transition_matrix.loc['Exposed']
+        expected = np.cumsum([w[0] if isinstance(w, list) else w
+                              for w in weights])
+        np.testing.assert_array_almost_equal(
+            self.test_sweep._cumulative_weights[
+                InfectionStatus.Exposed.value, 0], expected)
+
+    def test_call(self):
+        self.test_sweep.bind_population(self.population)
+        self.test_sweep(1.0)
+        for person in self.persons[:20]:
+            self.assertEqual(person.infection_status,
+                             InfectionStatus.InfectMild)
+            self.assertEqual(person.infection_start_times, [1.0])
+            self.assertEqual(person.num_times_infected, 1)
+            self.assertEqual(person.secondary_infections_counts, [0])
+            self.assertGreater(person.infectiousness, 0)
+            self.assertIsNotNone(person.next_infection_status)
+            self.assertEqual(person.time_of_status_change,
+                             6.0 + self.test_sweep.delay)
+        for person in self.persons[20:]:
+            self.assertEqual(person.infection_status,
+                             InfectionStatus.Susceptible)
+            self.assertEqual(person.infectiousness, 0)
+            self.assertIsNone(person.time_of_status_change)
+        self.assertEqual(sum(self.cell.compartment_counter.retrieve()[
+            InfectionStatus.InfectMild]), 20)
+
+    def test_status_calendar(self):
+        self.test_sweep.bind_population(self.population)
+        self.test_sweep(1.0)
+        # The cell's calendar follows the times written to the store
+        calendar = self.cell.status_calendar
+        self.assertEqual(len(calendar), 20)
+        self.assertEqual(calendar.pop_due(5.0 + self.test_sweep.delay), [])
+        self.assertCountEqual(calendar.pop_due(6.0 + self.test_sweep.delay),
+                              self.persons[:20])
+
+    def test_infectiousness_matches_per_person(self):
+        self.test_sweep.bind_population(self.population)
+        self.test_sweep(1.0)
+        per_person_sweep = pe.sweep.HostProgressionSweep()
+        for person in self.persons[:20]:
+            person.time_of_status_change = np.inf
+        self.test_sweep(3.0)
+        for person in self.persons[:20]:
+            batched = person.infectiousness
+            per_person_sweep._updates_infectiousness(person, 3.0)
+            self.assertEqual(batched, person.infectiousness)
+
+    def test_next_status_distribution(self):
+        # Everyone is exposed, so the next status follows the matrix row
+        for person in self.persons[20:]:
+            person.update_status(InfectionStatus.Exposed)
+            person.next_infection_status = InfectionStatus.InfectASympt
+            person.time_of_status_change = 1.0
+        matrix = self.test_sweep.state_transition_matrix.copy()
+        matrix.loc['InfectASympt'] = 0
+        matrix.loc['InfectASympt', 'InfectGP'] = 1
+        self.test_sweep.state_transition_matrix = matrix
+        self.test_sweep.bind_population(self.population)
+        self.test_sweep(1.0)
+        for person in self.persons[20:]:
+            self.assertEqual(person.infection_status,
+                             InfectionStatus.InfectASympt)
+            self.assertEqual(person.next_infection_status,
+                             InfectionStatus.InfectGP)
+
+    def test_final_statuses(self):
+        person = self.persons[0]
+        person.update_status(InfectionStatus.InfectHosp)
+        person.next_infection_status = InfectionStatus.Dead
+        self.test_sweep.bind_population(self.population)
+        self.test_sweep(1.0)
+        self.assertEqual(person.infection_status, InfectionStatus.Dead)
+        self.assertIsNone(person.next_infection_status)
+        self.assertEqual(person.time_of_status_change, np.inf)
+        self.assertEqual(person.infectiousness, 0)
+
+    def test_care_home_fallback(self):
+        person = self.persons[0]
+        person.care_home_resident = True
+        person.update_status(InfectionStatus.InfectHosp)
+        person.infection_start_times.append(0.0)
+        person.next_infection_status = InfectionStatus.InfectICU
+        self.test_sweep.bind_population(self.population)
+        with mock.patch.object(self.test_sweep,
+                               'update_next_infection_status') as mock_next:
+            mock_next.side_effect = lambda p, t: setattr(
+                p, 'next_infection_status', InfectionStatus.Dead)
+            self.test_sweep(1.0)
+        mock_next.assert_called_once_with(person, 1.0)
+        self.assertEqual(person.next_infection_status, InfectionStatus.Dead)
+
+    def test_neg_trans_raise(self):
+        self.test_sweep.transition_time_matrix = \
+            pe.sweep.TransitionTimeMatrix().matrix
+        self.test_sweep.bind_population(self.population)
+        with self.assertRaises(ValueError):
+            self.test_sweep(1.0)
+
+    def test_zero_weights_raise(self):
+        labels = [status.name for status in InfectionStatus]
+        self.test_sweep.state_transition_matrix = pd.DataFrame(
+            0, columns=labels, index=labels, dtype=object)
+        self.test_sweep.bind_population(self.population)
+        with self.assertRaises(ValueError):
+            self.test_sweep(1.0)
+
+    @mock.patch('pyEpiabm.sweep.BatchedHostProgressionSweep.'
+                'asympt_uninf_testing_queue')
+    def test_asymptomatic_list(self, mock_asympt):
+        for person in self.persons[:20]:
+            person.next_infection_status = InfectionStatus.InfectASympt
+        self.persons[20].update_status(InfectionStatus.Recovered)
+        self.persons[20].time_of_status_change = np.inf
+        self.test_sweep.bind_population(self.population)
+        self.test_sweep(1.0)
+        called_persons = [item[1] for item in mock_asympt.call_args[0][0]]
+        self.assertCountEqual(called_persons, self.persons)
+
+    def test_testing_active(self):
+        # Disease testing is read from the parameters bound to the sweep,
+        # not from the global instance
+        parameters = pe.Parameters.from_file(os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            'testing_parameters.json'))
+        parameters.intervention_params = {}
+        self.assertIn('disease_testing',
+                      pe.Parameters.instance().intervention_params)
+        self.test_sweep.bind_population(self.population, parameters)
+        self.assertFalse(self.test_sweep._testing_active())
+        parameters.intervention_params = {'disease_testing': {}}
+        self.assertTrue(self.test_sweep._testing_active())
+
+    def test_multiple_transitions(self):
+        time_matrix = self.test_sweep.transition_time_matrix.copy()
+        time_matrix.loc[:, :] = 0.0
+        self.test_sweep.transition_time_matrix = time_matrix
+        self.test_sweep.delay = 0
+        self.test_sweep.bind_population(self.population)
+        self.test_sweep(1.0)
+        for person in self.persons[:20]:
+            self.assertIn(person.infection_status,
+                          [InfectionStatus.Recovered, InfectionStatus.Dead])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.sweep import BatchedHouseholdSweep
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestBatchedHouseholdSweep(TestPyEpiabm):
+    """Test the 'BatchedHouseholdSweep' class.
+    """
+
+    def setUp(self) -> None:
+        """Initialises a population with two households of four people, with
+        two infectors in the first household.
+
+        """
+        self.pop = pe.Population()
+        self.pop.add_cells(1)
+        self.cell = self.pop.cells[0]
+        self.cell.add_microcells(1)
+        microcell = self.cell.microcells[0]
+        microcell.add_people(8)
+        microcell.add_household(microcell.persons[:4])
+        microcell.add_household(microcell.persons[4:])
+        self.infectors = microcell.persons[:2]
+        for person in microcell.persons:
+            person.infection_start_times = [0.0]
+            person.secondary_infections_counts = [0]
+        for infector in self.infectors:
+            infector.update_status(InfectionStatus.InfectMild)
+            infector.infectiousness = 1.0
+            infector.set_latent_period(2.0)
+            infector.household.remove_susceptible_person(infector)
+        self.infectees = microcell.persons[2:4]
+        self.time = 1
+        self.test_sweep = BatchedHouseholdSweep()
+        self.test_sweep.bind_population(self.pop)
+
+    def queued(self):
+        queued = []
+        while not self.cell.person_queue.empty():
+            queued.append(self.cell.person_queue.get())
+        return queued
+
+    @mock.patch('pyEpiabm.property.HouseholdInfection'
+                + '.household_infector_scale')
+    def test__call__(self, mock_scale):
+        # Force of infection above one infects every susceptible member of
+        # the infectors' household, once each
+        mock_scale.return_value = 100.0
+        self.test_sweep(self.time)
+        self.assertEqual(self.queued(), self.infectees)
+        self.assertEqual(sum(infector.secondary_infections_counts[-1]
+                             for infector in self.infectors), 2)
+        for infectee in self.infectees:
+            self.assertEqual(infectee.exposure_period, 1.0)
+            self.assertEqual(infectee.infector_latent_period, 2.0)
+
+        mock_scale.return_value = 0.0
+        self.test_sweep(self.time)
+        self.assertEqual(self.queued(), [])
+
+    @mock.patch('numpy.random.random')
+    @mock.patch('pyEpiabm.property.HouseholdInfection'
+                + '.household_infectee_scales')
+    @mock.patch('pyEpiabm.property.HouseholdInfection'
+                + '.household_infector_scale')
+    def test__call__probability(self, mock_scale, mock_infectee,
+                                mock_random):
+        # Two infectors with force of infection 0.5 infect each susceptible
+        # with probability 0.75, and the second infector is drawn as the
+        # infector
+        mock_scale.side_effect = [0.5, 0.5]
+        mock_infectee.return_value = (1.0, 1.0)
+        mock_random.side_effect = [np.array([0.7, 0.8]), 0.9]
+        self.test_sweep(self.time)
+        self.assertEqual(self.queued(), [self.infectees[0]])
+        self.assertEqual([infector.secondary_infections_counts[-1]
+                          for infector in self.infectors], [0, 1])
+        self.assertEqual(mock_scale.call_count, 2)
+        self.assertEqual(mock_infectee.call_count, 2)
+
+        np.testing.assert_array_equal(mock_random.call_args_list[0][0], (2,))
+
+    def test__call__matches_household_foi(self):
+        # Infection frequency matches the per pair draws of HouseholdSweep
+        pe.Parameters.instance().household_transmission = 0.3
+        np.random.seed(1)
+        infections = 0
+        for _ in range(2000):
+            self.test_sweep(self.time)
+            infections += len(self.queued())
+        foi = pe.property.HouseholdInfection.household_foi(
+            self.infectors[0], self.infectees[0], self.time)
+        expected = 2 * 2000 * (1 - (1 - foi) ** 2)
+        self.assertAlmostEqual(infections / expected, 1, delta=0.05)
+
+    def test__call__errors(self):
+        self.infectors[0].household = None
+        with self.assertRaises(AttributeError):
+            self.test_sweep(self.time)
+
+        # No susceptible household members
+        self.infectors[0].household = self.infectees[0].household
+        for infectee in self.infectees:
+            infectee.household.remove_susceptible_person(infectee)
+        with mock.patch('numpy.random.random') as mock_random:
+            self.test_sweep(self.time)
+            mock_random.assert_not_called()
+        self.assertEqual(self.queued(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
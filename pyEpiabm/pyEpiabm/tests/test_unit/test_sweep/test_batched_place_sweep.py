@@ -0,0 +1,137 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus, PlaceType
+from pyEpiabm.sweep import BatchedPlaceSweep
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestBatchedPlaceSweep(TestPyEpiabm):
+    """Test the 'BatchedPlaceSweep' class.
+    """
+
+    def setUp(self) -> None:
+        """Initialises a population with one workplace of two groups, each
+        of three people, with two infectors in the first group.
+
+        """
+        self.pop = pe.Population()
+        self.pop.add_cells(1)
+        self.cell = self.pop.cells[0]
+        self.cell.add_microcells(1)
+        microcell = self.cell.microcells[0]
+        microcell.add_people(6)
+        microcell.add_place(1, (1, 1), PlaceType.Workplace)
+        self.place = microcell.places[0]
+        for i, person in enumerate(microcell.persons):
+            self.place.add_person(person, i // 3)
+            person.infection_start_times = [0.0]
+            person.secondary_infections_counts = [0]
+        self.infectors = microcell.persons[:2]
+        for infector in self.infectors:
+            infector.update_status(InfectionStatus.InfectMild)
+            infector.infectiousness = 1.0
+            infector.set_latent_period(2.0)
+        self.infectee = microcell.persons[2]
+        self.time = 1
+        self.test_sweep = BatchedPlaceSweep()
+        self.test_sweep.bind_population(self.pop)
+
+    def queued(self):
+        queued = []
+        while not self.cell.person_queue.empty():
+            queued.append(self.cell.person_queue.get())
+        return queued
+
+    @mock.patch('pyEpiabm.property.PlaceInfection.place_inf')
+    def test__call__(self, mock_inf):
+        # Infectiousness above one infects every susceptible member of the
+        # infectors' group, once each
+        mock_inf.return_value = 10.0
+        self.test_sweep(self.time)
+        self.assertEqual(self.queued(), [self.infectee])
+        self.assertEqual(sum(infector.secondary_infections_counts[-1]
+                             for infector in self.infectors), 1)
+        self.assertEqual(self.infectee.exposure_period, 1.0)
+        self.assertEqual(self.infectee.infector_latent_period, 2.0)
+
+        mock_inf.return_value = 0.0
+        self.test_sweep(self.time)
+        self.assertEqual(self.queued(), [])
+
+    @mock.patch('numpy.random.random')
+    @mock.patch('pyEpiabm.property.PlaceInfection.place_susc')
+    @mock.patch('pyEpiabm.property.PlaceInfection.place_inf')
+    def test__call__probability(self, mock_inf, mock_susc, mock_random):
+        # Both infectors meet the whole group and have force of infection
+        # 0.5, so the hazard of the infectee is 1, and the second infector
+        # is drawn as the infector
+        mock_inf.return_value = 1.0
+        mock_susc.return_value = 0.5
+        mock_random.side_effect = [np.array([0.6]), np.array([0.9])]
+        self.test_sweep(self.time)
+        self.assertEqual(self.queued(), [self.infectee])
+        self.assertEqual([infector.secondary_infections_counts[-1]
+                          for infector in self.infectors], [0, 1])
+        # Infectiousness is calculated once per infector and place, and
+        # susceptibility once per susceptible member
+        self.assertEqual(mock_inf.call_count, 2)
+        self.assertEqual(mock_susc.call_count, 1)
+        np.testing.assert_array_equal(mock_random.call_args_list[0][0], (1,))
+
+        # One draw per group decides the infections of its members
+        mock_random.side_effect = [np.array([1 - np.exp(-1)])]
+        self.test_sweep(self.time)
+        self.assertEqual(self.queued(), [])
+        self.assertEqual(mock_random.call_count, 3)
+
+    @mock.patch('numpy.random.random')
+    @mock.patch('pyEpiabm.core.Parameters.instance')
+    @mock.patch('pyEpiabm.property.PlaceInfection.place_susc')
+    @mock.patch('pyEpiabm.property.PlaceInfection.place_inf')
+    def test__call__carehome(self, mock_inf, mock_susc, mock_params,
+                             mock_random):
+        # Key workers in care homes are scaled as in place_foi, raising the
+        # hazard of the infectee from 0.5 to 2
+        mock_inf.return_value = 1.0
+        mock_susc.return_value = 0.25
+        mock_random.return_value = np.array([0.8])
+        mock_params.return_value.carehome_params = {
+            'carehome_worker_group_scaling': 4}
+        self.test_sweep(self.time)
+        self.assertEqual(self.queued(), [])
+
+        self.place.place_type = PlaceType.CareHome
+        self.infectee.key_worker = True
+        self.test_sweep(self.time)
+        self.assertEqual(self.queued(), [self.infectee])
+
+    def test__call__matches_place_foi(self):
+        # Infection frequency matches the summed force of infection of the
+        # two infectors
+        pe.Parameters.instance().place_params['place_transmission'] = 6
+        np.random.seed(1)
+        infections = 0
+        for _ in range(2000):
+            self.test_sweep(self.time)
+            infections += len(self.queued())
+        inf = pe.property.PlaceInfection.place_inf(
+            self.place, self.infectors[0], self.time)
+        foi = pe.property.PlaceInfection.place_foi(
+            self.place, self.infectors[0], self.infectee, self.time)
+        expected = 2000 * (1 - np.exp(-2 * inf * foi))
+        self.assertAlmostEqual(infections / expected, 1, delta=0.05)
+
+    def test__call__no_susceptibles(self):
+        self.infectee.update_status(InfectionStatus.Recovered)
+        with mock.patch('numpy.random.random') as mock_random:
+            self.test_sweep(self.time)
+            mock_random.assert_not_called()
+        self.assertEqual(self.queued(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
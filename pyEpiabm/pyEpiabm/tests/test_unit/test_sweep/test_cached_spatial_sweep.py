@@ -0,0 +1,201 @@
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.core import Population, Parameters
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.sweep import CachedSpatialSweep, SpatialSweep
+from pyEpiabm.utility import DistanceFunctions, SpatialKernel
+from pyEpiabm.tests.test_unit.mocked_logging_tests import TestMockedLogs
+
+
+class TestCachedSpatialSweep(TestMockedLogs):
+    """Test the "CachedSpatialSweep" class.
+    """
+
+    def setUp(self):
+        Parameters.instance().infection_radius = 1.5
+        Parameters.instance().time_steps_per_day = 1
+        Parameters.instance().do_CovidSim = False
+        self.pop = self.make_population()
+
+    @staticmethod
+    def make_population():
+        # Row of four cells one unit apart, with an infector in the first
+        pop = Population()
+        pop.add_cells(4)
+        for i, cell in enumerate(pop.cells):
+            cell.set_location((float(i), 0.0))
+            cell.add_microcells(1)
+            cell.microcells[0].add_people(i + 2)
+            for person in cell.persons:
+                person.infection_start_times = [0.0]
+                person.secondary_infections_counts = [0]
+        infector = pop.cells[0].persons[0]
+        infector.update_status(InfectionStatus.InfectMild)
+        infector.infectiousness = 1.0
+        infector.set_latent_period(5.0)
+        return pop
+
+    def test_bind_population(self):
+        test_sweep = CachedSpatialSweep()
+        test_sweep.bind_population(self.pop)
+        np.testing.assert_array_equal(test_sweep._indptr, [0, 1, 3, 5, 6])
+        np.testing.assert_array_equal(test_sweep._indices,
+                                      [1, 0, 2, 1, 3, 2])
+        np.testing.assert_array_equal(test_sweep._distances, [1.0] * 6)
+
+    @mock.patch("random.random")
+    def test_find_infectees_cached(self, mock_random):
+        test_sweep = CachedSpatialSweep()
+        test_sweep.bind_population(self.pop)
+        test_sweep._update_cell_sizes()
+
+        # Neighbours of cell 1 are cells 0 and 2, weighted by size
+        neighbours, cumulative = test_sweep._cumulative_weights(1)
+        self.assertEqual(neighbours, [0, 2])
+        self.assertEqual(cumulative, [2.0, 6.0])
+
+        mock_random.return_value = 0.5
+        test_list = test_sweep.find_infectees_cached(1, 2)
+        self.assertEqual(len(test_list), 2)
+        for infectee in test_list:
+            self.assertIn(infectee, self.pop.cells[2].persons)
+
+        # Cached weights are discarded when a cell changes size
+        self.pop.cells[0].microcells[0].add_people(2)
+        test_sweep._update_cell_sizes()
+        self.assertEqual(test_sweep._cumulative_weights(1)[1], [4.0, 8.0])
+
+    @mock.patch('logging.exception')
+    def test_find_infectees_cached_fails(self, mock_log):
+        Parameters.instance().infection_radius = 0.5
+        test_sweep = CachedSpatialSweep()
+        test_sweep.bind_population(self.pop)
+        test_sweep._update_cell_sizes()
+        self.assertEqual(test_sweep.find_infectees_cached(0, 1), [])
+        mock_log.assert_called_once()
+        self.assertTrue(mock_log.call_args[0][0].startswith("ValueError"))
+
+    def test__call__matches_spatial_sweep(self):
+        # Same seed gives the same infection events as SpatialSweep
+        queues = []
+        for sweep_class in [SpatialSweep, CachedSpatialSweep]:
+            random.seed(2)
+            np.random.seed(2)
+            pop = self.make_population()
+            test_sweep = sweep_class()
+            test_sweep.bind_population(pop)
+            with mock.patch("pyEpiabm.property.SpatialInfection.cell_inf",
+                            return_value=5):
+                for time in range(1, 4):
+                    test_sweep(time)
+            queues.append([[person.id for person in cell.person_queue.queue]
+                           for cell in pop.cells])
+        self.assertEqual(queues[0], queues[1])
+        self.assertGreater(sum(len(q) for q in queues[1]), 0)
+
+    def test_find_infectees_Covidsim_cached(self):
+        test_sweep = CachedSpatialSweep()
+        test_sweep.bind_population(self.pop)
+        infector = self.pop.cells[1].persons[0]
+        susceptible = np.array([len(cell.persons) for cell in self.pop.cells])
+
+        # Same seed gives the same infectees as SpatialSweep
+        random.seed(4)
+        expected = test_sweep.find_infectees_Covidsim(
+            infector, [self.pop.cells[0]] + self.pop.cells[2:], 5)
+        random.seed(4)
+        test_list = test_sweep.find_infectees_Covidsim_cached(
+            1, infector, 5, susceptible)
+        self.assertEqual(test_list, expected)
+        self.assertEqual(len(test_list), 5)
+
+        # Kernels are computed on first use
+        self.assertEqual(test_sweep._kernels.shape, (4, 4))
+        self.assertEqual(test_sweep._acceptance[1, 0], 1.0)
+
+        self.assertEqual(test_sweep.find_infectees_Covidsim_cached(
+            1, infector, 0, np.zeros(4)), [])
+        with self.assertRaises(ValueError):
+            test_sweep.find_infectees_Covidsim_cached(
+                1, infector, 1, np.zeros(4))
+
+    def test__call__Covidsim_matches_spatial_sweep(self):
+        Parameters.instance().do_CovidSim = True
+        queues = []
+        for sweep_class in [SpatialSweep, CachedSpatialSweep]:
+            random.seed(3)
+            np.random.seed(3)
+            pop = self.make_population()
+            test_sweep = sweep_class()
+            test_sweep.bind_population(pop)
+            with mock.patch("pyEpiabm.property.SpatialInfection.cell_inf",
+                            return_value=5):
+                for time in range(1, 4):
+                    test_sweep(time)
+            queues.append([[person.id for person in cell.person_queue.queue]
+                           for cell in pop.cells])
+        self.assertEqual(queues[0], queues[1])
+        self.assertGreater(sum(len(q) for q in queues[1]), 0)
+
+    def test_compute_kernels(self):
+        Parameters.instance().do_CovidSim = True
+        # Cells with several microcells, not at the cell location
+        self.pop.cells[3].microcells[0].set_location((3.5, 0.5))
+        self.pop.cells[3].add_microcells(1)
+        self.pop.cells[3].microcells[1].set_location((2.5, 0.0))
+        test_sweep = CachedSpatialSweep()
+        test_sweep.bind_population(self.pop)
+        with mock.patch.object(test_sweep, '_compute_kernels',
+                               wraps=test_sweep._compute_kernels) as mock_fn:
+            for i in range(3):
+                test_sweep.find_infectees_Covidsim_cached(
+                    i, self.pop.cells[i].persons[0], 1, np.ones(4))
+        mock_fn.assert_called_once_with()
+
+        # Kernels match those of each pair of cells found one at a time
+        cells = self.pop.cells
+        for i, infector_cell in enumerate(cells):
+            for j, infectee_cell in enumerate(cells):
+                kernel = SpatialKernel.weighting(DistanceFunctions.dist(
+                    infectee_cell.location, infector_cell.location))
+                minimum = SpatialKernel.weighting(
+                    DistanceFunctions.minimum_between_cells(
+                        infectee_cell, infector_cell))
+                self.assertAlmostEqual(test_sweep._kernels[i, j], kernel)
+                self.assertAlmostEqual(test_sweep._acceptance[i, j],
+                                       kernel / minimum)
+
+    def test__call__no_susceptibles(self):
+        for cell in self.pop.cells[1:]:
+            for person in cell.persons:
+                person.update_status(InfectionStatus.Recovered)
+        test_sweep = CachedSpatialSweep()
+        test_sweep.bind_population(self.pop)
+        counts = self.pop.compartment_counts
+        with mock.patch("numpy.random.poisson") as mock_poisson, \
+                mock.patch.object(self.pop, 'compartment_counts',
+                                  wraps=counts) as mock_counts:
+            test_sweep(1)
+            mock_poisson.assert_not_called()
+            # Susceptible counts are read from the population-wide counts
+            mock_counts.assert_called_once_with(by_cell=True)
+
+        # Single cell and zero radius populations return immediately
+        pop = pe.Population()
+        pop.add_cells(1)
+        test_sweep.bind_population(pop)
+        test_sweep(1)
+        Parameters.instance().infection_radius = 0
+        test_sweep.bind_population(self.pop)
+        test_sweep(1)
+        self.assertTrue(all(cell.person_queue.empty()
+                            for cell in self.pop.cells))
+
+
+if __name__ == '__main__':
+    unittest.main()
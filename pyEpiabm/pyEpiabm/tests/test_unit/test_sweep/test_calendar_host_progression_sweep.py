@@ -0,0 +1,130 @@
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestCalendarHostProgressionSweep(TestPyEpiabm):
+    """Tests the 'CalendarHostProgressionSweep' class.
+    """
+
+    @staticmethod
+    def make_population():
+        """Returns a population of two cells of 50 susceptible people, 10
+        of which are exposed in each cell and due to become infectious at
+        times 1 to 10.
+        """
+        population = pe.Population()
+        population.add_cells(2)
+        for cell in population.cells:
+            cell.add_microcells(1)
+            cell.microcells[0].add_people(50)
+            for i, person in enumerate(cell.persons[:10]):
+                person.update_status(InfectionStatus.Exposed)
+                person.next_infection_status = InfectionStatus.InfectMild
+                person.time_of_status_change = 10.0 - i
+        return population
+
+    def setUp(self) -> None:
+        self.population = self.make_population()
+        self.persons = self.population.cells[0].persons
+        self.test_sweep = pe.sweep.CalendarHostProgressionSweep()
+        self.test_sweep.bind_population(self.population)
+        pe.Parameters.instance().intervention_params = {}
+
+    def test__call__(self):
+        with mock.patch.object(self.test_sweep, '_progress_person',
+                               wraps=self.test_sweep._progress_person) \
+                as mock_progress:
+            self.test_sweep(2.5)
+        # Only the due people are visited, in the order of their cell
+        self.assertEqual([call.args[1] for call in mock_progress.mock_calls],
+                         [self.persons[8], self.persons[9],
+                          self.population.cells[1].persons[8],
+                          self.population.cells[1].persons[9]])
+        self.assertEqual(self.persons[9].infection_status,
+                         InfectionStatus.InfectMild)
+        self.assertGreater(self.persons[9].time_of_status_change, 2.5)
+        self.assertEqual(self.persons[7].infection_status,
+                         InfectionStatus.Exposed)
+
+        # Infectiousness of people who are not due is also updated
+        with mock.patch.object(self.test_sweep, '_updates_infectiousness') \
+                as mock_update:
+            self.test_sweep(3)
+        updated = [call.args[0] for call in mock_update.mock_calls]
+        self.assertIn(self.persons[9], updated)
+        self.assertIn(self.persons[7], updated)
+
+    def test_matches_host_progression(self):
+        def statuses(population):
+            return [(person.infection_status, person.time_of_status_change,
+                     person.infectiousness)
+                    for cell in population.cells for person in cell.persons]
+
+        results = []
+        for sweep in [pe.sweep.HostProgressionSweep(), self.test_sweep]:
+            random.seed(1)
+            np.random.seed(1)
+            population = self.make_population()
+            sweep.bind_population(population)
+            for time in range(1, 30):
+                sweep(time)
+            results.append(statuses(population))
+        self.assertEqual(results[0], results[1])
+
+    def test_travellers(self):
+        def statuses(population):
+            return [(person.infection_status, person.time_of_status_change)
+                    for cell in population.cells for person in cell.persons]
+
+        results = []
+        for sweep in [pe.sweep.HostProgressionSweep(), self.test_sweep]:
+            random.seed(1)
+            np.random.seed(1)
+            population = pe.Population()
+            population.add_cells(1)
+            population.cells[0].add_microcells(2)
+            for microcell in population.cells[0].microcells:
+                microcell.add_people(10)
+                microcell.add_household(microcell.persons.copy())
+            travel_sweep = pe.sweep.TravelSweep()
+            travel_sweep.travel_params['constant_introduce_cases'] = [2]
+            travel_sweep.travel_params['ratio_introduce_cases'] = 0
+            travel_sweep.travel_params['duration_travel_stay'] = [20, 20]
+            travel_sweep.bind_population(population)
+            sweep.bind_population(population)
+            travel_sweep(1)
+            travellers = list(population.travellers)
+            self.assertEqual(len(travellers), 2)
+            # Travellers move to the calendar of the cell they join
+            for person in travellers:
+                self.assertIn(person, population.cells[0].status_calendar)
+                self.assertNotIn(person,
+                                 travel_sweep.initial_cell.status_calendar)
+            travel_sweep.travel_params['constant_introduce_cases'] = [0]
+            for time in range(2, 20):
+                sweep(time)
+            self.assertTrue(all(person.infection_status
+                                == InfectionStatus.Recovered
+                                for person in travellers))
+            results.append(statuses(population))
+        self.assertEqual(results[0], results[1])
+
+    @mock.patch('pyEpiabm.sweep.HostProgressionSweep.__call__')
+    def test_disease_testing(self, mock_call):
+        pe.Parameters.instance().intervention_params = {
+            'disease_testing': {}}
+        self.test_sweep(1)
+        mock_call.assert_called_once_with(1)
+        self.assertEqual(self.persons[9].infection_status,
+                         InfectionStatus.Exposed)
+
+
+if __name__ == '__main__':
+    unittest.main()
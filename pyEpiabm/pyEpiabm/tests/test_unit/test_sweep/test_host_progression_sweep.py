@@ -1,3 +1,4 @@
+import os
 import unittest
 from unittest import mock
 import numpy as np
@@ -102,6 +103,25 @@ class TestHostProgressionSweep(TestPyEpiabm):
         """
         pe.sweep.HostProgressionSweep()
 
+    def test_bind_parameters(self):
+        """Tests that the sweep is built again from parameters bound with
+        the population.
+        """
+        params = pe.Parameters.from_file(os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            'testing_parameters.json'))
+        params.latent_to_sympt_delay = 3.0
+        test_sweep = pe.sweep.HostProgressionSweep()
+        matrix = test_sweep.state_transition_matrix
+        test_sweep.bind_population(self.test_population1,
+                                   pe.Parameters.instance())
+        self.assertIs(test_sweep.state_transition_matrix, matrix)
+        test_sweep.bind_population(self.test_population1, params)
+        self.assertEqual(test_sweep.latent_to_symptom_delay, 3.0)
+        self.assertIsNot(test_sweep.state_transition_matrix, matrix)
+        self.assertEqual(pe.sweep.HostProgressionSweep(
+            params).latent_to_symptom_delay, 3.0)
+
     def test_set_infectiousness(self):
         """Tests that the set infectiousness function returns a positive
         float and the correct infection start times.
@@ -239,6 +259,38 @@ class TestHostProgressionSweep(TestPyEpiabm):
                     next_enum_value = person.next_infection_status.value
                     self.assertTrue(current_enum_value <= next_enum_value)
 
+    def test_matrices_edited_in_place(self):
+        pe.Parameters.instance().use_waning_immunity = False
+        test_sweep = pe.sweep.HostProgressionSweep()
+        test_sweep.bind_population(self.test_population2)
+        person = self.people[InfectionStatus.InfectHosp.value - 1]
+
+        # Edits to the matrices are used without reassigning them
+        test_sweep.state_transition_matrix.loc['InfectHosp'] = 0.0
+        test_sweep.state_transition_matrix.loc['InfectHosp',
+                                               'InfectICU'] = 1.0
+        test_sweep.update_next_infection_status(person)
+        self.assertEqual(person.next_infection_status,
+                         InfectionStatus.InfectICU)
+        test_sweep.transition_time_matrix.loc['InfectHosp',
+                                              'InfectICU'] = 3.0
+        test_sweep.update_time_status_change(person, 1.0)
+        self.assertEqual(person.time_of_status_change, 4.0)
+
+        # Edits are found from the version of the matrix, and the sweep
+        # uses them when it is called
+        version = test_sweep.transition_time_matrix.version
+        test_sweep.transition_time_matrix.iat[
+            InfectionStatus.InfectHosp.value - 1,
+            InfectionStatus.InfectICU.value - 1] = 2.0
+        self.assertEqual(test_sweep.transition_time_matrix.version,
+                         version + 1)
+        test_sweep.bind_population(self.test_population1)
+        test_sweep(2.0)
+        self.assertEqual(test_sweep._fixed_time_rows[
+            InfectionStatus.InfectHosp.value][
+            InfectionStatus.InfectICU.value], 2.0)
+
     def test_update_next_infection_status_waning_immunity(self):
         """Tests that Recovered people return to Susceptible when their status
         is updated if waning immunity is turned on.
@@ -466,6 +518,10 @@ class TestHostProgressionSweep(TestPyEpiabm):
         test_sweep.transition_time_matrix.loc[row_index, column_index]. \
             icdf_choose_noexp.assert_called_once()
 
+        init_matrix.loc[row_index, column_index] = "Not a time"
+        with self.assertRaises(ValueError):
+            test_sweep.transition_time_matrix = init_matrix
+
     def test_infectiousness_progression(self):
         """Tests that the output is a numpy ndarray and that the tail of the
         array is 0, starting at the first element after the last infectious
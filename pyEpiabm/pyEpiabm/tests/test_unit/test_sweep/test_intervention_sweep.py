@@ -58,6 +58,8 @@ class TestInterventionSweep(TestPyEpiabm):
                              intervention_params['travel_isolation']), 10)
         self.assertEqual(len(
             self.intervention_sweep.intervention_active_status.keys()), 8)
+        self.assertIsInstance(self._population.intervention_modifiers,
+                              pe.InterventionModifiers)
 
     def test___call__(self):
         self.intervention_sweep.bind_population(self._population)
@@ -116,6 +118,12 @@ class TestInterventionSweep(TestPyEpiabm):
         self.assertEqual(self.person_symp.isolation_start_time, 10)
         self.assertIsNotNone(self.person_susc.quarantine_start_time)
 
+        # Multipliers of the force of infection are updated
+        modifiers = self._population.intervention_modifiers
+        self.assertEqual(modifiers.time, 10)
+        self.assertEqual(modifiers.isolation[
+            modifiers.index(self.person_symp, 10)], 0.5)
+
         # Parameters for the first place closure
         self.assertEqual(self.intervention_sweep._population.cells[0].
                          microcells[0].closure_start_time, 10)
@@ -150,6 +158,15 @@ class TestInterventionSweep(TestPyEpiabm):
                  if isinstance(key, CaseIsolation)][0]])
         self.assertIsNone(self.person_symp.isolation_start_time)
 
+    def test___call___without_modifiers(self):
+        self.intervention_sweep.bind_population(self._population)
+        # Modifiers are recreated if the population has lost them
+        self._population.intervention_modifiers = None
+        self.intervention_sweep(time=10)
+        modifiers = self._population.intervention_modifiers
+        self.assertIsInstance(modifiers, pe.InterventionModifiers)
+        self.assertEqual(modifiers.time, 10)
+
     @mock.patch('logging.warning')
     def test_concurrent_event_warning(self, mock_log):
         # Move the second intervention forward in time so it is concurrent
@@ -0,0 +1,106 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from pyEpiabm.property import InfectionStatus, PlaceType
+from pyEpiabm.core import Parameters, Person, Population
+from pyEpiabm.sweep import LazyUpdatePlaceSweep
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestLazyUpdatePlaceSweep(TestPyEpiabm):
+    """Test the 'LazyUpdatePlaceSweep' class.
+    """
+
+    def setUp(self) -> None:
+        """Initialises a population with two cells of ten people, each with
+        a workplace with two fixed workers and two outdoor spaces, which
+        have one visitor each.
+        """
+        self.pop = Population()
+        self.pop.add_cells(2)
+        for cell in self.pop.cells:
+            cell.add_microcells(1)
+            microcell = cell.microcells[0]
+            microcell.add_people(10)
+            microcell.add_place(1, (1, 1), PlaceType.Workplace)
+            microcell.add_place(2, (1, 1), PlaceType.OutdoorSpace)
+            workplace = cell.places[0]
+            for person in microcell.persons[:2]:
+                workplace.add_person(person, 0)
+            workplace.add_person(microcell.persons[2], 1)
+            cell.places[1].add_person(microcell.persons[3])
+            cell.places[2].add_person(microcell.persons[4])
+        self.cell = self.pop.cells[0]
+        self.workplace = self.cell.places[0]
+        self.outdoor_spaces = self.cell.places[1:]
+        self.infector = self.cell.persons[5]
+        Parameters.instance().use_key_workers = 0
+        self.test_sweep = LazyUpdatePlaceSweep()
+        self.test_sweep.bind_population(self.pop)
+
+    def test__call__no_infectors(self):
+        # Variable groups are emptied, keeping the fixed workers
+        self.test_sweep(1)
+        for cell in self.pop.cells:
+            self.assertEqual(cell.places[0].person_groups,
+                             {0: cell.persons[:2], 1: []})
+            for place in cell.places[1:]:
+                self.assertEqual(place.persons, [])
+
+    @mock.patch('numpy.random.choice')
+    @mock.patch('numpy.random.poisson')
+    def test__call__(self, mock_poisson, mock_choice):
+        # The infector is drawn beyond the capacity of the workplace, and
+        # into the first outdoor space
+        self.infector.update_status(InfectionStatus.InfectMild)
+        mock_poisson.side_effect = [np.array([3]), np.array([4, 6])]
+        mock_choice.side_effect = [np.array([7]), np.array([2])]
+        self.test_sweep(1)
+        self.assertEqual(self.workplace.person_groups[1], [])
+        outdoor_space = self.outdoor_spaces[0]
+        self.assertEqual(len(outdoor_space.persons), 4)
+        self.assertIn(self.infector, outdoor_space.persons)
+        self.assertEqual(len(set(outdoor_space.persons)), 4)
+        self.assertEqual(self.outdoor_spaces[1].persons, [])
+        mock_choice.assert_called_with(10, 1, replace=False)
+
+        # Filled groups are emptied in the next timestep
+        self.infector.update_status(InfectionStatus.Recovered)
+        self.test_sweep(2)
+        self.assertEqual(outdoor_space.persons, [])
+
+    @mock.patch('numpy.random.poisson')
+    def test__call__workplace(self, mock_poisson):
+        # The infector always visits a workplace large enough for the pool
+        self.infector.update_status(InfectionStatus.InfectMild)
+        mock_poisson.side_effect = [np.array([100]), np.array([0, 0])]
+        Parameters.instance().use_key_workers = 1
+        self.test_sweep(1)
+        visitors = self.workplace.person_groups[1]
+        self.assertCountEqual(visitors, self.cell.persons[2:])
+        self.assertTrue(all(person.key_worker for person in visitors))
+        self.assertEqual(self.pop.cells[1].places[0].person_groups[1], [])
+
+    @mock.patch('numpy.random.poisson')
+    def test__call__swapped_people(self, mock_poisson):
+        # A traveller replacing someone in the cell is found in the pools
+        self.test_sweep(1)
+        microcell = self.cell.microcells[0]
+        microcell.add_household(microcell.persons.copy())
+        leaving = self.cell.persons[6]
+        leaving.remove_person()
+        traveller = Person(microcell)
+        microcell.add_person(traveller)
+        traveller.update_status(InfectionStatus.InfectMild)
+        mock_poisson.side_effect = [np.array([100]), np.array([0, 0])]
+        self.test_sweep(2)
+        visitors = self.workplace.person_groups[1]
+        self.assertIn(traveller, visitors)
+        self.assertNotIn(leaving, visitors)
+        self.assertEqual(len(visitors), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from pyEpiabm.property import InfectionStatus, PlaceType
+from pyEpiabm.core import Parameters, Person, Population
+from pyEpiabm.sweep import PooledUpdatePlaceSweep
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestPooledUpdatePlaceSweep(TestPyEpiabm):
+    """Test the 'PooledUpdatePlaceSweep' class.
+    """
+
+    def setUp(self) -> None:
+        """Initialises a population with two cells of ten people, each with
+        a workplace with two fixed workers and two outdoor spaces.
+        """
+        self.pop = Population()
+        self.pop.add_cells(2)
+        for cell in self.pop.cells:
+            cell.add_microcells(1)
+            microcell = cell.microcells[0]
+            microcell.add_people(10)
+            microcell.add_place(1, (1, 1), PlaceType.Workplace)
+            microcell.add_place(2, (1, 1), PlaceType.OutdoorSpace)
+            workplace = cell.places[0]
+            for person in microcell.persons[:2]:
+                workplace.add_person(person, 0)
+            workplace.add_person(microcell.persons[2], 1)
+        self.cell = self.pop.cells[0]
+        self.workplace = self.cell.places[0]
+        self.outdoor_spaces = self.cell.places[1:]
+        Parameters.instance().use_key_workers = 0
+        self.test_sweep = PooledUpdatePlaceSweep()
+        self.test_sweep.bind_population(self.pop)
+
+    def test__init__(self):
+        self.assertEqual(self.test_sweep.update_interval, 1)
+        self.assertFalse(self.test_sweep.infectious_cells_only)
+        self.assertRaises(ValueError, PooledUpdatePlaceSweep, 0)
+        self.assertRaises(ValueError, PooledUpdatePlaceSweep, 1.5)
+
+    @mock.patch('numpy.random.poisson')
+    def test__call__(self, mock_poisson):
+        mock_poisson.side_effect = [np.array([3]), np.array([4, 10])] * 2
+        self.test_sweep(1)
+        fixed = self.cell.persons[:2]
+        self.assertEqual(self.workplace.person_groups[0], fixed)
+        variable = self.workplace.person_groups[1]
+        self.assertEqual(len(variable), 3)
+        self.assertFalse(set(variable) & set(fixed))
+
+        # Nobody visits two outdoor spaces, which are limited by the number
+        # of people in the cell
+        visitors = [person for place in self.outdoor_spaces
+                    for person in place.person_groups[0]]
+        self.assertEqual(len(visitors), 10)
+        self.assertCountEqual(visitors, self.cell.persons)
+        self.assertEqual([len(place.persons) for place in self.outdoor_spaces],
+                         [4, 6])
+        for person in self.cell.persons:
+            self.assertEqual(person.place_types.count(PlaceType.OutdoorSpace),
+                             1)
+        mock_poisson.assert_any_call(25, 2)
+
+    def test__call__key_workers(self):
+        Parameters.instance().use_key_workers = 1
+        self.test_sweep(1)
+        for person in self.workplace.person_groups[1]:
+            self.assertTrue(person.key_worker)
+
+    def test_update_interval(self):
+        test_sweep = PooledUpdatePlaceSweep(update_interval=2)
+        test_sweep.bind_population(self.pop)
+        test_sweep(1)
+        occupants = list(self.workplace.persons)
+        test_sweep(2)
+        self.assertEqual(self.workplace.persons, occupants)
+
+    def test_infectious_cells_only(self):
+        test_sweep = PooledUpdatePlaceSweep(infectious_cells_only=True)
+        test_sweep.bind_population(self.pop)
+        self.cell.persons[5].update_status(InfectionStatus.InfectMild)
+        test_sweep(1)
+        other_cell = self.pop.cells[1]
+        self.assertEqual(len(other_cell.places[0].persons), 3)
+        self.assertEqual(other_cell.places[1].persons, [])
+        self.assertNotEqual(self.outdoor_spaces[0].persons, [])
+
+    def test_pools(self):
+        workplace_pool = self.test_sweep._cell_pools(self.cell)[0][1]
+        self.assertEqual(workplace_pool, self.cell.persons[2:])
+
+        # Pools are rebuilt when the cell changes size
+        self.cell.microcells[0].add_people(1)
+        workplace_pool = self.test_sweep._cell_pools(self.cell)[0][1]
+        self.assertIn(self.cell.persons[-1], workplace_pool)
+
+        # and when people are swapped without changing its size
+        microcell = self.cell.microcells[0]
+        microcell.add_household(microcell.persons.copy())
+        leaving = self.cell.persons[5]
+        leaving.remove_person()
+        joining = Person(microcell)
+        microcell.add_person(joining)
+        workplace_pool, outdoor_pool = [
+            pool for _, pool in self.test_sweep._cell_pools(self.cell)]
+        self.assertEqual(workplace_pool, self.cell.persons[2:])
+        self.assertIn(joining, outdoor_pool)
+        self.assertNotIn(leaving, outdoor_pool)
+
+
+if __name__ == '__main__':
+    unittest.main()
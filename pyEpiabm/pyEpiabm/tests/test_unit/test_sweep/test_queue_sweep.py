@@ -1,6 +1,8 @@
 import unittest
 from unittest import mock
 
+import numpy as np
+
 import pyEpiabm as pe
 from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
 
@@ -59,6 +61,19 @@ class TestQueueSweep(TestPyEpiabm):
         self.assertEqual(self.person2.time_of_status_change,
                          self.time)
 
+    def test_call_duplicates(self):
+        # A person enqueued twice is only processed once
+        self.cell.enqueue_person(self.person2)
+        self.cell.enqueue_person(self.person2)
+        self.assertEqual(self.cell.person_queue.qsize(), 1)
+        test_sweep = pe.sweep.QueueSweep()
+        test_sweep.bind_population(self.test_population)
+        with mock.patch.object(self.person2.__class__, 'time_of_status_change',
+                               new_callable=mock.PropertyMock) as mock_time:
+            test_sweep(self.time)
+        mock_time.assert_called_once_with(self.time)
+        self.assertTrue(self.cell.person_queue.empty())
+
     def test_vaccine_protection_full(self):
         """Tests that a vaccinated person will be moved to the vaccinated
         compartment.
@@ -153,6 +168,27 @@ class TestQueueSweep(TestPyEpiabm):
         self.assertEqual(self.person2.time_of_status_change,
                          self.time)
 
+    @mock.patch('random.random', return_value=0.0)
+    @mock.patch('numpy.random.poisson')
+    def test_vaccine_protection_draws(self, mock_poisson, mock_random):
+        """Tests that protection is only drawn for people whose vaccine has
+        become effective.
+        """
+        for person in [self.person1, self.person2]:
+            person.is_vaccinated = True
+            person.date_vaccinated = 0
+            self.cell.enqueue_person(person)
+        mock_poisson.return_value = np.array([5, 0])
+
+        test_sweep = pe.sweep.QueueSweep()
+        test_sweep.bind_population(self.test_population)
+        test_sweep(self.time)
+        mock_random.assert_called_once_with()
+        self.assertEqual(self.person1.next_infection_status,
+                         pe.property.InfectionStatus.Exposed)
+        self.assertEqual(self.person2.next_infection_status,
+                         pe.property.InfectionStatus.Vaccinated)
+
 
 if __name__ == '__main__':
     unittest.main()
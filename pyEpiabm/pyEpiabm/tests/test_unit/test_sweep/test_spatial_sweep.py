@@ -265,9 +265,11 @@ class TestSpatialSweep(TestMockedLogs):
         self.assertEqual(self.infectee.exposure_period, 1.0)
         self.assertEqual(self.infectee.infector_latent_period, 5.0)
 
-        mock_inf.assert_called_once_with(self.cell_inf, time)
+        mock_inf.assert_called_once_with(self.cell_inf, time,
+                                         test_sweep.parameters)
         mock_foi.assert_called_once_with(self.cell_inf, self.cell_susc,
-                                         self.infector, self.infectee, time)
+                                         self.infector, self.infectee, time,
+                                         test_sweep.parameters, None)
         mock_poisson.assert_called_once_with(mock_inf.return_value)
 
         # Change infector's status to infected
@@ -339,6 +341,7 @@ class TestSpatialSweep(TestMockedLogs):
         fake_infectee.update_status(InfectionStatus.Recovered)
         actual_infectee = microcell_susc.persons[0]
         self.infector.infection_start_times = [0.0]
+        test_sweep.bind_population(test_pop)
 
         self.assertTrue(cell_susc.person_queue.empty())
         test_sweep.do_infection_event(self.infector, fake_infectee, 1)
@@ -63,6 +63,36 @@ class TestStateTransitionMatrix(TestPyEpiabm):
                                                       use_ages=True)
         self.assertTrue(self.matrix_object_ad.age_dependent)
 
+    def test_compile_matrix(self):
+        matrix_object = StateTransitionMatrix(self.real_coefficients,
+                                              self.rate_multipliers)
+        weights = matrix_object.cumulative_weights
+        n = len(InfectionStatus)
+        self.assertEqual(weights.shape, (n + 1, 1, n))
+        np.testing.assert_array_almost_equal(
+            weights[InfectionStatus.Exposed.value, 0],
+            np.cumsum(matrix_object.matrix.loc['Exposed'].to_numpy(
+                dtype=float)))
+
+        # Age dependent entries give one row of weights per age group
+        matrix_object = StateTransitionMatrix(self.list_coefficients,
+                                              self.rate_multipliers,
+                                              use_ages=True)
+        weights = matrix_object.cumulative_weights
+        self.assertEqual(weights.shape, (n + 1, 2, n))
+        exposed_row = weights[InfectionStatus.Exposed.value]
+        self.assertAlmostEqual(
+            exposed_row[0, InfectionStatus.InfectASympt.value - 1], 0.8)
+        self.assertAlmostEqual(
+            exposed_row[1, InfectionStatus.InfectASympt.value - 1], 0.2)
+        self.assertAlmostEqual(exposed_row[1, -1], 1.0)
+
+        # Weights are recompiled when a probability is changed
+        matrix_object.update_probability(InfectionStatus.Dead,
+                                         InfectionStatus.Recovered, 0.5)
+        self.assertEqual(matrix_object.cumulative_weights[
+            InfectionStatus.Dead.value, 0, -1], 1.5)
+
     def test_create_empty_transition_matrix(self):
         """Tests the build_state_transition_matrix method by asserting if it is
         equal to the initial matrix expected.
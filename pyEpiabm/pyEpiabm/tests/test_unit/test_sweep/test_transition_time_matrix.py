@@ -31,6 +31,29 @@ class TestTransitionTimeMatrix(TestPyEpiabm):
                                               InverseCdf)
         self.assertEqual(inverse_cdf_count, 14)
 
+    def test_compile_matrix(self):
+        matrix = TransitionTimeMatrix().create_transition_time_matrix()
+        matrix.loc['Recovered', 'Susceptible'] = 2.0
+        samplers, fixed_times = TransitionTimeMatrix.compile_matrix(matrix)
+        n = len(InfectionStatus)
+        self.assertEqual(samplers.shape, (n + 1, n + 1))
+        self.assertEqual(fixed_times.shape, (n + 1, n + 1))
+        exposed = InfectionStatus.Exposed.value
+        mild = InfectionStatus.InfectMild.value
+        self.assertIs(samplers[exposed, mild],
+                      matrix.loc['Exposed', 'InfectMild'])
+        self.assertTrue(np.isnan(fixed_times[exposed, mild]))
+        self.assertIsNone(samplers[InfectionStatus.Recovered.value,
+                                   InfectionStatus.Susceptible.value])
+        self.assertEqual(fixed_times[InfectionStatus.Recovered.value,
+                                     InfectionStatus.Susceptible.value], 2.0)
+        self.assertEqual(fixed_times[InfectionStatus.Dead.value,
+                                     InfectionStatus.Dead.value], -1.0)
+
+        matrix.loc['Dead', 'Dead'] = "Not a time"
+        with self.assertRaises(ValueError):
+            TransitionTimeMatrix.compile_matrix(matrix)
+
     def test_update_transition_time_with_float(self):
         # Test method updates transition time as expected
         matrix_object = TransitionTimeMatrix()
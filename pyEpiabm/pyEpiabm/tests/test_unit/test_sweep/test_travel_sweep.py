@@ -1,3 +1,4 @@
+import os
 import unittest
 import numpy as np
 
@@ -52,6 +53,14 @@ class TestTravelSweep(TestPyEpiabm):
                          .persons[0].infection_status,
                          pe.property.InfectionStatus.InfectMild)
 
+        # Travel parameters are read from bound parameters
+        params = pe.Parameters.from_file(os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            'testing_parameters.json'))
+        params.travel_params = {'ratio_introduce_cases': 0.5}
+        test_sweep.bind_population(self._population, params)
+        self.assertIs(test_sweep.travel_params, params.travel_params)
+
     def test__call__(self):
         """Introduce 3 infected individuals. Of them, 2 are introduced due to
         ratio_introduce_cases and 1 due to constant_introduce_cases. All
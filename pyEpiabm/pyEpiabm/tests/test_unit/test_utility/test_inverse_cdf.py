@@ -27,6 +27,15 @@ class TestInverseCdf(TestPyEpiabm):
         value = icdf_object.icdf_choose_noexp()
         self.assertTrue(0 < value)
 
+    def test_choose_noexp_array(self):
+        icdf = 10 * np.sort(np.random.rand(21))
+        icdf_object = InverseCdf(3, icdf)
+        values = icdf_object.icdf_choose_noexp_array(50)
+        self.assertEqual(values.shape, (50,))
+        self.assertTrue(np.all(values >= np.floor(0.5 + 3 * icdf[0])))
+        self.assertTrue(np.all(values <= np.floor(0.5 + 3 * icdf[-1])))
+        np.testing.assert_array_equal(values, np.floor(values))
+
     @parameterized.expand([(np.random.rand(21) * numReps,)
                            for _ in range(numReps)])
     def test_choose_exp(self, icdf):
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+
+from pyEpiabm.utility import DistanceFunctions, SpatialIndex
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """Test the 'SpatialIndex' class.
+    """
+    def setUp(self) -> None:
+        np.random.seed(1)
+        self.locations = [tuple(loc) for loc in np.random.rand(200, 2)]
+        self.index = SpatialIndex(self.locations, bucket_size=0.1)
+
+    def brute_force(self, location, radius):
+        return [i for i, loc in enumerate(self.locations)
+                if DistanceFunctions.dist(location, loc) < radius]
+
+    def test__init__(self):
+        self.assertEqual(len(self.index), 200)
+        self.assertEqual(self.index._bucket_size, 0.1)
+        self.assertEqual(sum(len(bucket) for bucket
+                             in self.index._buckets.values()), 200)
+
+        # Buckets are not smaller than the average spacing of points
+        index = SpatialIndex(self.locations, bucket_size=1e-6)
+        self.assertGreater(index._bucket_size, 0.05)
+        self.assertEqual(len(SpatialIndex([])), 0)
+        self.assertEqual(SpatialIndex([(1, 1), (1, 1)])._bucket_size, 1.0)
+
+    def test_query_radius(self):
+        for radius in [0.0, 0.05, 0.23, 2.0, np.inf]:
+            for location in [(0.5, 0.5), (0.0, 1.0), (-1.0, 3.0)]:
+                self.assertEqual(self.index.query_radius(location, radius),
+                                 self.brute_force(location, radius))
+                self.assertEqual(self.index.any_within(location, radius),
+                                 bool(self.brute_force(location, radius)))
+        self.assertEqual(SpatialIndex([]).candidates((0, 0), 1), [])
+
+    def test_candidates(self):
+        location = (0.3, 0.6)
+        candidates = self.index.candidates(location, 0.1)
+        self.assertEqual(candidates, sorted(candidates))
+        self.assertTrue(set(self.brute_force(location, 0.1))
+                        <= set(candidates))
+        self.assertLess(len(candidates), 200)
+
+    def test_move(self):
+        self.index.move(3, (5.0, 5.0))
+        self.locations[3] = (5.0, 5.0)
+        self.assertEqual(self.index.query_radius((5.0, 5.1), 0.2), [3])
+        self.assertNotIn(3, self.index.candidates(self.locations[4], 0.1))
+        self.index.move(3, (5.01, 5.0))
+        self.assertEqual(self.index.query_radius((5.0, 5.1), 0.2), [3])
+
+    def test_query_radius_bulk(self):
+        neighbours = self.index.query_radius_bulk(0.1)
+        self.assertEqual(len(neighbours), 200)
+        for i, loc in enumerate(self.locations):
+            expected = [j for j in self.brute_force(loc, 0.1) if j != i]
+            self.assertEqual(neighbours[i], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
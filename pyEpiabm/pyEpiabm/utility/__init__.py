@@ -9,6 +9,7 @@ algorithms that are called throughout pyEpiabm.
 
 from .distance_metrics import DistanceFunctions
 from .covidsim_kernel import SpatialKernel
+from .spatial_index import SpatialIndex
 from .random_methods import RandomMethods
 from .inverse_cdf import InverseCdf
 from .exception_logger import log_exceptions
@@ -56,6 +56,29 @@ class InverseCdf:
         value = float(math.floor(0.5 + (ti * self.time_steps_per_day)))
         return value
 
+    def icdf_choose_noexp_array(self, size: int) -> np.ndarray:
+        """Draws several values from the inverse cumulative distribution
+        function at once, in the same way as :meth:`icdf_choose_noexp` but
+        using NumPy's random number generator.
+
+        Parameters
+        ----------
+        size : int
+            Number of values to draw
+
+        Returns
+        -------
+        np.ndarray
+            Array of sampled values
+
+        """
+        q = np.random.random(size) * self.CDF_RES
+        i = np.floor(q).astype(int)
+        q -= i
+        ti = (self.mean
+              * (q * self.icdf_array[i+1] + (1.0 - q) * self.icdf_array[i]))
+        return np.floor(0.5 + (ti * self.time_steps_per_day))
+
     def icdf_choose_exp(self) -> float:
         """Samples a value from the inverse cumulative distribution function,
         following what is done in CovidSim (with negative exponentiation),
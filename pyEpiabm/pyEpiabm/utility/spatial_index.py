@@ -0,0 +1,208 @@
+#
+# Uniform grid index for radius queries on spatial points
+#
+
+import math
+import typing
+
+from .distance_metrics import DistanceFunctions
+
+
+class SpatialIndex:
+    """Class which buckets a set of (x,y) locations into a uniform grid, so
+    that the points near a given location can be found without computing
+    the distance to every point. Used when finding nearby cells and when
+    placing microcells.
+
+    Points are referred to by their position in the list of locations
+    used to build the index, and can be moved after the index is built.
+
+    """
+    def __init__(self, locations: typing.List[typing.Tuple[float, float]],
+                 bucket_size: float = None):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        locations : typing.List[typing.Tuple[float, float]]
+            List of (x,y) locations of the points to index
+        bucket_size : float
+            Side length of the grid buckets, usually the radius of the
+            queries to be made. Buckets are never smaller than the average
+            spacing between the initial points, so that the grid does not
+            have many more buckets than points. Defaults to the average
+            spacing
+
+        """
+        self._locations = [tuple(loc) for loc in locations]
+        n = len(self._locations)
+        if n > 0:
+            xs = [loc[0] for loc in self._locations]
+            ys = [loc[1] for loc in self._locations]
+            self._origin = (min(xs), min(ys))
+            extent = max(max(xs) - min(xs), max(ys) - min(ys))
+        else:
+            self._origin = (0.0, 0.0)
+            extent = 0.0
+        if bucket_size is None or not math.isfinite(bucket_size) or \
+                bucket_size <= 0:
+            bucket_size = extent / math.sqrt(n) if extent > 0 else 1.0
+        elif extent > 0:
+            bucket_size = max(bucket_size, extent / math.sqrt(n))
+        self._bucket_size = bucket_size
+
+        self._buckets = dict()
+        for i, loc in enumerate(self._locations):
+            self._buckets.setdefault(self._bucket_of(loc), []).append(i)
+
+    def __len__(self):
+        """Returns the number of points in the index.
+
+        """
+        return len(self._locations)
+
+    def _bucket_of(self, location: typing.Tuple[float, float]):
+        """Returns the grid coordinates of the bucket containing a location.
+
+        """
+        return (math.floor((location[0] - self._origin[0])
+                           / self._bucket_size),
+                math.floor((location[1] - self._origin[1])
+                           / self._bucket_size))
+
+    def move(self, index: int, location: typing.Tuple[float, float]):
+        """Changes the location of one of the indexed points.
+
+        Parameters
+        ----------
+        index : int
+            Position of the point in the list of locations
+        location : typing.Tuple[float, float]
+            New (x,y) location of the point
+
+        """
+        old_bucket = self._bucket_of(self._locations[index])
+        location = tuple(location)
+        new_bucket = self._bucket_of(location)
+        self._locations[index] = location
+        if new_bucket != old_bucket:
+            bucket = self._buckets[old_bucket]
+            bucket.remove(index)
+            if not bucket:
+                del self._buckets[old_bucket]
+            self._buckets.setdefault(new_bucket, []).append(index)
+
+    def candidates(self, location: typing.Tuple[float, float],
+                   radius: float) -> typing.List[int]:
+        """Returns the indices of all points which may lie within a radius
+        of a location, being those in the grid buckets overlapping a square
+        of side 2 * radius centred on the location (plus one bucket margin
+        to allow for rounding). Callers should then check the distance to
+        each candidate.
+
+        Parameters
+        ----------
+        location : typing.Tuple[float, float]
+            (x,y) location at the centre of the query
+        radius : float
+            Radius of the query
+
+        Returns
+        -------
+        typing.List[int]
+            Sorted list of candidate indices
+
+        """
+        if not self._buckets:
+            return []
+        if not math.isfinite(radius):
+            return list(range(len(self._locations)))
+        low = self._bucket_of((location[0] - radius, location[1] - radius))
+        high = self._bucket_of((location[0] + radius, location[1] + radius))
+        x_range = range(low[0] - 1, high[0] + 2)
+        y_range = range(low[1] - 1, high[1] + 2)
+        if len(x_range) * len(y_range) >= len(self._buckets):
+            # Query covers more buckets than are occupied
+            found = [indices for key, indices in self._buckets.items()
+                     if key[0] in x_range and key[1] in y_range]
+        else:
+            found = [self._buckets[(x, y)] for x in x_range for y in y_range
+                     if (x, y) in self._buckets]
+        return sorted(i for indices in found for i in indices)
+
+    def query_radius(self, location: typing.Tuple[float, float],
+                     radius: float) -> typing.List[int]:
+        """Returns the indices of all points strictly closer than a radius
+        to a location, with distances computed by
+        :meth:`DistanceFunctions.dist`.
+
+        Parameters
+        ----------
+        location : typing.Tuple[float, float]
+            (x,y) location at the centre of the query
+        radius : float
+            Radius of the query
+
+        Returns
+        -------
+        typing.List[int]
+            Sorted list of indices of points within the radius
+
+        """
+        return [i for i in self.candidates(location, radius)
+                if DistanceFunctions.dist(location, self._locations[i])
+                < radius]
+
+    def any_within(self, location: typing.Tuple[float, float],
+                   radius: float) -> bool:
+        """Returns whether any point is strictly closer than a radius to a
+        location, searching outwards from the location's grid bucket and
+        stopping at the first such point.
+
+        Parameters
+        ----------
+        location : typing.Tuple[float, float]
+            (x,y) location at the centre of the query
+        radius : float
+            Radius of the query
+
+        Returns
+        -------
+        bool
+            Whether :meth:`query_radius` would return any points
+
+        """
+        if not math.isfinite(radius):
+            return bool(self.query_radius(location, radius))
+        centre_x, centre_y = self._bucket_of(location)
+        # One bucket margin, as in candidates
+        max_ring = math.floor(radius / self._bucket_size) + 2
+        for ring in range(max_ring + 1):
+            for x in range(centre_x - ring, centre_x + ring + 1):
+                # Only the edge of the square of buckets is new in each ring
+                step = 1 if abs(x - centre_x) == ring else max(2 * ring, 1)
+                for y in range(centre_y - ring, centre_y + ring + 1, step):
+                    for i in self._buckets.get((x, y), ()):
+                        if DistanceFunctions.dist(
+                                location, self._locations[i]) < radius:
+                            return True
+        return False
+
+    def query_radius_bulk(self, radius: float) \
+            -> typing.List[typing.List[int]]:
+        """Returns, for each indexed point, the indices of the other points
+        strictly closer than a radius to it.
+
+        Parameters
+        ----------
+        radius : float
+            Radius of the queries
+
+        Returns
+        -------
+        typing.List[typing.List[int]]
+            List of sorted lists of indices, one for each point
+
+        """
+        return [[j for j in self.query_radius(loc, radius) if j != i]
+                for i, loc in enumerate(self._locations)]